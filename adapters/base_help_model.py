@@ -11,6 +11,7 @@ from time import perf_counter
 from typing import Any, Mapping
 
 from adapters.help_response_parser import parse_help_response_with_diagnostics
+from adapters.http_client_pool import HttpClientConfig, build_request_timeout, shared_http_client
 from adapters.json_extract import parse_first_json
 from adapters.prompting import build_help_prompt_result
 from adapters.response_mapping import map_help_response_to_tutor_response
@@ -184,6 +185,7 @@ class BaseHelpModel(ModelPort):
         print_model_io: bool = False,
         telemetry_map_path: str | Path | None = None,
         client: Any | None = None,
+        http_client_config: HttpClientConfig | None = None,
     ) -> None:
         self.model_name = model_name
         self.base_url = base_url.rstrip("/")
@@ -194,16 +196,15 @@ class BaseHelpModel(ModelPort):
         self.print_model_io = bool(print_model_io)
         self.telemetry_map_path = _normalize_telemetry_map_path(telemetry_map_path)
 
+        self.http_client_config = http_client_config
         if client is None:
-            try:
-                import httpx  # local import keeps unit tests offline with fake client
-            except ModuleNotFoundError as exc:
-                raise RuntimeError("httpx is required when no client is injected") from exc
-            self._client = httpx.Client(timeout=self.timeout_s)
-            self._owns_client = True
+            # Pooled per endpoint so fresh model instances (e.g. per replay-eval case) reuse warm connections.
+            self._client = shared_http_client(self.base_url, config=http_client_config)
+            self._request_timeout: Any = build_request_timeout(self.timeout_s, http_client_config)
         else:
             self._client = client
-            self._owns_client = False
+            self._request_timeout = self.timeout_s
+        self._owns_client = False
 
     def close(self) -> None:
         if self._owns_client and hasattr(self._client, "close"):
@@ -991,6 +992,15 @@ class BaseHelpModel(ModelPort):
                 annotate_exception(exc, code=failure_code, stage=failure_stage)
             raise
 
+    @staticmethod
+    def _accepts_streamed_help_json(text: str) -> bool:
+        """Early-stop predicate for streamed completions: the first JSON segment is a valid HelpResponse."""
+        try:
+            parse_help_response_with_diagnostics(text)
+        except Exception:
+            return False
+        return True
+
     def _classify_chat_exception(self, exc: Exception) -> tuple[str | None, str | None]:
         if self._is_transport_or_http_exception(exc):
             return MODEL_HTTP_FAIL, "model_http"
@@ -4,7 +4,9 @@ import ipaddress
 import json
 import socket
 import struct
+import sys
 import time
+from bisect import bisect_left
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Tuple
@@ -99,6 +101,7 @@ class DcsBiosReceiver:
 
 SYNC = b"\x55\x55\x55\x55"
 STATE_SIZE = 65536
+_WRITE_HEADER = struct.Struct("<HH")
 
 
 @dataclass(frozen=True)
@@ -151,15 +154,47 @@ def _load_control_reference(paths: Iterable[Path]) -> list[OutputDef]:
     return outputs
 
 
-def _build_address_map(outputs: Iterable[OutputDef]) -> dict[int, list[OutputDef]]:
-    mapping: dict[int, list[OutputDef]] = {}
-    for out in outputs:
-        if out.kind == "string" and out.max_length > 0:
-            for addr in range(out.address, out.address + out.max_length):
-                mapping.setdefault(addr, []).append(out)
-        else:
-            mapping.setdefault(out.address, []).append(out)
-    return mapping
+class _DecodeIndex:
+    """
+    Address-to-output interval index built once per control reference.
+
+    Integer outputs are grouped by word address so every output sharing a word is
+    decoded from a single uint16 read; string outputs are kept as sorted
+    ``[start, end)`` intervals. A write ``[addr, end)`` is resolved with bisect
+    instead of probing every written byte.
+    """
+
+    def __init__(self, outputs: Iterable[OutputDef]) -> None:
+        int_groups: dict[int, list[OutputDef]] = {}
+        strings: list[OutputDef] = []
+        for out in outputs:
+            if out.kind == "string" and out.max_length > 0:
+                strings.append(out)
+            else:
+                int_groups.setdefault(out.address, []).append(out)
+        self.int_addresses: list[int] = sorted(int_groups)
+        self.int_groups: dict[int, tuple[tuple[str, int, int], ...]] = {
+            address: tuple((out.identifier, out.mask, out.shift_by) for out in group)
+            for address, group in int_groups.items()
+        }
+        strings.sort(key=lambda out: (out.address, out.identifier))
+        self.strings: list[OutputDef] = strings
+        self.string_starts: list[int] = [out.address for out in strings]
+        self.max_string_length = max((out.max_length for out in strings), default=0)
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self.int_groups.values()) + len(self.strings)
+
+    def int_addresses_in(self, start: int, end: int) -> list[int]:
+        addresses = self.int_addresses
+        return addresses[bisect_left(addresses, start) : bisect_left(addresses, end)]
+
+    def strings_overlapping(self, start: int, end: int) -> list[OutputDef]:
+        if not self.strings:
+            return []
+        lo = bisect_left(self.string_starts, start - self.max_string_length + 1)
+        hi = bisect_left(self.string_starts, end)
+        return [out for out in self.strings[lo:hi] if out.address + out.max_length > start]
 
 
 class DcsBiosRawReceiver:
@@ -198,7 +233,12 @@ class DcsBiosRawReceiver:
             if include_metadata:
                 ref_paths.append(base_dir / "MetadataStart.json")
         outputs = _load_control_reference(ref_paths)
-        self._addr_map = _build_address_map(outputs)
+        self._index = _DecodeIndex(outputs)
+        # Little-endian uint16 view over the state buffer for word-aligned outputs.
+        self._words = memoryview(self._state).cast("H") if sys.byteorder == "little" else None
+        # Copy-on-write: the last snapshot handed to an Observation is shared until
+        # the next value change, so unchanged state is never copied per frame.
+        self._values_shared = False
 
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -246,42 +286,78 @@ class DcsBiosRawReceiver:
         return (word & out.mask) >> out.shift_by
 
     def _apply_frame(self, frame: bytes) -> Dict[str, Any]:
-        updated_addresses: set[int] = set()
+        index = self._index
+        int_addresses: set[int] = set()
+        strings: dict[str, OutputDef] = {}
         idx = 0
-        while idx + 4 <= len(frame):
-            addr = int.from_bytes(frame[idx : idx + 2], "little")
-            length = int.from_bytes(frame[idx + 2 : idx + 4], "little")
+        frame_len = len(frame)
+        while idx + 4 <= frame_len:
+            addr, length = _WRITE_HEADER.unpack_from(frame, idx)
             idx += 4
             if length <= 0:
                 continue
-            if idx + length > len(frame):
+            if idx + length > frame_len:
                 break
             end = addr + length
-            if end <= len(self._state):
+            if end <= STATE_SIZE:
                 self._state[addr:end] = frame[idx : idx + length]
-                for a in range(addr, end):
-                    if a in self._addr_map:
-                        updated_addresses.add(a)
+                int_addresses.update(index.int_addresses_in(addr, end))
+                for out in index.strings_overlapping(addr, end):
+                    strings.setdefault(out.identifier, out)
             idx += length
 
         delta: Dict[str, Any] = {}
         seen: set[str] = set()
-        for address in updated_addresses:
-            for out in self._addr_map.get(address, []):
-                if out.identifier in seen:
-                    continue
-                seen.add(out.identifier)
-                value = self._decode_output(out)
-                if self._values.get(out.identifier) != value:
-                    self._values[out.identifier] = value
-                    delta[out.identifier] = value
+        if int_addresses:
+            self._decode_integers(sorted(int_addresses), seen, delta)
+        for identifier, out in strings.items():
+            if identifier in seen:
+                continue
+            seen.add(identifier)
+            self._set_value(identifier, self._decode_output(out), delta)
         if "_ACFT_NAME" in delta and isinstance(delta["_ACFT_NAME"], str):
             self._aircraft = delta["_ACFT_NAME"]
         return delta
 
+    def _decode_integers(self, addresses: list[int], seen: set[str], delta: Dict[str, Any]) -> None:
+        words = self._words
+        groups = self._index.int_groups
+        values = self._values
+        for address in addresses:
+            if words is not None and not address & 1:
+                word = words[address >> 1]
+            else:
+                word = self._read_uint16(address)
+            for identifier, mask, shift_by in groups[address]:
+                if identifier in seen:
+                    continue
+                seen.add(identifier)
+                value = (word & mask) >> shift_by
+                if values.get(identifier) == value:
+                    continue
+                if self._values_shared:
+                    values = self._values = dict(values)
+                    self._values_shared = False
+                values[identifier] = value
+                delta[identifier] = value
+
+    def _set_value(self, identifier: str, value: Any, delta: Dict[str, Any]) -> None:
+        if self._values.get(identifier) == value:
+            return
+        if self._values_shared:
+            self._values = dict(self._values)
+            self._values_shared = False
+        self._values[identifier] = value
+        delta[identifier] = value
+
     def _enqueue_observation(self, delta: Dict[str, Any], addr: Tuple[str, int]) -> None:
         self._frame_seq += 1
-        bios_state = dict(self._values) if self.merge_full_state else dict(delta)
+        if self.merge_full_state:
+            # Shared read-only snapshot; the receiver copies before its next write.
+            bios_state = self._values
+            self._values_shared = True
+        else:
+            bios_state = dict(delta)
         frame = {
             "schema_version": "v2",
             "seq": self._frame_seq,
@@ -0,0 +1,403 @@
+"""
+Chunked, columnar telemetry recording format for long sessions.
+
+A `.tcol` file is a header followed by independently decodable chunks. Each
+chunk stores a keyframe (the first row's full state) plus per-key change arrays
+for the remaining rows, so a `bios` map that repeats the full cockpit state on
+every frame costs one entry per actual switch change instead of one per frame.
+`seq`/`t_wall` are kept as dense columns and each chunk header carries its row
+count and time range, which lets readers skip whole chunks when seeking.
+
+Chunks are compressed with zstd when `zstandard` is installed and zlib
+otherwise; the codec is recorded per chunk. A crash loses at most the chunk
+being buffered: readers stop at the first truncated record.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Union
+
+from core.types_v2 import TelemetryFrame
+
+COLUMNAR_TELEMETRY_SUFFIX = ".tcol"
+COLUMNAR_TELEMETRY_MAGIC = b"SIMTCOL1"
+DEFAULT_CHUNK_FRAMES = 512
+COLUMNAR_COMPRESSIONS = ("auto", "zlib", "zstd")
+
+_CODEC_ZLIB = 0
+_CODEC_ZSTD = 1
+# codec, payload length, rows, t_wall min, t_wall max (NaN when the chunk has no t_wall)
+_CHUNK_HEADER = struct.Struct("<BIIdd")
+_DENSE_FIELDS = ("seq", "t_wall")
+
+
+def _zstd_module(required: bool) -> Any:
+    try:
+        import zstandard as zstd  # type: ignore
+    except Exception as exc:
+        if required:
+            raise RuntimeError("zstd compression requested but zstandard is not installed") from exc
+        return None
+    return zstd
+
+
+def _same_value(left: Any, right: Any) -> bool:
+    # 1, 1.0 and True compare equal but must round-trip with their own JSON type.
+    return type(left) is type(right) and left == right
+
+
+@dataclass(frozen=True)
+class ColumnarChunkInfo:
+    offset: int
+    codec: int
+    length: int
+    rows: int
+    t0: float | None
+    t1: float | None
+
+
+class _ChunkEncoder:
+    """Accumulates change arrays for one chunk; the first row is the keyframe."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.dense: dict[str, list[Any]] = {name: [] for name in _DENSE_FIELDS}
+        self.absent: dict[str, list[int]] = {}
+        self.scalars: dict[str, list[list[Any]]] = {}
+        self.scalars_del: dict[str, list[int]] = {}
+        self.maps: dict[str, dict[str, Any]] = {}
+        self._scalar_state: dict[str, Any] = {}
+        self._map_state: dict[str, dict[str, Any]] = {}
+        self.t0: float | None = None
+        self.t1: float | None = None
+
+    def add(self, frame: Mapping[str, Any]) -> None:
+        row = self.rows
+        for name in _DENSE_FIELDS:
+            if name in frame:
+                self.dense[name].append(frame[name])
+            else:
+                self.dense[name].append(None)
+                self.absent.setdefault(name, []).append(row)
+        t_wall = frame.get("t_wall")
+        if isinstance(t_wall, (int, float)) and not isinstance(t_wall, bool) and math.isfinite(t_wall):
+            self.t0 = float(t_wall) if self.t0 is None else min(self.t0, float(t_wall))
+            self.t1 = float(t_wall) if self.t1 is None else max(self.t1, float(t_wall))
+
+        seen_scalars: set[str] = set()
+        seen_maps: set[str] = set()
+        for key, value in frame.items():
+            if key in _DENSE_FIELDS:
+                continue
+            if isinstance(value, Mapping):
+                seen_maps.add(key)
+                self._add_map(row, key, value)
+                continue
+            seen_scalars.add(key)
+            if key not in self._scalar_state or not _same_value(self._scalar_state[key], value):
+                self.scalars.setdefault(key, []).append([row, value])
+                self._scalar_state[key] = value
+        for key in [key for key in self._scalar_state if key not in seen_scalars]:
+            del self._scalar_state[key]
+            self.scalars_del.setdefault(key, []).append(row)
+        for key in [key for key in self._map_state if key not in seen_maps]:
+            del self._map_state[key]
+            self.maps[key]["on"].append([row, False])
+        self.rows += 1
+
+    def _add_map(self, row: int, key: str, value: Mapping[str, Any]) -> None:
+        column = self.maps.setdefault(key, {"on": [], "set": {}, "del": {}})
+        state = self._map_state.get(key)
+        if state is None:
+            state = {}
+            self._map_state[key] = state
+            column["on"].append([row, True])
+        for sub_key, sub_value in value.items():
+            sub_key = str(sub_key)
+            if sub_key not in state or not _same_value(state[sub_key], sub_value):
+                column["set"].setdefault(sub_key, []).append([row, sub_value])
+                state[sub_key] = sub_value
+        if len(state) != len(value):
+            for sub_key in [sub_key for sub_key in state if sub_key not in value]:
+                del state[sub_key]
+                column["del"].setdefault(sub_key, []).append(row)
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "dense": self.dense,
+            "absent": self.absent,
+            "scalars": self.scalars,
+            "scalars_del": self.scalars_del,
+            "maps": self.maps,
+        }
+
+
+def _decode_chunk(payload: Mapping[str, Any]) -> list[dict[str, Any]]:
+    rows = int(payload.get("rows") or 0)
+    # ops[row] = list of (kind, key, sub_key, value) applied before emitting the row.
+    ops: list[list[tuple[int, str, str | None, Any]]] = [[] for _ in range(rows)]
+    for key, changes in (payload.get("scalars") or {}).items():
+        for row, value in changes:
+            ops[row].append((0, key, None, value))
+    for key, removed_rows in (payload.get("scalars_del") or {}).items():
+        for row in removed_rows:
+            ops[row].append((1, key, None, None))
+    for key, column in (payload.get("maps") or {}).items():
+        # Presence toggles go first so a map switched on in a row receives that row's sets.
+        for row, present in column.get("on") or []:
+            ops[row].insert(0, (2, key, None, bool(present)))
+        for sub_key, changes in (column.get("set") or {}).items():
+            for row, value in changes:
+                ops[row].append((3, key, sub_key, value))
+        for sub_key, removed_rows in (column.get("del") or {}).items():
+            for row in removed_rows:
+                ops[row].append((4, key, sub_key, None))
+
+    dense = payload.get("dense") or {}
+    absent = {name: set(rows_) for name, rows_ in (payload.get("absent") or {}).items()}
+    scalar_state: dict[str, Any] = {}
+    map_state: dict[str, dict[str, Any]] = {}
+    frames: list[dict[str, Any]] = []
+    for row in range(rows):
+        for kind, key, sub_key, value in ops[row]:
+            if kind == 0:
+                scalar_state[key] = value
+            elif kind == 1:
+                scalar_state.pop(key, None)
+            elif kind == 2:
+                if value:
+                    map_state[key] = {}
+                else:
+                    map_state.pop(key, None)
+            elif kind == 3:
+                map_state[key][sub_key] = value  # type: ignore[index]
+            else:
+                map_state[key].pop(sub_key, None)  # type: ignore[arg-type]
+        frame: dict[str, Any] = {}
+        for name in _DENSE_FIELDS:
+            if row not in absent.get(name, ()):
+                frame[name] = dense[name][row]
+        frame.update(scalar_state)
+        for key, state in map_state.items():
+            frame[key] = dict(state)
+        frames.append(frame)
+    return frames
+
+
+class ColumnarTelemetryWriter:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+        compression: str = "auto",
+    ) -> None:
+        if compression not in COLUMNAR_COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chunk_frames = max(1, int(chunk_frames))
+        zstd = _zstd_module(required=compression == "zstd") if compression != "zlib" else None
+        self._compressor = zstd.ZstdCompressor(level=3) if zstd is not None else None
+        self.compression = "zstd" if self._compressor is not None else "zlib"
+        self.frames_written = 0
+        self.chunks_written = 0
+        self._encoder = _ChunkEncoder()
+        self._fh: BinaryIO = self.path.open("wb")
+        self._fh.write(COLUMNAR_TELEMETRY_MAGIC)
+
+    def append(self, frame: TelemetryFrame | Mapping[str, Any]) -> None:
+        payload = frame.to_dict() if isinstance(frame, TelemetryFrame) else frame
+        self._encoder.add(payload)
+        self.frames_written += 1
+        if self._encoder.rows >= self.chunk_frames:
+            self._flush_chunk()
+
+    def extend(self, frames: Iterable[TelemetryFrame | Mapping[str, Any]]) -> None:
+        for frame in frames:
+            self.append(frame)
+
+    def _flush_chunk(self) -> None:
+        encoder = self._encoder
+        if encoder.rows == 0:
+            return
+        raw = json.dumps(encoder.to_payload(), separators=(",", ":")).encode("utf-8")
+        if self._compressor is not None:
+            codec, data = _CODEC_ZSTD, self._compressor.compress(raw)
+        else:
+            codec, data = _CODEC_ZLIB, zlib.compress(raw, 6)
+        t0 = encoder.t0 if encoder.t0 is not None else math.nan
+        t1 = encoder.t1 if encoder.t1 is not None else math.nan
+        self._fh.write(_CHUNK_HEADER.pack(codec, len(data), encoder.rows, t0, t1))
+        self._fh.write(data)
+        self._fh.flush()
+        self.chunks_written += 1
+        self._encoder = _ChunkEncoder()
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        try:
+            self._flush_chunk()
+        finally:
+            self._fh.close()
+
+    def __enter__(self) -> "ColumnarTelemetryWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class ColumnarTelemetryReader:
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.chunks = self._scan_chunks()
+
+    def __len__(self) -> int:
+        return sum(chunk.rows for chunk in self.chunks)
+
+    @property
+    def time_range(self) -> tuple[float, float] | None:
+        starts = [chunk.t0 for chunk in self.chunks if chunk.t0 is not None]
+        ends = [chunk.t1 for chunk in self.chunks if chunk.t1 is not None]
+        if not starts or not ends:
+            return None
+        return min(starts), max(ends)
+
+    def _scan_chunks(self) -> list[ColumnarChunkInfo]:
+        chunks: list[ColumnarChunkInfo] = []
+        with self.path.open("rb") as fh:
+            if fh.read(len(COLUMNAR_TELEMETRY_MAGIC)) != COLUMNAR_TELEMETRY_MAGIC:
+                raise ValueError(f"{self.path}: not a columnar telemetry file")
+            size = self.path.stat().st_size
+            while True:
+                offset = fh.tell()
+                header = fh.read(_CHUNK_HEADER.size)
+                if len(header) < _CHUNK_HEADER.size:
+                    break
+                codec, length, rows, t0, t1 = _CHUNK_HEADER.unpack(header)
+                data_offset = offset + _CHUNK_HEADER.size
+                if data_offset + length > size:
+                    # Truncated tail from an interrupted recording.
+                    break
+                chunks.append(
+                    ColumnarChunkInfo(
+                        offset=data_offset,
+                        codec=codec,
+                        length=length,
+                        rows=rows,
+                        t0=None if math.isnan(t0) else t0,
+                        t1=None if math.isnan(t1) else t1,
+                    )
+                )
+                fh.seek(data_offset + length)
+        return chunks
+
+    def _read_chunk(self, fh: BinaryIO, chunk: ColumnarChunkInfo) -> list[dict[str, Any]]:
+        fh.seek(chunk.offset)
+        data = fh.read(chunk.length)
+        if chunk.codec == _CODEC_ZSTD:
+            raw = _zstd_module(required=True).ZstdDecompressor().decompress(data)
+        elif chunk.codec == _CODEC_ZLIB:
+            raw = zlib.decompress(data)
+        else:
+            raise ValueError(f"{self.path}: unknown chunk codec {chunk.codec}")
+        return _decode_chunk(json.loads(raw.decode("utf-8")))
+
+    def iter_frames(self, *, start_t_wall: float | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Yield full frames in recording order, decoding one chunk at a time.
+
+        With `start_t_wall`, chunks that end before it are skipped without being
+        decompressed and iteration starts at the first frame with t_wall >= start_t_wall.
+        """
+        with self.path.open("rb") as fh:
+            seeking = start_t_wall is not None
+            for chunk in self.chunks:
+                if seeking and chunk.t1 is not None and chunk.t1 < start_t_wall:  # type: ignore[operator]
+                    continue
+                for frame in self._read_chunk(fh, chunk):
+                    if seeking:
+                        t_wall = frame.get("t_wall")
+                        if isinstance(t_wall, (int, float)) and t_wall < start_t_wall:  # type: ignore[operator]
+                            continue
+                        seeking = False
+                    yield frame
+
+
+def is_columnar_telemetry_path(path: Union[str, Path]) -> bool:
+    return Path(path).suffix == COLUMNAR_TELEMETRY_SUFFIX
+
+
+def iter_columnar_frames(path: Union[str, Path], *, start_t_wall: float | None = None) -> Iterator[dict[str, Any]]:
+    return ColumnarTelemetryReader(path).iter_frames(start_t_wall=start_t_wall)
+
+
+def _unwrap_telemetry_frame(item: Mapping[str, Any]) -> dict[str, Any] | None:
+    """Accept raw frames as well as event envelopes whose payload (or nested payload) is a v2 frame."""
+    if item.get("schema_version") == "v2" or "bios" in item:
+        return dict(item)
+    payload = item.get("payload")
+    if isinstance(payload, Mapping):
+        if payload.get("schema_version") == "v2":
+            return dict(payload)
+        nested = payload.get("payload")
+        if isinstance(nested, Mapping) and nested.get("schema_version") == "v2":
+            return dict(nested)
+    return None
+
+
+def convert_jsonl_to_columnar(
+    source: Union[str, Path],
+    dest: Union[str, Path],
+    *,
+    chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+    compression: str = "auto",
+) -> dict[str, Any]:
+    # telemetry_writer dispatches .tcol reads to this module, so import it lazily.
+    from adapters.event_store.telemetry_writer import TelemetryWriter
+
+    source_path = Path(source)
+    dest_path = Path(dest)
+    skipped = 0
+    with ColumnarTelemetryWriter(dest_path, chunk_frames=chunk_frames, compression=compression) as writer:
+        for item in TelemetryWriter.iter_frames(source_path):
+            frame = _unwrap_telemetry_frame(item) if isinstance(item, Mapping) else None
+            if frame is None:
+                skipped += 1
+                continue
+            writer.append(frame)
+    source_bytes = source_path.stat().st_size
+    dest_bytes = dest_path.stat().st_size
+    return {
+        "source": str(source_path),
+        "dest": str(dest_path),
+        "frames": writer.frames_written,
+        "chunks": writer.chunks_written,
+        "skipped": skipped,
+        "compression": writer.compression,
+        "source_bytes": source_bytes,
+        "dest_bytes": dest_bytes,
+        "ratio": round(source_bytes / dest_bytes, 2) if dest_bytes else None,
+    }
+
+
+__all__ = [
+    "COLUMNAR_COMPRESSIONS",
+    "COLUMNAR_TELEMETRY_SUFFIX",
+    "DEFAULT_CHUNK_FRAMES",
+    "ColumnarChunkInfo",
+    "ColumnarTelemetryReader",
+    "ColumnarTelemetryWriter",
+    "convert_jsonl_to_columnar",
+    "is_columnar_telemetry_path",
+    "iter_columnar_frames",
+]
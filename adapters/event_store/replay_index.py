@@ -0,0 +1,289 @@
+"""
+Seek index for JSONL BIOS replay logs.
+
+The index is a gzip-compressed JSON sidecar (`<log>.idx.gz`) holding one
+keyframe every `every_n_frames` frames: the byte offset and line number of the
+frame, its `seq`/`t_wall`, and the merged BIOS state of all frames before it.
+A replay can then seek to a keyframe and rebuild the exact merged state by
+applying at most `every_n_frames` frames, instead of decoding the log from the
+start. The sidecar records the log's size and mtime and is rebuilt when stale.
+"""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Sequence, Union
+
+REPLAY_INDEX_SCHEMA_VERSION = "replay_index.v1"
+REPLAY_INDEX_SUFFIX = ".idx.gz"
+DEFAULT_INDEX_EVERY_N_FRAMES = 256
+
+
+def extract_bios_frame(item: Mapping[str, Any]) -> dict[str, Any] | None:
+    """Return the v2 BIOS frame of a raw frame, observation event or serialized observation line."""
+    if item.get("schema_version") == "v2" and isinstance(item.get("bios"), Mapping):
+        return item if isinstance(item, dict) else dict(item)
+    payload = item.get("payload")
+    if isinstance(payload, Mapping):
+        if payload.get("schema_version") == "v2" and isinstance(payload.get("bios"), Mapping):
+            return payload if isinstance(payload, dict) else dict(payload)
+        nested = payload.get("payload")
+        if isinstance(nested, Mapping):
+            if nested.get("schema_version") == "v2" and isinstance(nested.get("bios"), Mapping):
+                return nested if isinstance(nested, dict) else dict(nested)
+    return None
+
+
+@dataclass(frozen=True)
+class ReplayKeyframe:
+    frame: int
+    offset: int
+    line: int
+    seq: int | None
+    t_wall: float | None
+    bios: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class ReplayIndex:
+    source_size: int
+    source_mtime_ns: int
+    every_n_frames: int
+    frame_count: int
+    t0: float | None
+    keyframes: tuple[ReplayKeyframe, ...]
+
+    def keyframe_for_seq(self, seq: int) -> ReplayKeyframe:
+        """Latest keyframe at or before `seq` (the first keyframe when none is)."""
+        best = self.keyframes[0]
+        for keyframe in self.keyframes:
+            if keyframe.seq is None:
+                continue
+            if keyframe.seq > seq:
+                break
+            best = keyframe
+        return best
+
+    def keyframe_for_t_wall(self, t_wall: float) -> ReplayKeyframe:
+        """Latest keyframe at or before `t_wall` (the first keyframe when none is)."""
+        timed = [keyframe for keyframe in self.keyframes if keyframe.t_wall is not None]
+        pos = bisect.bisect_right([keyframe.t_wall for keyframe in timed], t_wall)
+        return timed[pos - 1] if pos > 0 else self.keyframes[0]
+
+    def is_current_for(self, path: Union[str, Path]) -> bool:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return False
+        return stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema_version": REPLAY_INDEX_SCHEMA_VERSION,
+            "source_size": self.source_size,
+            "source_mtime_ns": self.source_mtime_ns,
+            "every_n_frames": self.every_n_frames,
+            "frame_count": self.frame_count,
+            "t0": self.t0,
+            "keyframes": [
+                {
+                    "frame": keyframe.frame,
+                    "offset": keyframe.offset,
+                    "line": keyframe.line,
+                    "seq": keyframe.seq,
+                    "t_wall": keyframe.t_wall,
+                    "bios": dict(keyframe.bios),
+                }
+                for keyframe in self.keyframes
+            ],
+        }
+
+
+def default_replay_index_path(path: Union[str, Path]) -> Path:
+    source = Path(path)
+    return source.with_name(source.name + REPLAY_INDEX_SUFFIX)
+
+
+def _as_int(value: Any) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _as_float(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def build_replay_index(
+    path: Union[str, Path],
+    *,
+    every_n_frames: int = DEFAULT_INDEX_EVERY_N_FRAMES,
+) -> ReplayIndex:
+    """Scan a JSONL replay log once and collect keyframes; invalid JSON lines are skipped."""
+    source = Path(path)
+    every_n = max(1, int(every_n_frames))
+    stat = source.stat()
+    keyframes: list[ReplayKeyframe] = []
+    merged: dict[str, Any] = {}
+    frame_count = 0
+    t0: float | None = None
+    line_no = 0
+    with source.open("rb") as fh:
+        while True:
+            offset = fh.tell()
+            line = fh.readline()
+            if not line:
+                break
+            line_no += 1
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                obj = json.loads(text)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            frame = extract_bios_frame(obj) if isinstance(obj, dict) else None
+            if frame is None:
+                continue
+            t_wall = _as_float(frame.get("t_wall"))
+            if t0 is None and t_wall is not None:
+                t0 = t_wall
+            if frame_count % every_n == 0:
+                keyframes.append(
+                    ReplayKeyframe(
+                        frame=frame_count,
+                        offset=offset,
+                        line=line_no - 1,
+                        seq=_as_int(frame.get("seq")),
+                        t_wall=t_wall,
+                        bios=dict(merged),
+                    )
+                )
+            merged.update(frame["bios"])
+            frame_count += 1
+    if not keyframes:
+        keyframes.append(ReplayKeyframe(frame=0, offset=0, line=0, seq=None, t_wall=None, bios={}))
+    return ReplayIndex(
+        source_size=stat.st_size,
+        source_mtime_ns=stat.st_mtime_ns,
+        every_n_frames=every_n,
+        frame_count=frame_count,
+        t0=t0,
+        keyframes=tuple(keyframes),
+    )
+
+
+def _index_from_dict(raw: Mapping[str, Any]) -> ReplayIndex | None:
+    if raw.get("schema_version") != REPLAY_INDEX_SCHEMA_VERSION:
+        return None
+    rows = raw.get("keyframes")
+    if not isinstance(rows, Sequence) or not rows:
+        return None
+    keyframes: list[ReplayKeyframe] = []
+    for row in rows:
+        if not isinstance(row, Mapping) or not isinstance(row.get("bios"), Mapping):
+            return None
+        frame = _as_int(row.get("frame"))
+        offset = _as_int(row.get("offset"))
+        line = _as_int(row.get("line"))
+        if frame is None or offset is None or line is None:
+            return None
+        keyframes.append(
+            ReplayKeyframe(
+                frame=frame,
+                offset=offset,
+                line=line,
+                seq=_as_int(row.get("seq")),
+                t_wall=_as_float(row.get("t_wall")),
+                bios=dict(row["bios"]),
+            )
+        )
+    source_size = _as_int(raw.get("source_size"))
+    source_mtime_ns = _as_int(raw.get("source_mtime_ns"))
+    every_n = _as_int(raw.get("every_n_frames"))
+    frame_count = _as_int(raw.get("frame_count"))
+    if source_size is None or source_mtime_ns is None or every_n is None or frame_count is None:
+        return None
+    return ReplayIndex(
+        source_size=source_size,
+        source_mtime_ns=source_mtime_ns,
+        every_n_frames=every_n,
+        frame_count=frame_count,
+        t0=_as_float(raw.get("t0")),
+        keyframes=tuple(keyframes),
+    )
+
+
+def load_replay_index(index_path: Union[str, Path]) -> ReplayIndex | None:
+    try:
+        with gzip.open(index_path, "rt", encoding="utf-8") as fh:
+            raw = json.load(fh)
+    except (OSError, EOFError, json.JSONDecodeError):
+        return None
+    return _index_from_dict(raw) if isinstance(raw, Mapping) else None
+
+
+def write_replay_index(index: ReplayIndex, index_path: Union[str, Path]) -> Path:
+    dest = Path(index_path)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    temp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            dir=dest.parent,
+            prefix=".replay_index_",
+            suffix=".tmp",
+            delete=False,
+        ) as handle:
+            temp_path = Path(handle.name)
+            with gzip.GzipFile(fileobj=handle, mode="wb") as gz:
+                gz.write(json.dumps(index.to_dict(), ensure_ascii=False, sort_keys=True).encode("utf-8"))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, dest)
+    except OSError:
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+        raise
+    return dest
+
+
+def load_or_build_replay_index(
+    path: Union[str, Path],
+    *,
+    index_path: Union[str, Path, None] = None,
+    every_n_frames: int = DEFAULT_INDEX_EVERY_N_FRAMES,
+) -> ReplayIndex:
+    """Load the sidecar index when it matches the log, else rebuild it and try to save it."""
+    resolved_index_path = Path(index_path) if index_path is not None else default_replay_index_path(path)
+    index = load_replay_index(resolved_index_path)
+    if index is not None and index.is_current_for(path):
+        return index
+    index = build_replay_index(path, every_n_frames=every_n_frames)
+    try:
+        write_replay_index(index, resolved_index_path)
+    except OSError:
+        # Read-only recording directories still get an in-memory index.
+        pass
+    return index
+
+
+__all__ = [
+    "DEFAULT_INDEX_EVERY_N_FRAMES",
+    "REPLAY_INDEX_SCHEMA_VERSION",
+    "REPLAY_INDEX_SUFFIX",
+    "ReplayIndex",
+    "ReplayKeyframe",
+    "build_replay_index",
+    "default_replay_index_path",
+    "extract_bios_frame",
+    "load_or_build_replay_index",
+    "load_replay_index",
+    "write_replay_index",
+]
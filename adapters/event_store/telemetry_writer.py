@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 from typing import Iterable, Iterator, Union
 
+from adapters.event_store.columnar_telemetry import is_columnar_telemetry_path, iter_columnar_frames
 from core.types_v2 import TelemetryFrame
 
 
@@ -51,6 +52,9 @@ class TelemetryWriter:
     @staticmethod
     def iter_frames(path: Union[str, Path]) -> Iterator[dict]:
         path = Path(path)
+        if is_columnar_telemetry_path(path):
+            yield from iter_columnar_frames(path)
+            return
         opener = TelemetryWriter._open_read(path)
         with opener as fh:
             for line in fh:
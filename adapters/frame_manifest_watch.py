@@ -0,0 +1,211 @@
+"""
+Incremental reading and change notification for vision frame manifests.
+
+`ManifestTailer` keeps `frames.jsonl` open between polls and only reads when
+a single `os.stat` shows the file changed size, mtime or inode, so an
+idle live loop no longer reopens and seeks the manifest every iteration.
+
+`DirectoryChangeWaiter` lets a help cycle block until the capture sidecar
+writes into the channel directory. On Linux it waits on an inotify
+descriptor (via ctypes, no extra dependency); elsewhere, or when inotify is
+unavailable, it falls back to a condition-variable wait with a short poll
+interval. The watch is added at construction so writes made before the
+first `wait()` are still queued. `close()` wakes any waiter in both modes:
+inotify waiters also select on a self-pipe, and the descriptors are closed
+only after the last waiter has left `select`, so a closed (and possibly
+reused) descriptor number is never read.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+DEFAULT_FALLBACK_POLL_INTERVAL_S = 0.02
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+
+class ManifestTailer:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.offset = 0
+        self._handle: BinaryIO | None = None
+        self._inode: int | None = None
+        self._read_signature: tuple[int, int] | None = None
+
+    def changed(self, *, force: bool = False) -> bool:
+        """Stat the manifest and report whether unread bytes may exist (reopens on replace/truncate)."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.close()
+            return False
+        replaced = self._inode is not None and stat.st_ino != self._inode
+        if self._handle is None or replaced:
+            self.close()
+            self._handle = self.path.open("rb")
+            self._inode = stat.st_ino
+            if replaced:
+                self.offset = 0
+        if stat.st_size < self.offset:
+            # Truncated in place: start over; callers dedupe frames by frame_id.
+            self.offset = 0
+            self._read_signature = None
+        return force or (stat.st_size, stat.st_mtime_ns) != self._read_signature
+
+    def iter_lines(self) -> Iterator[tuple[int, bytes]]:
+        """Yield `(line_start, line)` from `offset` to EOF; callers advance `offset` as they commit."""
+        if self._handle is None:
+            return
+        stat = os.fstat(self._handle.fileno())
+        self._read_signature = (stat.st_size, stat.st_mtime_ns)
+        self._handle.seek(self.offset)
+        while True:
+            line_start = self._handle.tell()
+            line = self._handle.readline()
+            if not line:
+                return
+            yield line_start, line
+
+    def close(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+        self._handle = None
+        self._inode = None
+        self._read_signature = None
+
+
+class _Inotify:
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+        try:
+            self.wake_fd, self._wake_write_fd = os.pipe()
+        except OSError:
+            os.close(fd)
+            raise
+        os.set_blocking(self._wake_write_fd, False)
+
+    def add_watch(self, directory: Path) -> bool:
+        return self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK) >= 0
+
+    def drain(self) -> None:
+        while True:
+            try:
+                if not os.read(self.fd, 64 * 1024):
+                    return
+            except BlockingIOError:
+                return
+
+    def wake(self) -> None:
+        try:
+            os.write(self._wake_write_fd, b"\0")
+        except BlockingIOError:
+            # The pipe is already full of wake-ups.
+            pass
+
+    def close(self) -> None:
+        for fd in (self.fd, self.wake_fd, self._wake_write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class DirectoryChangeWaiter:
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        poll_interval_s: float = DEFAULT_FALLBACK_POLL_INTERVAL_S,
+        use_inotify: bool = True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.poll_interval_s = max(0.001, float(poll_interval_s))
+        self._cond = threading.Condition()
+        self._closed = False
+        self._watching = False
+        self._active_waiters = 0
+        self._inotify: _Inotify | None = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError):
+                self._inotify = None
+            else:
+                # Watch before the first wait() so writes in between are queued, not lost.
+                self._watching = self._inotify.add_watch(self.directory)
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self._inotify is not None else "polling"
+
+    def wait(self, timeout_s: float) -> bool:
+        """Block up to `timeout_s`; True when the directory (may have) changed and callers should re-read."""
+        timeout_s = max(0.0, float(timeout_s))
+        with self._cond:
+            if self._closed:
+                return False
+            if self._inotify is not None and not self._watching:
+                self._watching = self._inotify.add_watch(self.directory)
+                if self._watching:
+                    # The directory just appeared; anything written before the watch must be re-read.
+                    return True
+            inotify = self._inotify if self._watching else None
+            if inotify is None:
+                # The directory may not exist yet (sidecar not started) or inotify is unavailable.
+                self._cond.wait(timeout=min(timeout_s, self.poll_interval_s))
+                return not self._closed
+            self._active_waiters += 1
+        try:
+            readable, _, _ = select.select([inotify.fd, inotify.wake_fd], [], [], timeout_s)
+            if self._closed or inotify.fd not in readable:
+                return False
+            inotify.drain()
+            return True
+        finally:
+            with self._cond:
+                self._active_waiters -= 1
+                if self._closed and self._active_waiters == 0:
+                    self._release_inotify()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            if self._inotify is not None:
+                self._inotify.wake()
+                if self._active_waiters == 0:
+                    self._release_inotify()
+
+    def _release_inotify(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+__all__ = [
+    "DEFAULT_FALLBACK_POLL_INTERVAL_S",
+    "DirectoryChangeWaiter",
+    "ManifestTailer",
+]
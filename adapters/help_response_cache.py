@@ -0,0 +1,185 @@
+"""
+Bounded LRU/TTL cache of tutor help responses keyed by help-cycle state.
+
+Entries are keyed by a caller-supplied string (live loop: state_key plus a
+generation identity hash that includes the prompt fingerprint) and expire
+`ttl_s` wall-clock seconds after they were stored. When `path` is set the
+cache is loaded at construction; mutations only mark it dirty and `flush()`
+writes one atomic snapshot, so the help path never waits on disk. Replay and
+training sessions pass a persistence-sized TTL so answers survive across runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Mapping
+
+from core.types import TutorResponse
+
+HELP_CACHE_SCHEMA_VERSION = "help_response_cache.v1"
+DEFAULT_HELP_CACHE_MAX_ENTRIES = 32
+DEFAULT_HELP_CACHE_PERSIST_TTL_S = 7 * 24 * 3600.0
+
+_TUTOR_RESPONSE_FIELDS = frozenset(item.name for item in fields(TutorResponse))
+
+
+@dataclass
+class HelpCacheEntry:
+    key: str
+    t_wall: float
+    response: TutorResponse
+
+
+@dataclass
+class HelpCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+def _response_from_dict(raw: Mapping[str, Any]) -> TutorResponse | None:
+    try:
+        return TutorResponse(**{key: value for key, value in raw.items() if key in _TUTOR_RESPONSE_FIELDS})
+    except TypeError:
+        return None
+
+
+class HelpResponseCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_HELP_CACHE_MAX_ENTRIES,
+        ttl_s: float,
+        path: str | Path | None = None,
+    ) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_s = max(0.0, float(ttl_s))
+        self.path = Path(path) if path is not None else None
+        self.stats = HelpCacheStats()
+        self._entries: OrderedDict[str, HelpCacheEntry] = OrderedDict()
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: str, *, now_wall: float) -> HelpCacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if (now_wall - entry.t_wall) > self.ttl_s:
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            self._dirty = True
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def put(self, key: str, response: TutorResponse, *, now_wall: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = HelpCacheEntry(key=key, t_wall=float(now_wall), response=response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        self._dirty = True
+
+    def discard(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write the current entries to `path` if anything changed since the last flush."""
+        if self.path is None or not self._dirty:
+            return
+        self._dirty = False
+        self._save()
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(raw, Mapping) or raw.get("schema_version") != HELP_CACHE_SCHEMA_VERSION:
+            return
+        rows = raw.get("entries")
+        if not isinstance(rows, list):
+            return
+        # Rows are stored oldest first; trim to the newest max_entries.
+        for row in rows[-self.max_entries :] if self.max_entries > 0 else []:
+            if not isinstance(row, Mapping):
+                continue
+            key = row.get("key")
+            t_wall = row.get("t_wall")
+            response_raw = row.get("response")
+            if not isinstance(key, str) or not key or not isinstance(response_raw, Mapping):
+                continue
+            if not isinstance(t_wall, (int, float)) or isinstance(t_wall, bool):
+                continue
+            response = _response_from_dict(response_raw)
+            if response is None:
+                continue
+            self._entries[key] = HelpCacheEntry(key=key, t_wall=float(t_wall), response=response)
+            self._entries.move_to_end(key)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "schema_version": HELP_CACHE_SCHEMA_VERSION,
+            "entries": [
+                {"key": key, "t_wall": entry.t_wall, "response": asdict(entry.response)}
+                for key, entry in self._entries.items()
+            ],
+        }
+        temp_path: Path | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                prefix=".help_response_cache_",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                temp_path = Path(handle.name)
+                handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            if temp_path is not None:
+                try:
+                    temp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+
+__all__ = [
+    "DEFAULT_HELP_CACHE_MAX_ENTRIES",
+    "DEFAULT_HELP_CACHE_PERSIST_TTL_S",
+    "HELP_CACHE_SCHEMA_VERSION",
+    "HelpCacheEntry",
+    "HelpCacheStats",
+    "HelpResponseCache",
+]
@@ -0,0 +1,163 @@
+"""
+Process-wide keep-alive HTTP clients for model endpoints.
+
+Help models, vision-fact extractors and prelabelers used to build one
+`httpx.Client` each, so every replay-eval case (which constructs fresh models)
+paid new TCP/TLS handshakes. `shared_http_client()` hands out one client per
+`(endpoint origin, HttpClientConfig)` with explicit connection limits,
+keep-alive expiry and optional HTTP/2. Callers never close these clients;
+`close_shared_http_clients()` runs at interpreter exit.
+
+Each pooled client counts requests and new TCP connections through httpcore
+trace events, so `http_client_pool_stats()` can report connection reuse.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+DEFAULT_HTTP_MAX_CONNECTIONS = 16
+DEFAULT_HTTP_KEEPALIVE_EXPIRY_S = 60.0
+DEFAULT_HTTP_CONNECT_TIMEOUT_S = 5.0
+_NEW_CONNECTION_TRACE_EVENT = "connection.connect_tcp.started"
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    max_connections: int = DEFAULT_HTTP_MAX_CONNECTIONS
+    max_keepalive_connections: int | None = None
+    keepalive_expiry_s: float = DEFAULT_HTTP_KEEPALIVE_EXPIRY_S
+    connect_timeout_s: float = DEFAULT_HTTP_CONNECT_TIMEOUT_S
+    http2: bool = False
+
+
+@dataclass
+class HttpClientPoolStats:
+    clients: int = 0
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "clients": self.clients,
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+        }
+
+
+def endpoint_origin(base_url: str) -> str:
+    parts = urlsplit(str(base_url).strip())
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def build_request_timeout(timeout_s: float, config: HttpClientConfig | None = None) -> Any:
+    """`httpx.Timeout` whose connect phase is capped separately from read/write/pool."""
+    import httpx
+
+    connect_s = DEFAULT_HTTP_CONNECT_TIMEOUT_S if config is None else config.connect_timeout_s
+    return httpx.Timeout(float(timeout_s), connect=min(float(connect_s), float(timeout_s)))
+
+
+class _ClientCounters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def on_request(self, request: Any) -> None:
+        with self._lock:
+            self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    def _trace(self, event_name: str, info: Any) -> None:
+        if event_name == _NEW_CONNECTION_TRACE_EVENT:
+            with self._lock:
+                self.connections_opened += 1
+
+
+_SHARED_CLIENTS: dict[tuple[str, HttpClientConfig], tuple[Any, _ClientCounters]] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _build_client(config: HttpClientConfig, counters: _ClientCounters) -> Any:
+    try:
+        import httpx
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("httpx is required when no client is injected") from exc
+    if config.http2:
+        try:
+            import h2  # noqa: F401
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("HTTP/2 model connections require the h2 package (httpx[http2])") from exc
+    max_connections = max(1, int(config.max_connections))
+    keepalive = config.max_keepalive_connections
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections if keepalive is None else max(0, int(keepalive)),
+            keepalive_expiry=float(config.keepalive_expiry_s),
+        ),
+        timeout=httpx.Timeout(None, connect=float(config.connect_timeout_s)),
+        http2=bool(config.http2),
+        event_hooks={"request": [counters.on_request]},
+    )
+
+
+def shared_http_client(base_url: str, *, config: HttpClientConfig | None = None) -> Any:
+    """Keep-alive client shared by every caller of the same endpoint origin and config."""
+    effective = config if config is not None else HttpClientConfig()
+    key = (endpoint_origin(base_url), effective)
+    with _SHARED_CLIENTS_LOCK:
+        entry = _SHARED_CLIENTS.get(key)
+        if entry is None:
+            counters = _ClientCounters()
+            entry = (_build_client(effective, counters), counters)
+            _SHARED_CLIENTS[key] = entry
+        return entry[0]
+
+
+def http_client_pool_stats() -> HttpClientPoolStats:
+    with _SHARED_CLIENTS_LOCK:
+        entries = list(_SHARED_CLIENTS.values())
+    stats = HttpClientPoolStats(clients=len(entries))
+    for _client, counters in entries:
+        stats.requests += counters.requests
+        stats.connections_opened += counters.connections_opened
+    return stats
+
+
+def close_shared_http_clients() -> None:
+    with _SHARED_CLIENTS_LOCK:
+        entries = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    for client, _counters in entries:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_shared_http_clients)
+
+
+__all__ = [
+    "DEFAULT_HTTP_CONNECT_TIMEOUT_S",
+    "DEFAULT_HTTP_KEEPALIVE_EXPIRY_S",
+    "DEFAULT_HTTP_MAX_CONNECTIONS",
+    "HttpClientConfig",
+    "HttpClientPoolStats",
+    "build_request_timeout",
+    "close_shared_http_clients",
+    "endpoint_origin",
+    "http_client_pool_stats",
+    "shared_http_client",
+]
@@ -0,0 +1,237 @@
+"""
+Bounded cache of base64 image payloads for multimodal requests.
+
+The help model and the vision-fact extractor both send the same
+`pre_trigger_frame`/`trigger_frame` images in one help cycle (and again on
+retries). `ImagePayloadCache` keys each encoded data URL by
+`(path, mtime_ns, size, mime_type, ImageEncodeOptions)` so a frame file is
+read and encoded once, and evicts least-recently-used entries beyond
+`max_entries` or `max_bytes` of payload text.
+
+`ImageEncodeOptions` optionally transcodes a frame before encoding: it
+downscales to a `max_pixels` budget, re-encodes as JPEG/WebP, and lowers
+quality (then size) until the image fits `max_bytes`. Fewer pixels mean fewer
+VLM prefill tokens, and smaller payloads mean smaller request bodies.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+IMAGE_FORMAT_ORIGINAL = "original"
+IMAGE_FORMAT_JPEG = "jpeg"
+IMAGE_FORMAT_WEBP = "webp"
+IMAGE_FORMATS = (IMAGE_FORMAT_ORIGINAL, IMAGE_FORMAT_JPEG, IMAGE_FORMAT_WEBP)
+DEFAULT_IMAGE_QUALITY = 85
+DEFAULT_IMAGE_CACHE_MAX_ENTRIES = 32
+DEFAULT_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_MIN_TRANSCODE_QUALITY = 40
+_QUALITY_STEP = 15
+_DOWNSCALE_STEP = 0.75
+_MIN_TRANSCODE_SIDE_PX = 64
+_PIL_FORMATS = {IMAGE_FORMAT_JPEG: "JPEG", IMAGE_FORMAT_WEBP: "WEBP"}
+_FORMAT_MIME_TYPES = {IMAGE_FORMAT_JPEG: "image/jpeg", IMAGE_FORMAT_WEBP: "image/webp"}
+
+
+@dataclass(frozen=True)
+class ImageEncodeOptions:
+    format: str = IMAGE_FORMAT_ORIGINAL
+    max_pixels: int | None = None
+    max_bytes: int | None = None
+    quality: int = DEFAULT_IMAGE_QUALITY
+
+    def __post_init__(self) -> None:
+        if self.format not in IMAGE_FORMATS:
+            raise ValueError(f"unsupported image format: {self.format}")
+        if self.max_pixels is not None and self.max_pixels <= 0:
+            raise ValueError("max_pixels must be > 0")
+        if self.max_bytes is not None and self.max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        if not 1 <= int(self.quality) <= 100:
+            raise ValueError("quality must be in [1, 100]")
+
+    @property
+    def transcodes(self) -> bool:
+        return self.format != IMAGE_FORMAT_ORIGINAL or self.max_pixels is not None or self.max_bytes is not None
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    data_url: str
+    mime_type: str
+    source_bytes: int
+    output_bytes: int
+    width: int | None = None
+    height: int | None = None
+    transcoded: bool = False
+
+
+@dataclass
+class ImagePayloadCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def _fit_max_pixels(width: int, height: int, max_pixels: int | None) -> tuple[int, int]:
+    if max_pixels is None or width * height <= max_pixels:
+        return width, height
+    scale = math.sqrt(max_pixels / float(width * height))
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def transcode_image_bytes(raw: bytes, *, mime_type: str, options: ImageEncodeOptions) -> tuple[bytes, str, int, int]:
+    """Apply `options` to encoded image bytes; returns `(bytes, mime_type, width, height)`."""
+    from PIL import Image  # local import keeps text-only model paths free of Pillow
+
+    with Image.open(io.BytesIO(raw)) as opened:
+        source_format = opened.format or "PNG"
+        image = opened.copy()
+    target_format = options.format
+    if target_format == IMAGE_FORMAT_ORIGINAL:
+        # Without an explicit format, only a byte budget forces lossy output.
+        target_format = IMAGE_FORMAT_JPEG if options.max_bytes is not None else IMAGE_FORMAT_ORIGINAL
+    if target_format == IMAGE_FORMAT_JPEG and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    width, height = _fit_max_pixels(image.width, image.height, options.max_pixels)
+    quality = int(options.quality)
+    while True:
+        resized = image if (width, height) == image.size else image.resize((width, height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        if target_format == IMAGE_FORMAT_ORIGINAL:
+            resized.save(buffer, format=source_format)
+            out_mime = mime_type
+        else:
+            resized.save(buffer, format=_PIL_FORMATS[target_format], quality=quality)
+            out_mime = _FORMAT_MIME_TYPES[target_format]
+        data = buffer.getvalue()
+        if options.max_bytes is None or len(data) <= options.max_bytes or target_format == IMAGE_FORMAT_ORIGINAL:
+            return data, out_mime, width, height
+        if quality - _QUALITY_STEP >= _MIN_TRANSCODE_QUALITY:
+            quality -= _QUALITY_STEP
+            continue
+        if min(width, height) * _DOWNSCALE_STEP < _MIN_TRANSCODE_SIDE_PX:
+            # Best effort: the smallest rendition we are willing to send.
+            return data, out_mime, width, height
+        width, height = max(1, int(width * _DOWNSCALE_STEP)), max(1, int(height * _DOWNSCALE_STEP))
+
+
+def encode_image_file(path: Path, *, mime_type: str, options: ImageEncodeOptions | None = None) -> EncodedImage:
+    raw = path.read_bytes()
+    if options is None or not options.transcodes:
+        return EncodedImage(
+            data_url=f"data:{mime_type};base64,{base64.b64encode(raw).decode('ascii')}",
+            mime_type=mime_type,
+            source_bytes=len(raw),
+            output_bytes=len(raw),
+        )
+    data, out_mime, width, height = transcode_image_bytes(raw, mime_type=mime_type, options=options)
+    return EncodedImage(
+        data_url=f"data:{out_mime};base64,{base64.b64encode(data).decode('ascii')}",
+        mime_type=out_mime,
+        source_bytes=len(raw),
+        output_bytes=len(data),
+        width=width,
+        height=height,
+        transcoded=True,
+    )
+
+
+class ImagePayloadCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_IMAGE_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_IMAGE_CACHE_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.stats = ImagePayloadCacheStats()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[object, ...], EncodedImage] = OrderedDict()
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_encode(
+        self,
+        path: Path,
+        *,
+        mime_type: str,
+        options: ImageEncodeOptions | None = None,
+    ) -> tuple[EncodedImage, bool]:
+        """Return `(encoded, cache_hit)`; a changed mtime or size is a new key, so edits are never served stale."""
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size, mime_type, options)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return cached, True
+            self.stats.misses += 1
+        # Encode outside the lock; two racing misses for one frame just encode it twice.
+        encoded = encode_image_file(path, mime_type=mime_type, options=options)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous.data_url)
+            self._entries[key] = encoded
+            self._total_bytes += len(encoded.data_url)
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted.data_url)
+                self.stats.evictions += 1
+        return encoded, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_SHARED_CACHE: ImagePayloadCache | None = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def shared_image_payload_cache() -> ImagePayloadCache:
+    """Process-wide cache shared by help models and vision-fact extractors."""
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = ImagePayloadCache()
+        return _SHARED_CACHE
+
+
+def reset_shared_image_payload_cache() -> None:
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        _SHARED_CACHE = None
+
+
+__all__ = [
+    "DEFAULT_IMAGE_CACHE_MAX_BYTES",
+    "DEFAULT_IMAGE_CACHE_MAX_ENTRIES",
+    "DEFAULT_IMAGE_QUALITY",
+    "EncodedImage",
+    "IMAGE_FORMATS",
+    "IMAGE_FORMAT_JPEG",
+    "IMAGE_FORMAT_ORIGINAL",
+    "IMAGE_FORMAT_WEBP",
+    "ImageEncodeOptions",
+    "ImagePayloadCache",
+    "ImagePayloadCacheStats",
+    "encode_image_file",
+    "reset_shared_image_payload_cache",
+    "shared_image_payload_cache",
+    "transcode_image_bytes",
+]
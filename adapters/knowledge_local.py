@@ -121,10 +121,12 @@ class LocalKnowledgeAdapter(KnowledgePort):
         self._last_retrieve_metadata: dict[str, Any] = {}
         self._index_state: str = "unknown"
         self._index_error_type: str | None = None
-        self.retriever = self._load_retriever(self.index_path)
+        self._retriever_pool_key = str(self.index_path.resolve())
+        self.retriever = self._load_retriever()
 
-    def _load_retriever(self, path: Path) -> BM25Retriever | None:
-        key = str(path.resolve())
+    def _load_retriever(self) -> BM25Retriever | None:
+        path = self.index_path
+        key = self._retriever_pool_key
         if not path.is_file():
             self._index_state = "missing"
             self._index_error_type = None
@@ -145,11 +147,23 @@ class LocalKnowledgeAdapter(KnowledgePort):
             self._retriever_pool[key] = retriever
             self._retriever_pool.move_to_end(key)
             while len(self._retriever_pool) > RETRIEVER_POOL_MAX_SIZE:
-                self._retriever_pool.popitem(last=False)
+                _evicted_key, evicted = self._retriever_pool.popitem(last=False)
+                evicted.close()
             self._index_state = "ready"
             self._index_error_type = None
             return retriever
 
+    def _query_retriever(self, query: str, k: int) -> list[dict[str, Any]]:
+        # Evicted retrievers are closed, so re-acquire ours from the pool if it was dropped;
+        # the pool lock also keeps another adapter from evicting it mid-query.
+        with self._retriever_pool_lock:
+            retriever = self.retriever
+            if retriever is not None and self._retriever_pool.get(self._retriever_pool_key) is not retriever:
+                retriever = self.retriever = self._load_retriever()
+            if retriever is None:
+                return []
+            return retriever.query(query, k=k)
+
     @property
     def has_index(self) -> bool:
         return self.retriever is not None
@@ -304,7 +318,7 @@ class LocalKnowledgeAdapter(KnowledgePort):
                     self._last_retrieve_metadata = dict(meta)
                     return snippets, meta
 
-        raw_results = self.retriever.query(query, k=k)
+        raw_results = self._query_retriever(query, k)
         ranked_snippets = [self._normalize_result(item, idx) for idx, item in enumerate(raw_results)]
         raw_result_count = len(raw_results)
         (
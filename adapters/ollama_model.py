@@ -5,9 +5,12 @@ Ollama-backed ModelPort adapter for HelpResponse generation.
 from __future__ import annotations
 
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Mapping
 
 from adapters.base_help_model import BaseHelpModel
+from adapters.http_client_pool import HttpClientConfig
+from adapters.streaming_json import iter_ollama_stream_content, read_text_stream
 
 
 class OllamaModel(BaseHelpModel):
@@ -23,7 +26,11 @@ class OllamaModel(BaseHelpModel):
         print_model_io: bool = False,
         telemetry_map_path: str | Path | None = None,
         client: object | None = None,
+        http_client_config: HttpClientConfig | None = None,
+        stream: bool = False,
     ) -> None:
+        self.stream = bool(stream)
+        self._runtime_metadata: dict[str, Any] = {}
         super().__init__(
             model_name=model_name,
             base_url=base_url,
@@ -33,20 +40,29 @@ class OllamaModel(BaseHelpModel):
             print_model_io=print_model_io,
             telemetry_map_path=telemetry_map_path,
             client=client,
+            http_client_config=http_client_config,
         )
 
+    def _reset_runtime_metadata(self) -> None:
+        self._runtime_metadata = {}
+
+    def _collect_runtime_metadata(self) -> dict[str, Any]:
+        return dict(self._runtime_metadata)
+
     def _chat(self, messages: list[dict[str, Any]]) -> str:
         payload_messages = self._normalize_messages(messages)
         payload = {
             "model": self.model_name,
             "messages": payload_messages,
-            "stream": False,
+            "stream": self.stream,
             "options": {"temperature": 0},
         }
+        if self.stream:
+            return self._chat_streamed(payload)
         response = self._client.post(
             f"{self.base_url}/api/chat",
             json=payload,
-            timeout=self.timeout_s,
+            timeout=self._request_timeout,
         )
         response.raise_for_status()
         body = response.json()
@@ -60,6 +76,23 @@ class OllamaModel(BaseHelpModel):
             return body["response"]
         raise ValueError("Ollama response missing assistant content")
 
+    def _chat_streamed(self, payload: Mapping[str, Any]) -> str:
+        started = perf_counter()
+        with self._client.stream(
+            "POST",
+            f"{self.base_url}/api/chat",
+            json=payload,
+            timeout=self._request_timeout,
+        ) as response:
+            response.raise_for_status()
+            streamed = read_text_stream(
+                iter_ollama_stream_content(response.iter_lines()),
+                started=started,
+                accept=self._accepts_streamed_help_json,
+            )
+        self._runtime_metadata.update(streamed.to_metadata())
+        return streamed.text
+
     @staticmethod
     def _normalize_messages(messages: list[dict[str, Any]]) -> list[dict[str, str]]:
         normalized: list[dict[str, str]] = []
@@ -0,0 +1,222 @@
+"""
+Per-endpoint capability negotiation cache for OpenAI-compatible backends.
+
+Requests start with the richest payload (json_schema `response_format`,
+request overrides such as `enable_thinking`, image inputs) and fall back after
+a 400 that rejects one of them. The cache remembers those rejections per
+`(base_url, model)` for `ttl_s` seconds so later requests from any model or
+vision-fact extractor instance go straight to the payload shape that works.
+When `path` is set, rejections are loaded at construction and written back
+atomically after each change.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+CAPABILITY_JSON_SCHEMA = "json_schema"
+CAPABILITY_REQUEST_OVERRIDES = "request_overrides"
+CAPABILITY_MULTIMODAL = "multimodal"
+ENDPOINT_CAPABILITIES = (CAPABILITY_JSON_SCHEMA, CAPABILITY_REQUEST_OVERRIDES, CAPABILITY_MULTIMODAL)
+ENDPOINT_CAPABILITY_SCHEMA_VERSION = "endpoint_capabilities.v1"
+DEFAULT_CAPABILITY_TTL_S = 3600.0
+
+
+@dataclass
+class CapabilityRejection:
+    rejected_at: float
+    reason: str
+
+
+@dataclass
+class CapabilityCacheStats:
+    skipped: int = 0
+    rejections: int = 0
+    expirations: int = 0
+
+
+def _endpoint_key(base_url: str, model: str) -> tuple[str, str]:
+    return str(base_url).rstrip("/"), str(model)
+
+
+class EndpointCapabilityCache:
+    def __init__(
+        self,
+        *,
+        ttl_s: float = DEFAULT_CAPABILITY_TTL_S,
+        path: str | Path | None = None,
+    ) -> None:
+        self.ttl_s = max(0.0, float(ttl_s))
+        self.path = Path(path) if path is not None else None
+        self.stats = CapabilityCacheStats()
+        self._lock = threading.Lock()
+        self._rejections: dict[tuple[str, str, str], CapabilityRejection] = {}
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._rejections)
+
+    def rejection(
+        self,
+        base_url: str,
+        model: str,
+        capability: str,
+        *,
+        now: float | None = None,
+    ) -> CapabilityRejection | None:
+        key = (*_endpoint_key(base_url, model), capability)
+        now_wall = time.time() if now is None else float(now)
+        with self._lock:
+            entry = self._rejections.get(key)
+            if entry is None:
+                return None
+            if (now_wall - entry.rejected_at) > self.ttl_s:
+                del self._rejections[key]
+                self.stats.expirations += 1
+                self._save_locked()
+                return None
+            self.stats.skipped += 1
+            return entry
+
+    def is_rejected(self, base_url: str, model: str, capability: str, *, now: float | None = None) -> bool:
+        return self.rejection(base_url, model, capability, now=now) is not None
+
+    def record_rejected(
+        self,
+        base_url: str,
+        model: str,
+        capability: str,
+        *,
+        reason: str = "",
+        now: float | None = None,
+    ) -> None:
+        key = (*_endpoint_key(base_url, model), capability)
+        rejected_at = time.time() if now is None else float(now)
+        with self._lock:
+            self._rejections[key] = CapabilityRejection(rejected_at=rejected_at, reason=str(reason))
+            self.stats.rejections += 1
+            self._save_locked()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rejections.clear()
+            self._save_locked()
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(raw, Mapping) or raw.get("schema_version") != ENDPOINT_CAPABILITY_SCHEMA_VERSION:
+            return
+        rows = raw.get("rejections")
+        if not isinstance(rows, list):
+            return
+        for row in rows:
+            if not isinstance(row, Mapping):
+                continue
+            base_url = row.get("base_url")
+            model = row.get("model")
+            capability = row.get("capability")
+            rejected_at = row.get("rejected_at")
+            if not isinstance(base_url, str) or not isinstance(model, str) or capability not in ENDPOINT_CAPABILITIES:
+                continue
+            if not isinstance(rejected_at, (int, float)) or isinstance(rejected_at, bool):
+                continue
+            reason = row.get("reason")
+            self._rejections[(*_endpoint_key(base_url, model), str(capability))] = CapabilityRejection(
+                rejected_at=float(rejected_at),
+                reason=reason if isinstance(reason, str) else "",
+            )
+
+    def _save_locked(self) -> None:
+        if self.path is None:
+            return
+        payload = {
+            "schema_version": ENDPOINT_CAPABILITY_SCHEMA_VERSION,
+            "rejections": [
+                {
+                    "base_url": base_url,
+                    "model": model,
+                    "capability": capability,
+                    "rejected_at": entry.rejected_at,
+                    "reason": entry.reason,
+                }
+                for (base_url, model, capability), entry in sorted(self._rejections.items())
+            ],
+        }
+        temp_path: Path | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                prefix=".endpoint_capabilities_",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                temp_path = Path(handle.name)
+                handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            if temp_path is not None:
+                try:
+                    temp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+
+_SHARED_CACHES: dict[str | None, EndpointCapabilityCache] = {}
+_SHARED_CACHES_LOCK = threading.Lock()
+
+
+def shared_endpoint_capability_cache(
+    path: str | Path | None = None,
+    *,
+    ttl_s: float | None = None,
+) -> EndpointCapabilityCache:
+    """Process-wide cache per persistence path (None is the in-memory default); `ttl_s` updates it."""
+    key = str(Path(path).expanduser().resolve()) if path else None
+    with _SHARED_CACHES_LOCK:
+        cache = _SHARED_CACHES.get(key)
+        if cache is None:
+            cache = EndpointCapabilityCache(
+                ttl_s=DEFAULT_CAPABILITY_TTL_S if ttl_s is None else ttl_s,
+                path=key,
+            )
+            _SHARED_CACHES[key] = cache
+        elif ttl_s is not None:
+            cache.ttl_s = max(0.0, float(ttl_s))
+        return cache
+
+
+def reset_shared_endpoint_capability_caches() -> None:
+    with _SHARED_CACHES_LOCK:
+        _SHARED_CACHES.clear()
+
+
+__all__ = [
+    "CAPABILITY_JSON_SCHEMA",
+    "CAPABILITY_MULTIMODAL",
+    "CAPABILITY_REQUEST_OVERRIDES",
+    "DEFAULT_CAPABILITY_TTL_S",
+    "ENDPOINT_CAPABILITIES",
+    "ENDPOINT_CAPABILITY_SCHEMA_VERSION",
+    "CapabilityCacheStats",
+    "CapabilityRejection",
+    "EndpointCapabilityCache",
+    "reset_shared_endpoint_capability_caches",
+    "shared_endpoint_capability_cache",
+]
@@ -5,9 +5,19 @@ OpenAI-compatible ModelPort adapter (vLLM/llama.cpp/TGI compatible).
 from __future__ import annotations
 
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Mapping, Sequence
 
 from adapters.base_help_model import BaseHelpModel
+from adapters.http_client_pool import HttpClientConfig
+from adapters.image_payload_cache import ImageEncodeOptions, ImagePayloadCache, shared_image_payload_cache
+from adapters.openai_compat_capabilities import (
+    CAPABILITY_JSON_SCHEMA,
+    CAPABILITY_MULTIMODAL,
+    CAPABILITY_REQUEST_OVERRIDES,
+    EndpointCapabilityCache,
+    shared_endpoint_capability_cache,
+)
 from adapters.openai_compat_multimodal import (
     MultimodalRequestRejected,
     build_multimodal_image_contents,
@@ -22,7 +32,9 @@ from adapters.openai_compat_multimodal import (
     normalize_frame_payload,
     strip_images_from_messages,
     summarize_frame_failures,
+    summarize_image_payloads,
 )
+from adapters.streaming_json import iter_openai_stream_content, read_text_stream
 from core.llm_schema import get_help_response_schema
 
 
@@ -48,8 +60,19 @@ class OpenAICompatModel(BaseHelpModel):
         max_local_image_bytes: int | None = None,
         telemetry_map_path: str | Path | None = None,
         client: object | None = None,
+        http_client_config: HttpClientConfig | None = None,
+        capability_cache: EndpointCapabilityCache | None = None,
+        stream: bool = False,
+        image_encode_options: ImageEncodeOptions | None = None,
+        image_cache: ImagePayloadCache | None = None,
     ) -> None:
         self.api_key = api_key
+        self.stream = bool(stream)
+        self.image_encode_options = image_encode_options
+        # Shared with the vision-fact extractor so each frame is read and encoded once per help cycle.
+        self.image_cache = image_cache if image_cache is not None else shared_image_payload_cache()
+        # Shared by default so every model/extractor for an endpoint skips known-rejected features.
+        self.capability_cache = capability_cache if capability_cache is not None else shared_endpoint_capability_cache()
         self.max_tokens = int(max_tokens) if isinstance(max_tokens, int) and max_tokens > 0 else None
         self.enable_multimodal = bool(enable_multimodal)
         self.allowed_local_image_roots = normalize_allowed_local_image_roots(allowed_local_image_roots)
@@ -72,6 +95,7 @@ class OpenAICompatModel(BaseHelpModel):
             print_model_io=print_model_io,
             telemetry_map_path=telemetry_map_path,
             client=client,
+            http_client_config=http_client_config,
         )
 
     def _reset_runtime_metadata(self) -> None:
@@ -114,6 +138,7 @@ class OpenAICompatModel(BaseHelpModel):
                 "multimodal_path_success": False,
                 "multimodal_fallback_to_text": False,
                 "multimodal_failure_reason": multimodal_spec["failure_reason"],
+                **summarize_image_payloads(multimodal_spec["image_payloads"]),
             }
         )
         if not self.enable_multimodal or not multimodal_spec["image_contents"]:
@@ -153,10 +178,23 @@ class OpenAICompatModel(BaseHelpModel):
             headers["Authorization"] = f"Bearer {self.api_key}"
 
         if self._messages_contain_images(messages):
+            known_rejection = self.capability_cache.rejection(self.base_url, self.model_name, CAPABILITY_MULTIMODAL)
+            if known_rejection is not None:
+                self._note_capability_skipped(CAPABILITY_MULTIMODAL)
+                self._runtime_metadata["multimodal_path_attempted"] = False
+                self._runtime_metadata["multimodal_path_success"] = False
+                self._runtime_metadata["multimodal_fallback_to_text"] = True
+                self._runtime_metadata["multimodal_failure_reason"] = (
+                    known_rejection.reason or "server rejected multimodal request"
+                )
+                stripped_messages = self._strip_images_from_messages(messages)
+                messages[:] = [dict(item) for item in stripped_messages]
+                return self._chat_once(stripped_messages, headers=headers, has_vision=False)
             self._runtime_metadata["multimodal_path_attempted"] = True
             try:
                 content = self._chat_once(messages, headers=headers, has_vision=True)
             except MultimodalRequestRejected as exc:
+                self._note_capability_rejected(CAPABILITY_MULTIMODAL, reason=str(exc))
                 self._runtime_metadata["multimodal_path_success"] = False
                 self._runtime_metadata["multimodal_fallback_to_text"] = True
                 self._runtime_metadata["multimodal_failure_reason"] = str(exc)
@@ -186,8 +224,9 @@ class OpenAICompatModel(BaseHelpModel):
         headers: Mapping[str, str],
         has_vision: bool,
     ) -> str:
-        include_json_schema = True
-        include_request_overrides = True
+        include_json_schema = self._capability_usable(CAPABILITY_JSON_SCHEMA)
+        include_request_overrides = self._capability_usable(CAPABILITY_REQUEST_OVERRIDES)
+        url = f"{self.base_url}/v1/chat/completions"
         while True:
             payload = self._build_chat_payload(
                 messages,
@@ -195,20 +234,44 @@ class OpenAICompatModel(BaseHelpModel):
                 include_request_overrides=include_request_overrides,
                 has_vision=has_vision,
             )
-            response = self._client.post(
-                f"{self.base_url}/v1/chat/completions",
-                json=payload,
-                headers=headers,
-                timeout=self.timeout_s,
-            )
+            if self.stream:
+                payload["stream"] = True
+                started = perf_counter()
+                with self._client.stream(
+                    "POST",
+                    url,
+                    json=payload,
+                    headers=headers,
+                    timeout=self._request_timeout,
+                ) as response:
+                    status_code = getattr(response, "status_code", None)
+                    if isinstance(status_code, int) and status_code < 400:
+                        return self._read_streamed_content(response, started=started)
+                    # Error bodies are small; read them so the 400 fallbacks below can inspect them.
+                    response.read()
+            else:
+                response = self._client.post(
+                    url,
+                    json=payload,
+                    headers=headers,
+                    timeout=self._request_timeout,
+                )
             status_code = getattr(response, "status_code", None)
             if not isinstance(status_code, int) or status_code != 400:
                 break
             if include_request_overrides and self._is_request_override_unsupported_400(response):
                 include_request_overrides = False
+                self._note_capability_rejected(
+                    CAPABILITY_REQUEST_OVERRIDES,
+                    reason=self._extract_response_error_text(response),
+                )
                 continue
             if include_json_schema and self._is_json_schema_unsupported_400(response):
                 include_json_schema = False
+                self._note_capability_rejected(
+                    CAPABILITY_JSON_SCHEMA,
+                    reason=self._extract_response_error_text(response),
+                )
                 continue
             break
 
@@ -221,6 +284,23 @@ class OpenAICompatModel(BaseHelpModel):
             raise ValueError("OpenAI-compatible response must be a JSON object")
         return self._extract_content_from_body(body)
 
+    def _capability_usable(self, capability: str) -> bool:
+        if self.capability_cache.is_rejected(self.base_url, self.model_name, capability):
+            self._note_capability_skipped(capability)
+            return False
+        return True
+
+    def _note_capability_skipped(self, capability: str) -> None:
+        skipped = self._runtime_metadata.setdefault("endpoint_capabilities_skipped", [])
+        if capability not in skipped:
+            skipped.append(capability)
+
+    def _note_capability_rejected(self, capability: str, *, reason: str) -> None:
+        self.capability_cache.record_rejected(self.base_url, self.model_name, capability, reason=reason)
+        rejected = self._runtime_metadata.setdefault("endpoint_capabilities_rejected", [])
+        if capability not in rejected:
+            rejected.append(capability)
+
     def _extract_content_from_body(self, body: Mapping[str, object]) -> str:
         if not isinstance(body, Mapping):
             raise ValueError("OpenAI-compatible response must be a JSON object")
@@ -236,6 +316,24 @@ class OpenAICompatModel(BaseHelpModel):
             return message["content"]
         raise ValueError("OpenAI-compatible response missing choices[0].message.content")
 
+    def _read_streamed_content(self, response: Any, *, started: float) -> str:
+        headers = getattr(response, "headers", None) or {}
+        content_type = str(headers.get("content-type", ""))
+        if "text/event-stream" not in content_type:
+            # Some servers ignore `stream` and answer with a regular completion body.
+            response.read()
+            body = response.json()
+            if not isinstance(body, Mapping):
+                raise ValueError("OpenAI-compatible response must be a JSON object")
+            return self._extract_content_from_body(body)
+        streamed = read_text_stream(
+            iter_openai_stream_content(response.iter_lines()),
+            started=started,
+            accept=self._accepts_streamed_help_json,
+        )
+        self._runtime_metadata.update(streamed.to_metadata())
+        return streamed.text
+
     def _build_chat_payload(
         self,
         messages: list[dict[str, Any]],
@@ -323,6 +421,7 @@ class OpenAICompatModel(BaseHelpModel):
                 "secondary_frame_id": None,
                 "secondary_frame_role": None,
                 "failure_reason": None,
+                "image_payloads": [],
             }
 
         candidate_frames = self._candidate_multimodal_frames(vision)
@@ -345,11 +444,14 @@ class OpenAICompatModel(BaseHelpModel):
                 "secondary_frame_id": candidate_frame_ids[1] if len(candidate_frame_ids) > 1 else None,
                 "secondary_frame_role": self._frame_role(candidate_frames[1]) if len(candidate_frames) > 1 else None,
                 "failure_reason": None,
+                "image_payloads": [],
             }
         multimodal_built = build_multimodal_image_contents(
             candidate_frames,
             allowed_local_image_roots=self.allowed_local_image_roots,
             max_local_image_bytes=self.max_local_image_bytes,
+            encode_options=self.image_encode_options,
+            image_cache=self.image_cache,
         )
         image_contents = multimodal_built["image_contents"]
         frame_ids = multimodal_built["frame_ids"]
@@ -369,6 +471,7 @@ class OpenAICompatModel(BaseHelpModel):
             "secondary_frame_id": frame_ids[1] if len(frame_ids) > 1 else None,
             "secondary_frame_role": self._frame_role(successful_frames[1]) if len(successful_frames) > 1 else None,
             "failure_reason": failure_reason,
+            "image_payloads": multimodal_built["image_payloads"],
         }
 
     def _candidate_multimodal_frames(self, vision: Mapping[str, Any]) -> list[dict[str, Any]]:
@@ -503,6 +606,11 @@ class OpenAICompatModel(BaseHelpModel):
             "multimodal_path_success": False,
             "multimodal_fallback_to_text": False,
             "multimodal_failure_reason": None,
+            "multimodal_image_cache_hits": 0,
+            "multimodal_image_output_bytes": 0,
+            "multimodal_image_payloads": [],
+            "endpoint_capabilities_skipped": [],
+            "endpoint_capabilities_rejected": [],
         }
 
     @staticmethod
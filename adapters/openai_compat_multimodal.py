@@ -4,12 +4,13 @@ Shared multimodal helpers for OpenAI-compatible adapters.
 
 from __future__ import annotations
 
-import base64
 import mimetypes
 from pathlib import Path
 import re
 from typing import Any, Mapping, Sequence
 
+from adapters.image_payload_cache import EncodedImage, ImageEncodeOptions, ImagePayloadCache, encode_image_file
+
 
 class MultimodalRequestRejected(RuntimeError):
     """Raised when the upstream server rejects multimodal content."""
@@ -29,7 +30,28 @@ def frame_to_data_url(
     *,
     allowed_local_image_roots: Sequence[Path],
     max_local_image_bytes: int,
+    encode_options: ImageEncodeOptions | None = None,
+    image_cache: ImagePayloadCache | None = None,
 ) -> str:
+    encoded, _ = encode_frame_image(
+        frame,
+        allowed_local_image_roots=allowed_local_image_roots,
+        max_local_image_bytes=max_local_image_bytes,
+        encode_options=encode_options,
+        image_cache=image_cache,
+    )
+    return encoded.data_url
+
+
+def encode_frame_image(
+    frame: Mapping[str, Any],
+    *,
+    allowed_local_image_roots: Sequence[Path],
+    max_local_image_bytes: int,
+    encode_options: ImageEncodeOptions | None = None,
+    image_cache: ImagePayloadCache | None = None,
+) -> tuple[EncodedImage, bool]:
+    """Validate a local frame path and encode it; returns `(encoded, cache_hit)`."""
     raw_url = frame.get("image_uri") or frame.get("source_image_path")
     if not isinstance(raw_url, str) or not raw_url.strip():
         raise ValueError("vision frame is missing image_uri/source_image_path")
@@ -53,8 +75,9 @@ def frame_to_data_url(
     mime_type = frame.get("mime_type")
     if not isinstance(mime_type, str) or not mime_type:
         mime_type = mimetypes.guess_type(path.name)[0] or "image/png"
-    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
-    return f"data:{mime_type};base64,{encoded}"
+    if image_cache is not None:
+        return image_cache.get_or_encode(path, mime_type=mime_type, options=encode_options)
+    return encode_image_file(path, mime_type=mime_type, options=encode_options), False
 
 
 def build_multimodal_image_contents(
@@ -62,31 +85,46 @@ def build_multimodal_image_contents(
     *,
     allowed_local_image_roots: Sequence[Path],
     max_local_image_bytes: int,
+    encode_options: ImageEncodeOptions | None = None,
+    image_cache: ImagePayloadCache | None = None,
 ) -> dict[str, Any]:
     image_contents: list[dict[str, Any]] = []
     frame_ids: list[str] = []
     successful_frames: list[dict[str, Any]] = []
     failed_frame_ids: list[str] = []
     frame_failures: dict[str, str] = {}
+    image_payloads: list[dict[str, Any]] = []
     failure_reason: str | None = None
     for frame in candidate_frames:
         frame_id = frame.get("frame_id")
         if not isinstance(frame_id, str) or not frame_id:
             continue
         try:
-            data_url = frame_to_data_url(
+            encoded, cache_hit = encode_frame_image(
                 frame,
                 allowed_local_image_roots=allowed_local_image_roots,
                 max_local_image_bytes=max_local_image_bytes,
+                encode_options=encode_options,
+                image_cache=image_cache,
             )
         except Exception as exc:
             failure = f"{type(exc).__name__}: {exc}"
             failed_frame_ids.append(frame_id)
             frame_failures[frame_id] = failure
             continue
-        image_contents.append({"type": "image_url", "image_url": {"url": data_url}})
+        image_contents.append({"type": "image_url", "image_url": {"url": encoded.data_url}})
         frame_ids.append(frame_id)
         successful_frames.append(dict(frame))
+        image_payloads.append(
+            {
+                "frame_id": frame_id,
+                "cache_hit": cache_hit,
+                "mime_type": encoded.mime_type,
+                "source_bytes": encoded.source_bytes,
+                "output_bytes": encoded.output_bytes,
+                "transcoded": encoded.transcoded,
+            }
+        )
 
     if frame_failures:
         failure_reason = summarize_frame_failures(frame_failures)
@@ -97,6 +135,16 @@ def build_multimodal_image_contents(
         "failed_frame_ids": failed_frame_ids,
         "frame_failures": frame_failures,
         "failure_reason": failure_reason,
+        "image_payloads": image_payloads,
+    }
+
+
+def summarize_image_payloads(image_payloads: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    """Per-request image metadata: cache hits and bytes actually sent."""
+    return {
+        "multimodal_image_cache_hits": sum(1 for item in image_payloads if item.get("cache_hit")),
+        "multimodal_image_output_bytes": sum(int(item.get("output_bytes") or 0) for item in image_payloads),
+        "multimodal_image_payloads": [dict(item) for item in image_payloads],
     }
 
 
@@ -317,6 +365,7 @@ __all__ = [
     "build_multimodal_image_contents",
     "coerce_frame_mapping",
     "copy_messages_for_payload",
+    "encode_frame_image",
     "extract_response_error_text",
     "frame_to_data_url",
     "is_json_schema_unsupported_400",
@@ -327,4 +376,5 @@ __all__ = [
     "normalize_frame_payload",
     "strip_images_from_messages",
     "summarize_frame_failures",
+    "summarize_image_payloads",
 ]
@@ -1,5 +1,10 @@
 """
 Pack-level precondition/completion gates for deterministic help context.
+
+`CompiledPackGates` compiles every step's rules once (see `core.gating.compile_rules`)
+and evaluates the whole pack against one observation history in a single pass;
+`load_compiled_pack_gates` caches programs per (pack, scenario profile) next to
+the `load_pack_gate_config` cache.
 """
 
 from __future__ import annotations
@@ -10,7 +15,7 @@ from typing import Any, Iterable, Mapping
 
 import yaml
 
-from core.gating import GatingEngine
+from core.gating import CompiledRuleSet, GateEvalContext, ObservationHistory, compile_rules
 
 _GATE_FIELD_NAMES = ("precondition_gates", "completion_gates")
 DEFAULT_SCENARIO_PROFILE = "airfield"
@@ -154,35 +159,6 @@ def _default_reason_code(step_id: str, gate_type: str, rule: Mapping[str, Any],
     return f"{step_id.lower()}_{gate_type}_{op_text}_{key_text}"
 
 
-def _evaluate_gate_rules(
-    *,
-    step_id: str,
-    gate_type: str,
-    rules: Iterable[Mapping[str, Any]],
-    observations: list[dict[str, Any]],
-) -> tuple[bool, str, str | None]:
-    normalized_rules = [dict(rule) for rule in rules]
-    if not normalized_rules:
-        return True, "no_rules", None
-
-    engine = GatingEngine(normalized_rules)
-    result, failed_rule_index = engine.evaluate_with_failure_index_from_history(observations)
-    if result.allowed:
-        return True, "ok", None
-
-    failed_idx = failed_rule_index if isinstance(failed_rule_index, int) and failed_rule_index >= 0 else 0
-    rule = normalized_rules[failed_idx]
-    reason_code_raw = rule.get("reason_code")
-    reason_code = (
-        reason_code_raw.strip()
-        if isinstance(reason_code_raw, str) and reason_code_raw.strip()
-        else _default_reason_code(step_id, gate_type, rule, failed_idx)
-    )
-    reason_raw = rule.get("reason")
-    reason = reason_raw.strip() if isinstance(reason_raw, str) and reason_raw.strip() else result.reason
-    return False, reason_code, reason
-
-
 def _coerce_rules_iterable(raw: Any) -> tuple[Mapping[str, Any], ...]:
     if raw is None:
         return ()
@@ -200,6 +176,116 @@ def _coerce_rules_iterable(raw: Any) -> tuple[Mapping[str, Any], ...]:
     return tuple(out)
 
 
+def _rule_reason_code(step_id: str, gate_type: str, rule: Mapping[str, Any], index: int) -> str:
+    reason_code_raw = rule.get("reason_code")
+    if isinstance(reason_code_raw, str) and reason_code_raw.strip():
+        return reason_code_raw.strip()
+    return _default_reason_code(step_id, gate_type, rule, index)
+
+
+def _rule_reason(rule: Mapping[str, Any]) -> str | None:
+    reason_raw = rule.get("reason")
+    return reason_raw.strip() if isinstance(reason_raw, str) and reason_raw.strip() else None
+
+
+class _CompiledGate:
+    __slots__ = ("gate_id", "step_id", "gate_type", "program", "reason_codes", "reasons")
+
+    def __init__(self, *, step_id: str, gate_type: str, rules: Iterable[Mapping[str, Any]]) -> None:
+        normalized_rules = [dict(rule) for rule in rules]
+        self.gate_id = f"{step_id}.{gate_type}"
+        self.step_id = step_id
+        self.gate_type = gate_type
+        self.program: CompiledRuleSet = compile_rules(normalized_rules)
+        # Reason code/text overrides resolved per rule so a failure only indexes into them.
+        self.reason_codes = tuple(
+            _rule_reason_code(step_id, gate_type, rule, idx) for idx, rule in enumerate(normalized_rules)
+        )
+        self.reasons = tuple(_rule_reason(rule) for rule in normalized_rules)
+
+    def evaluate(self, ctx: GateEvalContext) -> dict[str, Any]:
+        if not len(self.program):
+            allowed, reason_code, reason = True, "no_rules", None
+        else:
+            failed_idx, why = self.program.first_failure(ctx)
+            if failed_idx is None:
+                allowed, reason_code, reason = True, "ok", None
+            else:
+                allowed = False
+                reason_code = self.reason_codes[failed_idx]
+                reason = self.reasons[failed_idx] or why
+        return {
+            "step_id": self.step_id,
+            "gate_type": self.gate_type,
+            "status": "allowed" if allowed else "blocked",
+            "allowed": allowed,
+            "reason_code": reason_code,
+            "reason": reason,
+        }
+
+
+class CompiledPackGates:
+    def __init__(
+        self,
+        *,
+        precondition_gates: Mapping[str, Iterable[Mapping[str, Any]]],
+        completion_gates: Mapping[str, Iterable[Mapping[str, Any]]],
+    ) -> None:
+        step_ids = sorted(
+            {step_id for step_id in precondition_gates.keys() if isinstance(step_id, str)}
+            | {step_id for step_id in completion_gates.keys() if isinstance(step_id, str)},
+            key=_step_sort_key,
+        )
+        gates: list[_CompiledGate] = []
+        for step_id in step_ids:
+            for gate_type, gate_map in (
+                ("precondition", precondition_gates),
+                ("completion", completion_gates),
+            ):
+                gates.append(
+                    _CompiledGate(
+                        step_id=step_id,
+                        gate_type=gate_type,
+                        rules=_coerce_rules_iterable(gate_map.get(step_id, ())),
+                    )
+                )
+        self._gates = tuple(gates)
+
+    @property
+    def gate_ids(self) -> tuple[str, ...]:
+        return tuple(gate.gate_id for gate in self._gates)
+
+    def evaluate(self, observations: Iterable[Mapping[str, Any]] | ObservationHistory) -> dict[str, dict[str, Any]]:
+        if isinstance(observations, ObservationHistory):
+            if not len(observations):
+                return {}
+            ctx = GateEvalContext(observations)
+        else:
+            obs_list = [dict(item) for item in observations if isinstance(item, Mapping)]
+            if not obs_list:
+                return {}
+            ctx = GateEvalContext(obs_list)
+        return {gate.gate_id: gate.evaluate(ctx) for gate in self._gates}
+
+
+@lru_cache(maxsize=16)
+def _load_compiled_pack_gates_cached(resolved_pack_path: str, scenario_profile: str) -> CompiledPackGates:
+    config = load_pack_gate_config(resolved_pack_path, scenario_profile=scenario_profile)
+    return CompiledPackGates(
+        precondition_gates=config["precondition_gates"],
+        completion_gates=config["completion_gates"],
+    )
+
+
+def load_compiled_pack_gates(
+    pack_path: str | Path | None = None,
+    *,
+    scenario_profile: str | None = None,
+) -> CompiledPackGates:
+    path = Path(pack_path) if pack_path else _default_pack_path()
+    return _load_compiled_pack_gates_cached(str(path.resolve()), normalize_scenario_profile(scenario_profile))
+
+
 def evaluate_pack_gates(
     *,
     observations: Iterable[Mapping[str, Any]],
@@ -209,42 +295,16 @@ def evaluate_pack_gates(
     obs_list = [dict(item) for item in observations if isinstance(item, Mapping)]
     if not obs_list:
         return {}
-
-    step_ids = sorted(
-        {step_id for step_id in precondition_gates.keys() if isinstance(step_id, str)}
-        | {step_id for step_id in completion_gates.keys() if isinstance(step_id, str)},
-        key=_step_sort_key,
-    )
-
-    out: dict[str, dict[str, Any]] = {}
-    for step_id in step_ids:
-        for gate_type, gate_map in (
-            ("precondition", precondition_gates),
-            ("completion", completion_gates),
-        ):
-            rules = gate_map.get(step_id, ())
-            allowed, reason_code, reason = _evaluate_gate_rules(
-                step_id=step_id,
-                gate_type=gate_type,
-                rules=_coerce_rules_iterable(rules),
-                observations=obs_list,
-            )
-            gate_id = f"{step_id}.{gate_type}"
-            out[gate_id] = {
-                "step_id": step_id,
-                "gate_type": gate_type,
-                "status": "allowed" if allowed else "blocked",
-                "allowed": allowed,
-                "reason_code": reason_code,
-                "reason": reason,
-            }
-    return out
+    compiled = CompiledPackGates(precondition_gates=precondition_gates, completion_gates=completion_gates)
+    return compiled.evaluate(obs_list)
 
 
 __all__ = [
+    "CompiledPackGates",
     "DEFAULT_SCENARIO_PROFILE",
     "SUPPORTED_SCENARIO_PROFILES",
     "evaluate_pack_gates",
+    "load_compiled_pack_gates",
     "load_pack_gate_config",
     "normalize_scenario_profile",
 ]
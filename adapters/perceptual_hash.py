@@ -0,0 +1,115 @@
+"""
+Difference hashes (dHash) for cockpit frames.
+
+A frame is hashed per `vision_layout.yaml` region when it is ingested, so two
+captures of the same MFD pages hash to (nearly) the same bits even when
+unrelated parts of the screen changed. Hashes are hex strings so they survive
+JSON payloads and event logs unchanged.
+
+A 16x16 dHash cannot tell small glyph changes apart (INS "GRND" vs "OK" differ
+by 0-3 bits), so text regions and whole frames append a digest of their 4-bit
+grayscale pixels. Any glyph change flips about half of the digest bits, which
+keeps such hashes far apart under `hamming_distance`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Collection, Mapping
+
+from PIL import Image
+
+DEFAULT_DHASH_SIZE = 16
+CONTENT_DIGEST_BYTES = 16
+WHOLE_FRAME_REGION_ID = "frame"
+_FILE_HASH_CACHE_MAX_ENTRIES = 64
+_QUANTIZE_4BIT = [value >> 4 for value in range(256)]
+
+
+def dhash_image(image: Image.Image, *, hash_size: int = DEFAULT_DHASH_SIZE) -> str:
+    """`hash_size**2`-bit horizontal-gradient hash as fixed-width hex."""
+    small = image.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR)
+    pixels = small.tobytes()
+    row_width = hash_size + 1
+    value = 0
+    for row in range(hash_size):
+        offset = row * row_width
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] < pixels[offset + col + 1])
+    return f"{value:0{(hash_size * hash_size + 3) // 4}x}"
+
+
+def content_digest(image: Image.Image) -> str:
+    """128-bit digest of the image's 4-bit grayscale pixels as hex; tolerant only of sub-step color noise."""
+    quantized = image.convert("L").point(_QUANTIZE_4BIT)
+    return hashlib.blake2b(quantized.tobytes(), digest_size=CONTENT_DIGEST_BYTES).hexdigest()
+
+
+def text_dhash(image: Image.Image, *, hash_size: int = DEFAULT_DHASH_SIZE) -> str:
+    """dHash followed by `content_digest`, so unchanged text matches exactly and edited text never does."""
+    return dhash_image(image, hash_size=hash_size) + content_digest(image)
+
+
+def region_dhashes(
+    image: Image.Image,
+    boxes: Mapping[str, tuple[int, int, int, int]],
+    *,
+    text_regions: Collection[str] = (),
+    hash_size: int = DEFAULT_DHASH_SIZE,
+) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for region_id, box in boxes.items():
+        crop = image.crop(box)
+        hasher = text_dhash if region_id in text_regions else dhash_image
+        out[region_id] = hasher(crop, hash_size=hash_size)
+    return out
+
+
+def hamming_distance(left: str, right: str) -> int:
+    return (int(left, 16) ^ int(right, 16)).bit_count()
+
+
+def region_hash_distance(left: Mapping[str, str], right: Mapping[str, str]) -> int | None:
+    """Largest per-region distance, or None when the two frames were hashed over different regions."""
+    if left.keys() != right.keys() or not left:
+        return None
+    return max(hamming_distance(left[region_id], right[region_id]) for region_id in left)
+
+
+_FILE_HASHES: OrderedDict[tuple[str, int, int], dict[str, str]] = OrderedDict()
+_FILE_HASHES_LOCK = threading.Lock()
+
+
+def file_dhashes(path: Path, *, hash_size: int = DEFAULT_DHASH_SIZE) -> dict[str, str]:
+    """Whole-frame `text_dhash` for frames that arrive without ingest-time region hashes, memoized per file version."""
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _FILE_HASHES_LOCK:
+        cached = _FILE_HASHES.get(key)
+        if cached is not None:
+            _FILE_HASHES.move_to_end(key)
+            return dict(cached)
+    with Image.open(path) as image:
+        hashes = {WHOLE_FRAME_REGION_ID: text_dhash(image, hash_size=hash_size)}
+    with _FILE_HASHES_LOCK:
+        _FILE_HASHES[key] = hashes
+        while len(_FILE_HASHES) > _FILE_HASH_CACHE_MAX_ENTRIES:
+            _FILE_HASHES.popitem(last=False)
+    return dict(hashes)
+
+
+__all__ = [
+    "CONTENT_DIGEST_BYTES",
+    "DEFAULT_DHASH_SIZE",
+    "WHOLE_FRAME_REGION_ID",
+    "content_digest",
+    "dhash_image",
+    "file_dhashes",
+    "hamming_distance",
+    "region_dhashes",
+    "region_hash_distance",
+    "text_dhash",
+]
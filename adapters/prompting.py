@@ -4,6 +4,7 @@ Help prompt builder with strict JSON/output constraints.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import math
@@ -182,6 +183,18 @@ _DEFAULT_TARGET_INTERACTION_HINTS = {
 }
 
 
+# Bump whenever the help prompt wording or layout changes (here or in
+# adapters/vision_prompting.py); persisted help responses keyed on the old
+# version are then no longer served.
+HELP_PROMPT_VERSION = "1"
+
+
+def help_prompt_fingerprint() -> str:
+    """`HELP_PROMPT_VERSION` plus a short hash of the rendered HelpResponse schema."""
+    schema_text = json.dumps(get_help_response_schema(), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return f"v{HELP_PROMPT_VERSION}-{hashlib.sha256(schema_text.encode('utf-8')).hexdigest()[:16]}"
+
+
 def _default_ui_map_path() -> Path:
     return Path(__file__).resolve().parents[1] / "packs" / "fa18c_startup" / "ui_map.yaml"
 
@@ -1632,6 +1645,7 @@ def build_help_prompt(context: Mapping[str, Any], lang: str) -> str:
 
 
 __all__ = [
+    "HELP_PROMPT_VERSION",
     "MAX_DELTA_SUMMARY_ITEMS",
     "MAX_RECENT_ACTIONS_SIGNAL_ITEMS",
     "MAX_PROMPT_CHARS",
@@ -1639,4 +1653,5 @@ __all__ = [
     "PromptBuildResult",
     "build_help_prompt",
     "build_help_prompt_result",
+    "help_prompt_fingerprint",
 ]
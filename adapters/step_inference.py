@@ -16,7 +16,9 @@ import yaml
 
 from adapters.pack_gates import (
     DEFAULT_SCENARIO_PROFILE,
+    CompiledPackGates,
     evaluate_pack_gates,
+    load_compiled_pack_gates,
     load_pack_gate_config,
     normalize_scenario_profile,
 )
@@ -346,6 +348,14 @@ def infer_step_id(
         gates=gates,
         precondition_gates=pre_map,
         completion_gates=comp_map,
+        compiled_gates=(
+            load_compiled_pack_gates(
+                effective_pack_path,
+                scenario_profile=_normalize_scenario_profile_for_inference(scenario_profile),
+            )
+            if precondition_gates is None and completion_gates is None
+            else None
+        ),
     )
 
     soft_candidate: tuple[str, tuple[str, ...]] | None = None
@@ -611,6 +621,7 @@ def _resolve_gate_statuses(
     gates: Mapping[str, Any] | None,
     precondition_gates: Mapping[str, IterableABC[Mapping[str, Any]]],
     completion_gates: Mapping[str, IterableABC[Mapping[str, Any]]],
+    compiled_gates: CompiledPackGates | None = None,
 ) -> dict[str, dict[str, Any]]:
     provided: dict[str, dict[str, Any]] = {}
     if isinstance(gates, Mapping):
@@ -635,11 +646,14 @@ def _resolve_gate_statuses(
             return provided
 
     obs = _build_inference_observation(vars_map)
-    evaluated = evaluate_pack_gates(
-        observations=[obs],
-        precondition_gates=precondition_gates,
-        completion_gates=completion_gates,
-    )
+    if compiled_gates is not None:
+        evaluated = compiled_gates.evaluate([obs])
+    else:
+        evaluated = evaluate_pack_gates(
+            observations=[obs],
+            precondition_gates=precondition_gates,
+            completion_gates=completion_gates,
+        )
     if provided:
         evaluated.update(provided)
     return evaluated
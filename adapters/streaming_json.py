@@ -0,0 +1,271 @@
+"""
+Incremental JSON detection for streamed chat completions.
+
+`IncrementalJsonScanner` is fed completion text chunk by chunk and reports the
+text up to the end of the first complete top-level JSON object/array, using
+the same string/bracket rules as `json_extract._find_first_json_segment`.
+Leading `<think>...</think>` blocks are skipped before scanning starts so
+braces inside reasoning text never open a segment. A segment opened inside a
+markdown code fence is reported with the closing fence appended, so an
+early-closed reply parses with the same repair metadata as the full one.
+
+`read_text_stream()` drives the scanner over content chunks and stops reading
+as soon as `accept(text)` approves the completed segment, so the caller can
+close the HTTP stream instead of waiting for trailing text the parser would
+drop anyway.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+_THINK_OPEN = "<think"
+_THINK_CLOSE = "</think>"
+SSE_DONE = "[DONE]"
+_FENCE_OPEN_RE = re.compile(r"\s*```[\w+-]*\s*")
+
+
+class IncrementalJsonScanner:
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._size = 0
+        self._joined: str | None = ""
+        # Unresolved leading text (whitespace / think blocks) and its offset in the stream.
+        self._pending = ""
+        self._pending_offset = 0
+        self._in_think = False
+        self._prefix_resolved = False
+        self._body_start = 0
+        self._in_string = False
+        self._escaped = False
+        self._stack: list[str] = []
+        self._start = -1
+        self._end: int | None = None
+
+    @property
+    def text(self) -> str:
+        if self._joined is None:
+            self._joined = "".join(self._parts)
+            self._parts = [self._joined]
+        return self._joined
+
+    @property
+    def segment_end(self) -> int | None:
+        """End offset of the first complete JSON segment, once one has closed."""
+        return self._end
+
+    def feed(self, chunk: str) -> str | None:
+        """
+        Append `chunk`; returns the text through the first complete segment the moment it closes.
+
+        When the segment was opened inside a markdown code fence the returned text
+        gets the closing fence appended, so `extract_first_json` reports the same
+        repairs it would for the fully streamed reply.
+        """
+        offset = self._size
+        self._parts.append(chunk)
+        self._size += len(chunk)
+        self._joined = None
+        if self._end is not None:
+            return None
+        if not self._prefix_resolved:
+            self._pending += chunk
+            if not self._resolve_prefix():
+                return None
+            chunk, offset = self._pending, self._pending_offset
+            self._pending = ""
+        end = self._scan(chunk, offset)
+        if end is None:
+            return None
+        self._end = end
+        return self._closed_candidate(end)
+
+    def _drop_pending(self, count: int) -> None:
+        self._pending = self._pending[count:]
+        self._pending_offset += count
+
+    def _resolve_prefix(self) -> bool:
+        while True:
+            text = self._pending
+            if self._in_think:
+                close = text.lower().find(_THINK_CLOSE)
+                if close < 0:
+                    # Keep only enough tail to match a close tag split across chunks.
+                    self._drop_pending(max(0, len(text) - len(_THINK_CLOSE) + 1))
+                    return False
+                self._drop_pending(close + len(_THINK_CLOSE))
+                self._in_think = False
+                continue
+            pos = len(text) - len(text.lstrip())
+            head = text[pos : pos + len(_THINK_OPEN)].lower()
+            if len(head) < len(_THINK_OPEN) and _THINK_OPEN.startswith(head):
+                # Not enough text yet to tell a think block from JSON/prose.
+                return False
+            self._drop_pending(pos)
+            if head != _THINK_OPEN:
+                self._body_start = self._pending_offset
+                self._prefix_resolved = True
+                return True
+            self._in_think = True
+
+    def _scan(self, text: str, offset: int) -> int | None:
+        stack = self._stack
+        for i, ch in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                self._in_string = True
+                continue
+            if self._start < 0:
+                if ch == "{":
+                    self._start = offset + i
+                    stack.append("}")
+                elif ch == "[":
+                    self._start = offset + i
+                    stack.append("]")
+                continue
+            if ch == "{":
+                stack.append("}")
+            elif ch == "[":
+                stack.append("]")
+            elif ch in ("}", "]"):
+                if not stack or ch != stack[-1]:
+                    continue
+                stack.pop()
+                if not stack:
+                    return offset + i + 1
+        return None
+
+    def _closed_candidate(self, end: int) -> str:
+        text = self.text
+        opener = text[self._body_start : self._start]
+        if not _FENCE_OPEN_RE.fullmatch(opener):
+            return text[:end]
+        # Close the fence the way the model would have, keeping single-line fences inline.
+        return text[:end] + ("\n```" if "\n" in opener else " ```")
+
+
+@dataclass
+class StreamedText:
+    text: str
+    chunk_count: int = 0
+    time_to_first_token_ms: float | None = None
+    time_to_valid_json_ms: float | None = None
+    closed_early: bool = False
+
+    def to_metadata(self) -> dict[str, Any]:
+        return {
+            "stream_enabled": True,
+            "stream_chunk_count": self.chunk_count,
+            "stream_time_to_first_token_ms": self.time_to_first_token_ms,
+            "stream_time_to_valid_json_ms": self.time_to_valid_json_ms,
+            "stream_closed_early": self.closed_early,
+        }
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
+def read_text_stream(
+    chunks: Iterable[str],
+    *,
+    started: float,
+    accept: Callable[[str], bool] | None = None,
+) -> StreamedText:
+    """
+    Concatenate content chunks, stopping once the first JSON segment passes `accept`.
+
+    `started` is the `time.perf_counter()` value taken before the request was sent.
+    A segment that `accept` rejects is left to the normal full-text parser, so the
+    rest of the stream is still read.
+    """
+    scanner = IncrementalJsonScanner()
+    result = StreamedText(text="")
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if result.time_to_first_token_ms is None:
+            result.time_to_first_token_ms = _elapsed_ms(started)
+        result.chunk_count += 1
+        candidate = scanner.feed(chunk)
+        if candidate is not None and accept is not None and accept(candidate):
+            result.time_to_valid_json_ms = _elapsed_ms(started)
+            result.closed_early = True
+            result.text = candidate
+            return result
+    result.text = scanner.text
+    return result
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """Yield `data:` payloads of a server-sent event stream until `[DONE]`."""
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:") :].strip()
+        if data == SSE_DONE:
+            return
+        if data:
+            yield data
+
+
+def iter_openai_stream_content(lines: Iterable[str]) -> Iterator[str]:
+    """Yield `choices[0].delta.content` pieces from an OpenAI-compatible SSE stream."""
+    for data in iter_sse_data(lines):
+        try:
+            event = json.loads(data)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"OpenAI-compatible stream event is invalid JSON: {exc.msg}") from exc
+        if not isinstance(event, dict):
+            continue
+        choices = event.get("choices")
+        if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+            continue
+        delta = choices[0].get("delta")
+        if isinstance(delta, dict) and isinstance(delta.get("content"), str):
+            yield delta["content"]
+
+
+def iter_ollama_stream_content(lines: Iterable[str]) -> Iterator[str]:
+    """Yield assistant content pieces from an Ollama NDJSON `/api/chat` stream."""
+    for line in lines:
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            event = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Ollama stream line is invalid JSON: {exc.msg}") from exc
+        if not isinstance(event, dict):
+            continue
+        if isinstance(event.get("error"), str):
+            raise ValueError(f"Ollama stream error: {event['error']}")
+        message = event.get("message")
+        if isinstance(message, dict) and isinstance(message.get("content"), str):
+            yield message["content"]
+        elif isinstance(event.get("response"), str):
+            yield event["response"]
+        if event.get("done") is True:
+            return
+
+
+__all__ = [
+    "IncrementalJsonScanner",
+    "SSE_DONE",
+    "StreamedText",
+    "iter_ollama_stream_content",
+    "iter_openai_stream_content",
+    "iter_sse_data",
+    "read_text_stream",
+]
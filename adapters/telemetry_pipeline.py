@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import os
 import stat
 import tempfile
 import threading
+import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -16,7 +18,7 @@ from adapters.delta_aggregator import DeltaAggregator, aggregate_delta_window, e
 from adapters.delta_sanitizer import DeltaPolicy, DeltaSanitizer
 from adapters.dcs_bios.bios_ui_map import BiosUiMapper
 from core.types import Event, Observation
-from core.vars import VarResolver
+from core.vars import IncrementalVarResolver, VarResolver
 
 TagHook = Callable[[Observation, Mapping[str, Any]], Sequence[str] | None]
 
@@ -240,6 +242,165 @@ def _save_completion_latches_to_disk(
         return
 
 
+@dataclass
+class CompletionLatchPersistStats:
+    changes: int = 0
+    writes: int = 0
+    coalesced: int = 0
+    total_write_ms: float = 0.0
+    max_write_ms: float = 0.0
+    last_write_ms: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "changes": self.changes,
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "mean_write_ms": round(self.total_write_ms / self.writes, 3) if self.writes else None,
+            "max_write_ms": round(self.max_write_ms, 3),
+            "last_write_ms": round(self.last_write_ms, 3) if self.last_write_ms is not None else None,
+        }
+
+
+_COMPLETION_LATCH_PERSIST_STATS = CompletionLatchPersistStats()
+_COMPLETION_LATCH_PERSIST_LOCK = threading.Lock()
+
+
+def _timed_save_completion_latches(payload: Mapping[str, Mapping[str, bool | float]]) -> None:
+    started = time.perf_counter()
+    _save_completion_latches_to_disk(payload)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    with _COMPLETION_LATCH_PERSIST_LOCK:
+        stats = _COMPLETION_LATCH_PERSIST_STATS
+        stats.writes += 1
+        stats.total_write_ms += elapsed_ms
+        stats.max_write_ms = max(stats.max_write_ms, elapsed_ms)
+        stats.last_write_ms = elapsed_ms
+
+
+class _CompletionLatchWriteBehind:
+    """
+    Persist latch snapshots from a background thread.
+
+    Snapshots submitted within `debounce_s` of the first pending change are
+    coalesced into one write of the newest snapshot. Each write is the same
+    temp-file + fsync + replace as the synchronous path, so the file on disk is
+    always a complete earlier snapshot.
+    """
+
+    def __init__(self, debounce_s: float) -> None:
+        self.debounce_s = max(0.0, float(debounce_s))
+        self._cond = threading.Condition()
+        self._pending: dict[str, dict[str, bool | float]] | None = None
+        self._pending_since: float | None = None
+        self._writing = False
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="completion-latch-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, payload: dict[str, dict[str, bool | float]]) -> None:
+        with self._cond:
+            if self._pending is not None:
+                with _COMPLETION_LATCH_PERSIST_LOCK:
+                    _COMPLETION_LATCH_PERSIST_STATS.coalesced += 1
+            else:
+                self._pending_since = time.monotonic()
+            self._pending = payload
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + max(0.0, timeout)
+        with self._cond:
+            self._pending_since = time.monotonic() - self.debounce_s if self._pending is not None else None
+            self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending is not None:
+                        wait_s = self.debounce_s - (time.monotonic() - (self._pending_since or 0.0))
+                        if self._stopping or wait_s <= 0:
+                            break
+                        self._cond.wait(wait_s)
+                    elif self._stopping:
+                        return
+                    else:
+                        self._cond.wait()
+                payload = self._pending
+                self._pending = None
+                self._pending_since = None
+                self._writing = True
+            try:
+                if payload is not None:
+                    _timed_save_completion_latches(payload)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+
+_COMPLETION_LATCH_WRITER: _CompletionLatchWriteBehind | None = None
+_COMPLETION_LATCH_WRITER_LOCK = threading.Lock()
+_COMPLETION_LATCH_ATEXIT_REGISTERED = False
+
+
+def configure_completion_latch_write_behind(debounce_s: float | None) -> None:
+    """
+    Persist completion latches from a background writer debounced by `debounce_s`.
+
+    `None` or a non-positive value restores synchronous writes on the telemetry
+    thread (the default); pending latches are flushed before switching.
+    """
+    global _COMPLETION_LATCH_WRITER, _COMPLETION_LATCH_ATEXIT_REGISTERED
+    with _COMPLETION_LATCH_WRITER_LOCK:
+        previous = _COMPLETION_LATCH_WRITER
+        _COMPLETION_LATCH_WRITER = None
+        if previous is not None:
+            previous.close()
+        if debounce_s is None or debounce_s <= 0:
+            return
+        _COMPLETION_LATCH_WRITER = _CompletionLatchWriteBehind(debounce_s)
+        if not _COMPLETION_LATCH_ATEXIT_REGISTERED:
+            atexit.register(flush_completion_latches)
+            _COMPLETION_LATCH_ATEXIT_REGISTERED = True
+
+
+def flush_completion_latches(timeout: float | None = None) -> bool:
+    """Block until pending write-behind latches are on disk; True when nothing is left pending."""
+    writer = _COMPLETION_LATCH_WRITER
+    if writer is None:
+        return True
+    return writer.flush(timeout)
+
+
+def completion_latch_persist_stats() -> dict[str, Any]:
+    with _COMPLETION_LATCH_PERSIST_LOCK:
+        return _COMPLETION_LATCH_PERSIST_STATS.to_dict()
+
+
+def _persist_completion_latches(payload: dict[str, dict[str, bool | float]]) -> None:
+    with _COMPLETION_LATCH_PERSIST_LOCK:
+        _COMPLETION_LATCH_PERSIST_STATS.changes += 1
+    writer = _COMPLETION_LATCH_WRITER
+    if writer is not None:
+        writer.submit(payload)
+        return
+    _timed_save_completion_latches(payload)
+
+
 @dataclass
 class TelemetryDebugCache:
     """In-memory cache for raw bios data during live runs (not logged by default)."""
@@ -391,7 +552,7 @@ def _apply_momentary_completion_latches(
             save_payload = _serialize_completion_latches_payload(_COMPLETION_LATCHES)
 
     if save_payload is not None:
-        _save_completion_latches_to_disk(save_payload)
+        _persist_completion_latches(save_payload)
 
     raw_missing = out.get("vars_source_missing")
     if isinstance(raw_missing, list):
@@ -506,7 +667,7 @@ def _resolve_delta_policy_and_sanitizer(
 
 def enrich_bios_observation(
     obs: Observation,
-    resolver: VarResolver,
+    resolver: VarResolver | IncrementalVarResolver,
     *,
     mapper: BiosUiMapper | None = None,
     selected_var_keys: Sequence[str] | None = None,
@@ -534,6 +695,8 @@ def enrich_bios_observation(
     in-memory for debug by passing `debug_cache`.
     BIOS hash calculation is optional; by default it is enabled when `debug_cache`
     is provided, or can be forced with `include_bios_hash=True`.
+    Passing an `IncrementalVarResolver` (live mode with merged full-state bios)
+    re-resolves only the vars affected by `payload["delta"]`.
     Delta sanitizer behavior:
     - If `delta_sanitizer` is provided, that instance is used directly and guarded
       with a per-instance shared lock inside this module.
@@ -648,7 +811,11 @@ def enrich_bios_observation(
 
 __all__ = [
     "DEFAULT_SELECTED_VAR_KEYS",
+    "CompletionLatchPersistStats",
     "TagHook",
     "TelemetryDebugCache",
+    "completion_latch_persist_stats",
+    "configure_completion_latch_write_behind",
     "enrich_bios_observation",
+    "flush_completion_latches",
 ]
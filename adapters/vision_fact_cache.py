@@ -0,0 +1,191 @@
+"""
+Content-addressed cache of vision-fact extractions.
+
+Pressing help repeatedly on an unchanged cockpit page used to run one full
+multimodal inference per press. `VisionFactResultCache` remembers the last
+`VisionFactObservation` per set of frame perceptual hashes (see
+`adapters.perceptual_hash`) and serves it again when every region of every
+candidate frame is within `max_distance` bits of a stored entry. The default
+is an exact match: text regions carry a pixel digest, so any edited glyph
+misses the cache instead of replaying the facts read before the edit.
+
+A hit is attributed to the new trigger and frame, but each fact keeps the
+`observed_at_wall_ms` of the extraction that actually read it, so
+`merge_vision_fact_observation` ages cached facts by their real observation
+time. Entries themselves expire `max_age_ms` after the extraction that
+produced them, and only confident (`available`) results are stored.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Mapping, Sequence
+
+from adapters.perceptual_hash import region_hash_distance
+from core.types_v2 import VisionFactObservation
+
+DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES = 16
+DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE = 0
+DEFAULT_VISION_FACT_CACHE_MAX_AGE_MS = 120_000
+
+
+@dataclass
+class VisionFactCacheStats:
+    lookups: int = 0
+    hits: int = 0
+    near_hits: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return round(self.hits / self.lookups, 4) if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+@dataclass(frozen=True)
+class VisionFactCacheHit:
+    observation: VisionFactObservation
+    distance: int
+    source_trigger_wall_ms: int | None
+
+
+@dataclass
+class _CacheEntry:
+    frame_hashes: tuple[dict[str, str], ...]
+    observation: VisionFactObservation
+    stored_wall_ms: int
+
+
+def restamp_cached_observation(
+    observation: VisionFactObservation,
+    *,
+    session_id: str | None,
+    trigger_wall_ms: int,
+    frame_ids: Sequence[str],
+) -> VisionFactObservation:
+    """Copy of a cached observation attributed to the current help cycle and frames; observation times are kept."""
+    source_frame_id = frame_ids[0] if frame_ids else "unknown_frame"
+    facts = [replace(fact, source_frame_id=source_frame_id) for fact in observation.facts]
+    return VisionFactObservation(
+        session_id=session_id,
+        trigger_wall_ms=trigger_wall_ms,
+        frame_ids=list(frame_ids),
+        facts=facts,
+        summary=observation.summary,
+        metadata=copy.deepcopy(observation.metadata),
+    )
+
+
+class VisionFactResultCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES,
+        max_distance: int = DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE,
+        max_age_ms: int = DEFAULT_VISION_FACT_CACHE_MAX_AGE_MS,
+    ) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.max_distance = max(0, int(max_distance))
+        self.max_age_ms = max(0, int(max_age_ms))
+        self.stats = VisionFactCacheStats()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[tuple[tuple[str, str], ...], ...], _CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(frame_hashes: Sequence[Mapping[str, str]]) -> tuple[tuple[tuple[str, str], ...], ...]:
+        return tuple(tuple(sorted(hashes.items())) for hashes in frame_hashes)
+
+    def lookup(self, frame_hashes: Sequence[Mapping[str, str]], *, trigger_wall_ms: int) -> VisionFactCacheHit | None:
+        with self._lock:
+            self.stats.lookups += 1
+            best: tuple[int, tuple[Any, ...], _CacheEntry] | None = None
+            for key, entry in list(self._entries.items()):
+                if trigger_wall_ms - entry.stored_wall_ms > self.max_age_ms:
+                    del self._entries[key]
+                    self.stats.expirations += 1
+                    continue
+                distance = self._distance(frame_hashes, entry.frame_hashes)
+                if distance is None or distance > self.max_distance:
+                    continue
+                if best is None or distance < best[0]:
+                    best = (distance, key, entry)
+            if best is None:
+                return None
+            distance, key, entry = best
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            if distance > 0:
+                self.stats.near_hits += 1
+            return VisionFactCacheHit(
+                observation=copy.deepcopy(entry.observation),
+                distance=distance,
+                source_trigger_wall_ms=entry.stored_wall_ms,
+            )
+
+    def store(
+        self,
+        frame_hashes: Sequence[Mapping[str, str]],
+        observation: VisionFactObservation,
+        *,
+        trigger_wall_ms: int,
+    ) -> None:
+        if self.max_entries <= 0 or not frame_hashes:
+            return
+        key = self._key(frame_hashes)
+        entry = _CacheEntry(
+            frame_hashes=tuple(dict(hashes) for hashes in frame_hashes),
+            observation=copy.deepcopy(observation),
+            stored_wall_ms=int(trigger_wall_ms),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _distance(
+        frame_hashes: Sequence[Mapping[str, str]],
+        stored: Sequence[Mapping[str, str]],
+    ) -> int | None:
+        if len(frame_hashes) != len(stored) or not frame_hashes:
+            return None
+        worst = 0
+        for current, previous in zip(frame_hashes, stored):
+            distance = region_hash_distance(current, previous)
+            if distance is None:
+                return None
+            worst = max(worst, distance)
+        return worst
+
+
+__all__ = [
+    "DEFAULT_VISION_FACT_CACHE_MAX_AGE_MS",
+    "DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE",
+    "DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES",
+    "VisionFactCacheHit",
+    "VisionFactCacheStats",
+    "VisionFactResultCache",
+    "restamp_cached_observation",
+]
@@ -5,28 +5,50 @@ VLM-backed structured vision-fact extraction.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
 from jsonschema import Draft202012Validator
 
+from adapters.http_client_pool import HttpClientConfig, build_request_timeout, shared_http_client
+from adapters.image_payload_cache import ImageEncodeOptions, ImagePayloadCache, shared_image_payload_cache
 from adapters.json_extract import parse_first_json
+from adapters.openai_compat_capabilities import (
+    CAPABILITY_JSON_SCHEMA,
+    CAPABILITY_MULTIMODAL,
+    CAPABILITY_REQUEST_OVERRIDES,
+    EndpointCapabilityCache,
+    shared_endpoint_capability_cache,
+)
 from adapters.openai_compat_multimodal import (
     MultimodalRequestRejected,
+    is_allowed_local_image_path,
     build_multimodal_image_contents,
     copy_messages_for_payload,
     extract_response_error_text,
     is_json_schema_unsupported_400,
     is_multimodal_unsupported_400,
     is_request_override_unsupported_400,
+    looks_like_windows_path,
     normalize_allowed_local_image_roots,
+    summarize_image_payloads,
+)
+from adapters.perceptual_hash import file_dhashes, hamming_distance
+from adapters.vision_fact_cache import (
+    DEFAULT_VISION_FACT_CACHE_MAX_AGE_MS,
+    VisionFactCacheHit,
+    VisionFactResultCache,
+    restamp_cached_observation,
 )
 from adapters.vision_fact_prompting import build_vision_fact_prompt
+from adapters.vision_frames import render_region_crops
 from core.types_v2 import VisionFact, VisionFactObservation
 from core.vision_facts import build_vision_fact_summary, load_vision_facts_config
 
 _ALLOWED_MODEL_FACT_STATES = frozenset({"seen", "not_seen", "uncertain"})
+DEFAULT_REGION_CHANGE_MAX_DISTANCE = 4
 
 
 def _vision_fact_response_schema(*, fact_ids: Sequence[str]) -> dict[str, Any]:
@@ -123,6 +145,15 @@ class VisionFactExtractionResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class _RegionPlan:
+    changed_regions: tuple[str, ...]
+    fact_ids: tuple[str, ...]
+    region_hashes: dict[str, str]
+    # Last facts of the regions that are not re-read, snapshotted when the plan was made.
+    carried_facts: dict[str, VisionFact]
+
+
 class VisionFactExtractor:
     _DEFAULT_QWEN35_VLM_MAX_TOKENS = 480
     _DEFAULT_MAX_LOCAL_IMAGE_BYTES = 4 * 1024 * 1024
@@ -138,11 +169,18 @@ class VisionFactExtractor:
         max_local_image_bytes: int | None = None,
         lang: str = "zh",
         client: object | None = None,
+        http_client_config: HttpClientConfig | None = None,
         enable_multimodal: bool = True,
         log_raw_llm_text: bool = False,
         print_model_io: bool = False,
         config_path: str | None = None,
         pack_path: str | Path | None = None,
+        capability_cache: EndpointCapabilityCache | None = None,
+        image_encode_options: ImageEncodeOptions | None = None,
+        image_cache: ImagePayloadCache | None = None,
+        result_cache: VisionFactResultCache | None = None,
+        region_incremental: bool = False,
+        region_change_max_distance: int = DEFAULT_REGION_CHANGE_MAX_DISTANCE,
     ) -> None:
         self.model_name = model_name
         self.base_url = base_url.rstrip("/")
@@ -165,14 +203,26 @@ class VisionFactExtractor:
             if isinstance(fact_id, str) and fact_id
         )
         self._response_validator = Draft202012Validator(_vision_fact_response_schema(fact_ids=self._fact_ids))
+        self.capability_cache = capability_cache if capability_cache is not None else shared_endpoint_capability_cache()
+        self.image_encode_options = image_encode_options
+        self.image_cache = image_cache if image_cache is not None else shared_image_payload_cache()
+        # Per extractor: cached facts are only meaningful for this fact config and model.
+        self.result_cache = result_cache if result_cache is not None else VisionFactResultCache()
+        self.region_incremental = bool(region_incremental)
+        self.region_change_max_distance = max(0, int(region_change_max_distance))
+        # Region mode: per-region hash (and when it was confirmed) plus the facts last read for it.
+        # Prefetch workers may run extract() concurrently, so both are guarded by _region_lock.
+        self._region_lock = threading.Lock()
+        self._region_baseline: dict[str, tuple[str, int]] = {}
+        self._last_facts: dict[str, VisionFact] = {}
+        self.http_client_config = http_client_config
         if client is None:
-            import httpx
-
-            self._client = httpx.Client(timeout=self.timeout_s)
-            self._owns_client = True
+            self._client = shared_http_client(self.base_url, config=http_client_config)
+            self._request_timeout: Any = build_request_timeout(self.timeout_s, http_client_config)
         else:
             self._client = client
-            self._owns_client = False
+            self._request_timeout = self.timeout_s
+        self._owns_client = False
 
     def close(self) -> None:
         if self._owns_client and hasattr(self._client, "close"):
@@ -208,13 +258,57 @@ class VisionFactExtractor:
                 error="multimodal_disabled",
                 metadata={"frame_ids": candidate_frame_ids, "multimodal_failure_reason": "multimodal_disabled"},
             )
+        known_rejection = self.capability_cache.rejection(self.base_url, self.model_name, CAPABILITY_MULTIMODAL)
+        if known_rejection is not None:
+            # The endpoint already refused image inputs; skip the round-trip that would fail the same way.
+            reason = known_rejection.reason or "server rejected multimodal request"
+            return VisionFactExtractionResult(
+                status="extractor_failed",
+                error=f"MultimodalRequestRejected: {reason}",
+                metadata={
+                    "frame_ids": candidate_frame_ids,
+                    "multimodal_failure_reason": f"MultimodalRequestRejected: {reason}",
+                    "endpoint_capabilities_skipped": [CAPABILITY_MULTIMODAL],
+                },
+            )
+
+        frame_hashes = self._candidate_frame_hashes(candidate_frames)
+        if frame_hashes is not None:
+            cache_hit = self.result_cache.lookup(frame_hashes, trigger_wall_ms=trigger_wall_ms)
+            if cache_hit is not None:
+                return self._cached_result(
+                    cache_hit,
+                    frame_ids=candidate_frame_ids,
+                    session_id=session_id,
+                    trigger_wall_ms=trigger_wall_ms,
+                )
+
+        region_plan = self._plan_region_extraction(candidate_frames, trigger_wall_ms=trigger_wall_ms)
+        request_frames: list[dict[str, Any]] = candidate_frames
+        if region_plan is not None:
+            if not region_plan.fact_ids:
+                return self._carried_forward_result(
+                    region_plan,
+                    frame_ids=candidate_frame_ids,
+                    session_id=session_id,
+                    trigger_wall_ms=trigger_wall_ms,
+                )
+            region_frames = self._region_crop_frames(candidate_frames, region_plan)
+            if region_frames is None:
+                region_plan = None
+            else:
+                request_frames = region_frames
 
         built = build_multimodal_image_contents(
-            candidate_frames,
+            request_frames,
             allowed_local_image_roots=self.allowed_local_image_roots,
             max_local_image_bytes=self.max_local_image_bytes,
+            encode_options=self.image_encode_options,
+            image_cache=self.image_cache,
         )
-        frame_ids = [item for item in built["frame_ids"] if isinstance(item, str) and item]
+        image_payload_metadata = summarize_image_payloads(built["image_payloads"])
+        # Region crops share their frame's id; keep one entry per frame.
+        frame_ids = list(dict.fromkeys(item for item in built["frame_ids"] if isinstance(item, str) and item))
         if not built["image_contents"]:
             return VisionFactExtractionResult(
                 status="extractor_failed",
@@ -227,10 +321,17 @@ class VisionFactExtractor:
                 },
             )
 
+        prompt_config: Mapping[str, Any] = self._config
+        if region_plan is not None:
+            prompt_config = {
+                **self._config,
+                "facts_by_id": {fact_id: self._config["facts_by_id"][fact_id] for fact_id in region_plan.fact_ids},
+            }
         prompt = build_vision_fact_prompt(
             vision=self._effective_vision_context(vision, successful_frames=built["successful_frames"], frame_ids=frame_ids),
             lang=self.lang,
-            config=self._config,
+            config=prompt_config,
+            regions=region_plan.changed_regions if region_plan is not None else None,
         )
         messages = [
             {"role": "system", "content": "You are SimTutor visual fact extractor. Reply with JSON only."},
@@ -255,7 +356,7 @@ class VisionFactExtractor:
             )
         raw_text = ""
         try:
-            raw_text = self._chat(messages)
+            raw_text = self._chat(messages, fact_ids=region_plan.fact_ids if region_plan is not None else None)
             self._print_model_io_block(
                 "VISION_FACT_REPLY",
                 raw_text,
@@ -271,7 +372,10 @@ class VisionFactExtractor:
                 frame_ids=frame_ids,
                 session_id=session_id,
                 trigger_wall_ms=trigger_wall_ms,
+                fact_ids=region_plan.fact_ids if region_plan is not None else None,
             )
+            if region_plan is not None:
+                self._merge_carried_forward_facts(observation, region_plan)
         except Exception as exc:
             return VisionFactExtractionResult(
                 status="extractor_failed",
@@ -282,16 +386,24 @@ class VisionFactExtractor:
                     "multimodal_failed_frame_ids": list(built["failed_frame_ids"]),
                     "multimodal_frame_failures": dict(built["frame_failures"]),
                     "raw_llm_text": raw_text if self.log_raw_llm_text and raw_text else "",
+                    **image_payload_metadata,
                 },
             )
 
         result_status = "available"
         model_summary = observation.summary if isinstance(observation.summary, str) and observation.summary.strip() else None
+        cache_metadata = self._cache_metadata(hit=False)
+        carried_forward_ids = set(region_plan.carried_facts) if region_plan is not None else set()
         summary = build_vision_fact_summary(
             {fact.fact_id: fact.to_dict() for fact in observation.facts},
             status=result_status,
             frame_ids=frame_ids,
-            fresh_fact_ids=[fact.fact_id for fact in observation.facts if fact.state == "seen"],
+            fresh_fact_ids=[
+                fact.fact_id
+                for fact in observation.facts
+                if fact.state == "seen" and fact.fact_id not in carried_forward_ids
+            ],
+            cache=cache_metadata,
         )
         if summary["uncertain_fact_ids"]:
             result_status = "uncertain"
@@ -308,16 +420,299 @@ class VisionFactExtractor:
             "multimodal_failed_frame_ids": list(built["failed_frame_ids"]),
             "multimodal_frame_failures": dict(built["frame_failures"]),
             "vision_fact_summary": summary,
+            "vision_fact_cache": cache_metadata,
             "raw_llm_text": raw_text if self.log_raw_llm_text else "",
+            **image_payload_metadata,
         }
         if model_summary is not None:
             result_metadata["model_summary"] = model_summary
+        if self.region_incremental:
+            result_metadata["vision_fact_regions"] = self._remember_region_facts(
+                observation,
+                candidate_frames,
+                region_plan,
+                trigger_wall_ms=trigger_wall_ms,
+            )
+        # Uncertain reads are retried on the next press rather than replayed; so are partial frame sets.
+        if result_status == "available" and frame_hashes is not None and frame_ids == candidate_frame_ids:
+            self.result_cache.store(frame_hashes, observation, trigger_wall_ms=trigger_wall_ms)
         return VisionFactExtractionResult(
             status=result_status,
             observation=observation,
             metadata=result_metadata,
         )
 
+    def _candidate_frame_hashes(self, candidate_frames: Sequence[Mapping[str, Any]]) -> list[dict[str, str]] | None:
+        """Perceptual hashes per candidate frame, or None when any frame cannot be hashed (no caching)."""
+        if self.result_cache.max_entries <= 0:
+            return None
+        out: list[dict[str, str]] = []
+        for frame in candidate_frames:
+            region_hashes = frame.get("region_hashes")
+            if isinstance(region_hashes, Mapping) and region_hashes and all(
+                isinstance(key, str) and isinstance(value, str) for key, value in region_hashes.items()
+            ):
+                out.append(dict(region_hashes))
+                continue
+            path = self._local_frame_path(frame.get("image_uri") or frame.get("source_image_path"))
+            if path is None:
+                return None
+            try:
+                out.append(file_dhashes(path))
+            except (OSError, ValueError):
+                return None
+        return out
+
+    def _local_frame_path(self, raw_path: Any) -> Path | None:
+        if not isinstance(raw_path, str) or not raw_path.strip():
+            return None
+        image_url = raw_path.strip()
+        if ":" in image_url and not looks_like_windows_path(image_url):
+            # data:, http(s): and other URI schemes are never read from disk.
+            return None
+        path = Path(image_url).expanduser().resolve()
+        if not is_allowed_local_image_path(path, allowed_local_image_roots=self.allowed_local_image_roots):
+            return None
+        return path
+
+    def _plan_region_extraction(
+        self,
+        candidate_frames: Sequence[Mapping[str, Any]],
+        *,
+        trigger_wall_ms: int,
+    ) -> _RegionPlan | None:
+        """Regions whose pixels moved since they were last read, and the facts they evidence; None means full extraction."""
+        if not self.region_incremental:
+            return None
+        with self._region_lock:
+            region_baseline = dict(self._region_baseline)
+            last_facts = dict(self._last_facts)
+        if not region_baseline:
+            return None
+        per_frame: list[dict[str, str]] = []
+        for frame in candidate_frames:
+            region_hashes = frame.get("region_hashes")
+            if not isinstance(region_hashes, Mapping) or not region_hashes:
+                return None
+            per_frame.append({str(key): str(value) for key, value in region_hashes.items()})
+        region_ids = list(per_frame[-1])
+        if any(list(hashes) != region_ids for hashes in per_frame):
+            return None
+        changed: set[str] = set()
+        for region_id in region_ids:
+            baseline = region_baseline.get(region_id)
+            if (
+                baseline is None
+                or trigger_wall_ms - baseline[1] > DEFAULT_VISION_FACT_CACHE_MAX_AGE_MS
+                or any(
+                    hamming_distance(hashes[region_id], baseline[0]) > self.region_change_max_distance
+                    for hashes in per_frame
+                )
+            ):
+                changed.add(region_id)
+        query_fact_ids: list[str] = []
+        query_regions: set[str] = set(changed)
+        for fact_id in self._fact_ids:
+            intended = set(self._config["facts_by_id"][fact_id].get("intended_regions", ())) & set(region_ids)
+            if not intended:
+                return None
+            if intended & changed or fact_id not in last_facts:
+                query_fact_ids.append(fact_id)
+                query_regions |= intended
+        if len(query_fact_ids) == len(self._fact_ids):
+            return None
+        return _RegionPlan(
+            changed_regions=tuple(region_id for region_id in region_ids if region_id in query_regions),
+            fact_ids=tuple(query_fact_ids),
+            region_hashes=per_frame[-1],
+            carried_facts={
+                fact_id: last_facts[fact_id] for fact_id in self._fact_ids if fact_id not in query_fact_ids
+            },
+        )
+
+    def _region_crop_frames(
+        self,
+        candidate_frames: Sequence[Mapping[str, Any]],
+        plan: _RegionPlan,
+    ) -> list[dict[str, Any]] | None:
+        crops_by_frame: list[tuple[Mapping[str, Any], dict[str, Path]]] = []
+        for frame in candidate_frames:
+            # Region hashes were taken on the raw capture, so crop that rather than the labelled VLM artifact.
+            source = self._local_frame_path(frame.get("source_image_path"))
+            if source is None:
+                return None
+            try:
+                crops_by_frame.append((frame, render_region_crops(source, plan.changed_regions)))
+            except (OSError, ValueError):
+                return None
+        # Grouped by region, pre-trigger crop before trigger crop, as the region prompt describes.
+        return [
+            {
+                "frame_id": frame.get("frame_id"),
+                "role": frame.get("role"),
+                "region_id": region_id,
+                "image_uri": str(crops[region_id]),
+                "mime_type": "image/png",
+            }
+            for region_id in plan.changed_regions
+            for frame, crops in crops_by_frame
+        ]
+
+    @staticmethod
+    def _carried_forward_facts(plan: _RegionPlan, *, source_frame_id: str) -> dict[str, VisionFact]:
+        # Attributed to the current frame but keeping the time they were actually read, so they still age out.
+        return {
+            fact_id: replace(fact, source_frame_id=source_frame_id) for fact_id, fact in plan.carried_facts.items()
+        }
+
+    def _merge_carried_forward_facts(self, observation: VisionFactObservation, plan: _RegionPlan) -> None:
+        """Complete a region-scoped read with the unchanged regions' last facts."""
+        facts_by_id = {fact.fact_id: fact for fact in observation.facts}
+        source_frame_id = observation.frame_ids[0] if observation.frame_ids else "unknown_frame"
+        carried = self._carried_forward_facts(plan, source_frame_id=source_frame_id)
+        carried_forward = [fact_id for fact_id in self._fact_ids if fact_id not in facts_by_id and fact_id in carried]
+        for fact_id in carried_forward:
+            facts_by_id[fact_id] = carried[fact_id]
+        observation.facts = [facts_by_id[fact_id] for fact_id in self._fact_ids if fact_id in facts_by_id]
+        observation.metadata["carried_forward_fact_ids"] = carried_forward
+
+    def _remember_region_facts(
+        self,
+        observation: VisionFactObservation,
+        candidate_frames: Sequence[Mapping[str, Any]],
+        plan: _RegionPlan | None,
+        *,
+        trigger_wall_ms: int,
+    ) -> dict[str, Any]:
+        if plan is not None:
+            region_hashes = plan.region_hashes
+            queried_regions = list(plan.changed_regions)
+            queried_fact_ids = list(plan.fact_ids)
+        else:
+            raw_hashes = candidate_frames[-1].get("region_hashes") if candidate_frames else None
+            region_hashes = (
+                {str(key): str(value) for key, value in raw_hashes.items()} if isinstance(raw_hashes, Mapping) else {}
+            )
+            queried_regions = list(region_hashes)
+            queried_fact_ids = list(self._fact_ids)
+        with self._region_lock:
+            for region_id in queried_regions:
+                if region_id in region_hashes:
+                    self._region_baseline[region_id] = (region_hashes[region_id], int(trigger_wall_ms))
+            for fact in observation.facts:
+                if fact.fact_id not in queried_fact_ids:
+                    continue
+                # Uncertain reads are not carried forward; their region is re-queried next time.
+                if fact.state == "uncertain":
+                    self._last_facts.pop(fact.fact_id, None)
+                else:
+                    self._last_facts[fact.fact_id] = fact
+        return {
+            "mode": "regions" if plan is not None else "full",
+            "queried_regions": queried_regions,
+            "queried_fact_ids": queried_fact_ids,
+            "carried_forward_fact_ids": [
+                fact_id for fact_id in self._fact_ids if plan is not None and fact_id not in plan.fact_ids
+            ],
+        }
+
+    def _carried_forward_result(
+        self,
+        plan: _RegionPlan,
+        *,
+        frame_ids: list[str],
+        session_id: str | None,
+        trigger_wall_ms: int,
+    ) -> VisionFactExtractionResult:
+        source_frame_id = frame_ids[0] if frame_ids else "unknown_frame"
+        carried = self._carried_forward_facts(plan, source_frame_id=source_frame_id)
+        facts = [carried[fact_id] for fact_id in self._fact_ids if fact_id in carried]
+        cache_metadata = self._cache_metadata(hit=False)
+        # Nothing was re-read, so no fact is fresh for this trigger.
+        summary = build_vision_fact_summary(
+            {fact.fact_id: fact.to_dict() for fact in facts},
+            status="available",
+            frame_ids=frame_ids,
+            fresh_fact_ids=[],
+            cache=cache_metadata,
+        )
+        region_metadata = {
+            "mode": "regions",
+            "queried_regions": [],
+            "queried_fact_ids": [],
+            "carried_forward_fact_ids": list(self._fact_ids),
+        }
+        observation = VisionFactObservation(
+            session_id=session_id,
+            trigger_wall_ms=trigger_wall_ms,
+            frame_ids=list(frame_ids),
+            facts=facts,
+            summary=summary["summary_text"],
+            metadata={
+                "vision_fact_summary": summary,
+                "carried_forward_fact_ids": list(self._fact_ids),
+            },
+        )
+        return VisionFactExtractionResult(
+            status="available",
+            observation=observation,
+            metadata={
+                "frame_ids": list(frame_ids),
+                "multimodal_failed_frame_ids": [],
+                "multimodal_frame_failures": {},
+                "vision_fact_summary": summary,
+                "vision_fact_cache": cache_metadata,
+                "vision_fact_regions": region_metadata,
+                "raw_llm_text": "",
+            },
+        )
+
+    def _cache_metadata(self, *, hit: bool, distance: int | None = None) -> dict[str, Any]:
+        return {"hit": hit, "distance": distance, **self.result_cache.stats.to_dict()}
+
+    def _cached_result(
+        self,
+        cache_hit: VisionFactCacheHit,
+        *,
+        frame_ids: list[str],
+        session_id: str | None,
+        trigger_wall_ms: int,
+    ) -> VisionFactExtractionResult:
+        observation = restamp_cached_observation(
+            cache_hit.observation,
+            session_id=session_id,
+            trigger_wall_ms=trigger_wall_ms,
+            frame_ids=frame_ids,
+        )
+        cache_metadata = self._cache_metadata(hit=True, distance=cache_hit.distance)
+        summary = build_vision_fact_summary(
+            {fact.fact_id: fact.to_dict() for fact in observation.facts},
+            status="available",
+            frame_ids=frame_ids,
+            fresh_fact_ids=[fact.fact_id for fact in observation.facts if fact.state == "seen"],
+            cache=cache_metadata,
+        )
+        observation.metadata.pop("raw_llm_text", None)
+        observation.metadata["vision_fact_summary"] = summary
+        observation.metadata["vision_fact_cache"] = {
+            "hit": True,
+            "distance": cache_hit.distance,
+            "source_observation_id": cache_hit.observation.observation_id,
+            "source_trigger_wall_ms": cache_hit.source_trigger_wall_ms,
+        }
+        result_metadata: dict[str, Any] = {
+            "frame_ids": list(frame_ids),
+            "multimodal_failed_frame_ids": [],
+            "multimodal_frame_failures": {},
+            "vision_fact_summary": summary,
+            "vision_fact_cache": cache_metadata,
+            "raw_llm_text": "",
+        }
+        model_summary = observation.metadata.get("model_summary")
+        if isinstance(model_summary, str):
+            result_metadata["model_summary"] = model_summary
+        return VisionFactExtractionResult(status="available", observation=observation, metadata=result_metadata)
+
     def _candidate_frames(self, vision: Mapping[str, Any]) -> list[dict[str, Any]]:
         frames: list[dict[str, Any]] = []
         for key in ("pre_trigger_frame", "trigger_frame"):
@@ -371,13 +766,17 @@ class VisionFactExtractor:
             effective.pop(key, None)
         return effective
 
-    def _chat(self, messages: list[dict[str, Any]]) -> str:
+    def _chat(self, messages: list[dict[str, Any]], *, fact_ids: Sequence[str] | None = None) -> str:
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        include_json_schema = True
-        include_request_overrides = True
+        include_json_schema = not self.capability_cache.is_rejected(
+            self.base_url, self.model_name, CAPABILITY_JSON_SCHEMA
+        )
+        include_request_overrides = not self.capability_cache.is_rejected(
+            self.base_url, self.model_name, CAPABILITY_REQUEST_OVERRIDES
+        )
         while True:
             payload = {
                 "model": self.model_name,
@@ -389,28 +788,48 @@ class VisionFactExtractor:
                     include_request_overrides=include_request_overrides,
                 )
             )
-            response_format = self._build_response_format_payload(include_json_schema=include_json_schema)
+            response_format = self._build_response_format_payload(
+                include_json_schema=include_json_schema,
+                fact_ids=fact_ids,
+            )
             if response_format is not None:
                 payload["response_format"] = response_format
             response = self._client.post(
                 f"{self.base_url}/v1/chat/completions",
                 json=payload,
                 headers=headers,
-                timeout=self.timeout_s,
+                timeout=self._request_timeout,
             )
             if getattr(response, "status_code", None) != 400:
                 break
             if include_request_overrides and is_request_override_unsupported_400(response):
                 include_request_overrides = False
+                self.capability_cache.record_rejected(
+                    self.base_url,
+                    self.model_name,
+                    CAPABILITY_REQUEST_OVERRIDES,
+                    reason=extract_response_error_text(response),
+                )
                 continue
             if include_json_schema and is_json_schema_unsupported_400(response):
                 include_json_schema = False
+                self.capability_cache.record_rejected(
+                    self.base_url,
+                    self.model_name,
+                    CAPABILITY_JSON_SCHEMA,
+                    reason=extract_response_error_text(response),
+                )
                 continue
             break
         if is_multimodal_unsupported_400(response):
-            raise MultimodalRequestRejected(
-                extract_response_error_text(response) or "server rejected multimodal request"
+            error_text = extract_response_error_text(response) or "server rejected multimodal request"
+            self.capability_cache.record_rejected(
+                self.base_url,
+                self.model_name,
+                CAPABILITY_MULTIMODAL,
+                reason=error_text,
             )
+            raise MultimodalRequestRejected(error_text)
         response.raise_for_status()
         body = response.json()
         if not isinstance(body, Mapping):
@@ -454,7 +873,12 @@ class VisionFactExtractor:
             return {"enable_thinking": False}
         return {"chat_template_kwargs": {"enable_thinking": False}}
 
-    def _build_response_format_payload(self, *, include_json_schema: bool) -> dict[str, object] | None:
+    def _build_response_format_payload(
+        self,
+        *,
+        include_json_schema: bool,
+        fact_ids: Sequence[str] | None = None,
+    ) -> dict[str, object] | None:
         if not include_json_schema:
             return None
         if self._should_use_json_object_response_format():
@@ -464,7 +888,7 @@ class VisionFactExtractor:
             "json_schema": {
                 "name": "VisionFactResponse",
                 "strict": True,
-                "schema": _vision_fact_response_schema(fact_ids=self._fact_ids),
+                "schema": _vision_fact_response_schema(fact_ids=self._fact_ids if fact_ids is None else fact_ids),
             },
         }
 
@@ -475,7 +899,9 @@ class VisionFactExtractor:
         frame_ids: Sequence[str],
         session_id: str | None,
         trigger_wall_ms: int,
+        fact_ids: Sequence[str] | None = None,
     ) -> VisionFactObservation:
+        requested_fact_ids = tuple(self._fact_ids if fact_ids is None else fact_ids)
         obj, _ = parse_first_json(raw_text)
         if not isinstance(obj, Mapping):
             raise ValueError("vision fact response must be a JSON object")
@@ -483,7 +909,7 @@ class VisionFactExtractor:
         if raw_facts is not None and not isinstance(raw_facts, list):
             raise ValueError("vision fact response facts must be a list")
         sanitized_obj, ignored_fact_fields, skipped_non_mapping_fact_count, skipped_incomplete_mapping_fact_count, skipped_unknown_fact_id_count = _sanitize_model_response(
-            obj, valid_fact_ids=frozenset(self._fact_ids)
+            obj, valid_fact_ids=frozenset(requested_fact_ids)
         )
         self._response_validator.validate(sanitized_obj)
         facts_raw = sanitized_obj.get("facts")
@@ -496,7 +922,7 @@ class VisionFactExtractor:
             if not isinstance(item, Mapping):
                 continue
             fact_id = item.get("fact_id")
-            if not isinstance(fact_id, str) or fact_id not in self._fact_ids or fact_id in facts_by_id:
+            if not isinstance(fact_id, str) or fact_id not in requested_fact_ids or fact_id in facts_by_id:
                 continue
             spec = self._config["facts_by_id"][fact_id]
             facts_by_id[fact_id] = VisionFact(
@@ -510,7 +936,7 @@ class VisionFactExtractor:
             )
 
         facts: list[VisionFact] = []
-        for fact_id in self._fact_ids:
+        for fact_id in requested_fact_ids:
             fact = facts_by_id.get(fact_id)
             if fact is None:
                 spec = self._config["facts_by_id"][fact_id]
@@ -540,7 +966,7 @@ class VisionFactExtractor:
             metadata={
                 "raw_fact_count": len(raw_facts) if isinstance(raw_facts, list) else 0,
                 "sanitized_fact_count": len(facts_raw),
-                "configured_fact_count": len(self._fact_ids),
+                "configured_fact_count": len(requested_fact_ids),
                 "coerced_source_frame_fact_ids": ignored_legacy_source_frame_fact_ids,
                 "coerced_source_frame_fact_ids_alias_of": "ignored_legacy_source_frame_fact_ids",
                 "ignored_legacy_source_frame_fact_ids": ignored_legacy_source_frame_fact_ids,
@@ -0,0 +1,295 @@
+"""
+Run vision fact extraction off the help-cycle critical path.
+
+`VisionFactPrefetcher` wraps a `VisionFactExtractor` with a small worker pool.
+The live loop calls `prefetch()` whenever new sidecar frames arrive so the VLM
+request for the newest frames is already in flight (or finished) when help is
+pressed. `start()` reuses that result by frame-id key, or starts an on-demand
+request, and returns at once so the caller can overlap other work; `wait()`
+then blocks at most `timeout_s` before falling back to a text-only
+`vision_unavailable` result. `extract()` is `start()` followed by `wait()`.
+
+A reused result was computed for an earlier (speculative or previous) trigger,
+so `wait()` returns a copy of its observation re-stamped to the consuming
+press: new observation id, that press's trigger time and request ids, and the
+original trigger kept as `prefetched_trigger_wall_ms`. Fact read times are
+left unchanged.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from uuid import uuid4
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Mapping
+
+from adapters.vision_fact_extractor import VisionFactExtractionResult
+
+DEFAULT_PREFETCH_MAX_RESULTS = 8
+# Minimum spacing of speculative requests for frames that carry no region hashes.
+SPECULATIVE_MIN_INTERVAL_MS = 1000
+VISION_FACT_TIMEOUT_REASON = "vision_fact_timeout"
+_REUSABLE_STATUSES = frozenset({"available", "uncertain"})
+
+
+@dataclass
+class VisionFactPrefetchStats:
+    speculative_started: int = 0
+    hits: int = 0
+    inflight_hits: int = 0
+    misses: int = 0
+    timeouts: int = 0
+
+
+@dataclass(frozen=True)
+class VisionFactRequest:
+    """Handle returned by `VisionFactPrefetcher.start()`; pass it to `wait()`."""
+
+    key: tuple[str, ...]
+    future: Future[VisionFactExtractionResult]
+    prefetch_state: str
+    trigger_wall_ms: int
+    request_id: str | None = None
+    help_cycle_id: str | None = None
+
+
+def vision_frame_key(vision: Mapping[str, Any]) -> tuple[str, ...]:
+    """Frame ids the extractor would send for this selection (trigger pair, else first two selected)."""
+    frame_ids: list[str] = []
+    for key in ("pre_trigger_frame", "trigger_frame"):
+        raw = vision.get(key)
+        if isinstance(raw, Mapping) and isinstance(raw.get("frame_id"), str) and raw.get("frame_id"):
+            frame_ids.append(str(raw["frame_id"]))
+    if frame_ids:
+        return tuple(frame_ids)
+    selected = vision.get("selected_frames")
+    if not isinstance(selected, list):
+        return ()
+    for item in selected:
+        if not isinstance(item, Mapping):
+            continue
+        frame_id = item.get("frame_id")
+        if isinstance(frame_id, str) and frame_id and frame_id not in frame_ids:
+            frame_ids.append(frame_id)
+        if len(frame_ids) >= 2:
+            break
+    return tuple(frame_ids)
+
+
+def _restamp_for_request(
+    result: VisionFactExtractionResult,
+    request: VisionFactRequest,
+) -> VisionFactExtractionResult:
+    observation = result.observation
+    if observation is None:
+        return result
+    ids = {
+        key: value
+        for key, value in (("request_id", request.request_id), ("help_cycle_id", request.help_cycle_id))
+        if value is not None
+    }
+    restamped = replace(
+        observation,
+        observation_id=str(uuid4()),
+        trigger_wall_ms=request.trigger_wall_ms,
+        facts=list(observation.facts),
+        metadata={**observation.metadata, **ids, "prefetched_trigger_wall_ms": observation.trigger_wall_ms},
+    )
+    return replace(
+        result,
+        observation=restamped,
+        metadata={**result.metadata, "prefetched_trigger_wall_ms": observation.trigger_wall_ms},
+    )
+
+
+class VisionFactPrefetcher:
+    def __init__(
+        self,
+        extractor: Any,
+        *,
+        session_id: str | None,
+        max_results: int = DEFAULT_PREFETCH_MAX_RESULTS,
+    ) -> None:
+        self.extractor = extractor
+        self.session_id = session_id
+        self.max_results = max(1, int(max_results))
+        self.stats = VisionFactPrefetchStats()
+        # One worker for speculation, one kept free for on-demand help-cycle requests.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vision-fact-prefetch")
+        self._lock = threading.RLock()
+        self._results: OrderedDict[tuple[str, ...], Future[VisionFactExtractionResult]] = OrderedDict()
+        self._speculative: Future[VisionFactExtractionResult] | None = None
+        self._pending: tuple[tuple[str, ...], Callable[[], tuple[dict[str, Any], int] | None]] | None = None
+        self._closed = False
+
+    def prefetch(self, vision: Mapping[str, Any], *, trigger_wall_ms: int) -> bool:
+        """Start speculative extraction for `vision`; returns False when deduplicated or deferred."""
+        payload = dict(vision)
+        return self.prefetch_frames(vision_frame_key(vision), lambda: (payload, int(trigger_wall_ms)))
+
+    def prefetch_frames(
+        self,
+        key: tuple[str, ...],
+        build_vision: Callable[[], tuple[dict[str, Any], int] | None],
+    ) -> bool:
+        """
+        Start speculative extraction keyed by frame ids; `build_vision` runs on the worker.
+
+        `build_vision` returns `(vision, trigger_wall_ms)`, or None when there is nothing to
+        extract. Returns False when `key` is already known or the request was deferred.
+        """
+        if not key:
+            return False
+        with self._lock:
+            if self._closed or key in self._results:
+                return False
+            if self._speculative is not None and not self._speculative.done():
+                # Only the newest deferred selection is worth running next.
+                self._pending = (tuple(key), build_vision)
+                return False
+            self._start_speculative_locked(tuple(key), build_vision)
+            return True
+
+    def extract(
+        self,
+        vision: Mapping[str, Any],
+        *,
+        trigger_wall_ms: int,
+        timeout_s: float | None = None,
+    ) -> tuple[VisionFactExtractionResult, dict[str, Any]]:
+        return self.wait(self.start(vision, trigger_wall_ms=trigger_wall_ms), timeout_s=timeout_s)
+
+    def start(self, vision: Mapping[str, Any], *, trigger_wall_ms: int) -> VisionFactRequest:
+        """Reuse or start the extraction for `vision` without waiting for it."""
+        key = vision_frame_key(vision)
+        with self._lock:
+            future = self._results.get(key) if key else None
+            if future is not None and future.done() and future.result().status not in _REUSABLE_STATUSES:
+                # A failed speculative attempt is retried rather than replayed.
+                future = None
+            if future is None:
+                prefetch_state = "miss"
+                self.stats.misses += 1
+                future = self._executor.submit(self._run_extract, dict(vision), int(trigger_wall_ms))
+                if key:
+                    self._remember_locked(key, future)
+            elif future.done():
+                prefetch_state = "hit"
+                self.stats.hits += 1
+            else:
+                prefetch_state = "inflight"
+                self.stats.inflight_hits += 1
+        return VisionFactRequest(
+            key=key,
+            future=future,
+            prefetch_state=prefetch_state,
+            trigger_wall_ms=int(trigger_wall_ms),
+            request_id=vision.get("request_id") if isinstance(vision.get("request_id"), str) else None,
+            help_cycle_id=vision.get("help_cycle_id") if isinstance(vision.get("help_cycle_id"), str) else None,
+        )
+
+    def wait(
+        self,
+        request: VisionFactRequest,
+        *,
+        timeout_s: float | None = None,
+    ) -> tuple[VisionFactExtractionResult, dict[str, Any]]:
+        key, future = request.key, request.future
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            result = future.result(timeout=timeout_s)
+        except FutureTimeoutError:
+            timed_out = True
+            self.stats.timeouts += 1
+            result = VisionFactExtractionResult(
+                status="vision_unavailable",
+                error=VISION_FACT_TIMEOUT_REASON,
+                metadata={"frame_ids": list(key), "multimodal_failure_reason": VISION_FACT_TIMEOUT_REASON},
+            )
+        if not timed_out and result.status not in _REUSABLE_STATUSES and key:
+            with self._lock:
+                if self._results.get(key) is future:
+                    del self._results[key]
+        if not timed_out and request.prefetch_state != "miss":
+            result = _restamp_for_request(result, request)
+        timing = {
+            "prefetch": request.prefetch_state,
+            "wait_ms": round((time.perf_counter() - started) * 1000.0, 3),
+            "timed_out": timed_out,
+        }
+        return result, timing
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._pending = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_extract(self, vision: dict[str, Any], trigger_wall_ms: int) -> VisionFactExtractionResult:
+        try:
+            return self.extractor.extract(vision, session_id=self.session_id, trigger_wall_ms=trigger_wall_ms)
+        except Exception as exc:
+            return VisionFactExtractionResult(
+                status="extractor_failed",
+                error=f"{type(exc).__name__}: {exc}",
+                metadata={"frame_ids": list(vision_frame_key(vision))},
+            )
+
+    def _run_speculative(
+        self,
+        key: tuple[str, ...],
+        build_vision: Callable[[], tuple[dict[str, Any], int] | None],
+    ) -> VisionFactExtractionResult:
+        try:
+            built = build_vision()
+        except Exception as exc:
+            return VisionFactExtractionResult(
+                status="extractor_failed",
+                error=f"{type(exc).__name__}: {exc}",
+                metadata={"frame_ids": list(key)},
+            )
+        if built is None:
+            return VisionFactExtractionResult(status="vision_unavailable", metadata={"frame_ids": list(key)})
+        vision, trigger_wall_ms = built
+        return self._run_extract(vision, trigger_wall_ms)
+
+    def _start_speculative_locked(
+        self,
+        key: tuple[str, ...],
+        build_vision: Callable[[], tuple[dict[str, Any], int] | None],
+    ) -> None:
+        future = self._executor.submit(self._run_speculative, key, build_vision)
+        self.stats.speculative_started += 1
+        self._speculative = future
+        self._remember_locked(key, future)
+        future.add_done_callback(self._on_speculative_done)
+
+    def _on_speculative_done(self, _future: Future[VisionFactExtractionResult]) -> None:
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+            if self._closed or pending is None or pending[0] in self._results:
+                return
+            self._start_speculative_locked(*pending)
+
+    def _remember_locked(self, key: tuple[str, ...], future: Future[VisionFactExtractionResult]) -> None:
+        self._results[key] = future
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+
+__all__ = [
+    "DEFAULT_PREFETCH_MAX_RESULTS",
+    "SPECULATIVE_MIN_INTERVAL_MS",
+    "VISION_FACT_TIMEOUT_REASON",
+    "VisionFactPrefetchStats",
+    "VisionFactPrefetcher",
+    "VisionFactRequest",
+    "vision_frame_key",
+]
@@ -4,7 +4,7 @@ Prompt builder for structured visual-fact extraction.
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 from adapters.vision_prompting import build_vlm_region_prompt
 from core.vision_facts import load_vision_facts_config
@@ -21,6 +21,7 @@ def build_vision_fact_prompt(
     vision: Mapping[str, Any] | None = None,
     lang: str = "zh",
     config: Mapping[str, Any] | None = None,
+    regions: Sequence[str] | None = None,
 ) -> str:
     del vision  # intentionally unused; kept for backward compat
     current_config = config if config is not None else load_vision_facts_config()
@@ -32,7 +33,15 @@ def build_vision_fact_prompt(
         else "No facts are configured; output an empty facts array."
     )
 
+    region_list = ", ".join(regions) if regions else ""
     if lang == "en":
+        input_block = (
+            f"The input contains cropped display-region images for only these regions: {region_list}.\n"
+            "If a region has two crops, they are ordered as pre-trigger frame first and trigger frame second.\n"
+            if regions
+            else "The input contains one or two composite-panel images with fixed top-to-bottom regions: left_ddi, ampcd, right_ddi.\n"
+            "If two images are provided, they are ordered as pre-trigger frame first and trigger frame second.\n"
+        )
         facts_block = _render_fact_list(fact_ids, empty_label="(none configured)")
         if fact_ids:
             example = (
@@ -43,8 +52,7 @@ def build_vision_fact_prompt(
             example = '{"summary":"one short sentence","facts":[]}'
         return (
             "You are the SimTutor visual fact extractor for the F/A-18C cold-start flow.\n"
-            "The input contains one or two composite-panel images with fixed top-to-bottom regions: left_ddi, ampcd, right_ddi.\n"
-            "If two images are provided, they are ordered as pre-trigger frame first and trigger frame second.\n"
+            f"{input_block}"
             "\n"
             "Task:\n"
             "Inspect only the provided image or images and label the configured visual facts below.\n"
@@ -88,6 +96,13 @@ def build_vision_fact_prompt(
             f"{example}"
         )
     else:
+        input_block = (
+            f"输入只包含以下显示区域的裁剪图：{region_list}。\n"
+            "如果同一区域有两张裁剪图，顺序是 pre_trigger_frame 在前、trigger_frame 在后。\n"
+            if regions
+            else "输入可能包含一张或两张组合面板图，固定从上到下依次是：left_ddi、ampcd、right_ddi。\n"
+            "如果提供两张图，顺序是 pre_trigger_frame 在前、trigger_frame 在后。\n"
+        )
         facts_block = _render_fact_list(fact_ids, empty_label="（当前没有配置 fact）")
         if fact_ids:
             example = (
@@ -100,8 +115,7 @@ def build_vision_fact_prompt(
             zh_include = "当前没有配置 fact；输出空的 facts 数组。"
         return (
             "你是 SimTutor 的视觉事实抽取器，负责 F/A-18C 冷启动流程的视觉事实判断。\n"
-            "输入可能包含一张或两张组合面板图，固定从上到下依次是：left_ddi、ampcd、right_ddi。\n"
-            "如果提供两张图，顺序是 pre_trigger_frame 在前、trigger_frame 在后。\n"
+            f"{input_block}"
             "\n"
             "任务：\n"
             "只根据当前提供的图像，为下面配置中的视觉 facts 输出标注。\n"
@@ -5,14 +5,18 @@ left-stack composite panel layout.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
 import json
 from pathlib import Path
+import re
 from typing import Any, Mapping
 
 from PIL import Image, ImageDraw, ImageFont
 
+from adapters.frame_manifest_watch import DirectoryChangeWaiter, ManifestTailer
+from adapters.perceptual_hash import region_dhashes
 from adapters.vision_prompting import DEFAULT_LAYOUT_ID, load_vision_layout, solve_layout_geometry
 from core.types_v2 import VisionObservation
 from ports.vision_port import VisionPort
@@ -35,6 +39,23 @@ _LABEL_BACKGROUNDS: dict[str, str] = {
     "right_ddi": "#10252f",
 }
 _CANVAS_BACKGROUND = "#0f1418"
+_TEXT_OCR_PRIORITIES = frozenset({"high", "medium"})
+_MANIFEST_ENTRY_SCHEMA_VERSION = "v2"
+_MANIFEST_ENTRY_KEYS = frozenset(
+    {
+        "schema_version",
+        "frame_id",
+        "capture_wall_ms",
+        "frame_seq",
+        "channel",
+        "layout_id",
+        "image_path",
+        "width",
+        "height",
+        "source_session_id",
+    }
+)
+_MANIFEST_FRAME_ID_RE = re.compile(r"^[0-9]{10,20}_[0-9]{6}$")
 
 
 def build_frames_root(saved_games_dir: str | Path) -> Path:
@@ -78,6 +99,7 @@ def render_vlm_ready_frame(
     output_path: str | Path,
     *,
     layout: Mapping[str, Any] | None = None,
+    compress_level: int | None = None,
 ) -> dict[str, Any]:
     resolved_source = Path(source_path).expanduser().resolve()
     resolved_output = Path(output_path).expanduser().resolve()
@@ -85,21 +107,79 @@ def render_vlm_ready_frame(
 
     with Image.open(resolved_source) as source_image:
         image = source_image.convert("RGB")
-        solved = solve_layout_geometry(current_layout, output_width=image.width, output_height=image.height)
-        strip_rect = solved["strip_rect"]
-        crop_box = (
-            int(strip_rect["x"]),
-            int(strip_rect["y"]),
-            int(strip_rect["x"]) + int(strip_rect["width"]),
-            int(strip_rect["y"]) + int(strip_rect["height"]),
+    template = _artifact_template(
+        json.dumps(current_layout, sort_keys=True, ensure_ascii=False, default=str),
+        image.width,
+        image.height,
+    )
+    region_hashes = region_dhashes(image, template.region_boxes, text_regions=template.text_region_ids)
+    canvas = Image.new("RGB", template.canvas_size, _CANVAS_BACKGROUND)
+    canvas.paste(image.crop(template.crop_box), (template.margin, template.margin))
+    canvas.paste(template.overlay, (0, 0), template.overlay)
+
+    resolved_output.parent.mkdir(parents=True, exist_ok=True)
+    if compress_level is None:
+        canvas.save(resolved_output)
+    else:
+        canvas.save(resolved_output, format="PNG", compress_level=int(compress_level))
+    return {
+        "crop_rect": dict(template.crop_rect),
+        "regions": [dict(region) for region in template.regions],
+        "region_hashes": region_hashes,
+        "source_size": {"width": image.width, "height": image.height},
+        "artifact_size": {"width": canvas.width, "height": canvas.height},
+    }
+
+
+@dataclass(frozen=True)
+class _ArtifactTemplate:
+    crop_box: tuple[int, int, int, int]
+    crop_rect: dict[str, int]
+    region_boxes: dict[str, tuple[int, int, int, int]]
+    # Regions the layout marks for OCR; hashed with a pixel digest so text edits never look unchanged.
+    text_region_ids: frozenset[str]
+    regions: tuple[dict[str, Any], ...]
+    margin: int
+    canvas_size: tuple[int, int]
+    # Region guides and labels on a transparent layer, composited over each pasted crop.
+    overlay: Image.Image
+
+
+@lru_cache(maxsize=8)
+def _artifact_template(layout_json: str, width: int, height: int) -> _ArtifactTemplate:
+    """Everything about a VLM artifact that depends only on the layout and the source size."""
+    layout = json.loads(layout_json)
+    solved = solve_layout_geometry(layout, output_width=width, output_height=height)
+    text_region_ids = frozenset(
+        str(region["region_id"])
+        for region in layout.get("regions", [])
+        if isinstance(region, Mapping) and region.get("ocr_priority") in _TEXT_OCR_PRIORITIES
+    )
+    strip_rect = solved["strip_rect"]
+    crop_box = (
+        int(strip_rect["x"]),
+        int(strip_rect["y"]),
+        int(strip_rect["x"]) + int(strip_rect["width"]),
+        int(strip_rect["y"]) + int(strip_rect["height"]),
+    )
+    cropped_width = crop_box[2] - crop_box[0]
+    cropped_height = crop_box[3] - crop_box[1]
+    region_boxes = {
+        str(region["region_id"]): (
+            int(region["x"]),
+            int(region["y"]),
+            int(region["x"]) + int(region["width"]),
+            int(region["y"]) + int(region["height"]),
         )
-        cropped = image.crop(crop_box)
+        for region in solved["regions"]
+    }
 
-    margin = max(20, cropped.width // 24)
-    border_width = max(4, cropped.width // 160)
-    label_padding_x = max(10, cropped.width // 70)
-    label_padding_y = max(6, cropped.height // 160)
-    label_font = _load_font(max(18, cropped.height // 32))
+    margin = max(20, cropped_width // 24)
+    border_width = max(4, cropped_width // 160)
+    label_padding_x = max(10, cropped_width // 70)
+    label_padding_y = max(6, cropped_height // 160)
+    label_font = _load_font(max(18, cropped_height // 32))
+    measure = ImageDraw.Draw(Image.new("RGB", (1, 1)))
     label_specs: list[dict[str, Any]] = []
     for region in solved["regions"]:
         region_id = str(region["region_id"])
@@ -108,7 +188,7 @@ def render_vlm_ready_frame(
         label_background = _LABEL_BACKGROUNDS.get(region_id)
         if accent is None or label_background is None:
             raise ValueError(f"unsupported vision layout region_id for VLM artifact rendering: {region_id!r}")
-        label_bbox = ImageDraw.Draw(Image.new("RGB", (1, 1))).textbbox((0, 0), label_text, font=label_font)
+        label_bbox = measure.textbbox((0, 0), label_text, font=label_font)
         label_width = (label_bbox[2] - label_bbox[0]) + label_padding_x * 2
         label_height = (label_bbox[3] - label_bbox[1]) + label_padding_y * 2
         label_specs.append(
@@ -123,9 +203,9 @@ def render_vlm_ready_frame(
         )
 
     right_padding = max(margin * 2, max((int(spec["label_width"]) for spec in label_specs), default=0) + margin * 2)
-    canvas = Image.new("RGB", (cropped.width + margin * 2 + right_padding, cropped.height + margin * 2), _CANVAS_BACKGROUND)
-    canvas.paste(cropped, (margin, margin))
-    draw = ImageDraw.Draw(canvas)
+    canvas_size = (cropped_width + margin * 2 + right_padding, cropped_height + margin * 2)
+    overlay = Image.new("RGBA", canvas_size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
 
     region_metadata: list[dict[str, Any]] = []
     for region, label_spec in zip(solved["regions"], label_specs):
@@ -154,13 +234,13 @@ def render_vlm_ready_frame(
 
         label_x = min(
             local_x + local_w + border_width * 3,
-            canvas.width - margin - label_width,
+            canvas_size[0] - margin - label_width,
         )
         label_y = max(
             margin,
             min(
                 local_y + (local_h // 2) - (label_height // 2),
-                canvas.height - margin - label_height,
+                canvas_size[1] - margin - label_height,
             ),
         )
         draw.rounded_rectangle(
@@ -192,19 +272,73 @@ def render_vlm_ready_frame(
             }
         )
 
-    resolved_output.parent.mkdir(parents=True, exist_ok=True)
-    canvas.save(resolved_output)
-    return {
-        "crop_rect": {
+    return _ArtifactTemplate(
+        crop_box=crop_box,
+        crop_rect={
             "x": int(strip_rect["x"]),
             "y": int(strip_rect["y"]),
             "width": int(strip_rect["width"]),
             "height": int(strip_rect["height"]),
         },
-        "regions": region_metadata,
-        "source_size": {"width": image.width, "height": image.height},
-        "artifact_size": {"width": canvas.width, "height": canvas.height},
+        region_boxes=region_boxes,
+        text_region_ids=text_region_ids,
+        regions=tuple(region_metadata),
+        margin=margin,
+        canvas_size=canvas_size,
+        overlay=overlay,
+    )
+
+
+def build_region_crop_path(
+    image_path: str | Path,
+    region_id: str,
+    *,
+    artifact_dir_name: str = DEFAULT_ARTIFACT_DIRNAME,
+) -> Path:
+    source = Path(image_path)
+    region = _require_text(region_id, "region_id")
+    return source.parent / _normalize_artifact_dir_name(artifact_dir_name) / f"{source.stem}_{region}.png"
+
+
+def render_region_crops(
+    source_path: str | Path,
+    region_ids: list[str] | tuple[str, ...],
+    *,
+    layout: Mapping[str, Any] | None = None,
+    artifact_dir_name: str = DEFAULT_ARTIFACT_DIRNAME,
+) -> dict[str, Path]:
+    """Write one PNG per requested layout region of a source frame; existing up-to-date crops are reused."""
+    resolved_source = Path(source_path).expanduser().resolve()
+    current_layout = dict(layout) if isinstance(layout, Mapping) else load_vision_layout()
+    outputs = {
+        region_id: build_region_crop_path(resolved_source, region_id, artifact_dir_name=artifact_dir_name)
+        for region_id in region_ids
     }
+    source_mtime_ns = resolved_source.stat().st_mtime_ns
+    missing = [
+        region_id
+        for region_id, output in outputs.items()
+        if not output.exists() or output.stat().st_mtime_ns < source_mtime_ns
+    ]
+    if not missing:
+        return outputs
+    with Image.open(resolved_source) as source_image:
+        image = source_image.convert("RGB")
+    solved = solve_layout_geometry(current_layout, output_width=image.width, output_height=image.height)
+    regions_by_id = {str(region["region_id"]): region for region in solved["regions"]}
+    for region_id in missing:
+        region = regions_by_id.get(region_id)
+        if region is None:
+            raise ValueError(f"unknown vision layout region_id: {region_id!r}")
+        box = (
+            int(region["x"]),
+            int(region["y"]),
+            int(region["x"]) + int(region["width"]),
+            int(region["y"]) + int(region["height"]),
+        )
+        outputs[region_id].parent.mkdir(parents=True, exist_ok=True)
+        image.crop(box).save(outputs[region_id])
+    return outputs
 
 
 class FrameDirectoryVisionPort(VisionPort):
@@ -226,10 +360,12 @@ class FrameDirectoryVisionPort(VisionPort):
             raise ValueError(
                 f"unsupported layout_id {self.layout_id!r}; current crop pipeline only supports {loaded_layout_id!r}"
             )
-        self._manifest_offset = 0
         self._session_id: str | None = None
         self._channel_dir: Path | None = None
         self._manifest_path: Path | None = None
+        self._tailer: ManifestTailer | None = None
+        self._waiter: DirectoryChangeWaiter | None = None
+        self._pending_image_path: Path | None = None
 
     def start(self, session_id: str) -> None:
         if not isinstance(session_id, str) or not session_id.strip():
@@ -241,43 +377,43 @@ class FrameDirectoryVisionPort(VisionPort):
             channel=self.channel,
         )
         self._manifest_path = build_frame_manifest_path(self._channel_dir)
-        self._manifest_offset = 0
+        self._close_watchers()
+        self._tailer = ManifestTailer(self._manifest_path)
+        # Watch from start() on so a write between poll() and the first wait is not missed.
+        self._waiter = DirectoryChangeWaiter(self._channel_dir)
 
     def poll(self) -> list[VisionObservation]:
-        if self._channel_dir is None or self._manifest_path is None:
+        if self._channel_dir is None or self._manifest_path is None or self._tailer is None:
             raise RuntimeError("FrameDirectoryVisionPort.start(session_id) must be called before poll()")
-        if not self._manifest_path.exists():
+        # A line held back for a missing image is re-read once that image lands, even if the manifest is unchanged.
+        pending_ready = self._pending_image_path is not None and self._pending_image_path.exists()
+        if not self._tailer.changed(force=pending_ready):
             return []
 
         observations: list[VisionObservation] = []
-        with self._manifest_path.open("r", encoding="utf-8") as handle:
-            handle.seek(self._manifest_offset)
-            while True:
-                line_start = handle.tell()
-                line = handle.readline()
-                if not line:
-                    break
-                if not line.endswith("\n"):
-                    handle.seek(line_start)
-                    break
-                next_offset = handle.tell()
-                try:
-                    entry_raw = json.loads(line)
-                except json.JSONDecodeError:
-                    handle.seek(line_start)
-                    break
-                self._manifest_offset = next_offset
-                if not isinstance(entry_raw, dict):
-                    raise ValueError(f"vision frame manifest line must be an object: {self._manifest_path}")
+        self._pending_image_path = None
+        for line_start, line in self._tailer.iter_lines():
+            if not line.endswith(b"\n"):
+                break
+            try:
+                entry_raw = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                break
+            self._tailer.offset = line_start + len(line)
+            if not isinstance(entry_raw, dict):
+                raise ValueError(f"vision frame manifest line must be an object: {self._manifest_path}")
+            if not _is_valid_manifest_entry(entry_raw):
+                # The fast path only accepts; the full schema produces the precise error.
                 validate_instance(entry_raw, "vision_frame_manifest_entry")
-                entry = dict(entry_raw)
-                image_path = self._resolve_image_path(entry["image_path"])
-                if not is_final_frame_path(image_path):
-                    continue
-                if not image_path.exists():
-                    self._manifest_offset = line_start
-                    break
-                observations.append(self._build_observation(entry, image_path=image_path))
+            entry = dict(entry_raw)
+            image_path = self._resolve_image_path(entry["image_path"])
+            if not is_final_frame_path(image_path):
+                continue
+            if not image_path.exists():
+                self._tailer.offset = line_start
+                self._pending_image_path = image_path
+                break
+            observations.append(self._build_observation(entry, image_path=image_path))
         observations.sort(
             key=lambda observation: (
                 observation.capture_wall_ms if isinstance(observation.capture_wall_ms, int) else -1,
@@ -286,12 +422,29 @@ class FrameDirectoryVisionPort(VisionPort):
         )
         return observations
 
+    def wait_for_frames(self, timeout_s: float) -> bool:
+        """Block until the channel directory changes (or `timeout_s` passes); True means poll() may have news."""
+        if self._channel_dir is None:
+            raise RuntimeError("FrameDirectoryVisionPort.start(session_id) must be called before wait_for_frames()")
+        if self._waiter is None:
+            self._waiter = DirectoryChangeWaiter(self._channel_dir)
+        return self._waiter.wait(timeout_s)
+
     def stop(self) -> None:
-        self._manifest_offset = 0
+        self._close_watchers()
         self._session_id = None
         self._channel_dir = None
         self._manifest_path = None
 
+    def _close_watchers(self) -> None:
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
+        if self._tailer is not None:
+            self._tailer.close()
+            self._tailer = None
+        self._pending_image_path = None
+
     def _resolve_image_path(self, raw_path: Any) -> Path:
         if not isinstance(raw_path, str) or not raw_path.strip():
             raise ValueError("vision frame manifest image_path must be a non-empty string")
@@ -389,6 +542,24 @@ def _load_font(size: int) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
     return ImageFont.load_default()
 
 
+def _is_valid_manifest_entry(entry: Mapping[str, Any]) -> bool:
+    """Hand-compiled `vision_frame_manifest_entry` check for the per-line hot path."""
+    if entry.keys() != _MANIFEST_ENTRY_KEYS or entry["schema_version"] != _MANIFEST_ENTRY_SCHEMA_VERSION:
+        return False
+    frame_id = entry["frame_id"]
+    if not isinstance(frame_id, str) or _MANIFEST_FRAME_ID_RE.match(frame_id) is None:
+        return False
+    for key, minimum in (("capture_wall_ms", 0), ("frame_seq", 0), ("width", 1), ("height", 1)):
+        value = entry[key]
+        if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+            return False
+    for key in ("channel", "layout_id", "image_path", "source_session_id"):
+        value = entry[key]
+        if not isinstance(value, str) or not value:
+            return False
+    return True
+
+
 def _require_text(value: Any, label: str) -> str:
     if not isinstance(value, str) or not value.strip():
         raise ValueError(f"{label} must be a non-empty string")
@@ -429,7 +600,9 @@ __all__ = [
     "build_frame_id",
     "build_frame_manifest_path",
     "build_frames_root",
+    "build_region_crop_path",
     "build_vlm_artifact_path",
     "is_final_frame_path",
+    "render_region_crops",
     "render_vlm_ready_frame",
 ]
@@ -5,11 +5,12 @@ Shared buffering and help-cycle frame selection for live/replay vision sidecars.
 from __future__ import annotations
 
 from bisect import bisect_left
+from itertools import islice
 from dataclasses import dataclass
 from datetime import datetime
 import math
 import time
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator
 
 from core.types_v2 import VisionObservation
 from ports.vision_port import VisionPort
@@ -19,6 +20,7 @@ DEFAULT_REPLAY_SYNC_WINDOW_MS = 100
 DEFAULT_LIVE_TRIGGER_WAIT_MS = 250
 _POLL_SLEEP_S = 0.02
 _SELECTION_POLICIES = {"window", "trigger_only"}
+_HISTORY_COMPACT_MIN_HEAD = 256
 
 
 def _capture_wall_ms(observation: VisionObservation) -> int | None:
@@ -43,7 +45,7 @@ def _frame_payload(
 ) -> dict[str, Any]:
     capture_wall_ms = _capture_wall_ms(observation)
     sync_delta_ms = None if capture_wall_ms is None else capture_wall_ms - trigger_wall_ms
-    return {
+    payload = {
         "role": role,
         "frame_id": observation.frame_id,
         "capture_wall_ms": capture_wall_ms,
@@ -59,6 +61,10 @@ def _frame_payload(
         "frame_stale": bool(sync_delta_ms is not None and sync_delta_ms < 0),
         "sync_miss_reason": None,
     }
+    region_hashes = observation.metadata.get("region_hashes") if isinstance(observation.metadata, dict) else None
+    if isinstance(region_hashes, dict) and region_hashes:
+        payload["region_hashes"] = dict(region_hashes)
+    return payload
 
 
 def _primary_sync_payload(
@@ -109,6 +115,83 @@ def _trigger_sync_status(*, capture_wall_ms: int, trigger_wall_ms: int) -> str:
     return "matched_future_fallback"
 
 
+class VisionFrameHistory:
+    """
+    Frames ordered by `(capture_wall_ms, frame_id)` with bisect window queries.
+
+    Retention only advances a head index; the backing lists are compacted once
+    the dropped prefix outweighs the live frames, so pruning never copies the
+    history per poll. Frames without a capture time sort first (key -1), are
+    never returned by `window()` and go on the next prune.
+    """
+
+    def __init__(self, observations: Iterable[VisionObservation] = ()) -> None:
+        self._keys: list[tuple[int, str]] = []
+        self._observations: list[VisionObservation] = []
+        self._frame_ids: set[str] = set()
+        self._head = 0
+        for observation in observations:
+            self.insert(observation)
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._head
+
+    def __iter__(self) -> Iterator[VisionObservation]:
+        return islice(self._observations, self._head, None)
+
+    def __contains__(self, frame_id: object) -> bool:
+        return frame_id in self._frame_ids
+
+    @staticmethod
+    def key(observation: VisionObservation) -> tuple[int, str]:
+        capture_wall_ms = _capture_wall_ms(observation)
+        return ((capture_wall_ms if capture_wall_ms is not None else -1), observation.frame_id)
+
+    def insert(self, observation: VisionObservation) -> bool:
+        """Insert in capture order; False (and no change) when the frame_id is already buffered."""
+        if observation.frame_id in self._frame_ids:
+            return False
+        self._frame_ids.add(observation.frame_id)
+        key = self.key(observation)
+        if len(self._keys) == self._head or key >= self._keys[-1]:
+            self._keys.append(key)
+            self._observations.append(observation)
+            return True
+        insert_at = bisect_left(self._keys, key, lo=self._head)
+        self._keys.insert(insert_at, key)
+        self._observations.insert(insert_at, observation)
+        return True
+
+    def latest_capture_wall_ms(self) -> int | None:
+        if len(self._keys) == self._head or self._keys[-1][0] < 0:
+            return None
+        return self._keys[-1][0]
+
+    def prune_before(self, cutoff_wall_ms: int) -> list[VisionObservation]:
+        """Drop frames captured before `cutoff_wall_ms` (and frames without a capture time)."""
+        end = bisect_left(self._keys, (max(0, int(cutoff_wall_ms)), ""), lo=self._head)
+        if end == self._head:
+            return []
+        removed = self._observations[self._head:end]
+        for observation in removed:
+            self._frame_ids.discard(observation.frame_id)
+        self._head = end
+        if self._head >= _HISTORY_COMPACT_MIN_HEAD and self._head * 2 >= len(self._keys):
+            del self._keys[: self._head]
+            del self._observations[: self._head]
+            self._head = 0
+        return removed
+
+    def window(self, start_wall_ms: int, end_wall_ms: int) -> list[tuple[int, str, VisionObservation]]:
+        """`(capture_wall_ms, frame_id, observation)` for captures in `[start_wall_ms, end_wall_ms]`, in order."""
+        lo = bisect_left(self._keys, (max(0, int(start_wall_ms)), ""), lo=self._head)
+        hi = bisect_left(self._keys, (int(end_wall_ms) + 1, ""), lo=lo)
+        return [
+            (key[0], key[1], observation)
+            for key, observation in zip(self._keys[lo:hi], self._observations[lo:hi])
+        ]
+
+
 @dataclass(frozen=True)
 class HelpCycleVisionSelection:
     status: str
@@ -180,7 +263,7 @@ def _select_primary_observation(
 
 
 def select_help_cycle_frames(
-    observations: Iterable[VisionObservation],
+    observations: Iterable[VisionObservation] | VisionFrameHistory,
     *,
     trigger_wall_ms: int,
     sync_window_ms: int,
@@ -196,17 +279,22 @@ def select_help_cycle_frames(
         observation_t_wall_s=observation_t_wall_s,
         trigger_wall_ms=trigger_wall_ms,
     )
-    normalized: list[tuple[int, str, VisionObservation]] = []
-    seen_frame_ids: set[str] = set()
-    for observation in observations:
-        capture_wall_ms = _capture_wall_ms(observation)
-        if capture_wall_ms is None:
-            continue
-        if observation.frame_id in seen_frame_ids:
-            continue
-        seen_frame_ids.add(observation.frame_id)
-        normalized.append((capture_wall_ms, observation.frame_id, observation))
-    normalized.sort(key=lambda item: (item[0], item[1]))
+    normalized: list[tuple[int, str, VisionObservation]]
+    if isinstance(observations, VisionFrameHistory):
+        # Only frames inside the sync window can be selected, so skip the rest of the buffer.
+        normalized = observations.window(trigger_wall_ms - window_ms, trigger_wall_ms + window_ms)
+    else:
+        normalized = []
+        seen_frame_ids: set[str] = set()
+        for observation in observations:
+            capture_wall_ms = _capture_wall_ms(observation)
+            if capture_wall_ms is None:
+                continue
+            if observation.frame_id in seen_frame_ids:
+                continue
+            seen_frame_ids.add(observation.frame_id)
+            normalized.append((capture_wall_ms, observation.frame_id, observation))
+        normalized.sort(key=lambda item: (item[0], item[1]))
 
     resolved_observation, resolved_sync_status = _select_primary_observation(
         normalized,
@@ -349,62 +437,46 @@ class BufferedVisionSession:
         if self.selection_policy not in _SELECTION_POLICIES:
             raise ValueError(f"unsupported vision selection_policy: {self.selection_policy!r}")
         self.observation_sink = observation_sink
-        self._history: list[VisionObservation] = []
-        self._frame_ids: set[str] = set()
+        self._history = VisionFrameHistory()
         self.vision_port.start(session_id)
 
     @staticmethod
     def _history_key(observation: VisionObservation) -> tuple[int, str]:
-        capture_wall_ms = _capture_wall_ms(observation)
-        return ((capture_wall_ms if capture_wall_ms is not None else -1), observation.frame_id)
-
-    def _insert_observation(self, observation: VisionObservation) -> None:
-        key = self._history_key(observation)
-        if not self._history:
-            self._history.append(observation)
-            return
-        if key >= self._history_key(self._history[-1]):
-            self._history.append(observation)
-            return
-        keys = [self._history_key(item) for item in self._history]
-        insert_at = bisect_left(keys, key)
-        self._history.insert(insert_at, observation)
+        return VisionFrameHistory.key(observation)
 
     def _prune_history(self) -> None:
-        if not self._history or self.retention_ms <= 0:
+        if self.retention_ms <= 0:
             return
-        latest_capture_wall_ms = _capture_wall_ms(self._history[-1])
+        latest_capture_wall_ms = self._history.latest_capture_wall_ms()
         if latest_capture_wall_ms is None:
             return
-        cutoff_wall_ms = latest_capture_wall_ms - self.retention_ms
-        prune_count = 0
-        for observation in self._history:
-            capture_wall_ms = _capture_wall_ms(observation)
-            if capture_wall_ms is None or capture_wall_ms < cutoff_wall_ms:
-                prune_count += 1
-                continue
-            break
-        if prune_count <= 0:
-            return
-        removed = self._history[:prune_count]
-        self._history = self._history[prune_count:]
-        for observation in removed:
-            self._frame_ids.discard(observation.frame_id)
+        self._history.prune_before(latest_capture_wall_ms - self.retention_ms)
 
     def poll(self) -> list[VisionObservation]:
         observations = self.vision_port.poll()
         added: list[VisionObservation] = []
         for observation in observations:
-            if observation.frame_id in self._frame_ids:
+            if not self._history.insert(observation):
                 continue
-            self._frame_ids.add(observation.frame_id)
-            self._insert_observation(observation)
             added.append(observation)
             if self.observation_sink is not None:
                 self.observation_sink(observation)
         self._prune_history()
         return added
 
+    def recent_frames(self) -> list[VisionObservation]:
+        """Buffered frames within one sync window of the newest capture, oldest first."""
+        latest_capture_wall_ms = self._history.latest_capture_wall_ms()
+        if latest_capture_wall_ms is None:
+            return []
+        return [
+            observation
+            for _capture_wall_ms, _frame_id, observation in self._history.window(
+                latest_capture_wall_ms - self.sync_window_ms,
+                latest_capture_wall_ms,
+            )
+        ]
+
     def select_for_help(self, *, trigger_wall_s: float) -> HelpCycleVisionSelection:
         trigger_wall_ms = int(round(float(trigger_wall_s) * 1000.0))
         deadline = time.monotonic() + (self.trigger_wait_ms / 1000.0)
@@ -420,9 +492,18 @@ class BufferedVisionSession:
                 return selection
             if selection.frame_id is not None:
                 return selection
-            if time.monotonic() >= deadline:
+            remaining_s = deadline - time.monotonic()
+            if remaining_s <= 0:
                 return selection
-            time.sleep(_POLL_SLEEP_S)
+            self._wait_for_frames(remaining_s)
+
+    def _wait_for_frames(self, timeout_s: float) -> None:
+        # Ports that can block on capture writes wake on the next frame instead of sleep-polling.
+        wait_for_frames = getattr(self.vision_port, "wait_for_frames", None)
+        if callable(wait_for_frames):
+            wait_for_frames(timeout_s)
+            return
+        time.sleep(min(_POLL_SLEEP_S, timeout_s))
 
     def close(self) -> None:
         self.vision_port.stop()
@@ -434,5 +515,6 @@ __all__ = [
     "DEFAULT_LIVE_TRIGGER_WAIT_MS",
     "DEFAULT_REPLAY_SYNC_WINDOW_MS",
     "HelpCycleVisionSelection",
+    "VisionFrameHistory",
     "select_help_cycle_frames",
 ]
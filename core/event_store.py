@@ -1,12 +1,24 @@
 """
 JSONL Event Store for recording and replaying SimTutor runs.
+
+`JsonlEventStore` writes and flushes one line per `append`.
+`BufferedJsonlEventStore` hands events to a background writer thread through a
+bounded queue so serialization and file I/O stay off the telemetry hot path;
+both produce the same one-JSON-object-per-line format read by `load`.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import queue
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Union
+from typing import Any, Callable, Iterable, Iterator, List, Union
 
 from core.types import Event
 
@@ -40,3 +52,344 @@ class JsonlEventStore:
 
     def __exit__(self, exc_type, exc, tb):
         self.close()
+
+
+EVENT_OVERFLOW_BLOCK = "block"
+EVENT_OVERFLOW_DROP = "drop"
+EVENT_OVERFLOW_POLICIES = (EVENT_OVERFLOW_BLOCK, EVENT_OVERFLOW_DROP)
+DEFAULT_EVENT_QUEUE_MAX = 4096
+DEFAULT_EVENT_FLUSH_MAX_EVENTS = 256
+DEFAULT_EVENT_FLUSH_INTERVAL_S = 0.05
+_WRITER_POLL_S = 0.05
+
+_FLUSH_SIGNALS = tuple(
+    sig for sig in (getattr(signal, "SIGINT", None), getattr(signal, "SIGTERM", None)) if sig is not None
+)
+
+
+@dataclass
+class EventStoreStats:
+    appended: int = 0
+    written: int = 0
+    dropped: int = 0
+    backpressure_waits: int = 0
+    flushes: int = 0
+    write_errors: int = 0
+    max_queue_depth: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "appended": self.appended,
+            "written": self.written,
+            "dropped": self.dropped,
+            "backpressure_waits": self.backpressure_waits,
+            "flushes": self.flushes,
+            "write_errors": self.write_errors,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class _FlushMarker:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class BufferedJsonlEventStore(JsonlEventStore):
+    """
+    JSONL event store with a background writer thread.
+
+    `append` only enqueues; `Event.to_dict()` and `json.dumps` run on the writer,
+    so callers must not mutate an event after appending it. `append_deferred`
+    goes further and runs the event's construction there as well. Lines are flushed to
+    the OS once `flush_max_events` are pending or `flush_interval_s` has passed.
+    When the queue is full, `overflow="block"` waits for the writer and
+    `overflow="drop"` discards the event; both are counted in `stats`.
+    `flush_on_signal=True` drains the queue on SIGINT/SIGTERM before running the
+    previous handler (main thread only). If the writer thread ever stops, queued
+    and later events are written synchronously by the appending thread instead.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: str = "a",
+        *,
+        queue_max: int = DEFAULT_EVENT_QUEUE_MAX,
+        flush_max_events: int = DEFAULT_EVENT_FLUSH_MAX_EVENTS,
+        flush_interval_s: float = DEFAULT_EVENT_FLUSH_INTERVAL_S,
+        overflow: str = EVENT_OVERFLOW_BLOCK,
+        fsync_on_close: bool = False,
+        flush_on_signal: bool = False,
+    ):
+        if overflow not in EVENT_OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {EVENT_OVERFLOW_POLICIES}, got {overflow!r}")
+        super().__init__(path, mode=mode)
+        self.queue_max = max(1, int(queue_max))
+        self.flush_max_events = max(1, int(flush_max_events))
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.overflow = overflow
+        self.fsync_on_close = bool(fsync_on_close)
+        self.stats = EventStoreStats()
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=self.queue_max)
+        self._stats_lock = threading.Lock()
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self._previous_handlers: dict[int, Any] = {}
+        self._sync_lock = threading.Lock()
+        # Set while the main thread is inside the queue or a synchronous write, where a
+        # signal-handler flush would deadlock on the locks it interrupted.
+        self._main_thread_busy = threading.Event()
+        self._writer_done = threading.Event()
+        self._writer = threading.Thread(target=self._writer_loop, name="jsonl-event-writer", daemon=True)
+        self._writer.start()
+        if flush_on_signal:
+            self._install_signal_handlers()
+
+    def append_deferred(self, build_event: Callable[[], Event | dict]) -> None:
+        """Queue `build_event`; the writer calls it and serializes the result in append order."""
+        self.append(build_event)  # type: ignore[arg-type]
+
+    def append(self, event: Event | dict) -> None:
+        if self._closed:
+            raise ValueError("append to closed event store")
+        with self._stats_lock:
+            self.stats.appended += 1
+        if not self._enqueue(event):
+            self._drain_synchronously(event)
+            return
+        depth = self._queue.qsize()
+        if depth > self.stats.max_queue_depth:
+            with self._stats_lock:
+                self.stats.max_queue_depth = max(self.stats.max_queue_depth, depth)
+        if self._writer_done.is_set():
+            # The writer stopped after this event was queued.
+            self._drain_synchronously()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every event appended so far is written and flushed; False on timeout."""
+        if self._closed:
+            return True
+        marker = _FlushMarker()
+        if not self._enqueue(marker):
+            self._drain_synchronously()
+            return True
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        while True:
+            remaining = _WRITER_POLL_S if deadline is None else min(_WRITER_POLL_S, deadline - time.monotonic())
+            if marker.done.wait(max(0.0, remaining)):
+                return True
+            if self._writer_done.is_set():
+                self._drain_synchronously()
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._restore_signal_handlers()
+        if self._enqueue(_STOP):
+            self._writer.join()
+        # Anything the writer left behind when it stopped is written here.
+        self._drain_synchronously()
+        if self._fh.closed:
+            return
+        try:
+            self._fh.flush()
+            if self.fsync_on_close:
+                os.fsync(self._fh.fileno())
+        finally:
+            self._fh.close()
+
+    @contextmanager
+    def _main_thread_section(self) -> Iterator[None]:
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        self._main_thread_busy.set()
+        try:
+            yield
+        finally:
+            self._main_thread_busy.clear()
+
+    def _enqueue(self, item: Any) -> bool:
+        """Hand `item` to the writer (or drop it under overflow="drop"); False once the writer has stopped."""
+        with self._main_thread_section():
+            if self._writer_done.is_set():
+                return False
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                pass
+            if self.overflow == EVENT_OVERFLOW_DROP and not isinstance(item, _FlushMarker) and item is not _STOP:
+                with self._stats_lock:
+                    self.stats.dropped += 1
+                return True
+            with self._stats_lock:
+                self.stats.backpressure_waits += 1
+            while not self._writer_done.is_set():
+                try:
+                    self._queue.put(item, timeout=_WRITER_POLL_S)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+    def _drain_synchronously(self, *extra: Any) -> None:
+        """Write whatever is still queued, then `extra`, on the calling thread; used once the writer has stopped."""
+        with self._main_thread_section(), self._sync_lock:
+            lines: list[str] = []
+            markers: list[_FlushMarker] = []
+            items: list[Any] = []
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in [*items, *extra]:
+                if item is _STOP:
+                    continue
+                if isinstance(item, _FlushMarker):
+                    markers.append(item)
+                    continue
+                line = self._serialize(item)
+                if line is not None:
+                    lines.append(line)
+            if lines:
+                self._write_lines(lines)
+                self._flush_file()
+            for marker in markers:
+                marker.done.set()
+
+    def _writer_loop(self) -> None:
+        try:
+            self._run_writer()
+        finally:
+            self._writer_done.set()
+
+    def _run_writer(self) -> None:
+        pending = 0
+        last_flush = time.monotonic()
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, self.flush_interval_s - (time.monotonic() - last_flush))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            stop = False
+            markers: list[_FlushMarker] = []
+            lines: list[str] = []
+            while item is not None:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _FlushMarker):
+                    markers.append(item)
+                else:
+                    line = self._serialize(item)
+                    if line is not None:
+                        lines.append(line)
+                if stop or len(lines) >= self.flush_max_events:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            if lines:
+                pending += self._write_lines(lines)
+            if pending and (
+                stop
+                or markers
+                or pending >= self.flush_max_events
+                or (time.monotonic() - last_flush) >= self.flush_interval_s
+            ):
+                self._flush_file()
+                pending = 0
+                last_flush = time.monotonic()
+            for marker in markers:
+                marker.done.set()
+            if stop:
+                # Writes after close() are rejected, so the queue is empty here
+                # except for markers from flush() racing the shutdown.
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    if isinstance(item, _FlushMarker):
+                        item.done.set()
+
+    def _serialize(self, event: Event | dict | Callable[[], Event | dict]) -> str | None:
+        # Deferred builders run arbitrary code here; one bad event must not stop the writer.
+        try:
+            if callable(event):
+                event = event()
+            payload = event if isinstance(event, dict) else event.to_dict()
+            return json.dumps(payload)
+        except Exception:
+            with self._stats_lock:
+                self.stats.write_errors += 1
+            return None
+
+    def _write_lines(self, lines: list[str]) -> int:
+        try:
+            self._fh.write("\n".join(lines))
+            self._fh.write("\n")
+        except (OSError, ValueError):
+            with self._stats_lock:
+                self.stats.write_errors += len(lines)
+            return 0
+        with self._stats_lock:
+            self.stats.written += len(lines)
+        return len(lines)
+
+    def _flush_file(self) -> None:
+        try:
+            self._fh.flush()
+        except (OSError, ValueError):
+            with self._stats_lock:
+                self.stats.write_errors += 1
+            return
+        with self._stats_lock:
+            self.stats.flushes += 1
+
+    def _install_signal_handlers(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for signum in _FLUSH_SIGNALS:
+            try:
+                self._previous_handlers[signum] = signal.signal(signum, self._handle_signal)
+            except (OSError, ValueError):
+                continue
+
+    def _restore_signal_handlers(self) -> None:
+        handlers, self._previous_handlers = self._previous_handlers, {}
+        if not handlers or threading.current_thread() is not threading.main_thread():
+            return
+        for signum, previous in handlers.items():
+            try:
+                signal.signal(signum, previous)
+            except (OSError, ValueError, TypeError):
+                continue
+
+    def _handle_signal(self, signum: int, frame: Any) -> None:
+        previous = self._previous_handlers.get(signum, signal.SIG_DFL)
+        # The interrupted frame may be enqueueing or writing while holding the locks a
+        # flush needs; flushing then would deadlock, so fall through to the previous handler.
+        if not self._main_thread_busy.is_set():
+            self.flush(timeout=1.0)
+        if callable(previous):
+            previous(signum, frame)
+        elif previous == signal.SIG_DFL:
+            if signum == getattr(signal, "SIGINT", None):
+                raise KeyboardInterrupt
+            self.close()
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
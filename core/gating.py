@@ -10,15 +10,23 @@ Supported DSL operations (v1):
 Input observations are dicts (matching Observation.to_dict()) and can be
 evaluated using dot-delimited paths into the payload or top-level fields.
 Stable vars are preferred when available (vars.<key> or bare <key>).
+
+`compile_rules` turns a rule list into op-specialized predicates with var paths
+resolved once; it returns the same reasons as `GatingEngine` and is used for
+pack-wide gate evaluation, where one `GateEvalContext` shares var reads across
+every gate. Both accept an `ObservationHistory`, which keeps a per-tag last-seen
+index so `time_since` does not rescan the history.
 """
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Iterable, Optional, Sequence, Tuple
+from typing import Any, Callable, Iterable, Optional, Sequence, Tuple, Union
 
 _UNKNOWN_TEXT_VALUES = frozenset({"unknown", "unk", "missing", "n/a", "na"})
+DEFAULT_OBSERVATION_HISTORY_MAX_ITEMS = 4096
 
 
 def _parse_time(value: str) -> datetime:
@@ -145,6 +153,101 @@ def _missing_keys(rule: dict[str, Any], keys: Iterable[str]) -> list[str]:
     return [key for key in keys if key not in rule]
 
 
+def _tag_in(obs: dict[str, Any], tag: Any) -> bool:
+    return tag in (obs.get("tags") or [])
+
+
+class ObservationHistory:
+    """
+    Bounded observation history with a per-tag last-seen index.
+
+    Mirrors the list semantics `time_since` uses (the latest observation is
+    excluded when looking for a tag) but answers in O(1): tags of an observation
+    are indexed, with its timestamp parsed once, when the next one is appended.
+    Index entries for observations evicted by `max_items` are ignored.
+    """
+
+    def __init__(
+        self,
+        observations: Iterable[dict[str, Any]] = (),
+        *,
+        max_items: int | None = DEFAULT_OBSERVATION_HISTORY_MAX_ITEMS,
+    ) -> None:
+        self.max_items = max(1, int(max_items)) if max_items is not None else None
+        self._items: deque[dict[str, Any]] = deque(maxlen=self.max_items)
+        self._appended = 0
+        self._tag_last_seen: dict[Any, tuple[int, datetime]] = {}
+        self._latest_time: Optional[datetime] = None
+        for obs in observations:
+            self.append(obs)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        return self._items[index]
+
+    def append(self, obs: dict[str, Any]) -> None:
+        if self._items:
+            previous = self._items[-1]
+            tags = previous.get("tags") or []
+            if tags:
+                previous_seq = self._appended - 1
+                previous_time = (
+                    self._latest_time if self._latest_time is not None else _parse_time(previous["timestamp"])
+                )
+                for tag in tags:
+                    self._tag_last_seen[tag] = (previous_seq, previous_time)
+        self._items.append(obs)
+        self._appended += 1
+        self._latest_time = None
+
+    def last_seen(self, tag: Any) -> Optional[datetime]:
+        """Timestamp of the newest retained non-latest observation carrying `tag`."""
+        entry = self._tag_last_seen.get(tag)
+        if entry is None:
+            return None
+        seq, seen_at = entry
+        if seq < self._appended - len(self._items):
+            return None
+        return seen_at
+
+    def latest_time(self) -> datetime:
+        if self._latest_time is None:
+            self._latest_time = _parse_time(self._items[-1]["timestamp"])
+        return self._latest_time
+
+
+HistoryLike = Union[Sequence[dict[str, Any]], ObservationHistory]
+
+
+def _eval_time_since(
+    history: HistoryLike,
+    latest: dict[str, Any],
+    *,
+    tag: Any,
+    at_least: Any,
+) -> Tuple[bool, Optional[str]]:
+    if isinstance(history, ObservationHistory):
+        last_ts = history.last_seen(tag)
+    else:
+        last_ts = None
+        for obs in reversed(history[:-1]):
+            if _tag_in(obs, tag):
+                last_ts = _parse_time(obs["timestamp"])
+                break
+    if last_ts is None:
+        return False, f"tag {tag} never seen"
+    now_ts = history.latest_time() if isinstance(history, ObservationHistory) else _parse_time(latest["timestamp"])
+    delta = (now_ts - last_ts).total_seconds()
+    if delta < at_least:
+        return False, f"time_since {tag} {delta:.1f}s<{at_least}"
+    return True, None
+
+
 @dataclass
 class RuleResult:
     allowed: bool
@@ -155,22 +258,28 @@ class GatingEngine:
     def __init__(self, rules: list[dict[str, Any]]):
         self.rules = rules
 
-    def evaluate(self, observations: Iterable[dict[str, Any]]) -> RuleResult:
+    def evaluate(self, observations: Iterable[dict[str, Any]] | ObservationHistory) -> RuleResult:
         result, _ = self.evaluate_with_failure_index(observations)
         return result
 
     def evaluate_with_failure_index(
         self,
-        observations: Iterable[dict[str, Any]],
+        observations: Iterable[dict[str, Any]] | ObservationHistory,
     ) -> Tuple[RuleResult, Optional[int]]:
+        if isinstance(observations, ObservationHistory):
+            return self.evaluate_with_failure_index_from_history(observations)
         obs_list = list(observations)
         return self.evaluate_with_failure_index_from_history(obs_list)
 
     def evaluate_with_failure_index_from_history(
         self,
-        observations_history: Sequence[dict[str, Any]],
+        observations_history: HistoryLike,
     ) -> Tuple[RuleResult, Optional[int]]:
-        history = observations_history if isinstance(observations_history, list) else list(observations_history)
+        history = (
+            observations_history
+            if isinstance(observations_history, (list, ObservationHistory))
+            else list(observations_history)
+        )
         if not history:
             return RuleResult(False, "no observations"), None
         latest = history[-1]
@@ -185,7 +294,7 @@ class GatingEngine:
         self,
         rule: dict[str, Any],
         latest: dict[str, Any],
-        history: list[dict[str, Any]],
+        history: HistoryLike,
         vars_source_missing: set[str],
     ) -> Tuple[bool, Optional[str]]:
         op = rule.get("op")
@@ -252,18 +361,207 @@ class GatingEngine:
             at_least = rule["at_least"]
             if not _is_number(at_least):
                 return False, "time_since at_least not numeric"
-            last_ts = None
-            for obs in reversed(history[:-1]):
-                tags = obs.get("tags") or []
-                if tag in tags:
-                    last_ts = _parse_time(obs["timestamp"])
-                    break
-            if last_ts is None:
-                return False, f"tag {tag} never seen"
-            now_ts = _parse_time(latest["timestamp"])
-            delta = (now_ts - last_ts).total_seconds()
-            if delta < at_least:
-                return False, f"time_since {tag} {delta:.1f}s<{at_least}"
-            return True, None
+            return _eval_time_since(history, latest, tag=tag, at_least=at_least)
         return False, f"unknown op {op}"
 
+
+
+_MISSING = object()
+
+
+class _VarLookup:
+    """A dotted var path with `_get_var` fallback candidates split once."""
+
+    __slots__ = ("path", "candidates", "var_key")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        candidates: list[str] = []
+        if "." not in path:
+            candidates.extend((f"payload.vars.{path}", f"vars.{path}"))
+        if path.startswith("vars."):
+            candidates.append(f"payload.{path}")
+        candidates.append(path)
+        self.candidates = tuple(tuple(candidate.split(".")) for candidate in dict.fromkeys(candidates))
+        self.var_key = _var_key_from_path(path)
+
+    def resolve(self, data: dict[str, Any]) -> Optional[Any]:
+        for parts in self.candidates:
+            current: Any = data
+            for part in parts:
+                if isinstance(current, dict) and part in current:
+                    current = current[part]
+                else:
+                    current = None
+                    break
+            if current is not None:
+                return current
+        return None
+
+
+class GateEvalContext:
+    """Latest observation plus history, with var reads memoized across rules."""
+
+    __slots__ = ("history", "latest", "vars_source_missing", "_reads")
+
+    def __init__(self, observations_history: HistoryLike) -> None:
+        self.history = (
+            observations_history
+            if isinstance(observations_history, (list, ObservationHistory))
+            else list(observations_history)
+        )
+        self.latest = self.history[-1] if self.history else {}
+        self.vars_source_missing = _collect_vars_source_missing(self.latest) if self.history else set()
+        self._reads: dict[str, tuple[Any, Optional[str]]] = {}
+
+    def read_var(self, lookup: _VarLookup) -> tuple[Any, Optional[str]]:
+        cached = self._reads.get(lookup.path, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+        val = lookup.resolve(self.latest)
+        source_missing = lookup.var_key is not None and lookup.var_key in self.vars_source_missing
+        if source_missing or _is_unknown_value(val):
+            read = (val, _format_unknown_reason(lookup.path, source_missing=source_missing, value=val))
+        else:
+            read = (val, None)
+        self._reads[lookup.path] = read
+        return read
+
+
+RulePredicate = Callable[[GateEvalContext], Tuple[bool, Optional[str]]]
+
+
+def _constant(ok: bool, why: Optional[str]) -> RulePredicate:
+    return lambda _ctx: (ok, why)
+
+
+def _compile_var_gte(rule: dict[str, Any]) -> RulePredicate:
+    lookup = _VarLookup(rule["var"])
+    threshold = rule["value"]
+    threshold_numeric = _is_number(threshold)
+    missing_reason = f"{lookup.path} missing"
+    not_numeric_reason = f"{lookup.path} not numeric"
+
+    def predicate(ctx: GateEvalContext) -> Tuple[bool, Optional[str]]:
+        val, unknown_reason = ctx.read_var(lookup)
+        if unknown_reason is not None:
+            return False, unknown_reason
+        if val is None:
+            return False, missing_reason
+        if not threshold_numeric or not _is_number(val):
+            return False, not_numeric_reason
+        if val < threshold:
+            return False, f"{lookup.path} ({val}) < {threshold}"
+        return True, None
+
+    return predicate
+
+
+def _compile_arg_in_range(rule: dict[str, Any]) -> RulePredicate:
+    lookup = _VarLookup(rule["var"])
+    low = rule["min"]
+    high = rule["max"]
+    bounds_numeric = _is_number(low) and _is_number(high)
+    missing_reason = f"{lookup.path} missing"
+    not_numeric_reason = f"{lookup.path} not numeric"
+
+    def predicate(ctx: GateEvalContext) -> Tuple[bool, Optional[str]]:
+        val, unknown_reason = ctx.read_var(lookup)
+        if unknown_reason is not None:
+            return False, unknown_reason
+        if val is None:
+            return False, missing_reason
+        if not _is_number(val) or not bounds_numeric:
+            return False, not_numeric_reason
+        if val < low or val > high:
+            return False, f"{lookup.path} ({val}) not in [{low},{high}]"
+        return True, None
+
+    return predicate
+
+
+def _compile_flag_true(rule: dict[str, Any]) -> RulePredicate:
+    lookup = _VarLookup(rule["var"])
+    missing_reason = f"{lookup.path} missing"
+    false_reason = f"{lookup.path} not true"
+
+    def predicate(ctx: GateEvalContext) -> Tuple[bool, Optional[str]]:
+        val, unknown_reason = ctx.read_var(lookup)
+        if unknown_reason is not None:
+            return False, unknown_reason
+        if val is None:
+            return False, missing_reason
+        bool_val = _coerce_flag_bool(val)
+        if bool_val is None:
+            return False, f"{lookup.path} not boolean(type={type(val).__name__}, value={val!r})"
+        if not bool_val:
+            return False, false_reason
+        return True, None
+
+    return predicate
+
+
+def _compile_time_since(rule: dict[str, Any]) -> RulePredicate:
+    tag = rule["tag"]
+    at_least = rule["at_least"]
+    if not _is_number(at_least):
+        return _constant(False, "time_since at_least not numeric")
+    return lambda ctx: _eval_time_since(ctx.history, ctx.latest, tag=tag, at_least=at_least)
+
+
+_RULE_COMPILERS: dict[str, tuple[tuple[str, ...], Callable[[dict[str, Any]], RulePredicate]]] = {
+    "var_gte": (("var", "value"), _compile_var_gte),
+    "arg_in_range": (("var", "min", "max"), _compile_arg_in_range),
+    "flag_true": (("var",), _compile_flag_true),
+    "time_since": (("tag", "at_least"), _compile_time_since),
+}
+
+
+def compile_rule(rule: dict[str, Any]) -> RulePredicate:
+    op = rule.get("op")
+    spec = _RULE_COMPILERS.get(op) if isinstance(op, str) else None
+    if spec is None:
+        return _constant(False, f"unknown op {op}")
+    required_keys, compiler = spec
+    missing = _missing_keys(rule, required_keys)
+    if missing:
+        return _constant(False, f"rule {op} missing keys: {missing}")
+    if "var" in required_keys and not isinstance(rule["var"], str):
+        # Non-string paths keep the interpreter's exact behavior.
+        engine = GatingEngine([])
+        return lambda ctx: engine._eval_rule(rule, ctx.latest, ctx.history, ctx.vars_source_missing)
+    return compiler(rule)
+
+
+class CompiledRuleSet:
+    def __init__(self, rules: Iterable[dict[str, Any]]) -> None:
+        self.rules = tuple(rules)
+        self._predicates = tuple(compile_rule(rule) for rule in self.rules)
+
+    def __len__(self) -> int:
+        return len(self._predicates)
+
+    def first_failure(self, ctx: GateEvalContext) -> Tuple[Optional[int], Optional[str]]:
+        """Index and reason of the first failing rule, or (None, None) when all pass."""
+        if not ctx.history:
+            return 0, "no observations"
+        for idx, predicate in enumerate(self._predicates):
+            ok, why = predicate(ctx)
+            if not ok:
+                return idx, why
+        return None, None
+
+    def evaluate_with_failure_index_from_history(
+        self,
+        observations_history: HistoryLike,
+    ) -> Tuple[RuleResult, Optional[int]]:
+        if not len(observations_history):
+            return RuleResult(False, "no observations"), None
+        idx, why = self.first_failure(GateEvalContext(observations_history))
+        if idx is None:
+            return RuleResult(True, None), None
+        return RuleResult(False, why), idx
+
+
+def compile_rules(rules: Iterable[dict[str, Any]]) -> CompiledRuleSet:
+    return CompiledRuleSet(rules)
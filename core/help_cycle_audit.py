@@ -17,6 +17,7 @@ HELP_CYCLE_AUDIT_FIELDS: tuple[str, ...] = (
     "fused_missing_conditions",
     "vision_fallback_reason",
     "layout_id",
+    "help_cycle_timing",
 )
 
 
@@ -1,12 +1,21 @@
 """
 Lightweight deterministic BM25 retriever over pre-built index.json.
+
+`tools/index_docs.py --binary` can also emit a compact memory-mappable sidecar
+(`index.bm25`) holding the token dictionary, postings, chunk tie-break ranks and
+chunk text; when it matches the JSON it is opened lazily instead of re-tokenizing.
 """
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
+import mmap
 import re
+import struct
+import sys
+from array import array
 from functools import lru_cache
 from collections import Counter, defaultdict
 from collections.abc import Mapping
@@ -16,6 +25,17 @@ from typing import Any
 from ports.knowledge_port import KnowledgePort
 
 _SNIPPET_PREVIEW_CHARS = 320
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
+BINARY_INDEX_SUFFIX = ".bm25"
+_BINARY_MAGIC = b"SIMBM25\x00"
+_BINARY_VERSION = 1
+# magic, version, n_chunks, n_tokens, n_postings, avgdl, source_size, source_mtime_ns
+_BINARY_HEADER = struct.Struct("<8sIIIIdqq")
+# token_offsets, token_blob, token_postings, token_idf, postings_chunk,
+# postings_weight, chunk_tie_rank, chunk_offsets, chunk_blob, end
+_BINARY_SECTIONS = struct.Struct("<10Q")
 
 
 def _tokenize(text: str) -> list[str]:
@@ -43,110 +63,433 @@ def _load_index_data_cached(resolved_path: str, mtime_ns: int, size_bytes: int)
     return json.loads(Path(resolved_path).read_text(encoding="utf-8"))
 
 
+def _tie_break_key(chunk: Mapping[str, Any]) -> tuple[str, str, str, str]:
+    return (
+        str(chunk.get("doc_id") or ""),
+        str(chunk.get("section") or ""),
+        str(chunk.get("page_or_heading") or ""),
+        str(chunk.get("snippet_id") or ""),
+    )
+
+
 def load_index_data(index_path: str | Path) -> Any:
     path = Path(index_path).expanduser().resolve()
     stat = path.stat()
     return _load_index_data_cached(str(path), int(stat.st_mtime_ns), int(stat.st_size))
 
 
+def _extract_chunks(data: Any) -> list[dict[str, Any]]:
+    chunks_out: list[dict[str, Any]] = []
+    documents = data.get("documents", []) if isinstance(data, Mapping) else []
+    for doc_idx, doc in enumerate(documents):
+        if not isinstance(doc, Mapping):
+            continue
+        doc_id = _normalize_optional_string(doc.get("doc_id")) or f"doc_{doc_idx}"
+        chunks = doc.get("chunks")
+        if not isinstance(chunks, list):
+            continue
+        for chunk_idx, chunk in enumerate(chunks):
+            if not isinstance(chunk, Mapping):
+                continue
+            content = _normalize_text(chunk.get("text")).strip()
+            if not content:
+                continue
+            section = _normalize_optional_string(chunk.get("section"))
+            if section is None:
+                section = _normalize_optional_string(chunk.get("heading"))
+            page_or_heading: Any = chunk.get("page_or_heading")
+            if page_or_heading is None:
+                page_or_heading = chunk.get("page")
+            if page_or_heading is None:
+                page_or_heading = section
+            snippet_id = (
+                _normalize_optional_string(chunk.get("snippet_id"))
+                or _normalize_optional_string(chunk.get("chunk_id"))
+                or f"{doc_id}_{chunk_idx}"
+            )
+            chunks_out.append(
+                {
+                    "doc_id": doc_id,
+                    "section": section,
+                    "page_or_heading": page_or_heading,
+                    "snippet": content[:_SNIPPET_PREVIEW_CHARS],
+                    "snippet_id": snippet_id,
+                    "content": content,
+                }
+            )
+    return chunks_out
+
+
+def _build_postings(
+    chunks: list[dict[str, Any]],
+) -> tuple[dict[str, int], float, dict[str, float], dict[str, list[tuple[int, float]]]]:
+    """
+    Build an inverted index: token -> [(chunk_idx, tf_weight)] plus per-token IDF.
+
+    `tf_weight` folds the per-chunk length normalization into the BM25 TF term so a
+    query only touches postings of its own tokens; scores match the per-chunk
+    formula exactly.
+    """
+    docs_terms = [Counter(_tokenize(c["content"])) for c in chunks]
+    doc_freq: dict[str, int] = defaultdict(int)
+    for terms in docs_terms:
+        for token in terms:
+            doc_freq[token] += 1
+    n_docs = len(docs_terms)
+    avgdl = sum(sum(terms.values()) for terms in docs_terms) / n_docs if n_docs else 0.0
+    idf: dict[str, float] = {}
+    postings: dict[str, list[tuple[int, float]]] = {}
+    if avgdl == 0.0:
+        return doc_freq, avgdl, idf, postings
+    k1 = _BM25_K1
+    b = _BM25_B
+    for token, df in doc_freq.items():
+        idf[token] = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+    for idx, terms in enumerate(docs_terms):
+        dl = sum(terms.values()) or 1
+        length_norm = k1 * (1 - b + b * dl / avgdl)
+        for token, tf in terms.items():
+            weight = (tf * (k1 + 1)) / (tf + length_norm)
+            postings.setdefault(token, []).append((idx, weight))
+    return doc_freq, avgdl, idf, postings
+
+
+def _tie_break_ranks(chunks: list[dict[str, Any]]) -> list[int]:
+    """Dense ranks of chunk tie-break keys; equal keys share a rank."""
+    keys = [_tie_break_key(chunk) for chunk in chunks]
+    ranks = [0] * len(keys)
+    rank = -1
+    previous: tuple[str, str, str, str] | None = None
+    for idx in sorted(range(len(keys)), key=keys.__getitem__):
+        if keys[idx] != previous:
+            rank += 1
+            previous = keys[idx]
+        ranks[idx] = rank
+    return ranks
+
+
+def _top_k(
+    scores: Mapping[int, float],
+    tie_keys: Any,
+    k: int,
+) -> list[tuple[int, float]]:
+    # Same order as sorting all hits by (-score, doc_id, section, page_or_heading, snippet_id).
+    return heapq.nsmallest(
+        k,
+        ((idx, score) for idx, score in scores.items() if score > 0),
+        key=lambda item: (-item[1], tie_keys[item[0]]),
+    )
+
+
+def _result_from_chunk(chunk: Mapping[str, Any], score: float) -> dict[str, Any]:
+    return {
+        "doc_id": chunk["doc_id"],
+        "section": chunk["section"],
+        "page_or_heading": chunk["page_or_heading"],
+        "snippet": chunk["snippet"],
+        "snippet_id": chunk["snippet_id"],
+        "score": score,
+    }
+
+
+def binary_index_path(index_path: str | Path) -> Path:
+    return Path(index_path).with_suffix(BINARY_INDEX_SUFFIX)
+
+
+def _pad8(buf: bytearray) -> None:
+    buf.extend(b"\x00" * (-len(buf) % 8))
+
+
+def write_binary_index(
+    index_data: Any,
+    output_path: str | Path,
+    *,
+    source_path: str | Path | None = None,
+) -> Path:
+    """
+    Write the memory-mappable BM25 sidecar for `index_data` (the index.json mapping).
+
+    When `source_path` is given, its size/mtime are recorded so readers can detect a
+    stale sidecar and fall back to the JSON index.
+    """
+    chunks = _extract_chunks(index_data)
+    _, avgdl, idf, postings = _build_postings(chunks)
+    tokens = sorted(postings)
+    source_size = -1
+    source_mtime_ns = -1
+    if source_path is not None:
+        source_stat = Path(source_path).stat()
+        source_size = int(source_stat.st_size)
+        source_mtime_ns = int(source_stat.st_mtime_ns)
+
+    token_offsets = array("Q", [0])
+    token_blob = bytearray()
+    token_postings = array("Q", [0])
+    token_idf = array("d")
+    postings_chunk = array("I")
+    postings_weight = array("d")
+    for token in tokens:
+        token_blob.extend(token.encode("utf-8"))
+        token_offsets.append(len(token_blob))
+        for idx, weight in postings[token]:
+            postings_chunk.append(idx)
+            postings_weight.append(weight)
+        token_postings.append(len(postings_chunk))
+        token_idf.append(idf[token])
+    chunk_tie_rank = array("I", _tie_break_ranks(chunks))
+    chunk_offsets = array("Q", [0])
+    chunk_blob = bytearray()
+    for chunk in chunks:
+        record = {
+            "doc_id": chunk["doc_id"],
+            "section": chunk["section"],
+            "page_or_heading": chunk["page_or_heading"],
+            "snippet_id": chunk["snippet_id"],
+            "content": chunk["content"],
+        }
+        chunk_blob.extend(json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        chunk_offsets.append(len(chunk_blob))
+
+    body = bytearray()
+    offsets: list[int] = []
+    base = _BINARY_HEADER.size + _BINARY_SECTIONS.size
+    for section in (
+        token_offsets.tobytes(),
+        bytes(token_blob),
+        token_postings.tobytes(),
+        token_idf.tobytes(),
+        postings_chunk.tobytes(),
+        postings_weight.tobytes(),
+        chunk_tie_rank.tobytes(),
+        chunk_offsets.tobytes(),
+        bytes(chunk_blob),
+    ):
+        _pad8(body)
+        offsets.append(base + len(body))
+        body.extend(section)
+    offsets.append(base + len(body))
+
+    header = _BINARY_HEADER.pack(
+        _BINARY_MAGIC,
+        _BINARY_VERSION,
+        len(chunks),
+        len(tokens),
+        len(postings_chunk),
+        float(avgdl),
+        source_size,
+        source_mtime_ns,
+    )
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(header + _BINARY_SECTIONS.pack(*offsets) + bytes(body))
+    return path
+
+
+class BinaryBM25Index:
+    """Read-only view over a `.bm25` sidecar; token lookups are built on first query."""
+
+    def __init__(self, path: str | Path) -> None:
+        if sys.byteorder != "little":
+            raise ValueError("binary BM25 index requires a little-endian host")
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                self.n_chunks,
+                self.n_tokens,
+                n_postings,
+                self.avgdl,
+                self.source_size,
+                self.source_mtime_ns,
+            ) = _BINARY_HEADER.unpack_from(self._mmap, 0)
+            if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+                raise ValueError(f"unsupported binary BM25 index: {self.path.name}")
+            sections = _BINARY_SECTIONS.unpack_from(self._mmap, _BINARY_HEADER.size)
+            if sections[-1] != len(self._mmap):
+                raise ValueError(f"truncated binary BM25 index: {self.path.name}")
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise
+        view = memoryview(self._mmap)
+        self._views = [view]
+
+        def track(part: memoryview) -> memoryview:
+            self._views.append(part)
+            return part
+
+        def section(pos: int, fmt: str | None = None, count: int | None = None) -> memoryview:
+            part = track(view[sections[pos] : sections[pos + 1]])
+            if fmt is not None:
+                itemsize = struct.calcsize(fmt)
+                part = track(track(part[: len(part) - len(part) % itemsize]).cast(fmt))
+            if count is not None:
+                part = track(part[:count])
+            return part
+
+        self._token_offsets = section(0, "Q")
+        self._token_blob = section(1)
+        self._token_postings = section(2, "Q")
+        self._token_idf = section(3, "d")
+        self._postings_chunk = section(4, "I", n_postings)
+        self._postings_weight = section(5, "d")
+        self._tie_rank = section(6, "I", self.n_chunks)
+        self._chunk_offsets = section(7, "Q")
+        self._chunk_blob = section(8)
+        self._token_ids: dict[str, int] | None = None
+
+    def matches_source(self, source_path: str | Path) -> bool:
+        try:
+            source_stat = Path(source_path).stat()
+        except OSError:
+            return False
+        return (
+            int(source_stat.st_size) == self.source_size
+            and int(source_stat.st_mtime_ns) == self.source_mtime_ns
+        )
+
+    def _token_lookup(self) -> dict[str, int]:
+        if self._token_ids is None:
+            offsets = self._token_offsets
+            blob = bytes(self._token_blob)
+            self._token_ids = {
+                blob[offsets[i] : offsets[i + 1]].decode("utf-8"): i for i in range(self.n_tokens)
+            }
+        return self._token_ids
+
+    def chunk(self, idx: int) -> dict[str, Any]:
+        start = self._chunk_offsets[idx]
+        end = self._chunk_offsets[idx + 1]
+        record = json.loads(bytes(self._chunk_blob[start:end]).decode("utf-8"))
+        content = record["content"]
+        return {
+            "doc_id": record["doc_id"],
+            "section": record["section"],
+            "page_or_heading": record["page_or_heading"],
+            "snippet": content[:_SNIPPET_PREVIEW_CHARS],
+            "snippet_id": record["snippet_id"],
+            "content": content,
+        }
+
+    def query(self, text: str, k: int = 5) -> list[dict[str, Any]]:
+        if k <= 0 or not self.n_chunks:
+            return []
+        q_terms = _tokenize(text)
+        if not q_terms:
+            return []
+        token_ids = self._token_lookup()
+        token_postings = self._token_postings
+        postings_chunk = self._postings_chunk
+        postings_weight = self._postings_weight
+        scores: dict[int, float] = {}
+        for q in q_terms:
+            token_id = token_ids.get(q)
+            if token_id is None:
+                continue
+            idf = self._token_idf[token_id]
+            for pos in range(token_postings[token_id], token_postings[token_id + 1]):
+                idx = postings_chunk[pos]
+                scores[idx] = scores.get(idx, 0.0) + idf * postings_weight[pos]
+        return [
+            _result_from_chunk(self.chunk(idx), score)
+            for idx, score in _top_k(scores, self._tie_rank, k)
+        ]
+
+    def close(self) -> None:
+        """Release the memory map so the `.bm25` file can be replaced or deleted (idempotent)."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "BinaryBM25Index":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+
+def open_binary_index(index_path: str | Path) -> BinaryBM25Index | None:
+    """
+    Open the binary index for `index_path` if usable, else return None.
+
+    A `.bm25` path is opened directly; for a JSON path the sidecar is used only when
+    it records the JSON file's current size and mtime.
+    """
+    path = Path(index_path)
+    if path.suffix == BINARY_INDEX_SUFFIX:
+        return BinaryBM25Index(path)
+    sidecar = binary_index_path(path)
+    if not sidecar.is_file():
+        return None
+    try:
+        index = BinaryBM25Index(sidecar)
+    except (OSError, ValueError):
+        return None
+    if not index.matches_source(path):
+        index.close()
+        return None
+    return index
+
+
 class BM25Retriever(KnowledgePort):
-    def __init__(self, index_path: str | Path):
+    def __init__(self, index_path: str | Path, *, prefer_binary: bool = True):
         self.index_path = Path(index_path)
+        self.binary_index = open_binary_index(self.index_path) if prefer_binary else None
+        self.data: Any = None
+        self._chunks: list[dict[str, Any]] | None = None
+        if self.binary_index is not None:
+            self.N = self.binary_index.n_chunks
+            self.avgdl = self.binary_index.avgdl
+            return
         self.data = load_index_data(self.index_path)
-        self.chunks: list[dict[str, Any]] = []
-        for doc_idx, doc in enumerate(self.data.get("documents", [])):
-            if not isinstance(doc, Mapping):
-                continue
-            doc_id = _normalize_optional_string(doc.get("doc_id")) or f"doc_{doc_idx}"
-            chunks = doc.get("chunks")
-            if not isinstance(chunks, list):
-                continue
-            for chunk_idx, chunk in enumerate(chunks):
-                if not isinstance(chunk, Mapping):
-                    continue
-                content = _normalize_text(chunk.get("text")).strip()
-                if not content:
-                    continue
-                section = _normalize_optional_string(chunk.get("section"))
-                if section is None:
-                    section = _normalize_optional_string(chunk.get("heading"))
-                page_or_heading: Any = chunk.get("page_or_heading")
-                if page_or_heading is None:
-                    page_or_heading = chunk.get("page")
-                if page_or_heading is None:
-                    page_or_heading = section
-                snippet_id = (
-                    _normalize_optional_string(chunk.get("snippet_id"))
-                    or _normalize_optional_string(chunk.get("chunk_id"))
-                    or f"{doc_id}_{chunk_idx}"
-                )
-                self.chunks.append(
-                    {
-                        "doc_id": doc_id,
-                        "section": section,
-                        "page_or_heading": page_or_heading,
-                        "snippet": content[:_SNIPPET_PREVIEW_CHARS],
-                        "snippet_id": snippet_id,
-                        "content": content,
-                    }
-                )
+        self._chunks = _extract_chunks(self.data)
         self._build_stats()
 
+    @property
+    def chunks(self) -> list[dict[str, Any]]:
+        """All chunks in index order; a binary index decodes them on first access only."""
+        if self._chunks is None:
+            binary_index = self.binary_index
+            assert binary_index is not None
+            self._chunks = [binary_index.chunk(idx) for idx in range(binary_index.n_chunks)]
+        return self._chunks
+
+    def close(self) -> None:
+        if self.binary_index is not None:
+            self.binary_index.close()
+
+    def __enter__(self) -> "BM25Retriever":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
     def _build_stats(self) -> None:
-        self.docs_terms = [Counter(_tokenize(c["content"])) for c in self.chunks]
-        self.doc_freq: dict[str, int] = defaultdict(int)
-        for terms in self.docs_terms:
-            for token in terms:
-                self.doc_freq[token] += 1
-        self.N = len(self.docs_terms)
-        self.avgdl = sum(sum(terms.values()) for terms in self.docs_terms) / self.N if self.N else 0.0
-
-    def _score(self, query_terms: list[str], idx: int) -> float:
-        k1 = 1.5
-        b = 0.75
-        if self.avgdl == 0.0:
-            return 0.0
-        terms = self.docs_terms[idx]
-        dl = sum(terms.values()) or 1
-        score = 0.0
-        for q in query_terms:
-            if q not in terms:
-                continue
-            df = self.doc_freq.get(q, 0)
-            idf = math.log(1 + (self.N - df + 0.5) / (df + 0.5))
-            tf = terms[q]
-            score += idf * ((tf * (k1 + 1)) / (tf + k1 * (1 - b + b * dl / self.avgdl)))
-        return score
+        self.doc_freq, self.avgdl, self.idf, self.postings = _build_postings(self.chunks)
+        self.N = len(self.chunks)
+        self._tie_keys = [_tie_break_key(chunk) for chunk in self.chunks]
 
     def query(self, text: str, k: int = 5) -> list[dict[str, Any]]:
+        if self.binary_index is not None:
+            return self.binary_index.query(text, k)
         if k <= 0 or not self.chunks:
             return []
         q_terms = _tokenize(text)
         if not q_terms:
             return []
-        scored: list[dict[str, Any]] = []
-        for idx, chunk in enumerate(self.chunks):
-            score = self._score(q_terms, idx)
-            if score <= 0:
+        scores: dict[int, float] = {}
+        # Accumulate in query-term order (duplicates included) to keep float sums identical.
+        for q in q_terms:
+            postings = self.postings.get(q)
+            if not postings:
                 continue
-            scored.append(
-                {
-                    "doc_id": chunk["doc_id"],
-                    "section": chunk["section"],
-                    "page_or_heading": chunk["page_or_heading"],
-                    "snippet": chunk["snippet"],
-                    "snippet_id": chunk["snippet_id"],
-                    "score": score,
-                }
-            )
-        scored.sort(
-            key=lambda item: (
-                -float(item["score"]),
-                str(item.get("doc_id") or ""),
-                str(item.get("section") or ""),
-                str(item.get("page_or_heading") or ""),
-                str(item.get("snippet_id") or ""),
-            )
-        )
-        return scored[:k]
-
+            idf = self.idf[q]
+            for idx, weight in postings:
+                scores[idx] = scores.get(idx, 0.0) + idf * weight
+        return [
+            _result_from_chunk(self.chunks[idx], score)
+            for idx, score in _top_k(scores, self._tie_keys, k)
+        ]
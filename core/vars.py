@@ -7,10 +7,13 @@ Maps raw telemetry (bios/lo/etc) to stable vars used by packs and gating.
 from __future__ import annotations
 
 import ast
+import heapq
+import operator
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Mapping
 
 import yaml
 
@@ -64,6 +67,7 @@ def _attribute_chain(node: ast.AST) -> list[str] | None:
 class _SourceRefCollector(ast.NodeVisitor):
     def __init__(self) -> None:
         self.refs: set[str] = set()
+        self.bare_roots: set[str] = set()
 
     def visit_Attribute(self, node: ast.Attribute) -> None:
         chain = _attribute_chain(node)
@@ -72,19 +76,12 @@ class _SourceRefCollector(ast.NodeVisitor):
             return
         self.generic_visit(node)
 
-
-def _extract_source_refs(expr: str) -> set[str]:
-    try:
-        root = ast.parse(expr, mode="eval")
-    except SyntaxError as exc:
-        raise VarResolverError(f"Invalid expression: {expr}") from exc
-    collector = _SourceRefCollector()
-    collector.visit(root)
-    return collector.refs
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id in _REF_ROOTS:
+            self.bare_roots.add(node.id)
 
 
-def _read_ref(ctx: Mapping[str, Any], ref: str) -> Any:
-    parts = ref.split(".")
+def _read_ref_parts(ctx: Mapping[str, Any], parts: tuple[str, ...]) -> Any:
     current: Any = ctx.get(parts[0], _MISSING)
     if current is _MISSING:
         return _MISSING
@@ -98,152 +95,288 @@ def _read_ref(ctx: Mapping[str, Any], ref: str) -> Any:
     return current
 
 
-def _find_missing_refs(expr: str, ctx: Mapping[str, Any]) -> list[str]:
-    missing: list[str] = []
-    for ref in sorted(_extract_source_refs(expr)):
-        value = _read_ref(ctx, ref)
-        if value is _MISSING or _is_missing_value(value):
-            missing.append(ref)
-    return missing
+_Evaluator = Callable[[Mapping[str, Any]], Any]
+
+_COMPARE_OPS: dict[type, tuple[Callable[[Any, Any], Any], bool]] = {
+    # op type -> (predicate, swallow TypeError as False)
+    ast.Eq: (operator.eq, False),
+    ast.NotEq: (operator.ne, False),
+    ast.Gt: (operator.gt, True),
+    ast.GtE: (operator.ge, True),
+    ast.Lt: (operator.lt, True),
+    ast.LtE: (operator.le, True),
+}
+
+
+def _raiser(message: str) -> _Evaluator:
+    def evaluate(ctx: Mapping[str, Any]) -> Any:
+        raise VarResolverError(message)
+
+    return evaluate
 
 
-def _safe_eval(expr: str, ctx: Mapping[str, Any]) -> Any:
+def _compile_node(n: ast.AST, expr: str) -> _Evaluator:
     """
-    Evaluate a restricted expression with consistent None handling:
+    Compile an AST node into a closure with consistent None handling:
     - Arithmetic: if any operand is None, return None.
     - Boolean ops: use truthiness (None -> False).
     - Comparisons: if either side is None, return False.
-    """
-    try:
-        node = ast.parse(expr, mode="eval")
-    except SyntaxError as exc:
-        raise VarResolverError(f"Invalid expression: {expr}") from exc
 
-    def resolve_attr(value: Any, attr: str) -> Any:
-        if isinstance(value, dict):
-            return value.get(attr)
-        return None
+    Unsupported constructs compile to closures that raise when reached, so errors
+    surface at evaluation time exactly like the interpreted evaluator did.
+    """
+    if isinstance(n, ast.Expression):
+        return _compile_node(n.body, expr)
+    if isinstance(n, ast.Constant):
+        constant = n.value
+        return lambda ctx: constant
+    if isinstance(n, ast.Name):
+        name = n.id
+        return lambda ctx: ctx.get(name)
+    if isinstance(n, ast.Attribute):
+        base_eval = _compile_node(n.value, expr)
+        attr = n.attr
+
+        def eval_attribute(ctx: Mapping[str, Any]) -> Any:
+            base = base_eval(ctx)
+            if isinstance(base, dict):
+                return base.get(attr)
+            return None
 
-    def eval_node(n: ast.AST) -> Any:
-        if isinstance(n, ast.Expression):
-            return eval_node(n.body)
-        if isinstance(n, ast.Constant):
-            return n.value
-        if isinstance(n, ast.Name):
-            return ctx.get(n.id)
-        if isinstance(n, ast.Attribute):
-            base = eval_node(n.value)
-            return resolve_attr(base, n.attr)
-        if isinstance(n, ast.Call):
-            if not isinstance(n.func, ast.Name) or n.func.id != "num":
-                raise VarResolverError(
-                    "Unsupported function call. Only num(value) is supported in expressions."
-                )
-            if len(n.args) != 1 or n.keywords:
-                raise VarResolverError("num(...) expects exactly one positional argument.")
-            return _to_number(eval_node(n.args[0]))
-        if isinstance(n, ast.UnaryOp):
-            operand = eval_node(n.operand)
-            if isinstance(n.op, ast.Not):
-                return not bool(operand)
-            if isinstance(n.op, ast.USub):
+        return eval_attribute
+    if isinstance(n, ast.Call):
+        if not isinstance(n.func, ast.Name) or n.func.id != "num":
+            return _raiser("Unsupported function call. Only num(value) is supported in expressions.")
+        if len(n.args) != 1 or n.keywords:
+            return _raiser("num(...) expects exactly one positional argument.")
+        arg_eval = _compile_node(n.args[0], expr)
+        return lambda ctx: _to_number(arg_eval(ctx))
+    if isinstance(n, ast.UnaryOp):
+        operand_eval = _compile_node(n.operand, expr)
+        if isinstance(n.op, ast.Not):
+            return lambda ctx: not bool(operand_eval(ctx))
+        if isinstance(n.op, ast.USub):
+
+            def eval_neg(ctx: Mapping[str, Any]) -> Any:
+                operand = operand_eval(ctx)
                 return -operand if operand is not None else None
-        if isinstance(n, ast.BoolOp):
-            if isinstance(n.op, ast.And):
-                for v in n.values:
-                    if not bool(eval_node(v)):
+
+            return eval_neg
+        return _after(operand_eval, _unsupported_message(n))
+    if isinstance(n, ast.BoolOp):
+        value_evals = tuple(_compile_node(v, expr) for v in n.values)
+        if isinstance(n.op, ast.And):
+
+            def eval_and(ctx: Mapping[str, Any]) -> Any:
+                for value_eval in value_evals:
+                    if not bool(value_eval(ctx)):
                         return False
                 return True
-            if isinstance(n.op, ast.Or):
-                for v in n.values:
-                    if bool(eval_node(v)):
+
+            return eval_and
+        if isinstance(n.op, ast.Or):
+
+            def eval_or(ctx: Mapping[str, Any]) -> Any:
+                for value_eval in value_evals:
+                    if bool(value_eval(ctx)):
                         return True
                 return False
-            raise VarResolverError(
-                f"Unsupported boolean operator:{type(n.op).__name__} in expression: {expr}"
+
+            return eval_or
+        return _raiser(f"Unsupported boolean operator:{type(n.op).__name__} in expression: {expr}")
+    if isinstance(n, ast.Compare):
+        return _compile_compare(n, expr)
+    if isinstance(n, ast.BinOp):
+        return _compile_binop(n, expr)
+    return _raiser(_unsupported_message(n))
+
+
+def _unsupported_message(n: ast.AST) -> str:
+    return f"Unsupported expression: {ast.dump(n, include_attributes=False)}"
+
+
+def _after(first: _Evaluator, message: str) -> _Evaluator:
+    def evaluate(ctx: Mapping[str, Any]) -> Any:
+        first(ctx)
+        raise VarResolverError(message)
+
+    return evaluate
+
+
+def _compile_compare(n: ast.Compare, expr: str) -> _Evaluator:
+    left_eval = _compile_node(n.left, expr)
+    steps: list[tuple[Callable[[Any, Any], Any] | None, bool, _Evaluator | str]] = []
+    for op, comp in zip(n.ops, n.comparators):
+        spec = _COMPARE_OPS.get(type(op))
+        if spec is None:
+            # Unsupported operators raise before their comparator is evaluated.
+            steps.append(
+                (
+                    None,
+                    False,
+                    f"Unsupported comparison operator: {op.__class__.__name__}. "
+                    f"Only ==, !=, >, >=, <, <= are supported.",
+                )
             )
-        if isinstance(n, ast.Compare):
-            left = eval_node(n.left)
-            for op, comp in zip(n.ops, n.comparators):
-                # Check for unsupported operators before evaluating comparator
-                if not isinstance(op, (ast.Eq, ast.NotEq, ast.Gt, ast.GtE, ast.Lt, ast.LtE)):
-                    raise VarResolverError(
-                        f"Unsupported comparison operator: {op.__class__.__name__}. "
-                        f"Only ==, !=, >, >=, <, <= are supported."
-                    )
-                right = eval_node(comp)
-                if left is None or right is None:
+            break
+        predicate, swallow_type_error = spec
+        steps.append((predicate, swallow_type_error, _compile_node(comp, expr)))
+    compiled_steps = tuple(steps)
+
+    def eval_compare(ctx: Mapping[str, Any]) -> Any:
+        left = left_eval(ctx)
+        for predicate, swallow_type_error, right_eval in compiled_steps:
+            if predicate is None:
+                raise VarResolverError(right_eval)
+            right = right_eval(ctx)
+            if left is None or right is None:
+                return False
+            if swallow_type_error:
+                try:
+                    ok = predicate(left, right)
+                except TypeError:
                     return False
-                if isinstance(op, ast.Eq):
-                    if not (left == right):
-                        return False
-                elif isinstance(op, ast.NotEq):
-                    if not (left != right):
-                        return False
-                elif isinstance(op, ast.Gt):
-                    try:
-                        ok = left > right
-                    except TypeError:
-                        return False
-                    if not ok:
-                        return False
-                elif isinstance(op, ast.GtE):
-                    try:
-                        ok = left >= right
-                    except TypeError:
-                        return False
-                    if not ok:
-                        return False
-                elif isinstance(op, ast.Lt):
-                    try:
-                        ok = left < right
-                    except TypeError:
-                        return False
-                    if not ok:
-                        return False
-                elif isinstance(op, ast.LtE):
-                    try:
-                        ok = left <= right
-                    except TypeError:
-                        return False
-                    if not ok:
-                        return False
-                left = right
-            return True
-        if isinstance(n, ast.BinOp):
-            left = _to_number(eval_node(n.left))
-            right = _to_number(eval_node(n.right))
+            else:
+                ok = predicate(left, right)
+            if not ok:
+                return False
+            left = right
+        return True
+
+    return eval_compare
+
+
+def _compile_binop(n: ast.BinOp, expr: str) -> _Evaluator:
+    left_eval = _compile_node(n.left, expr)
+    right_eval = _compile_node(n.right, expr)
+    op = n.op
+    if isinstance(op, ast.Div):
+        division_error = f"Division by zero in expression: {expr}"
+
+        def eval_div(ctx: Mapping[str, Any]) -> Any:
+            left = _to_number(left_eval(ctx))
+            right = _to_number(right_eval(ctx))
             if left is None or right is None:
                 return None
-            if isinstance(n.op, ast.Add):
-                return left + right
-            if isinstance(n.op, ast.Sub):
-                return left - right
-            if isinstance(n.op, ast.Mult):
-                return left * right
-            if isinstance(n.op, ast.Div):
-                if right == 0:
-                    raise VarResolverError(f"Division by zero in expression: {expr}")
-                return left / right
-        raise VarResolverError(f"Unsupported expression: {ast.dump(n, include_attributes=False)}")
+            if right == 0:
+                raise VarResolverError(division_error)
+            return left / right
+
+        return eval_div
+    arithmetic: Callable[[Any, Any], Any] | None
+    if isinstance(op, ast.Add):
+        arithmetic = operator.add
+    elif isinstance(op, ast.Sub):
+        arithmetic = operator.sub
+    elif isinstance(op, ast.Mult):
+        arithmetic = operator.mul
+    else:
+        arithmetic = None
+    unsupported = _unsupported_message(n)
+
+    def eval_binop(ctx: Mapping[str, Any]) -> Any:
+        left = _to_number(left_eval(ctx))
+        right = _to_number(right_eval(ctx))
+        if left is None or right is None:
+            return None
+        if arithmetic is None:
+            raise VarResolverError(unsupported)
+        return arithmetic(left, right)
 
-    try:
-        return eval_node(node)
-    except VarResolverError:
-        raise
-    except Exception as exc:
-        raise VarResolverError(f"Failed to evaluate expression: {expr}") from exc
+    return eval_binop
+
+
+class CompiledExpression:
+    """Expression parsed once, with its source refs precomputed for missing-ref checks."""
+
+    __slots__ = ("expr", "source_refs", "bare_roots", "_ref_parts", "_evaluator", "_error")
+
+    def __init__(self, expr: str) -> None:
+        self.expr = expr
+        self._error: str | None = None
+        try:
+            root = ast.parse(expr, mode="eval")
+        except SyntaxError:
+            self._error = f"Invalid expression: {expr}"
+            self.source_refs: tuple[str, ...] = ()
+            self.bare_roots: frozenset[str] = frozenset()
+            self._ref_parts: tuple[tuple[str, ...], ...] = ()
+            self._evaluator: _Evaluator = _raiser(self._error)
+            return
+        collector = _SourceRefCollector()
+        collector.visit(root)
+        self.source_refs = tuple(sorted(collector.refs))
+        self.bare_roots = frozenset(collector.bare_roots)
+        self._ref_parts = tuple(tuple(ref.split(".")) for ref in self.source_refs)
+        self._evaluator = _compile_node(root, expr)
+
+    def missing_refs(self, ctx: Mapping[str, Any]) -> list[str]:
+        if self._error is not None:
+            raise VarResolverError(self._error)
+        missing: list[str] = []
+        for ref, parts in zip(self.source_refs, self._ref_parts):
+            value = _read_ref_parts(ctx, parts)
+            if value is _MISSING or _is_missing_value(value):
+                missing.append(ref)
+        return missing
+
+    def evaluate(self, ctx: Mapping[str, Any]) -> Any:
+        try:
+            return self._evaluator(ctx)
+        except VarResolverError:
+            raise
+        except Exception as exc:
+            raise VarResolverError(f"Failed to evaluate expression: {self.expr}") from exc
+
+    def evaluate_with_missing_refs(self, ctx: Mapping[str, Any]) -> tuple[Any, list[str]]:
+        missing_refs = self.missing_refs(ctx)
+        return self.evaluate(ctx), missing_refs
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expr: str) -> CompiledExpression:
+    return CompiledExpression(expr)
 
 
 def evaluate_expression_with_missing_refs(expr: str, ctx: Mapping[str, Any]) -> tuple[Any, list[str]]:
-    missing_refs = _find_missing_refs(expr, ctx)
-    value = _safe_eval(expr, ctx)
-    return value, missing_refs
+    return compile_expression(expr).evaluate_with_missing_refs(ctx)
+
+
+def _frame_data(frame: TelemetryFrame | Mapping[str, Any]) -> Dict[str, Any]:
+    if isinstance(frame, TelemetryFrame):
+        return frame.to_dict()
+    return dict(frame)
+
+
+def _frame_context(data: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "bios": data.get("bios") or {},
+        "lo": data.get("lo") or {},
+        "cockpit_args": data.get("cockpit_args") or {},
+        "vars": dict(data.get("vars") or {}),
+    }
+
+
+def _strip_derived(expr: str) -> str:
+    expr_text = expr.strip()
+    if expr_text.startswith("derived(") and expr_text.endswith(")"):
+        expr_text = expr_text[len("derived(") : -1].strip()
+    return expr_text
 
 
 @dataclass
 class VarResolver:
     rules: Dict[str, Any]
+    _compiled: Dict[str, CompiledExpression] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._compiled = {
+            key: compile_expression(_strip_derived(expr))
+            for key, expr in self.rules.items()
+            if isinstance(expr, str)
+        }
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "VarResolver":
@@ -255,42 +388,29 @@ class VarResolver:
 
     def resolve(self, frame: TelemetryFrame | Mapping[str, Any]) -> Dict[str, Any]:
         """Resolve vars in rule order; forward references are not supported."""
-        if isinstance(frame, TelemetryFrame):
-            data = frame.to_dict()
-        else:
-            data = dict(frame)
-
-        context = {
-            "bios": data.get("bios") or {},
-            "lo": data.get("lo") or {},
-            "cockpit_args": data.get("cockpit_args") or {},
-            "vars": dict(data.get("vars") or {}),
-        }
+        context = _frame_context(_frame_data(frame))
         resolved = dict(context["vars"])
+        context["vars"] = resolved
         source_missing_vars: set[str] = set()
+        compiled = self._compiled
 
         for key, expr in self.rules.items():
             if expr is None:
                 resolved[key] = None
-                context["vars"] = resolved
                 if key != "vars_source_missing":
                     source_missing_vars.add(key)
                 continue
             missing_refs: list[str] = []
-            if isinstance(expr, str):
-                expr_text = expr.strip()
-                if expr_text.startswith("derived(") and expr_text.endswith(")"):
-                    expr_text = expr_text[len("derived(") : -1].strip()
-                
+            compiled_expr = compiled.get(key)
+            if compiled_expr is not None:
                 try:
-                    missing_refs = _find_missing_refs(expr_text, context)
-                    value = _safe_eval(expr_text, context)
+                    missing_refs = compiled_expr.missing_refs(context)
+                    value = compiled_expr.evaluate(context)
                 except VarResolverError as exc:
                     raise VarResolverError(f"Failed to resolve var '{key}': {exc}") from exc
             else:
                 value = expr
             resolved[key] = value
-            context["vars"] = resolved
             if key != "vars_source_missing" and (value is None or missing_refs):
                 source_missing_vars.add(key)
         resolved["vars_source_missing"] = sorted(source_missing_vars)
@@ -307,4 +427,178 @@ class VarResolver:
         return data
 
 
-__all__ = ["VarResolver", "VarResolverError"]
+def _same_value(left: Any, right: Any) -> bool:
+    if left is right:
+        return True
+    if type(left) is not type(right):
+        return False
+    try:
+        return bool(left == right)
+    except Exception:
+        return False
+
+
+class IncrementalVarResolver:
+    """
+    Resolve vars incrementally from each frame's BIOS ``delta``.
+
+    A dependency graph from ``bios.*``/``vars.*`` refs to rules is built once.
+    Each frame re-evaluates only the rules reachable from the changed BIOS keys
+    (in rule order, stopping where a recomputed value did not change) and reuses
+    cached values for everything else, including ``vars_source_missing``.
+
+    Frames must carry the full merged bios state (``merge_full_state``) plus a
+    delta of changed keys. A full resolve (which reseeds the cache) is used for
+    the first frame, seq discontinuities, frames without a delta mapping,
+    shrinking bios state, frames with input vars, and maps whose rules use refs
+    the graph cannot track (forward/input ``vars`` refs, bare roots).
+    """
+
+    def __init__(self, resolver: VarResolver) -> None:
+        self.resolver = resolver
+        self.full_resolves = 0
+        self.incremental_resolves = 0
+        self.last_recomputed = 0
+        self._order: list[str] = []
+        self._bios_dependents: dict[str, tuple[int, ...]] = {}
+        self._var_dependents: dict[int, tuple[int, ...]] = {}
+        self._always_dirty: tuple[int, ...] = ()
+        self.supported = self._build_graph()
+        self.reset()
+
+    def _build_graph(self) -> bool:
+        rules = self.resolver.rules
+        if "vars_source_missing" in rules:
+            return False
+        self._order = list(rules.keys())
+        index = {key: pos for pos, key in enumerate(self._order)}
+        bios_dependents: dict[str, set[int]] = {}
+        var_dependents: dict[int, set[int]] = {}
+        always_dirty: set[int] = set()
+        for key, compiled_expr in self.resolver._compiled.items():
+            pos = index[key]
+            if compiled_expr.bare_roots:
+                return False
+            for ref in compiled_expr.source_refs:
+                root, name = (ref.split(".") + [""])[:2]
+                if root == "bios":
+                    bios_dependents.setdefault(name, set()).add(pos)
+                elif root == "vars":
+                    source_pos = index.get(name)
+                    if source_pos is None or source_pos >= pos:
+                        return False
+                    var_dependents.setdefault(source_pos, set()).add(pos)
+                else:
+                    # lo/cockpit_args carry no delta; recompute on every frame.
+                    always_dirty.add(pos)
+        self._bios_dependents = {name: tuple(sorted(deps)) for name, deps in bios_dependents.items()}
+        self._var_dependents = {pos: tuple(sorted(deps)) for pos, deps in var_dependents.items()}
+        self._always_dirty = tuple(sorted(always_dirty))
+        return True
+
+    def reset(self) -> None:
+        self._values: Dict[str, Any] | None = None
+        self._missing: set[str] = set()
+        self._missing_sorted: list[str] = []
+        self._last_seq: int | None = None
+        self._last_bios_size = 0
+
+    def _full_resolve(self, data: Mapping[str, Any], seq: Any, bios: Any) -> Dict[str, Any]:
+        self.full_resolves += 1
+        self.last_recomputed = len(self._order)
+        resolved = self.resolver.resolve(data)
+        if not self.supported:
+            return resolved
+        values = dict(resolved)
+        missing = values.pop("vars_source_missing", [])
+        self._values = values
+        self._missing = set(missing)
+        self._missing_sorted = list(missing)
+        self._last_seq = seq if isinstance(seq, int) and not isinstance(seq, bool) else None
+        self._last_bios_size = len(bios) if isinstance(bios, Mapping) else 0
+        return resolved
+
+    def resolve(self, frame: TelemetryFrame | Mapping[str, Any]) -> Dict[str, Any]:
+        data = frame.to_dict() if isinstance(frame, TelemetryFrame) else frame
+        seq = data.get("seq")
+        bios = data.get("bios")
+        delta = data.get("delta")
+        if (
+            not self.supported
+            or self._values is None
+            or self._last_seq is None
+            or seq != self._last_seq + 1
+            or not isinstance(bios, Mapping)
+            or not isinstance(delta, Mapping)
+            or len(bios) < self._last_bios_size
+            or data.get("vars")
+        ):
+            return self._full_resolve(data, seq, bios)
+
+        self._last_seq = seq
+        self._last_bios_size = len(bios)
+        self.incremental_resolves += 1
+        dirty: list[int] = list(self._always_dirty)
+        for name in delta:
+            dirty.extend(self._bios_dependents.get(name, ()))
+        heapq.heapify(dirty)
+
+        values = self._values
+        context = _frame_context(data)
+        context["vars"] = values
+        compiled = self.resolver._compiled
+        missing_changed = False
+        recomputed = 0
+        last_pos = -1
+        while dirty:
+            pos = heapq.heappop(dirty)
+            if pos == last_pos:
+                continue
+            last_pos = pos
+            key = self._order[pos]
+            compiled_expr = compiled[key]
+            try:
+                missing_refs = compiled_expr.missing_refs(context)
+                value = compiled_expr.evaluate(context)
+            except VarResolverError as exc:
+                self.reset()
+                raise VarResolverError(f"Failed to resolve var '{key}': {exc}") from exc
+            recomputed += 1
+            is_missing = value is None or bool(missing_refs)
+            if is_missing != (key in self._missing):
+                if is_missing:
+                    self._missing.add(key)
+                else:
+                    self._missing.discard(key)
+                missing_changed = True
+            previous = values.get(key, _MISSING)
+            values[key] = value
+            if not _same_value(previous, value):
+                for dependent in self._var_dependents.get(pos, ()):
+                    heapq.heappush(dirty, dependent)
+
+        if missing_changed:
+            self._missing_sorted = sorted(self._missing)
+        self.last_recomputed = recomputed
+        resolved = dict(values)
+        resolved["vars_source_missing"] = list(self._missing_sorted)
+        return resolved
+
+    def apply(self, frame: TelemetryFrame | Mapping[str, Any]) -> TelemetryFrame | Dict[str, Any]:
+        resolved = self.resolve(frame)
+        if isinstance(frame, TelemetryFrame):
+            frame.vars = resolved
+            return frame
+        data = dict(frame)
+        data["vars"] = resolved
+        return data
+
+
+__all__ = [
+    "CompiledExpression",
+    "IncrementalVarResolver",
+    "VarResolver",
+    "VarResolverError",
+    "compile_expression",
+    "evaluate_expression_with_missing_refs",
+]
@@ -462,6 +462,7 @@ def build_vision_fact_summary(
     status: str,
     frame_ids: Sequence[str] | None = None,
     fresh_fact_ids: Sequence[str] | None = None,
+    cache: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
     seen_fact_ids: list[str] = []
     uncertain_fact_ids: list[str] = []
@@ -486,7 +487,7 @@ def build_vision_fact_summary(
     if not_seen_fact_ids:
         segments.append("not_seen=" + ",".join(not_seen_fact_ids))
     summary_text = "; ".join(segments) if segments else "no_active_vision_facts"
-    return {
+    summary: dict[str, Any] = {
         "status": status,
         "frame_ids": [item for item in (frame_ids or []) if isinstance(item, str) and item],
         "fresh_fact_ids": [item for item in (fresh_fact_ids or []) if isinstance(item, str) and item],
@@ -495,6 +496,9 @@ def build_vision_fact_summary(
         "not_seen_fact_ids": not_seen_fact_ids,
         "summary_text": summary_text,
     }
+    if isinstance(cache, Mapping):
+        summary["cache"] = dict(cache)
+    return summary
 
 
 def extract_vision_fact_snapshot(raw: Any) -> dict[str, dict[str, Any]]:
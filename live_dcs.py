@@ -11,10 +11,12 @@ import re
 import socket
 import threading
 import time
-from dataclasses import dataclass
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for_futures
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path, PureWindowsPath
-from typing import Any, Callable, Iterable, Mapping, Protocol, Sequence
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Mapping, Protocol, Sequence
 from urllib.parse import urlparse
 from uuid import UUID, uuid4
 
@@ -23,21 +25,58 @@ import yaml
 from adapters.action_executor import OverlayActionExecutor
 from adapters.dcs_bios.bios_ui_map import BiosUiMapper
 from adapters.dcs_bios.receiver import DcsBiosRawReceiver, DcsBiosReceiver
+from adapters.event_store.columnar_telemetry import (
+    ColumnarTelemetryReader,
+    is_columnar_telemetry_path,
+    iter_columnar_frames,
+)
+from adapters.event_store.replay_index import (
+    DEFAULT_INDEX_EVERY_N_FRAMES,
+    ReplayIndex,
+    extract_bios_frame,
+    load_or_build_replay_index,
+)
 from adapters.evidence_refs import collect_evidence_refs_from_context, infer_evidence_type_from_ref
+from adapters.help_response_cache import (
+    DEFAULT_HELP_CACHE_MAX_ENTRIES,
+    DEFAULT_HELP_CACHE_PERSIST_TTL_S,
+    HelpResponseCache,
+)
+from adapters.http_client_pool import (
+    DEFAULT_HTTP_CONNECT_TIMEOUT_S,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY_S,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    HttpClientConfig,
+    HttpClientPoolStats,
+    http_client_pool_stats,
+)
+from adapters.image_payload_cache import (
+    DEFAULT_IMAGE_QUALITY,
+    IMAGE_FORMAT_ORIGINAL,
+    IMAGE_FORMATS,
+    ImageEncodeOptions,
+)
 from adapters.knowledge_source_policy import KnowledgeSourcePolicy, KnowledgeSourcePolicyError
 from adapters.knowledge_local import DEFAULT_INDEX_PATH, LocalKnowledgeAdapter, build_grounding_query
 from adapters.model_stub import ModelStub
 from adapters.ollama_model import OllamaModel
+from adapters.openai_compat_capabilities import DEFAULT_CAPABILITY_TTL_S, shared_endpoint_capability_cache
 from adapters.openai_compat_model import OpenAICompatModel
-from adapters.vision_fact_extractor import VisionFactExtractor
+from adapters.vision_fact_cache import (
+    DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE,
+    DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES,
+    VisionFactResultCache,
+)
+from adapters.vision_fact_extractor import DEFAULT_REGION_CHANGE_MAX_DISTANCE, VisionFactExtractor
+from adapters.vision_fact_prefetch import SPECULATIVE_MIN_INTERVAL_MS, VisionFactPrefetcher
 from adapters.pack_gates import (
     DEFAULT_SCENARIO_PROFILE,
     SUPPORTED_SCENARIO_PROFILES,
-    evaluate_pack_gates,
+    load_compiled_pack_gates,
     load_pack_gate_config,
     normalize_scenario_profile,
 )
-from adapters.prompting import build_help_prompt_result
+from adapters.prompting import build_help_prompt_result, help_prompt_fingerprint
 from adapters.recent_actions import (
     RecentDeltaRingBuffer,
     build_prompt_recent_deltas,
@@ -46,7 +85,11 @@ from adapters.recent_actions import (
 from adapters.response_mapping import map_help_response_to_tutor_response
 from adapters.source_chunk_refs import build_source_chunk_ref
 from adapters.step_inference import StepInferenceResult, infer_step_id, load_pack_steps
-from adapters.telemetry_pipeline import enrich_bios_observation
+from adapters.telemetry_pipeline import (
+    completion_latch_persist_stats,
+    configure_completion_latch_write_behind,
+    enrich_bios_observation,
+)
 from adapters.vision_capture_trigger import (
     DEFAULT_VISION_CAPTURE_TRIGGER_HOST,
     DEFAULT_VISION_CAPTURE_TRIGGER_PORT,
@@ -60,11 +103,19 @@ from adapters.vision_sync import (
     DEFAULT_REPLAY_SYNC_WINDOW_MS,
     BufferedVisionSession,
     HelpCycleVisionSelection,
+    select_help_cycle_frames,
 )
 from adapters.windows_global_help_trigger import DEFAULT_GLOBAL_HELP_COOLDOWN_MS, WindowsGlobalHelpTrigger
 from core.constants import ENV_COLD_START_PRODUCTION
 from core.env_bool import parse_env_bool
-from core.event_store import JsonlEventStore
+from core.event_store import (
+    DEFAULT_EVENT_FLUSH_INTERVAL_S,
+    DEFAULT_EVENT_QUEUE_MAX,
+    EVENT_OVERFLOW_BLOCK,
+    EVENT_OVERFLOW_POLICIES,
+    BufferedJsonlEventStore,
+    JsonlEventStore,
+)
 from core.help_cycle_audit import normalize_help_cycle_audit_fields
 from core.help_failure import (
     VISION_CONFLICT_UNRESOLVED,
@@ -110,6 +161,7 @@ _MISSING_CONDITION_TARGET_HINTS: dict[str, tuple[str, ...]] = {
     "throttle_r_idle_complete": ("throttle_quadrant_reference",),
 }
 from core.types import Event, Observation, TutorRequest, TutorResponse
+from core.types_v2 import VisionObservation
 from core.vision_facts import (
     VisionFactsConfigError,
     build_vision_fact_summary,
@@ -118,9 +170,9 @@ from core.vision_facts import (
     prune_expired_facts,
     snapshot_to_list,
 )
-from core.vars import VarResolver
+from core.vars import IncrementalVarResolver, VarResolver
 from ports.knowledge_port import KnowledgePort, KnowledgeRetrieveWithMetaPort
-from simtutor.cli_parsing import parse_env_int, parse_non_negative_int_arg
+from simtutor.cli_parsing import parse_env_int, parse_non_negative_int_arg, parse_positive_int_arg
 
 
 def _repo_root() -> Path:
@@ -309,6 +361,9 @@ def _build_vision_fact_extractor_from_model(
     model: Any,
     lang: str,
     pack_path: str | Path | None = None,
+    result_cache: VisionFactResultCache | None = None,
+    region_incremental: bool = False,
+    region_change_max_distance: int = DEFAULT_REGION_CHANGE_MAX_DISTANCE,
 ) -> VisionFactExtractor | None:
     if not isinstance(model, OpenAICompatModel):
         return None
@@ -326,6 +381,13 @@ def _build_vision_fact_extractor_from_model(
             log_raw_llm_text=getattr(model, "log_raw_llm_text", False),
             print_model_io=getattr(model, "print_model_io", False),
             pack_path=pack_path,
+            capability_cache=getattr(model, "capability_cache", None),
+            image_encode_options=getattr(model, "image_encode_options", None),
+            image_cache=getattr(model, "image_cache", None),
+            http_client_config=getattr(model, "http_client_config", None),
+            result_cache=result_cache,
+            region_incremental=region_incremental,
+            region_change_max_distance=region_change_max_distance,
         )
     except (FileNotFoundError, OSError, ValueError, VisionFactsConfigError):
         return None
@@ -1255,6 +1317,7 @@ def _build_help_cycle_audit_fields(
             fused_step_id=fused_step_id,
         ),
         "layout_id": _extract_selected_layout_id(vision_selection),
+        "help_cycle_timing": dict(vision_fact_context.get("timing") or {}),
     }
 
 
@@ -1724,22 +1787,24 @@ def _collect_request_evidence_refs(context: Mapping[str, Any]) -> set[str]:
     return collect_evidence_refs_from_context(context)
 
 
-@dataclass
-class HelpCacheEntry:
-    state_key: str
-    t_wall: float
-    response: TutorResponse
-
-
 @dataclass
 class LiveLoopStats:
     frames: int = 0
     help_cycles: int = 0
     model_calls: int = 0
     cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+    cache_expirations: int = 0
+    help_cycles_superseded: int = 0
+    help_cycle_errors: int = 0
     vision_cycles: int = 0
     vision_sync_miss_count: int = 0
     vision_text_fallback_count: int = 0
+    # Keep-alive pool traffic since this loop started (see adapters.http_client_pool).
+    http_requests: int = 0
+    http_connections_opened: int = 0
+    http_connections_reused: int = 0
 
     def to_dict(self) -> dict[str, int]:
         return {
@@ -1747,9 +1812,81 @@ class LiveLoopStats:
             "help_cycles": self.help_cycles,
             "model_calls": self.model_calls,
             "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_evictions": self.cache_evictions,
+            "cache_expirations": self.cache_expirations,
+            "help_cycles_superseded": self.help_cycles_superseded,
+            "help_cycle_errors": self.help_cycle_errors,
             "vision_cycles": self.vision_cycles,
             "vision_sync_miss_count": self.vision_sync_miss_count,
             "vision_text_fallback_count": self.vision_text_fallback_count,
+            "http_requests": self.http_requests,
+            "http_connections_opened": self.http_connections_opened,
+            "http_connections_reused": self.http_connections_reused,
+        }
+
+
+@dataclass
+class ReplayThroughputStats:
+    """Ingest throughput of `run()`; observation events are skipped only in fast-forward mode."""
+
+    frames: int = 0
+    observation_events: int = 0
+    observation_events_skipped: int = 0
+    elapsed_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "observation_events": self.observation_events,
+            "observation_events_skipped": self.observation_events_skipped,
+            "elapsed_s": round(self.elapsed_s, 6),
+            "frames_per_s": round(self.frames / self.elapsed_s, 3) if self.elapsed_s > 0 else None,
+        }
+
+
+@dataclass(frozen=True)
+class HelpCycleSnapshot:
+    observation: Observation
+    recent_frames: list[dict[str, Any]]
+    trigger_t_wall: float | None
+    triggered_monotonic: float
+
+
+HELP_LATENCY_BUCKETS_MS: tuple[float, ...] = (100.0, 250.0, 500.0, 1000.0, 2000.0, 5000.0, 10000.0, 20000.0)
+
+
+@dataclass
+class HelpLatencyHistogram:
+    """Trigger-to-overlay latency of help cycles, bucketed by upper bound in ms."""
+
+    bounds_ms: tuple[float, ...] = HELP_LATENCY_BUCKETS_MS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        if len(self.counts) != len(self.bounds_ms) + 1:
+            self.counts = [0] * (len(self.bounds_ms) + 1)
+
+    def observe(self, latency_ms: float) -> None:
+        value = max(0.0, float(latency_ms))
+        self.counts[bisect_left(self.bounds_ms, value)] += 1
+        self.count += 1
+        self.total_ms += value
+        self.max_ms = max(self.max_ms, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        buckets = [
+            {"le_ms": bound, "count": count}
+            for bound, count in zip((*self.bounds_ms, None), self.counts)
+        ]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
         }
 
 
@@ -1761,21 +1898,86 @@ class ReplayBiosReceiver:
     - raw frame object: {"schema_version":"v2","seq":...,"bios":...}
     - Event envelope with observation payload
     - Observation object serialized by Observation.to_dict()
+
+    Columnar `.tcol` recordings are decoded chunk by chunk instead.
+
+    `start_t`/`end_t` are seconds from the first frame and `start_seq` a frame seq.
+    Seeking a JSONL log uses (and on first use builds) a keyframe sidecar index;
+    the first replayed frame carries the merged BIOS state of everything before it.
     """
 
-    def __init__(self, path: str | Path, source: str = "dcs_bios_replay", speed: float = 1.0) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        source: str = "dcs_bios_replay",
+        speed: float = 1.0,
+        *,
+        start_t: float | None = None,
+        start_seq: int | None = None,
+        end_t: float | None = None,
+        index_path: str | Path | None = None,
+        index_every_n_frames: int = DEFAULT_INDEX_EVERY_N_FRAMES,
+    ) -> None:
         self.path = Path(path)
         self.source = source
         self.speed = float(speed)
         if not math.isfinite(self.speed) or self.speed < 0:
             raise ValueError("speed must be a finite number >= 0")
-        self._fh = self.path.open("r", encoding="utf-8")
+        for name, value in (("start_t", start_t), ("end_t", end_t)):
+            if value is not None and (not math.isfinite(float(value)) or float(value) < 0):
+                raise ValueError(f"{name} must be a finite number >= 0")
+        if start_t is not None and start_seq is not None:
+            raise ValueError("start_t and start_seq are mutually exclusive")
+        self.start_t = float(start_t) if start_t is not None else None
+        self.start_seq = int(start_seq) if start_seq is not None else None
+        self.end_t = float(end_t) if end_t is not None else None
+        self.index: ReplayIndex | None = None
+        self._t0: float | None = None
+        self._seeking = self.start_t is not None or self.start_seq is not None
+        # Merged BIOS state of the frames skipped while seeking to the start point.
+        self._seek_bios: dict[str, Any] = {}
+        self._columnar_frames: Iterator[dict[str, Any]] | None = None
+        self._fh: BinaryIO | None = None
         self._lineno = 0
+        if is_columnar_telemetry_path(self.path):
+            start_t_wall: float | None = None
+            if self.start_t is not None:
+                time_range = ColumnarTelemetryReader(self.path).time_range
+                if time_range is not None:
+                    self._t0 = time_range[0]
+                    start_t_wall = self._t0 + self.start_t
+            self._columnar_frames = iter_columnar_frames(self.path, start_t_wall=start_t_wall)
+        else:
+            self._fh = self.path.open("rb")
+            if self._seeking:
+                self._seek_to_keyframe(index_path=index_path, every_n_frames=index_every_n_frames)
         self.is_exhausted = False
         self._replay_origin_t_wall: float | None = None
         self._wall_start_monotonic: float | None = None
 
+    def _seek_to_keyframe(self, *, index_path: str | Path | None, every_n_frames: int) -> None:
+        assert self._fh is not None
+        index = load_or_build_replay_index(self.path, index_path=index_path, every_n_frames=every_n_frames)
+        self.index = index
+        self._t0 = index.t0
+        if self.start_seq is not None:
+            keyframe = index.keyframe_for_seq(self.start_seq)
+        elif self.start_t is not None and index.t0 is not None:
+            keyframe = index.keyframe_for_t_wall(index.t0 + self.start_t)
+        else:
+            keyframe = index.keyframes[0]
+        self._fh.seek(keyframe.offset)
+        self._lineno = keyframe.line
+        self._seek_bios = dict(keyframe.bios)
+
     def _next_item(self) -> dict[str, Any] | None:
+        if self._columnar_frames is not None:
+            item = next(self._columnar_frames, None)
+            if item is None:
+                self.is_exhausted = True
+                self.close()
+            return item
+        assert self._fh is not None
         while True:
             line = self._fh.readline()
             if not line:
@@ -1792,24 +1994,23 @@ class ReplayBiosReceiver:
                 self.is_exhausted = True
                 self.close()
                 raise ValueError(f"{self.path}:{self._lineno} invalid JSON: {exc}") from exc
-            if isinstance(obj, Mapping):
-                return dict(obj)
+            # json.loads builds a fresh dict per line, so it is handed out without copying.
+            if isinstance(obj, dict):
+                return obj
             # Ignore non-mapping JSON values and keep scanning the stream.
             continue
 
-    def _extract_frame(self, item: Mapping[str, Any]) -> dict[str, Any] | None:
-        if item.get("schema_version") == "v2" and isinstance(item.get("bios"), Mapping):
-            return dict(item)
-
-        payload = item.get("payload")
-        if isinstance(payload, Mapping):
-            if payload.get("schema_version") == "v2" and isinstance(payload.get("bios"), Mapping):
-                return dict(payload)
-            nested = payload.get("payload")
-            if isinstance(nested, Mapping):
-                if nested.get("schema_version") == "v2" and isinstance(nested.get("bios"), Mapping):
-                    return dict(nested)
-        return None
+    def _extract_frame(self, item: dict[str, Any]) -> dict[str, Any] | None:
+        # Items are owned by this receiver (decoded per line or per chunk), so frames are not copied.
+        return extract_bios_frame(item)
+
+    def _reached_start(self, frame: Mapping[str, Any], t_wall: float | None) -> bool:
+        if self.start_seq is not None:
+            seq = _coerce_int(frame.get("seq"))
+            return seq is not None and seq >= self.start_seq
+        if self.start_t is not None and self._t0 is not None:
+            return t_wall is not None and (t_wall - self._t0) >= self.start_t
+        return True
 
     def get_observation(self) -> Observation | None:
         while True:
@@ -1819,6 +2020,21 @@ class ReplayBiosReceiver:
             frame = self._extract_frame(item)
             if frame is None:
                 continue
+            t_wall = _coerce_float(frame.get("t_wall"))
+            if self._t0 is None and t_wall is not None:
+                self._t0 = t_wall
+            if self._seeking:
+                if not self._reached_start(frame, t_wall):
+                    self._seek_bios.update(frame["bios"])
+                    continue
+                self._seeking = False
+                self._seek_bios.update(frame["bios"])
+                frame["bios"] = self._seek_bios
+                self._seek_bios = {}
+            if self.end_t is not None and t_wall is not None and self._t0 is not None:
+                if (t_wall - self._t0) > self.end_t:
+                    self.close()
+                    return None
             self._pace_by_frame_t_wall(frame)
             seq = _coerce_int(frame.get("seq"))
             meta: dict[str, Any] = {"replay": True}
@@ -1846,8 +2062,12 @@ class ReplayBiosReceiver:
             time.sleep(sleep_s)
 
     def close(self) -> None:
-        if not self._fh.closed:
+        if self._fh is not None and not self._fh.closed:
             self._fh.close()
+        if self._columnar_frames is not None:
+            close_frames = getattr(self._columnar_frames, "close", None)
+            if callable(close_frames):
+                close_frames()
         self.is_exhausted = True
 
 
@@ -2041,6 +2261,22 @@ class LiveDcsTutorLoop:
         vision_trigger_wait_ms: int | None = None,
         vision_fact_extractor: Any | None = None,
         max_overlay_targets: int = 1,
+        incremental_vars: bool = False,
+        help_cache_max_entries: int = DEFAULT_HELP_CACHE_MAX_ENTRIES,
+        help_cache_ttl_s: float | None = None,
+        help_cache_path: str | Path | None = None,
+        help_cache_persist_ttl_s: float = DEFAULT_HELP_CACHE_PERSIST_TTL_S,
+        async_help: bool = False,
+        pipelined_vision: bool = False,
+        speculative_vision: bool = False,
+        vision_fact_timeout_s: float | None = None,
+        vision_fact_cache_entries: int = DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES,
+        vision_fact_cache_max_distance: int = DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE,
+        vision_fact_region_incremental: bool = False,
+        vision_fact_region_change_max_distance: int = DEFAULT_REGION_CHANGE_MAX_DISTANCE,
+        latch_write_behind_s: float | None = None,
+        fast_forward: bool = False,
+        observation_sample_every_n: int = 0,
     ) -> None:
         self.source = source
         self.model = model
@@ -2050,6 +2286,13 @@ class LiveDcsTutorLoop:
         self.lang = "zh" if lang not in {"zh", "en"} else lang
         self.scenario_profile = normalize_scenario_profile(scenario_profile)
         self.event_sink = event_sink
+        # A buffered store can also build observation envelopes on its writer thread.
+        sink_owner = getattr(event_sink, "__self__", None)
+        self._deferred_event_sink: Callable[[Callable[[], Event]], None] | None = (
+            sink_owner.append_deferred
+            if isinstance(sink_owner, BufferedJsonlEventStore) and event_sink == sink_owner.append
+            else None
+        )
         self.dry_run_overlay = dry_run_overlay
         self.vision_mode = _normalize_vision_mode(vision_mode)
         self.max_overlay_targets = max(0, int(max_overlay_targets))
@@ -2074,6 +2317,12 @@ class LiveDcsTutorLoop:
         self._load_knowledge_source_policy()
 
         self.resolver = resolver if resolver is not None else VarResolver.from_yaml(self.telemetry_map_path)
+        # Incremental resolution needs merged full-state bios frames (live receivers).
+        self._frame_resolver: VarResolver | IncrementalVarResolver = (
+            IncrementalVarResolver(self.resolver)
+            if incremental_vars and isinstance(self.resolver, VarResolver)
+            else self.resolver
+        )
         self.mapper = (
             mapper
             if mapper is not None
@@ -2093,6 +2342,10 @@ class LiveDcsTutorLoop:
         )
         self.precondition_gates = dict(gate_config.get("precondition_gates", {}))
         self.completion_gates = dict(gate_config.get("completion_gates", {}))
+        self.compiled_gates = load_compiled_pack_gates(
+            self.pack_path,
+            scenario_profile=self.scenario_profile,
+        )
         self.candidate_steps = _load_step_ids(self.pack_path)
         self.overlay_allowlist = _load_overlay_allowlist(self.pack_path, self.ui_map_path)
         self.overlay_allowset = set(self.overlay_allowlist)
@@ -2129,12 +2382,37 @@ class LiveDcsTutorLoop:
                 model=self.model,
                 lang=self.lang,
                 pack_path=self.pack_path,
+                result_cache=VisionFactResultCache(
+                    max_entries=vision_fact_cache_entries,
+                    max_distance=vision_fact_cache_max_distance,
+                ),
+                region_incremental=vision_fact_region_incremental,
+                region_change_max_distance=vision_fact_region_change_max_distance,
             )
         )
         self._vision_fact_config = _resolve_vision_fact_config(
             extractor=self.vision_fact_extractor,
             pack_path=self.pack_path,
         )
+        self._latch_write_behind = False
+        if isinstance(latch_write_behind_s, (int, float)) and latch_write_behind_s > 0:
+            configure_completion_latch_write_behind(float(latch_write_behind_s))
+            self._latch_write_behind = True
+        self.vision_fact_timeout_s = (
+            float(vision_fact_timeout_s)
+            if isinstance(vision_fact_timeout_s, (int, float)) and vision_fact_timeout_s > 0
+            else None
+        )
+        # Pipelined mode overlaps the help-cycle VLM wait with gate evaluation and RAG;
+        # speculative mode also starts extraction as sidecar frames change, before any press.
+        self._vision_prefetcher: VisionFactPrefetcher | None = (
+            VisionFactPrefetcher(self.vision_fact_extractor, session_id=self.vision_session_id)
+            if pipelined_vision and self.vision_fact_extractor is not None
+            else None
+        )
+        self.speculative_vision = bool(speculative_vision) and self._vision_prefetcher is not None
+        self._speculated_region_hashes: dict[str, str] | None = None
+        self._speculated_capture_wall_ms: int | None = None
         if vision_port is not None:
             if not isinstance(effective_vision_session_id, str) or not effective_vision_session_id:
                 raise ValueError("vision_session_id or session_id is required when vision_port is configured")
@@ -2146,14 +2424,25 @@ class LiveDcsTutorLoop:
                 live_mode=self.vision_mode == "live",
                 observation_sink=lambda observation: _emit_vision_observation_event(
                     observation=observation,
-                    event_sink=self.event_sink,
+                    event_sink=self._locked_event_sink(),
                     fallback_session_id=self.session_id,
                 ),
             )
 
         self._latest_raw_obs: Observation | None = None
         self._latest_enriched_obs: Observation | None = None
-        self._help_cache: HelpCacheEntry | None = None
+        # In-memory TTL defaults to cooldown_s so same-state reuse keeps the cooldown semantics;
+        # a persisted cache uses its own TTL so entries outlive the run that stored them.
+        if help_cache_path:
+            help_cache_effective_ttl_s = help_cache_persist_ttl_s
+        else:
+            help_cache_effective_ttl_s = self.cooldown_s if help_cache_ttl_s is None else help_cache_ttl_s
+        self._help_cache = HelpResponseCache(
+            max_entries=help_cache_max_entries,
+            ttl_s=help_cache_effective_ttl_s,
+            path=help_cache_path or None,
+        )
+        self._help_cache_generation_key = self._build_help_cache_generation_key()
         self._vision_fact_snapshot: dict[str, dict[str, Any]] = {}
         self._step_order_index = {
             step_id: idx for idx, step_id in enumerate(self.candidate_steps) if isinstance(step_id, str) and step_id
@@ -2162,14 +2451,58 @@ class LiveDcsTutorLoop:
         self._sticky_inference_missing_conditions: tuple[str, ...] = ()
         self._pending_help_trigger_t_wall: float | None = None
         self._stats = LiveLoopStats()
+        self._http_pool_baseline = http_client_pool_stats()
+        self._help_latency = HelpLatencyHistogram()
+        # Fast-forward keeps resolver, latch and ring-buffer state current for every frame
+        # but only writes observation events for help-cycle snapshots and sampled frames.
+        self.fast_forward = bool(fast_forward)
+        self.observation_sample_every_n = max(0, int(observation_sample_every_n))
+        self._unemitted_observation: tuple[Observation, float | None] | None = None
+        self._throughput = ReplayThroughputStats()
+
+        # Async help runs cycles on one worker so ingestion never waits on the model;
+        # a single worker keeps tutor_request/tutor_response events in trigger order.
+        self.async_help = bool(async_help)
+        self._help_executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="live-dcs-help")
+            if self.async_help
+            else None
+        )
+        self._help_future: Future[tuple[TutorResponse | None, dict[str, Any] | None]] | None = None
+        self._help_generation = 0
+        self._active_help_generation: int | None = None
+        self._active_help_trigger_monotonic: float | None = None
+        self._state_lock = threading.RLock()
+        self._emit_lock = threading.Lock()
+        self._vision_lock = threading.RLock()
 
     @property
     def stats(self) -> LiveLoopStats:
+        with self._state_lock:
+            self._sync_http_pool_stats()
         return self._stats
 
+    @property
+    def help_latency(self) -> HelpLatencyHistogram:
+        return self._help_latency
+
+    @property
+    def replay_throughput(self) -> ReplayThroughputStats:
+        return self._throughput
+
     def close(self) -> None:
+        if self._help_executor is not None:
+            self._help_executor.shutdown(wait=True, cancel_futures=True)
+            self._help_executor = None
         if self._vision_session is not None:
             self._vision_session.close()
+        if self._vision_prefetcher is not None:
+            self._vision_prefetcher.close()
+        self._help_cache.flush()
+        if self._latch_write_behind:
+            # Flushes pending latches and restores synchronous persistence.
+            configure_completion_latch_write_behind(None)
+            self._latch_write_behind = False
         if self.vision_fact_extractor is not None and hasattr(self.vision_fact_extractor, "close"):
             self.vision_fact_extractor.close()
         if hasattr(self.action_executor, "close"):
@@ -2263,11 +2596,89 @@ class LiveDcsTutorLoop:
             vision_refs=[item for item in (vision_refs or []) if isinstance(item, str) and item],
             metadata=dict(metadata) if isinstance(metadata, Mapping) else {},
         )
-        self.event_sink(event)
+        self._emit_locked(event)
+
+    def _emit_locked(self, event: Event) -> None:
+        # The help worker and the ingest thread both write events.
+        if self.event_sink is None:
+            return
+        with self._emit_lock:
+            self.event_sink(event)
+
+    def _locked_event_sink(self) -> Callable[[Event], None] | None:
+        return self._emit_locked if self.event_sink is not None else None
 
     def _poll_vision_sidecar(self) -> None:
-        if self._vision_session is not None:
-            self._vision_session.poll()
+        if self._vision_session is None:
+            return
+        # A running help cycle polls the session itself while selecting frames.
+        if not self._vision_lock.acquire(blocking=False):
+            return
+        try:
+            added = self._vision_session.poll()
+            # Only a snapshot is taken under the lock; selection runs on the prefetch worker.
+            frames = self._vision_session.recent_frames() if added and self.speculative_vision else []
+        finally:
+            self._vision_lock.release()
+        if frames:
+            self._prefetch_vision_facts(frames)
+
+    def _prefetch_vision_facts(self, frames: Sequence[VisionObservation]) -> None:
+        obs = self._latest_enriched_obs
+        if obs is None or self._vision_prefetcher is None or self._vision_session is None:
+            return
+        if not self._speculation_due(frames[-1]):
+            return
+        # A help press right now pairs the newest frame (as pre-trigger context) with a
+        # trigger frame that has not arrived yet, so it sends the newest frame alone.
+        # Keying on that frame id lets every press that resolves to it reuse this result.
+        self._vision_prefetcher.prefetch_frames(
+            (frames[-1].frame_id,),
+            lambda: self._speculative_vision_payload(observation=obs, frames=frames),
+        )
+
+    def _speculation_due(self, newest: VisionObservation) -> bool:
+        """Speculate once per change in the newest frame's region hashes, else at most once per interval."""
+        region_hashes = newest.metadata.get("region_hashes") if isinstance(newest.metadata, dict) else None
+        capture_wall_ms = newest.capture_wall_ms if isinstance(newest.capture_wall_ms, int) else None
+        if isinstance(region_hashes, dict) and region_hashes:
+            # Unchanged pixels are answered by the extractor's result cache on the next press.
+            if region_hashes == self._speculated_region_hashes:
+                return False
+        elif (
+            capture_wall_ms is not None
+            and self._speculated_capture_wall_ms is not None
+            and capture_wall_ms - self._speculated_capture_wall_ms < SPECULATIVE_MIN_INTERVAL_MS
+        ):
+            return False
+        self._speculated_region_hashes = dict(region_hashes) if isinstance(region_hashes, dict) else None
+        self._speculated_capture_wall_ms = capture_wall_ms
+        return True
+
+    def _speculative_vision_payload(
+        self,
+        *,
+        observation: Observation,
+        frames: Sequence[VisionObservation],
+    ) -> tuple[dict[str, Any], int] | None:
+        assert self._vision_session is not None
+        newest_capture_wall_ms = frames[-1].capture_wall_ms
+        if not isinstance(newest_capture_wall_ms, int):
+            return None
+        payload = observation.payload if isinstance(observation.payload, Mapping) else {}
+        selection = select_help_cycle_frames(
+            frames,
+            # Anchored just after the newest capture so that frame is selected as pre-trigger context.
+            trigger_wall_ms=newest_capture_wall_ms + 1,
+            sync_window_ms=self._vision_session.sync_window_ms,
+            observation_ref=observation.observation_id,
+            observation_seq=_coerce_int(payload.get("seq")),
+            observation_t_wall_s=_coerce_finite_float(payload.get("t_wall")),
+            selection_policy=self._vision_session.selection_policy,
+        )
+        if not selection.vision_used:
+            return None
+        return selection.to_dict(), int(selection.trigger_wall_ms)
 
     def _build_vision_selection(
         self,
@@ -2305,7 +2716,8 @@ class LiveDcsTutorLoop:
                 trigger_frame=None,
                 sync_miss_reason="vision_port_unconfigured",
             )
-        selection = self._vision_session.select_for_help(trigger_wall_s=normalized_trigger_t_wall)
+        with self._vision_lock:
+            selection = self._vision_session.select_for_help(trigger_wall_s=normalized_trigger_t_wall)
         return HelpCycleVisionSelection(
             status=selection.status,
             observation_ref=observation.observation_id,
@@ -2327,29 +2739,62 @@ class LiveDcsTutorLoop:
         )
 
     def _ingest_observation(self, raw_obs: Observation) -> Observation:
-        self._latest_raw_obs = raw_obs
         enriched = enrich_bios_observation(
             raw_obs,
-            self.resolver,
+            self._frame_resolver,
             mapper=self.mapper,
             delta_stream_id=self.session_id,
         )
-        self._latest_enriched_obs = enriched
 
         payload = raw_obs.payload if isinstance(raw_obs.payload, Mapping) else {}
         delta = payload.get("delta")
         t_wall = _coerce_float(payload.get("t_wall"))
         seq = _coerce_int(payload.get("seq"))
-        if isinstance(delta, Mapping) and t_wall is not None:
-            self.recent_ring.add_delta(delta, t_wall=t_wall, seq=seq)
+        self._throughput.frames += 1
+        sampled = not self.fast_forward or (
+            self.observation_sample_every_n > 0
+            and (self._throughput.frames - 1) % self.observation_sample_every_n == 0
+        )
+        with self._state_lock:
+            self._latest_raw_obs = raw_obs
+            self._latest_enriched_obs = enriched
+            self._unemitted_observation = None if sampled else (enriched, t_wall)
+            if isinstance(delta, Mapping) and t_wall is not None:
+                self.recent_ring.add_delta(delta, t_wall=t_wall, seq=seq)
+
+        if sampled:
+            self._emit_observation_event(enriched, t_wall=t_wall)
+        else:
+            self._throughput.observation_events_skipped += 1
+        return enriched
+
+    def _emit_observation_event(self, enriched: Observation, *, t_wall: float | None) -> None:
+        self._throughput.observation_events += 1
+        if self._deferred_event_sink is not None:
+            # Enriched observations are never mutated after ingest, so the writer
+            # thread can serialize this one and wrap it in its event later.
+            emitted_at = time.time()
+            session_id = self.session_id
+
+            def build_event() -> Event:
+                return Event(
+                    kind="observation",
+                    timestamp=datetime.fromtimestamp(emitted_at, tz=timezone.utc).isoformat(),
+                    payload=enriched.to_dict(),
+                    related_id=enriched.observation_id,
+                    t_wall=t_wall,
+                    session_id=session_id,
+                )
 
+            with self._emit_lock:
+                self._deferred_event_sink(build_event)
+            return
         self._emit_event(
             kind="observation",
             payload=enriched.to_dict(),
             related_id=enriched.observation_id,
             t_wall=t_wall,
         )
-        return enriched
 
     def _build_grounding_context(
         self,
@@ -2506,6 +2951,58 @@ class LiveDcsTutorLoop:
             "grounding_policy_filtered_out_count": policy_filtered_out_count,
         }
 
+    def _snapshot_recent_frames(self, obs: Observation) -> list[dict[str, Any]]:
+        payload = obs.payload if isinstance(obs.payload, Mapping) else {}
+        now_t_wall = _coerce_float(payload.get("t_wall"))
+        with self._state_lock:
+            if now_t_wall is not None:
+                return self.recent_ring.snapshot(now_t_wall=now_t_wall)
+            return self.recent_ring.snapshot()
+
+    def _evaluate_all_gates(self, obs: Observation) -> dict[str, dict[str, Any]]:
+        return self.compiled_gates.evaluate([obs.to_dict()])
+
+    def _prefetch_deterministic_context(
+        self,
+        obs: Observation,
+        recent_frames: Sequence[Mapping[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Vision-independent request inputs, computed while the VLM request is in flight.
+
+        RAG retrieval is warmed with the pre-merge fact snapshot; the knowledge step
+        cache then serves `_build_request` whenever the fused inference agrees.
+        """
+        all_gates = self._evaluate_all_gates(obs)
+        payload = obs.payload if isinstance(obs.payload, Mapping) else {}
+        vars_map = payload.get("vars")
+        vars_selected = dict(vars_map) if isinstance(vars_map, Mapping) else {}
+        recent_buttons = [
+            item
+            for item in build_recent_button_signal(recent_frames, self.mapper, max_items=8).get("recent_buttons", [])
+            if isinstance(item, str) and item
+        ]
+        inference = infer_step_id(
+            self.pack_steps,
+            vars_selected,
+            recent_buttons,
+            gates=all_gates,
+            precondition_gates=self.precondition_gates,
+            completion_gates=self.completion_gates,
+            scenario_profile=self.scenario_profile,
+            pack_path=self.pack_path,
+            vision_facts=snapshot_to_list(self._vision_fact_snapshot),
+        )
+        inference = self._stabilize_live_inference(inference, vars_selected, commit=False)
+        self._build_grounding_context(
+            {
+                "inferred_step_id": inference.inferred_step_id,
+                "missing_conditions": list(inference.missing_conditions),
+                "recent_ui_targets": recent_buttons,
+            }
+        )
+        return {"all_gates": all_gates}
+
     def _build_request(
         self,
         obs: Observation,
@@ -2513,6 +3010,8 @@ class LiveDcsTutorLoop:
         vision_selection: HelpCycleVisionSelection,
         vision_fact_context: Mapping[str, Any],
         request_id_override: str | None = None,
+        recent_frames: Sequence[Mapping[str, Any]] | None = None,
+        all_gates: Mapping[str, Mapping[str, Any]] | None = None,
     ) -> tuple[TutorRequest, dict[str, Any], str]:
         payload = obs.payload if isinstance(obs.payload, Mapping) else {}
         vars_map = payload.get("vars")
@@ -2521,8 +3020,8 @@ class LiveDcsTutorLoop:
         vars_selected = dict(vars_map)
         vision_context = vision_selection.to_dict()
 
-        now_t_wall = _coerce_float(payload.get("t_wall"))
-        recent_frames = self.recent_ring.snapshot(now_t_wall=now_t_wall) if now_t_wall is not None else self.recent_ring.snapshot()
+        if recent_frames is None:
+            recent_frames = self._snapshot_recent_frames(obs)
         recent_deltas = build_prompt_recent_deltas(recent_frames, self.mapper, max_items=20)
         recent_actions = build_recent_button_signal(recent_frames, self.mapper, max_items=8)
         recent_buttons = [
@@ -2530,11 +3029,8 @@ class LiveDcsTutorLoop:
             for item in recent_actions.get("recent_buttons", [])
             if isinstance(item, str) and item
         ]
-        all_gates = evaluate_pack_gates(
-            observations=[obs.to_dict()],
-            precondition_gates=self.precondition_gates,
-            completion_gates=self.completion_gates,
-        )
+        if all_gates is None:
+            all_gates = self._evaluate_all_gates(obs)
         inference = infer_step_id(
             self.pack_steps,
             vars_selected,
@@ -2759,10 +3255,13 @@ class LiveDcsTutorLoop:
         self,
         inference: StepInferenceResult,
         vars_selected: Mapping[str, Any],
+        *,
+        commit: bool = True,
     ) -> StepInferenceResult:
         if self._should_reset_sticky_inference(vars_selected):
-            self._sticky_inference_step_id = None
-            self._sticky_inference_missing_conditions = ()
+            if commit:
+                self._sticky_inference_step_id = None
+                self._sticky_inference_missing_conditions = ()
             return inference
         current_step_id = inference.inferred_step_id
         if not isinstance(current_step_id, str) or not current_step_id:
@@ -2773,8 +3272,9 @@ class LiveDcsTutorLoop:
         if current_idx is None:
             return inference
         if sticky_idx is None or current_idx >= sticky_idx:
-            self._sticky_inference_step_id = current_step_id
-            self._sticky_inference_missing_conditions = tuple(inference.missing_conditions)
+            if commit:
+                self._sticky_inference_step_id = current_step_id
+                self._sticky_inference_missing_conditions = tuple(inference.missing_conditions)
             return inference
         return StepInferenceResult(
             inferred_step_id=sticky_step_id,
@@ -2786,6 +3286,7 @@ class LiveDcsTutorLoop:
         *,
         vision_selection: HelpCycleVisionSelection,
         help_cycle_id: str | None = None,
+        overlap: Callable[[], None] | None = None,
     ) -> dict[str, Any]:
         trigger_wall_ms = int(vision_selection.trigger_wall_ms)
         self._vision_fact_snapshot = prune_expired_facts(
@@ -2809,11 +3310,28 @@ class LiveDcsTutorLoop:
         if isinstance(help_cycle_id, str) and help_cycle_id:
             vision_payload["help_cycle_id"] = help_cycle_id
             vision_payload["request_id"] = help_cycle_id
-        result = self.vision_fact_extractor.extract(
-            vision_payload,
-            session_id=self.vision_session_id,
-            trigger_wall_ms=trigger_wall_ms,
-        )
+        started = time.perf_counter()
+        if self._vision_prefetcher is not None:
+            request = self._vision_prefetcher.start(vision_payload, trigger_wall_ms=trigger_wall_ms)
+            overlap_ms = None
+            if overlap is not None:
+                overlap_started = time.perf_counter()
+                overlap()
+                overlap_ms = round((time.perf_counter() - overlap_started) * 1000.0, 3)
+            timeout_s = self.vision_fact_timeout_s
+            if timeout_s is not None:
+                # The overlapped work already used part of the budget.
+                timeout_s = max(0.0, timeout_s - (time.perf_counter() - started))
+            result, prefetch_timing = self._vision_prefetcher.wait(request, timeout_s=timeout_s)
+            timing: dict[str, Any] = {"mode": "pipelined", **prefetch_timing, "overlap_ms": overlap_ms}
+        else:
+            result = self.vision_fact_extractor.extract(
+                vision_payload,
+                session_id=self.vision_session_id,
+                trigger_wall_ms=trigger_wall_ms,
+            )
+            timing = {"mode": "sequential"}
+        timing["vision_fact_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
         effective_status = result.status
         merge_error: str | None = None
         if result.observation is not None:
@@ -2830,7 +3348,7 @@ class LiveDcsTutorLoop:
             else:
                 _emit_vision_fact_observation_event(
                     observation=result.observation,
-                    event_sink=self.event_sink,
+                    event_sink=self._locked_event_sink(),
                     fallback_session_id=self.session_id,
                 )
 
@@ -2839,10 +3357,21 @@ class LiveDcsTutorLoop:
             status=effective_status,
             frame_ids=vision_selection.frame_ids,
             fresh_fact_ids=(
-                [fact.fact_id for fact in result.observation.facts if fact.state == "seen"]
+                [
+                    fact.fact_id
+                    for fact in result.observation.facts
+                    if fact.state == "seen"
+                    # Facts carried forward from unchanged regions were read on an earlier cycle.
+                    and fact.fact_id not in (result.observation.metadata.get("carried_forward_fact_ids") or ())
+                ]
                 if result.observation is not None and merge_error is None
                 else []
             ),
+            cache=(
+                result.metadata.get("vision_fact_cache")
+                if isinstance(result.metadata.get("vision_fact_cache"), Mapping)
+                else None
+            ),
         )
         metadata = dict(result.metadata)
         if result.error:
@@ -2856,6 +3385,7 @@ class LiveDcsTutorLoop:
             "vision_fact_summary": summary,
             "observation": result.observation.to_dict() if result.observation is not None else None,
             "metadata": metadata,
+            "timing": timing,
         }
 
     def _fallback_message(self, inferred_step_id: str | None, missing_conditions: Sequence[str]) -> str:
@@ -3920,6 +4450,43 @@ class LiveDcsTutorLoop:
             response.metadata["s18_visual_completion_overlay_reason"] = reason
         return True, reason if used else "rewrite_only"
 
+    def _build_help_cache_generation_key(self) -> str:
+        return _stable_hash_json(
+            {
+                "model_class": type(self.model).__name__,
+                "model_name": getattr(self.model, "model_name", None),
+                "base_url": getattr(self.model, "base_url", None),
+                "lang": self.lang,
+                "pack_title": self.pack_title,
+                "max_overlay_targets": self.max_overlay_targets,
+                "prompt_fingerprint": help_prompt_fingerprint(),
+            }
+        )
+
+    def _help_cache_key(self, state_key: str) -> str:
+        return _stable_hash_json({"state_key": state_key, "generation": self._help_cache_generation_key})
+
+    def _sync_help_cache_stats(self) -> None:
+        cache_stats = self._help_cache.stats
+        with self._state_lock:
+            self._stats.cache_hits = cache_stats.hits
+            self._stats.cache_misses = cache_stats.misses
+            self._stats.cache_evictions = cache_stats.evictions
+            self._stats.cache_expirations = cache_stats.expirations
+
+    def _sync_http_pool_stats(self) -> None:
+        # The pool is process-global; report only the delta since this loop started.
+        pool_stats = http_client_pool_stats()
+        baseline = self._http_pool_baseline
+        if pool_stats.requests < baseline.requests or pool_stats.connections_opened < baseline.connections_opened:
+            # The shared clients were closed and rebuilt, which resets their counters.
+            baseline = self._http_pool_baseline = HttpClientPoolStats()
+        self._stats.http_requests = pool_stats.requests - baseline.requests
+        self._stats.http_connections_opened = pool_stats.connections_opened - baseline.connections_opened
+        self._stats.http_connections_reused = max(
+            0, self._stats.http_requests - self._stats.http_connections_opened
+        )
+
     def _new_response_from_cached(
         self,
         cached_response: TutorResponse,
@@ -3970,11 +4537,121 @@ class LiveDcsTutorLoop:
         overlay_raw_report = self.action_executor.execute_actions(actions)
         return _normalize_help_report(overlay_raw_report)
 
+    def _capture_help_snapshot(self, trigger_t_wall: float | None) -> HelpCycleSnapshot | None:
+        with self._state_lock:
+            obs = self._latest_enriched_obs
+            if obs is None:
+                return None
+            recent_frames = self._snapshot_recent_frames(obs)
+            unemitted = self._unemitted_observation
+            self._unemitted_observation = None
+        if unemitted is not None:
+            # Fast-forward still logs the frame each help cycle was answered from.
+            self._throughput.observation_events_skipped -= 1
+            self._emit_observation_event(unemitted[0], t_wall=unemitted[1])
+        return HelpCycleSnapshot(
+            observation=obs,
+            recent_frames=recent_frames,
+            trigger_t_wall=trigger_t_wall,
+            triggered_monotonic=time.monotonic(),
+        )
+
+    def _help_cycle_superseded(self) -> bool:
+        active = self._active_help_generation
+        return active is not None and active != self._help_generation
+
+    def submit_help_cycle(
+        self,
+        *,
+        trigger_t_wall: float | None = None,
+    ) -> Future[tuple[TutorResponse | None, dict[str, Any] | None]] | None:
+        """
+        Queue a help cycle on the worker against a snapshot of the latest frame.
+
+        A newer press supersedes older ones: a queued cycle is cancelled, and a
+        running cycle still emits its events but skips overlay execution.
+        """
+        if self._help_executor is None:
+            raise RuntimeError("submit_help_cycle requires async_help=True")
+        snapshot = self._capture_help_snapshot(trigger_t_wall)
+        if snapshot is None:
+            return None
+        previous = self._help_future
+        self._help_generation += 1
+        generation = self._help_generation
+        if previous is not None and previous.cancel():
+            self._count_stat("help_cycles_superseded")
+        self._help_future = self._help_executor.submit(self._run_help_cycle_job, snapshot, generation)
+        self._help_future.add_done_callback(self._record_help_cycle_failure)
+        return self._help_future
+
+    def _count_stat(self, name: str, amount: int = 1) -> None:
+        # Stats are updated from the ingest thread, the help worker and future callbacks.
+        with self._state_lock:
+            setattr(self._stats, name, getattr(self._stats, name) + amount)
+
+    def _record_help_cycle_failure(self, future: Future[Any]) -> None:
+        # A failed cycle must not surface in whichever ingest call happens to submit the next one.
+        if future.cancelled() or future.exception() is None:
+            return
+        exc = future.exception()
+        self._count_stat("help_cycle_errors")
+        self._emit_event(
+            kind="system",
+            payload={"type": "help_cycle_error", "error_type": type(exc).__name__, "error": str(exc)},
+            t_wall=time.time(),
+        )
+
+    def wait_for_help_cycles(self, timeout_s: float | None = None) -> bool:
+        """Wait for the latest help cycle; False on timeout. Failures are already recorded, so they are not re-raised."""
+        future = self._help_future
+        if future is None:
+            return True
+        done, _pending = wait_for_futures([future], timeout=timeout_s)
+        return bool(done)
+
+    def _run_help_cycle_job(
+        self,
+        snapshot: HelpCycleSnapshot,
+        generation: int,
+    ) -> tuple[TutorResponse | None, dict[str, Any] | None]:
+        self._active_help_generation = generation
+        try:
+            return self._run_help_cycle_from_snapshot(snapshot)
+        finally:
+            self._active_help_generation = None
+
+    def _dispatch_help_cycle(self, *, trigger_t_wall: float | None) -> None:
+        if self._help_executor is not None:
+            self.submit_help_cycle(trigger_t_wall=trigger_t_wall)
+        else:
+            self.run_help_cycle(trigger_t_wall=trigger_t_wall)
+
+    def _execute_help_cycle_actions(
+        self,
+        actions: Sequence[Mapping[str, Any] | Any],
+        *,
+        snapshot: HelpCycleSnapshot,
+    ) -> dict[str, Any]:
+        if self._help_cycle_superseded():
+            self._count_stat("help_cycles_superseded")
+            return {"executed": [], "rejected": [], "dropped": [], "superseded": True}
+        report = self._execute_or_dry_run_actions(actions)
+        self._help_latency.observe((time.monotonic() - snapshot.triggered_monotonic) * 1000.0)
+        return report
+
     def run_help_cycle(self, *, trigger_t_wall: float | None = None) -> tuple[TutorResponse | None, dict[str, Any] | None]:
-        obs = self._latest_enriched_obs
-        if obs is None:
+        snapshot = self._capture_help_snapshot(trigger_t_wall)
+        if snapshot is None:
             return None, None
+        return self._run_help_cycle_from_snapshot(snapshot)
 
+    def _run_help_cycle_from_snapshot(
+        self,
+        snapshot: HelpCycleSnapshot,
+    ) -> tuple[TutorResponse | None, dict[str, Any] | None]:
+        obs = snapshot.observation
+        trigger_t_wall = snapshot.trigger_t_wall
         resolved_trigger_t_wall = _coerce_finite_float(trigger_t_wall)
         if resolved_trigger_t_wall is None:
             payload = obs.payload if isinstance(obs.payload, Mapping) else {}
@@ -3987,16 +4664,28 @@ class LiveDcsTutorLoop:
             trigger_t_wall=resolved_trigger_t_wall,
         )
         help_cycle_id = str(uuid4())
+        prefetched: dict[str, Any] = {}
         vision_fact_context = self._extract_vision_fact_context(
             vision_selection=vision_selection,
             help_cycle_id=help_cycle_id,
+            overlap=(
+                (lambda: prefetched.update(self._prefetch_deterministic_context(obs, snapshot.recent_frames)))
+                if self._vision_prefetcher is not None
+                else None
+            ),
         )
+        request_build_started = time.perf_counter()
         request, prompt_meta, state_key = self._build_request(
             obs,
             vision_selection=vision_selection,
             vision_fact_context=vision_fact_context,
             request_id_override=help_cycle_id,
+            recent_frames=snapshot.recent_frames,
+            all_gates=prefetched.get("all_gates"),
         )
+        timing = vision_fact_context.get("timing")
+        if isinstance(timing, dict):
+            timing["request_build_ms"] = round((time.perf_counter() - request_build_started) * 1000.0, 3)
         help_cycle_id = request.request_id
         request.metadata = dict(request.metadata)
         request.metadata["help_cycle_id"] = help_cycle_id
@@ -4024,20 +4713,17 @@ class LiveDcsTutorLoop:
             },
             vision_refs=vision_selection.frame_ids,
         )
-        self._stats.help_cycles += 1
+        self._count_stat("help_cycles")
         if request_audit_fields["vision_used"] is True:
-            self._stats.vision_cycles += 1
+            self._count_stat("vision_cycles")
         if request_audit_fields["vision_fallback_reason"] == VISION_SYNC_MISS:
-            self._stats.vision_sync_miss_count += 1
+            self._count_stat("vision_sync_miss_count")
 
-        use_cache = False
-        cached = self._help_cache
-        if cached is not None and cached.state_key == state_key:
-            if (now_wall - cached.t_wall) <= self.cooldown_s:
-                use_cache = True
+        cache_key = self._help_cache_key(state_key)
+        cached = self._help_cache.get(cache_key, now_wall=now_wall)
+        self._sync_help_cache_stats()
 
-        if use_cache and cached is not None:
-            self._stats.cache_hits += 1
+        if cached is not None:
             response = self._new_response_from_cached(cached.response, in_reply_to=request.request_id)
             response.metadata = dict(response.metadata)
             response.metadata["cached_response_reused"] = True
@@ -4087,7 +4773,7 @@ class LiveDcsTutorLoop:
                 response.actions,
                 trace_metadata=trace_metadata,
             )
-            overlay_report = self._execute_or_dry_run_actions(response.actions)
+            overlay_report = self._execute_help_cycle_actions(response.actions, snapshot=snapshot)
         else:
             hint = request.context.get("deterministic_step_hint", {})
             inferred_step_id = hint.get("inferred_step_id") if isinstance(hint, Mapping) else None
@@ -4122,7 +4808,7 @@ class LiveDcsTutorLoop:
                     if isinstance(item, str) and item
                 ]
             )
-            self._stats.model_calls += 1
+            self._count_stat("model_calls")
             try:
                 response = self.model.explain_error(obs, request)
             except Exception as exc:
@@ -4259,17 +4945,14 @@ class LiveDcsTutorLoop:
                 trace_metadata=trace_metadata,
             )
 
-            overlay_report = self._execute_or_dry_run_actions(response.actions)
+            overlay_report = self._execute_help_cycle_actions(response.actions, snapshot=snapshot)
             provider = response.metadata.get("provider")
             cacheable = response.status == "ok" and provider != "fallback"
             if cacheable:
-                self._help_cache = HelpCacheEntry(
-                    state_key=state_key,
-                    t_wall=now_wall,
-                    response=copy.deepcopy(response),
-                )
+                self._help_cache.put(cache_key, copy.deepcopy(response), now_wall=now_wall)
             else:
-                self._help_cache = None
+                self._help_cache.discard(cache_key)
+            self._sync_help_cache_stats()
 
         hint = request.context.get("deterministic_step_hint")
         if isinstance(hint, Mapping):
@@ -4282,8 +4965,10 @@ class LiveDcsTutorLoop:
         self._annotate_response_audit_metadata(response)
         response.metadata["scenario_profile"] = self.scenario_profile
         if response.metadata.get("vision_fallback_reason") == VISION_TEXT_FALLBACK:
-            self._stats.vision_text_fallback_count += 1
+            self._count_stat("vision_text_fallback_count")
 
+        if overlay_report.get("superseded"):
+            response.metadata["help_cycle_superseded"] = True
         if self.dry_run_overlay and overlay_report.get("dry_run"):
             print(
                 json.dumps(
@@ -4346,6 +5031,7 @@ class LiveDcsTutorLoop:
             raise ValueError("duration_s must be >= 0")
 
         start = time.time()
+        started_perf = time.perf_counter()
         first_help_done = False
 
         while True:
@@ -4360,20 +5046,20 @@ class LiveDcsTutorLoop:
             obs = self.source.get_observation()
             if obs is not None:
                 self._ingest_observation(obs)
-                self._stats.frames += 1
+                self._count_stat("frames")
                 obs_payload = obs.payload if isinstance(obs.payload, Mapping) else {}
                 obs_t_wall = _coerce_float(obs_payload.get("t_wall"))
                 help_action_t_wall = time.time() if self.vision_mode == "live" else obs_t_wall
                 if auto_help_on_first_frame and not first_help_done:
                     if help_capture_notifier is not None and hasattr(help_capture_notifier, "notify_help"):
                         help_capture_notifier.notify_help()
-                    self.run_help_cycle(trigger_t_wall=help_action_t_wall)
+                    self._dispatch_help_cycle(trigger_t_wall=help_action_t_wall)
                     first_help_done = True
                 if auto_help_every_n_frames > 0:
                     if self._stats.frames % auto_help_every_n_frames == 0:
                         if help_capture_notifier is not None and hasattr(help_capture_notifier, "notify_help"):
                             help_capture_notifier.notify_help()
-                        self.run_help_cycle(trigger_t_wall=help_action_t_wall)
+                        self._dispatch_help_cycle(trigger_t_wall=help_action_t_wall)
             else:
                 exhausted = bool(getattr(self.source, "is_exhausted", False))
                 if exhausted:
@@ -4384,7 +5070,7 @@ class LiveDcsTutorLoop:
                 self._pending_help_trigger_t_wall = None
                 if help_capture_notifier is not None and hasattr(help_capture_notifier, "notify_help"):
                     help_capture_notifier.notify_help()
-                self.run_help_cycle(trigger_t_wall=help_trigger_t_wall)
+                self._dispatch_help_cycle(trigger_t_wall=help_trigger_t_wall)
 
             if max_frames > 0 and self._stats.frames >= max_frames:
                 break
@@ -4392,7 +5078,9 @@ class LiveDcsTutorLoop:
             if obs is None:
                 time.sleep(max(0.0, idle_sleep_s))
 
-        return self._stats.to_dict()
+        self.wait_for_help_cycles()
+        self._throughput.elapsed_s += time.perf_counter() - started_perf
+        return self.stats.to_dict()
 
 
 def _new_default_log_path() -> Path:
@@ -4402,7 +5090,14 @@ def _new_default_log_path() -> Path:
 
 def _build_observation_source_from_args(args: argparse.Namespace) -> ObservationSource:
     if args.replay_bios:
-        return ReplayBiosReceiver(args.replay_bios, speed=args.speed)
+        speed = 0.0 if getattr(args, "fast_forward", False) else args.speed
+        return ReplayBiosReceiver(
+            args.replay_bios,
+            speed=speed,
+            start_t=getattr(args, "start_t", None),
+            start_seq=getattr(args, "start_seq", None),
+            end_t=getattr(args, "end_t", None),
+        )
 
     bios_source = str(getattr(args, "bios_source", "decoded")).strip().lower()
     if bios_source == "raw":
@@ -4467,6 +5162,28 @@ def _build_vision_port_from_args(
     )
 
 
+def _image_encode_options_from_args(args: argparse.Namespace) -> ImageEncodeOptions | None:
+    image_format = getattr(args, "model_image_format", IMAGE_FORMAT_ORIGINAL) or IMAGE_FORMAT_ORIGINAL
+    max_pixels = int(getattr(args, "model_image_max_pixels", 0) or 0)
+    max_bytes = int(getattr(args, "model_image_max_bytes", 0) or 0)
+    options = ImageEncodeOptions(
+        format=image_format,
+        max_pixels=max_pixels if max_pixels > 0 else None,
+        max_bytes=max_bytes if max_bytes > 0 else None,
+        quality=int(getattr(args, "model_image_quality", DEFAULT_IMAGE_QUALITY)),
+    )
+    return options if options.transcodes else None
+
+
+def _http_client_config_from_args(args: argparse.Namespace) -> HttpClientConfig:
+    return HttpClientConfig(
+        max_connections=int(getattr(args, "model_http_max_connections", DEFAULT_HTTP_MAX_CONNECTIONS)),
+        keepalive_expiry_s=float(getattr(args, "model_http_keepalive_expiry_s", DEFAULT_HTTP_KEEPALIVE_EXPIRY_S)),
+        connect_timeout_s=float(getattr(args, "model_connect_timeout_s", DEFAULT_HTTP_CONNECT_TIMEOUT_S)),
+        http2=bool(getattr(args, "model_http2", False)),
+    )
+
+
 def _build_model_from_args(args: argparse.Namespace) -> Any:
     provider = args.model_provider
     lang = args.lang
@@ -4485,6 +5202,7 @@ def _build_model_from_args(args: argparse.Namespace) -> Any:
     vision_saved_games_dir = getattr(args, "vision_saved_games_dir", None)
     if isinstance(vision_saved_games_dir, str) and vision_saved_games_dir.strip():
         allowed_local_image_roots.append(build_frames_root(vision_saved_games_dir))
+    http_client_config = _http_client_config_from_args(args)
     if provider == "openai_compat":
         if not args.model_base_url:
             raise ValueError("--model-base-url is required for openai_compat")
@@ -4501,6 +5219,13 @@ def _build_model_from_args(args: argparse.Namespace) -> Any:
             enable_multimodal=model_enable_multimodal,
             allowed_local_image_roots=allowed_local_image_roots,
             telemetry_map_path=args.telemetry_map,
+            capability_cache=shared_endpoint_capability_cache(
+                getattr(args, "model_capability_cache_path", None) or None,
+                ttl_s=getattr(args, "model_capability_ttl_s", None),
+            ),
+            stream=bool(getattr(args, "model_stream", False)),
+            image_encode_options=_image_encode_options_from_args(args),
+            http_client_config=http_client_config,
         )
     if provider == "ollama":
         base_url = args.model_base_url or "http://127.0.0.1:11434"
@@ -4513,6 +5238,8 @@ def _build_model_from_args(args: argparse.Namespace) -> Any:
             log_raw_llm_text=log_raw_llm_text,
             print_model_io=print_model_io,
             telemetry_map_path=args.telemetry_map,
+            stream=bool(getattr(args, "model_stream", False)),
+            http_client_config=http_client_config,
         )
     raise ValueError(f"Unsupported model provider: {provider}")
 
@@ -4650,6 +5377,110 @@ def build_arg_parser() -> argparse.ArgumentParser:
     )
 
     parser.add_argument("--cooldown-s", type=float, default=4.0, help="Cooldown window for same-state help reuse")
+    parser.add_argument(
+        "--help-cache-max-entries",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_HELP_CACHE_MAX_ENTRIES,
+        help="Max help responses kept in the state_key LRU cache (0 disables reuse).",
+    )
+    parser.add_argument(
+        "--help-cache-ttl-s",
+        type=float,
+        default=None,
+        help="In-memory help response cache TTL in seconds (defaults to --cooldown-s; unused with --help-cache-path).",
+    )
+    parser.add_argument(
+        "--help-cache-path",
+        default="",
+        help="Optional JSON file persisting the help response cache across runs (written on shutdown).",
+    )
+    parser.add_argument(
+        "--help-cache-persist-ttl-s",
+        type=float,
+        default=DEFAULT_HELP_CACHE_PERSIST_TTL_S,
+        help="Wall-clock TTL in seconds for responses in --help-cache-path (default: 7 days).",
+    )
+    parser.add_argument(
+        "--pipelined-vision",
+        action="store_true",
+        help="Overlap gate evaluation and RAG with the help cycle's vision fact VLM wait.",
+    )
+    parser.add_argument(
+        "--speculative-vision",
+        action="store_true",
+        help=(
+            "With --pipelined-vision, also start vision fact extraction before help is pressed, "
+            "once per change in the newest frame's region hashes (adds VLM traffic)."
+        ),
+    )
+    parser.add_argument(
+        "--vision-fact-timeout-s",
+        type=float,
+        default=0.0,
+        help="With --pipelined-vision, max seconds a help cycle waits for vision facts before text-only fallback (0 waits).",
+    )
+    parser.add_argument(
+        "--vision-fact-cache-entries",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES,
+        help="Vision fact results remembered per frame perceptual hash; repeat presses on unchanged displays skip the VLM (0 disables).",
+    )
+    parser.add_argument(
+        "--vision-fact-cache-max-distance",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE,
+        help="Max differing hash bits per display region for a vision fact cache hit (default 0: exact match).",
+    )
+    parser.add_argument(
+        "--vision-fact-region-incremental",
+        action="store_true",
+        help="Re-extract vision facts only for display regions whose hash changed since the last read; unchanged regions keep their facts.",
+    )
+    parser.add_argument(
+        "--vision-fact-region-max-distance",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_REGION_CHANGE_MAX_DISTANCE,
+        help="With --vision-fact-region-incremental, max differing hash bits before a display region counts as changed.",
+    )
+    parser.add_argument(
+        "--buffered-events",
+        action="store_true",
+        help="Write the event log from a background thread with batched flushes (drains on SIGINT/SIGTERM).",
+    )
+    parser.add_argument(
+        "--event-queue-max",
+        type=int,
+        default=DEFAULT_EVENT_QUEUE_MAX,
+        help="With --buffered-events, max events queued for the writer thread.",
+    )
+    parser.add_argument(
+        "--event-flush-interval-s",
+        type=float,
+        default=DEFAULT_EVENT_FLUSH_INTERVAL_S,
+        help="With --buffered-events, max seconds written events wait before a file flush.",
+    )
+    parser.add_argument(
+        "--event-overflow",
+        choices=list(EVENT_OVERFLOW_POLICIES),
+        default=EVENT_OVERFLOW_BLOCK,
+        help="With --buffered-events, block the loop or drop events when the queue is full.",
+    )
+    parser.add_argument(
+        "--event-fsync-on-close",
+        action="store_true",
+        help="With --buffered-events, fsync the event log when it is closed.",
+    )
+    parser.add_argument(
+        "--latch-write-behind-s",
+        type=float,
+        default=0.0,
+        help="Persist momentary completion latches from a background writer debounced by this many seconds (0 writes synchronously).",
+    )
+    parser.add_argument(
+        "--async-help",
+        action="store_true",
+        help="Run help cycles on a worker thread so BIOS ingestion continues during model calls.",
+    )
     parser.add_argument("--max-frames", type=int, default=0, help="Max frames to process (0 means unlimited)")
     parser.add_argument("--duration", type=float, default=0.0, help="Run duration in seconds (0 means unlimited)")
 
@@ -4698,11 +5529,64 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=1.0,
         help="Replay speed multiplier for --replay-bios (1.0 realtime, 0 max speed)",
     )
+    parser.add_argument(
+        "--start-t",
+        type=float,
+        default=None,
+        help="With --replay-bios, start this many seconds after the first frame (seeks via a keyframe index).",
+    )
+    parser.add_argument(
+        "--start-seq",
+        type=int,
+        default=None,
+        help="With --replay-bios, start at the first frame with seq >= this value (seeks via a keyframe index).",
+    )
+    parser.add_argument(
+        "--end-t",
+        type=float,
+        default=None,
+        help="With --replay-bios, stop after this many seconds from the first frame.",
+    )
+    parser.add_argument(
+        "--fast-forward",
+        action="store_true",
+        help="With --replay-bios, replay at max speed and log observation events only for help cycles and samples.",
+    )
+    parser.add_argument(
+        "--observation-sample-every-n",
+        type=parse_positive_int_arg,
+        default=None,
+        help="With --fast-forward, also log every Nth observation event (N >= 1; omit to log help-cycle frames only).",
+    )
 
     parser.add_argument("--model-provider", choices=["stub", "openai_compat", "ollama"], default="stub")
     parser.add_argument("--model-name", default=os.getenv("SIMTUTOR_MODEL_NAME", "Qwen3-8B-Instruct"))
     parser.add_argument("--model-base-url", default=os.getenv("SIMTUTOR_MODEL_BASE_URL", ""))
     parser.add_argument("--model-timeout-s", type=float, default=float(os.getenv("SIMTUTOR_MODEL_TIMEOUT_S", "20")))
+    parser.add_argument(
+        "--model-connect-timeout-s",
+        type=float,
+        default=DEFAULT_HTTP_CONNECT_TIMEOUT_S,
+        help="Connect-phase timeout; --model-timeout-s still bounds each read/write.",
+    )
+    parser.add_argument(
+        "--model-http-max-connections",
+        type=parse_positive_int_arg,
+        default=DEFAULT_HTTP_MAX_CONNECTIONS,
+        help="Connection limit of the shared keep-alive pool per model endpoint.",
+    )
+    parser.add_argument(
+        "--model-http-keepalive-expiry-s",
+        type=float,
+        default=DEFAULT_HTTP_KEEPALIVE_EXPIRY_S,
+        help="Seconds an idle pooled model connection is kept open.",
+    )
+    parser.add_argument(
+        "--model-http2",
+        action="store_true",
+        default=parse_env_bool("SIMTUTOR_MODEL_HTTP2", default=False),
+        help="Negotiate HTTP/2 with the model endpoint (requires the h2 package).",
+    )
     parser.add_argument(
         "--model-max-tokens",
         type=parse_non_negative_int_arg,
@@ -4710,6 +5594,47 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Max completion tokens for model providers that support it (0 uses provider default).",
     )
     parser.add_argument("--model-api-key", default=os.getenv("SIMTUTOR_MODEL_API_KEY"))
+    parser.add_argument(
+        "--model-capability-cache-path",
+        default=os.getenv("SIMTUTOR_MODEL_CAPABILITY_CACHE_PATH", ""),
+        help="Persist OpenAI-compatible endpoint feature rejections (json_schema, overrides, images) to this JSON file.",
+    )
+    parser.add_argument(
+        "--model-capability-ttl-s",
+        type=float,
+        default=DEFAULT_CAPABILITY_TTL_S,
+        help="Seconds a rejected endpoint feature is skipped before it is probed again.",
+    )
+    parser.add_argument(
+        "--model-stream",
+        action="store_true",
+        default=parse_env_bool("SIMTUTOR_MODEL_STREAM", default=False),
+        help="Stream chat completions and stop reading once a valid HelpResponse JSON object has arrived.",
+    )
+    parser.add_argument(
+        "--model-image-format",
+        choices=list(IMAGE_FORMATS),
+        default=IMAGE_FORMAT_ORIGINAL,
+        help="Re-encode multimodal frames as JPEG/WebP before sending (original keeps the captured PNG).",
+    )
+    parser.add_argument(
+        "--model-image-max-pixels",
+        type=parse_non_negative_int_arg,
+        default=0,
+        help="Downscale multimodal frames to at most this many pixels (0 keeps full resolution).",
+    )
+    parser.add_argument(
+        "--model-image-max-bytes",
+        type=parse_non_negative_int_arg,
+        default=0,
+        help="Lower quality, then resolution, until each encoded frame fits this many bytes (0 disables).",
+    )
+    parser.add_argument(
+        "--model-image-quality",
+        type=int,
+        default=DEFAULT_IMAGE_QUALITY,
+        help="Starting JPEG/WebP quality for transcoded multimodal frames.",
+    )
     model_multimodal_default = parse_env_bool("SIMTUTOR_MODEL_ENABLE_MULTIMODAL", default=False)
     model_multimodal_group = parser.add_mutually_exclusive_group()
     model_multimodal_group.add_argument(
@@ -4789,7 +5714,20 @@ def main(argv: Sequence[str] | None = None) -> int:
         else None
     )
 
-    with JsonlEventStore(output, mode="w") as store:
+    event_store = (
+        BufferedJsonlEventStore(
+            output,
+            mode="w",
+            queue_max=args.event_queue_max,
+            flush_interval_s=args.event_flush_interval_s,
+            overflow=args.event_overflow,
+            fsync_on_close=bool(args.event_fsync_on_close),
+            flush_on_signal=True,
+        )
+        if args.buffered_events
+        else JsonlEventStore(output, mode="w")
+    )
+    with event_store as store:
         executor = OverlayActionExecutor(
             ui_map_path=args.ui_map,
             pack_path=args.pack,
@@ -4822,6 +5760,22 @@ def main(argv: Sequence[str] | None = None) -> int:
             vision_sync_window_ms=vision_sync_window_ms,
             vision_trigger_wait_ms=vision_trigger_wait_ms,
             max_overlay_targets=max(0, int(args.max_overlay_targets)),
+            incremental_vars=bool(args.merge_full_state) and not args.replay_bios,
+            help_cache_max_entries=args.help_cache_max_entries,
+            help_cache_ttl_s=args.help_cache_ttl_s,
+            help_cache_path=args.help_cache_path or None,
+            help_cache_persist_ttl_s=args.help_cache_persist_ttl_s,
+            async_help=bool(args.async_help),
+            pipelined_vision=bool(args.pipelined_vision),
+            speculative_vision=bool(args.speculative_vision),
+            vision_fact_timeout_s=args.vision_fact_timeout_s or None,
+            vision_fact_cache_entries=args.vision_fact_cache_entries,
+            vision_fact_cache_max_distance=args.vision_fact_cache_max_distance,
+            vision_fact_region_incremental=bool(args.vision_fact_region_incremental),
+            vision_fact_region_change_max_distance=args.vision_fact_region_max_distance,
+            latch_write_behind_s=args.latch_write_behind_s or None,
+            fast_forward=bool(args.fast_forward) and bool(args.replay_bios),
+            observation_sample_every_n=args.observation_sample_every_n or 0,
         )
 
         stdin_trigger = StdinHelpTrigger() if args.stdin_help else None
@@ -4875,6 +5829,8 @@ def main(argv: Sequence[str] | None = None) -> int:
                 help_trigger=trigger,
                 help_capture_notifier=vision_capture_notifier,
             )
+            help_latency = loop.help_latency.to_dict()
+            replay_throughput = loop.replay_throughput.to_dict()
         finally:
             if stdin_trigger is not None:
                 stdin_trigger.close()
@@ -4888,6 +5844,16 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     print(f"[LIVE_DCS] wrote events to {output}")
     print(f"[LIVE_DCS] stats={json.dumps(stats, ensure_ascii=False, sort_keys=True)}")
+    print(f"[LIVE_DCS] help_latency_ms={json.dumps(help_latency, ensure_ascii=False, sort_keys=True)}")
+    if args.fast_forward and args.replay_bios:
+        print(f"[LIVE_DCS] replay_throughput={json.dumps(replay_throughput, ensure_ascii=False, sort_keys=True)}")
+    if args.latch_write_behind_s > 0:
+        print(
+            f"[LIVE_DCS] completion_latch_persist="
+            f"{json.dumps(completion_latch_persist_stats(), ensure_ascii=False, sort_keys=True)}"
+        )
+    if isinstance(event_store, BufferedJsonlEventStore):
+        print(f"[LIVE_DCS] event_store={json.dumps(event_store.stats.to_dict(), ensure_ascii=False, sort_keys=True)}")
     return 0
 
 
@@ -10,12 +10,28 @@ from typing import Any, Iterable, Tuple
 
 from jsonschema import Draft202012Validator, FormatChecker
 
+from adapters.help_response_cache import DEFAULT_HELP_CACHE_MAX_ENTRIES, DEFAULT_HELP_CACHE_PERSIST_TTL_S
+from adapters.http_client_pool import (
+    DEFAULT_HTTP_CONNECT_TIMEOUT_S,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY_S,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+)
+from adapters.image_payload_cache import DEFAULT_IMAGE_QUALITY, IMAGE_FORMAT_ORIGINAL, IMAGE_FORMATS
+from adapters.openai_compat_capabilities import DEFAULT_CAPABILITY_TTL_S
 from adapters.pack_gates import DEFAULT_SCENARIO_PROFILE, SUPPORTED_SCENARIO_PROFILES
+from adapters.vision_fact_cache import DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE, DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES
+from adapters.vision_fact_extractor import DEFAULT_REGION_CHANGE_MAX_DISTANCE
 from adapters.vision_frames import DEFAULT_FRAME_CHANNEL
 from adapters.vision_prompting import DEFAULT_LAYOUT_ID
 from core.constants import ENV_COLD_START_PRODUCTION
 from core.env_bool import parse_env_bool
-from simtutor.cli_parsing import parse_env_int, parse_non_negative_int_arg
+from core.event_store import (
+    DEFAULT_EVENT_FLUSH_INTERVAL_S,
+    DEFAULT_EVENT_QUEUE_MAX,
+    EVENT_OVERFLOW_BLOCK,
+    EVENT_OVERFLOW_POLICIES,
+)
+from simtutor.cli_parsing import parse_env_int, parse_non_negative_int_arg, parse_positive_int_arg
 from simtutor.schemas import SCHEMA_INDEX, load_schema
 from simtutor.runner import replay_log, run_simulation
 
@@ -71,6 +87,30 @@ def _add_model_args(parser: argparse.ArgumentParser, *, default_provider: str, p
     parser.add_argument("--model-name", default=os.getenv("SIMTUTOR_MODEL_NAME", "Qwen3-8B-Instruct"))
     parser.add_argument("--model-base-url", default=os.getenv("SIMTUTOR_MODEL_BASE_URL", ""))
     parser.add_argument("--model-timeout-s", type=float, default=float(os.getenv("SIMTUTOR_MODEL_TIMEOUT_S", "20")))
+    parser.add_argument(
+        "--model-connect-timeout-s",
+        type=float,
+        default=DEFAULT_HTTP_CONNECT_TIMEOUT_S,
+        help="Connect-phase timeout; --model-timeout-s still bounds each read/write.",
+    )
+    parser.add_argument(
+        "--model-http-max-connections",
+        type=parse_positive_int_arg,
+        default=DEFAULT_HTTP_MAX_CONNECTIONS,
+        help="Connection limit of the shared keep-alive pool per model endpoint.",
+    )
+    parser.add_argument(
+        "--model-http-keepalive-expiry-s",
+        type=float,
+        default=DEFAULT_HTTP_KEEPALIVE_EXPIRY_S,
+        help="Seconds an idle pooled model connection is kept open.",
+    )
+    parser.add_argument(
+        "--model-http2",
+        action="store_true",
+        default=parse_env_bool("SIMTUTOR_MODEL_HTTP2", default=False),
+        help="Negotiate HTTP/2 with the model endpoint (requires the h2 package).",
+    )
     parser.add_argument(
         "--model-max-tokens",
         type=parse_non_negative_int_arg,
@@ -78,6 +118,47 @@ def _add_model_args(parser: argparse.ArgumentParser, *, default_provider: str, p
         help="Max completion tokens for model providers that support it (0 uses provider default).",
     )
     parser.add_argument("--model-api-key", default=os.getenv("SIMTUTOR_MODEL_API_KEY"))
+    parser.add_argument(
+        "--model-capability-cache-path",
+        default=os.getenv("SIMTUTOR_MODEL_CAPABILITY_CACHE_PATH", ""),
+        help="Persist OpenAI-compatible endpoint feature rejections (json_schema, overrides, images) to this JSON file.",
+    )
+    parser.add_argument(
+        "--model-capability-ttl-s",
+        type=float,
+        default=DEFAULT_CAPABILITY_TTL_S,
+        help="Seconds a rejected endpoint feature is skipped before it is probed again.",
+    )
+    parser.add_argument(
+        "--model-stream",
+        action="store_true",
+        default=parse_env_bool("SIMTUTOR_MODEL_STREAM", default=False),
+        help="Stream chat completions and stop reading once a valid HelpResponse JSON object has arrived.",
+    )
+    parser.add_argument(
+        "--model-image-format",
+        choices=list(IMAGE_FORMATS),
+        default=IMAGE_FORMAT_ORIGINAL,
+        help="Re-encode multimodal frames as JPEG/WebP before sending (original keeps the captured PNG).",
+    )
+    parser.add_argument(
+        "--model-image-max-pixels",
+        type=parse_non_negative_int_arg,
+        default=0,
+        help="Downscale multimodal frames to at most this many pixels (0 keeps full resolution).",
+    )
+    parser.add_argument(
+        "--model-image-max-bytes",
+        type=parse_non_negative_int_arg,
+        default=0,
+        help="Lower quality, then resolution, until each encoded frame fits this many bytes (0 disables).",
+    )
+    parser.add_argument(
+        "--model-image-quality",
+        type=int,
+        default=DEFAULT_IMAGE_QUALITY,
+        help="Starting JPEG/WebP quality for transcoded multimodal frames.",
+    )
     model_multimodal_default = parse_env_bool("SIMTUTOR_MODEL_ENABLE_MULTIMODAL", default=False)
     model_multimodal_group = parser.add_mutually_exclusive_group()
     model_multimodal_group.add_argument(
@@ -129,7 +210,7 @@ def _add_model_args(parser: argparse.ArgumentParser, *, default_provider: str, p
 
 def _run_replay_bios(args: argparse.Namespace) -> int:
     from adapters.action_executor import OverlayActionExecutor
-    from core.event_store import JsonlEventStore
+    from core.event_store import BufferedJsonlEventStore, JsonlEventStore
     from live_dcs import (
         CompositeHelpTrigger,
         LiveDcsTutorLoop,
@@ -148,15 +229,37 @@ def _run_replay_bios(args: argparse.Namespace) -> int:
     stdin_trigger = None
     udp_trigger = None
     stats: dict[str, Any] = {}
+    help_latency: dict[str, Any] = {}
+    replay_throughput: dict[str, Any] = {}
+    event_store = None
 
     try:
-        source = ReplayBiosReceiver(args.input, speed=args.speed)
+        source = ReplayBiosReceiver(
+            args.input,
+            speed=0.0 if args.fast_forward else args.speed,
+            start_t=args.start_t,
+            start_seq=args.start_seq,
+            end_t=args.end_t,
+        )
         model = _build_replay_model_from_args(args)
         vision_port, vision_session_id, vision_sync_window_ms, vision_trigger_wait_ms = _build_vision_port_from_args(
             args,
             mode="replay",
         )
-        with JsonlEventStore(output, mode="w") as store:
+        event_store = (
+            BufferedJsonlEventStore(
+                output,
+                mode="w",
+                queue_max=args.event_queue_max,
+                flush_interval_s=args.event_flush_interval_s,
+                overflow=args.event_overflow,
+                fsync_on_close=bool(args.event_fsync_on_close),
+                flush_on_signal=True,
+            )
+            if args.buffered_events
+            else JsonlEventStore(output, mode="w")
+        )
+        with event_store as store:
             with OverlayActionExecutor(
                 ui_map_path=args.ui_map,
                 pack_path=args.pack,
@@ -189,6 +292,21 @@ def _run_replay_bios(args: argparse.Namespace) -> int:
                     vision_sync_window_ms=vision_sync_window_ms,
                     vision_trigger_wait_ms=vision_trigger_wait_ms,
                     max_overlay_targets=max(0, int(args.max_overlay_targets)),
+                    help_cache_max_entries=args.help_cache_max_entries,
+                    help_cache_ttl_s=args.help_cache_ttl_s,
+                    help_cache_path=args.help_cache_path or None,
+                    help_cache_persist_ttl_s=args.help_cache_persist_ttl_s,
+                    async_help=bool(args.async_help),
+                    pipelined_vision=bool(args.pipelined_vision),
+                    speculative_vision=bool(args.speculative_vision),
+                    vision_fact_timeout_s=args.vision_fact_timeout_s or None,
+                    vision_fact_cache_entries=args.vision_fact_cache_entries,
+                    vision_fact_cache_max_distance=args.vision_fact_cache_max_distance,
+                    vision_fact_region_incremental=bool(args.vision_fact_region_incremental),
+                    vision_fact_region_change_max_distance=args.vision_fact_region_max_distance,
+                    latch_write_behind_s=args.latch_write_behind_s or None,
+                    fast_forward=bool(args.fast_forward),
+                    observation_sample_every_n=args.observation_sample_every_n or 0,
                 )
 
                 stdin_trigger = StdinHelpTrigger() if args.stdin_help else None
@@ -226,6 +344,8 @@ def _run_replay_bios(args: argparse.Namespace) -> int:
                     auto_help_every_n_frames=args.auto_help_every_n_frames,
                     help_trigger=help_trigger,
                 )
+                help_latency = loop.help_latency.to_dict()
+                replay_throughput = loop.replay_throughput.to_dict()
     finally:
         if stdin_trigger is not None:
             stdin_trigger.close()
@@ -241,6 +361,11 @@ def _run_replay_bios(args: argparse.Namespace) -> int:
 
     print(f"[REPLAY_BIOS] wrote events to {output}")
     print(f"[REPLAY_BIOS] stats={json.dumps(stats, ensure_ascii=False, sort_keys=True)}")
+    print(f"[REPLAY_BIOS] help_latency_ms={json.dumps(help_latency, ensure_ascii=False, sort_keys=True)}")
+    if args.fast_forward:
+        print(f"[REPLAY_BIOS] replay_throughput={json.dumps(replay_throughput, ensure_ascii=False, sort_keys=True)}")
+    if isinstance(event_store, BufferedJsonlEventStore):
+        print(f"[REPLAY_BIOS] event_store={json.dumps(event_store.stats.to_dict(), ensure_ascii=False, sort_keys=True)}")
     return 0
 
 
@@ -319,16 +444,14 @@ def _run_record_vlm(args: argparse.Namespace) -> int:
     return 0
 
 
-def _run_replay_eval(args: argparse.Namespace) -> int:
-    from simtutor.replay_eval import ReplayEvalOracleModel, load_replay_eval_suite, run_replay_eval_suite
+class _ReplayEvalModelFactory:
+    """Picklable per-case model factory so `--jobs` workers can rebuild models from CLI args."""
 
-    suite = replace(load_replay_eval_suite(args.suite), lang=args.lang)
-    provider_name = "replay_eval_oracle" if args.model_provider == "oracle" else args.model_provider
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
 
-    def _model_factory(case) -> Any:
-        if args.model_provider == "oracle":
-            return ReplayEvalOracleModel(case, lang=args.lang)
-        runtime_args = argparse.Namespace(**vars(args))
+    def __call__(self, case) -> Any:
+        runtime_args = argparse.Namespace(**vars(self.args))
         runtime_args.session_id = case.session_id
         runtime_args.vision_saved_games_dir = str(case.vision.saved_games_dir) if case.vision is not None else None
         runtime_args.vision_session_id = case.vision.session_id if case.vision is not None else None
@@ -336,12 +459,23 @@ def _run_replay_eval(args: argparse.Namespace) -> int:
         runtime_args.vision_layout_id = case.vision.layout_id if case.vision is not None else DEFAULT_LAYOUT_ID
         return _build_replay_model_from_args(runtime_args)
 
+
+def _run_replay_eval(args: argparse.Namespace) -> int:
+    from simtutor.replay_eval import load_replay_eval_suite, run_replay_eval_suite
+
+    suite = replace(load_replay_eval_suite(args.suite), lang=args.lang)
+    provider_name = "replay_eval_oracle" if args.model_provider == "oracle" else args.model_provider
+    # None selects the built-in oracle model for the suite language.
+    model_factory = None if args.model_provider == "oracle" else _ReplayEvalModelFactory(args)
+
     report = run_replay_eval_suite(
         suite,
         output_dir=args.output_dir,
         report_path=args.report,
-        model_factory=_model_factory,
+        model_factory=model_factory,
         provider_name=provider_name,
+        jobs=args.jobs,
+        fast_forward=bool(args.fast_forward),
     )
     print(f"[REPLAY_EVAL] suite={suite.suite_id}")
     print(f"[REPLAY_EVAL] summary={json.dumps(report['summary'], ensure_ascii=False, sort_keys=True)}")
@@ -392,6 +526,35 @@ def main() -> int:
     rep_bios = sub.add_parser("replay-bios", help="Replay DCS-BIOS JSONL through live tutor pipeline")
     rep_bios.add_argument("--input", required=True, help="Path to dcs_bios_raw.jsonl")
     rep_bios.add_argument("--speed", type=float, default=1.0, help="Replay speed (1.0 realtime, 0 max speed)")
+    rep_bios.add_argument(
+        "--start-t",
+        type=float,
+        default=None,
+        help="Start replay this many seconds after the first frame (seeks via the <input>.idx.gz keyframe index)",
+    )
+    rep_bios.add_argument(
+        "--start-seq",
+        type=int,
+        default=None,
+        help="Start replay at the first frame with seq >= this value (seeks via the keyframe index)",
+    )
+    rep_bios.add_argument(
+        "--end-t",
+        type=float,
+        default=None,
+        help="Stop replay after this many seconds from the first frame",
+    )
+    rep_bios.add_argument(
+        "--fast-forward",
+        action="store_true",
+        help="Replay at max speed and log observation events only for help cycles and samples; prints frames/sec.",
+    )
+    rep_bios.add_argument(
+        "--observation-sample-every-n",
+        type=parse_positive_int_arg,
+        default=None,
+        help="With --fast-forward, also log every Nth observation event (N >= 1; omit to log help-cycle frames only).",
+    )
 
     rep_bios.add_argument("--pack", default="packs/fa18c_startup/pack.yaml", help="pack.yaml path")
     rep_bios.add_argument("--ui-map", default="packs/fa18c_startup/ui_map.yaml", help="ui_map.yaml path")
@@ -469,6 +632,110 @@ def main() -> int:
         help="Reserved extra wait budget for trigger-frame arrival.",
     )
     rep_bios.add_argument("--cooldown-s", type=float, default=4.0, help="Help cache cooldown seconds")
+    rep_bios.add_argument(
+        "--help-cache-max-entries",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_HELP_CACHE_MAX_ENTRIES,
+        help="Max help responses kept in the state_key LRU cache (0 disables reuse).",
+    )
+    rep_bios.add_argument(
+        "--help-cache-ttl-s",
+        type=float,
+        default=None,
+        help="In-memory help response cache TTL in seconds (defaults to --cooldown-s; unused with --help-cache-path).",
+    )
+    rep_bios.add_argument(
+        "--help-cache-path",
+        default="",
+        help="Optional JSON file persisting the help response cache across replay runs (written on shutdown).",
+    )
+    rep_bios.add_argument(
+        "--help-cache-persist-ttl-s",
+        type=float,
+        default=DEFAULT_HELP_CACHE_PERSIST_TTL_S,
+        help="Wall-clock TTL in seconds for responses in --help-cache-path (default: 7 days).",
+    )
+    rep_bios.add_argument(
+        "--pipelined-vision",
+        action="store_true",
+        help="Overlap gate evaluation and RAG with the help cycle's vision fact VLM wait.",
+    )
+    rep_bios.add_argument(
+        "--speculative-vision",
+        action="store_true",
+        help=(
+            "With --pipelined-vision, also start vision fact extraction before help is pressed, "
+            "once per change in the newest frame's region hashes (adds VLM traffic)."
+        ),
+    )
+    rep_bios.add_argument(
+        "--vision-fact-timeout-s",
+        type=float,
+        default=0.0,
+        help="With --pipelined-vision, max seconds a help cycle waits for vision facts before text-only fallback (0 waits).",
+    )
+    rep_bios.add_argument(
+        "--vision-fact-cache-entries",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_VISION_FACT_CACHE_MAX_ENTRIES,
+        help="Vision fact results remembered per frame perceptual hash; repeat presses on unchanged displays skip the VLM (0 disables).",
+    )
+    rep_bios.add_argument(
+        "--vision-fact-cache-max-distance",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_VISION_FACT_CACHE_MAX_DISTANCE,
+        help="Max differing hash bits per display region for a vision fact cache hit (default 0: exact match).",
+    )
+    rep_bios.add_argument(
+        "--vision-fact-region-incremental",
+        action="store_true",
+        help="Re-extract vision facts only for display regions whose hash changed since the last read; unchanged regions keep their facts.",
+    )
+    rep_bios.add_argument(
+        "--vision-fact-region-max-distance",
+        type=parse_non_negative_int_arg,
+        default=DEFAULT_REGION_CHANGE_MAX_DISTANCE,
+        help="With --vision-fact-region-incremental, max differing hash bits before a display region counts as changed.",
+    )
+    rep_bios.add_argument(
+        "--buffered-events",
+        action="store_true",
+        help="Write the event log from a background thread with batched flushes (drains on SIGINT/SIGTERM).",
+    )
+    rep_bios.add_argument(
+        "--event-queue-max",
+        type=int,
+        default=DEFAULT_EVENT_QUEUE_MAX,
+        help="With --buffered-events, max events queued for the writer thread.",
+    )
+    rep_bios.add_argument(
+        "--event-flush-interval-s",
+        type=float,
+        default=DEFAULT_EVENT_FLUSH_INTERVAL_S,
+        help="With --buffered-events, max seconds written events wait before a file flush.",
+    )
+    rep_bios.add_argument(
+        "--event-overflow",
+        choices=list(EVENT_OVERFLOW_POLICIES),
+        default=EVENT_OVERFLOW_BLOCK,
+        help="With --buffered-events, block the loop or drop events when the queue is full.",
+    )
+    rep_bios.add_argument(
+        "--event-fsync-on-close",
+        action="store_true",
+        help="With --buffered-events, fsync the event log when it is closed.",
+    )
+    rep_bios.add_argument(
+        "--latch-write-behind-s",
+        type=float,
+        default=0.0,
+        help="Persist momentary completion latches from a background writer debounced by this many seconds (0 writes synchronously).",
+    )
+    rep_bios.add_argument(
+        "--async-help",
+        action="store_true",
+        help="Run help cycles on a worker thread so frame replay continues during model calls.",
+    )
     rep_bios.add_argument("--max-frames", type=int, default=0, help="Max frames to process (0 means unlimited)")
     rep_bios.add_argument("--duration", type=float, default=0.0, help="Run duration seconds (0 means unlimited)")
     rep_bios.add_argument("--auto-help-once", action="store_true", help="Auto trigger one help after first frame")
@@ -556,6 +823,17 @@ def main() -> int:
         help="Directory for per-case replay event logs and the report",
     )
     rep_eval.add_argument("--report", default=None, help="Optional explicit report JSON path")
+    rep_eval.add_argument(
+        "--jobs",
+        type=parse_positive_int_arg,
+        default=1,
+        help="Run cases across N worker processes that preload the pack and knowledge index once (default: 1)",
+    )
+    rep_eval.add_argument(
+        "--fast-forward",
+        action="store_true",
+        help="Log observation events only for help-cycle frames; case outcomes are unchanged.",
+    )
     _add_model_args(rep_eval, default_provider="oracle", provider_choices=["oracle", "stub", "openai_compat", "ollama"])
 
     args, unknown_args = parser.parse_known_args()
@@ -45,4 +45,11 @@ def parse_non_negative_int_arg(raw_value: str) -> int:
     return value
 
 
-__all__ = ["parse_env_int", "parse_non_negative_int_arg"]
+def parse_positive_int_arg(raw_value: str) -> int:
+    value = parse_non_negative_int_arg(raw_value)
+    if value == 0:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return value
+
+
+__all__ = ["parse_env_int", "parse_non_negative_int_arg", "parse_positive_int_arg"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 import json
 from pathlib import Path
@@ -669,130 +670,238 @@ def _error_case_result(
     }
 
 
-def run_replay_eval_suite(
+def _run_replay_eval_case(
     suite: ReplayEvalSuite,
+    case: ReplayEvalCase,
     *,
-    output_dir: str | Path,
-    report_path: str | Path | None = None,
-    model_factory: Callable[[ReplayEvalCase], Any] | None = None,
-    provider_name: str = "replay_eval_oracle",
+    output_dir: Path,
+    factory: Callable[[ReplayEvalCase], Any],
+    fast_forward: bool = False,
 ) -> dict[str, Any]:
     from live_dcs import LiveDcsTutorLoop, ReplayBiosReceiver
 
-    resolved_output_dir = Path(output_dir).expanduser().resolve()
-    resolved_output_dir.mkdir(parents=True, exist_ok=True)
+    case_output_dir = output_dir / case.case_id
+    case_output_dir.mkdir(parents=True, exist_ok=True)
+    event_log_path = case_output_dir / "events.jsonl"
 
-    case_results: list[dict[str, Any]] = []
-    factory = model_factory or (lambda case: _default_model_factory(case, lang=suite.lang))
-
-    for case in suite.cases:
-        case_output_dir = resolved_output_dir / case.case_id
-        case_output_dir.mkdir(parents=True, exist_ok=True)
-        event_log_path = case_output_dir / "events.jsonl"
-
-        source = ReplayBiosReceiver(case.input_path, speed=0.0)
-        model = None
-        loop = None
-        execution_error: Exception | None = None
-        try:
-            model = factory(case)
-            with JsonlEventStore(event_log_path, mode="w") as store:
-                with OverlayActionExecutor(
-                    sender=_NoopOverlaySender(),
-                    ui_map_path=suite.ui_map_path,
+    source = ReplayBiosReceiver(case.input_path, speed=0.0)
+    model = None
+    loop = None
+    execution_error: Exception | None = None
+    try:
+        model = factory(case)
+        with JsonlEventStore(event_log_path, mode="w") as store:
+            with OverlayActionExecutor(
+                sender=_NoopOverlaySender(),
+                ui_map_path=suite.ui_map_path,
+                pack_path=suite.pack_path,
+                dry_run=True,
+                session_id=case.session_id,
+                event_sink=store.append,
+            ) as executor:
+                loop = LiveDcsTutorLoop(
+                    source=source,
+                    model=model,
+                    action_executor=executor,
                     pack_path=suite.pack_path,
-                    dry_run=True,
+                    ui_map_path=suite.ui_map_path,
+                    telemetry_map_path=suite.telemetry_map_path,
+                    bios_to_ui_path=suite.bios_to_ui_path,
+                    knowledge_index_path=suite.knowledge_index_path,
+                    rag_top_k=5,
+                    cold_start_production=False,
+                    knowledge_source_policy_path=suite.knowledge_source_policy_path,
+                    cooldown_s=0.0,
                     session_id=case.session_id,
+                    lang=suite.lang,
+                    scenario_profile=case.scenario_profile,
                     event_sink=store.append,
-                ) as executor:
-                    loop = LiveDcsTutorLoop(
-                        source=source,
-                        model=model,
-                        action_executor=executor,
-                        pack_path=suite.pack_path,
-                        ui_map_path=suite.ui_map_path,
-                        telemetry_map_path=suite.telemetry_map_path,
-                        bios_to_ui_path=suite.bios_to_ui_path,
-                        knowledge_index_path=suite.knowledge_index_path,
-                        rag_top_k=5,
-                        cold_start_production=False,
-                        knowledge_source_policy_path=suite.knowledge_source_policy_path,
-                        cooldown_s=0.0,
-                        session_id=case.session_id,
-                        lang=suite.lang,
-                        scenario_profile=case.scenario_profile,
-                        event_sink=store.append,
-                        dry_run_overlay=False,
-                        vision_port=(
-                            None
-                            if case.vision is None
-                            else FrameDirectoryVisionPort(
-                                saved_games_dir=case.vision.saved_games_dir,
-                                channel=case.vision.channel,
-                                layout_id=case.vision.layout_id,
-                            )
-                        ),
-                        vision_session_id=None if case.vision is None else case.vision.session_id,
-                        vision_mode="replay",
-                        vision_sync_window_ms=None if case.vision is None else case.vision.sync_window_ms,
-                        vision_trigger_wait_ms=None if case.vision is None else case.vision.trigger_wait_ms,
-                    )
-                    loop.run(
-                        max_frames=case.max_frames,
-                        duration_s=0.0,
-                        auto_help_on_first_frame=True,
-                        auto_help_every_n_frames=0,
-                        help_trigger=None,
-                    )
-        except Exception as exc:
-            execution_error = exc
-        finally:
-            if loop is not None:
-                loop.close()
-            else:
-                source.close()
-                if model is not None and hasattr(model, "close"):
-                    model.close()
-        load_error: Exception | None = None
-        events: list[dict[str, Any]] | None = None
-        try:
-            events = JsonlEventStore.load(event_log_path)
-        except Exception as exc:
-            load_error = exc
-
-        if execution_error is not None:
-            case_results.append(
-                _error_case_result(
-                    case=case,
-                    primary_stage="execution",
-                    primary_exc=execution_error,
-                    event_log_path=event_log_path,
-                    secondary_stage="event_load" if load_error is not None else None,
-                    secondary_exc=load_error,
+                    dry_run_overlay=False,
+                    vision_port=(
+                        None
+                        if case.vision is None
+                        else FrameDirectoryVisionPort(
+                            saved_games_dir=case.vision.saved_games_dir,
+                            channel=case.vision.channel,
+                            layout_id=case.vision.layout_id,
+                        )
+                    ),
+                    vision_session_id=None if case.vision is None else case.vision.session_id,
+                    vision_mode="replay",
+                    vision_sync_window_ms=None if case.vision is None else case.vision.sync_window_ms,
+                    vision_trigger_wait_ms=None if case.vision is None else case.vision.trigger_wait_ms,
+                    fast_forward=fast_forward,
                 )
-            )
-            continue
-        if load_error is not None or events is None:
-            case_results.append(
-                _error_case_result(
-                    case=case,
-                    primary_stage="event_load",
-                    primary_exc=(load_error if load_error is not None else RuntimeError("event log unavailable")),
-                    event_log_path=event_log_path,
+                loop.run(
+                    max_frames=case.max_frames,
+                    duration_s=0.0,
+                    auto_help_on_first_frame=True,
+                    auto_help_every_n_frames=0,
+                    help_trigger=None,
                 )
-            )
-            continue
-        try:
-            case_results.append(_extract_case_outcome(events, case=case))
-        except Exception as exc:
-            case_results.append(
-                _error_case_result(
-                    case=case,
-                    primary_stage="outcome_extract",
-                    primary_exc=exc,
-                    event_log_path=event_log_path,
+    except Exception as exc:
+        execution_error = exc
+    finally:
+        if loop is not None:
+            loop.close()
+        else:
+            source.close()
+            if model is not None and hasattr(model, "close"):
+                model.close()
+    load_error: Exception | None = None
+    events: list[dict[str, Any]] | None = None
+    try:
+        events = JsonlEventStore.load(event_log_path)
+    except Exception as exc:
+        load_error = exc
+
+    if execution_error is not None:
+        return _error_case_result(
+            case=case,
+            primary_stage="execution",
+            primary_exc=execution_error,
+            event_log_path=event_log_path,
+            secondary_stage="event_load" if load_error is not None else None,
+            secondary_exc=load_error,
+        )
+    if load_error is not None or events is None:
+        return _error_case_result(
+            case=case,
+            primary_stage="event_load",
+            primary_exc=(load_error if load_error is not None else RuntimeError("event log unavailable")),
+            event_log_path=event_log_path,
+        )
+    try:
+        return _extract_case_outcome(events, case=case)
+    except Exception as exc:
+        return _error_case_result(
+            case=case,
+            primary_stage="outcome_extract",
+            primary_exc=exc,
+            event_log_path=event_log_path,
+        )
+
+
+def _preload_replay_eval_resources(suite: ReplayEvalSuite) -> None:
+    """Warm the process-level pack, gate and knowledge-index caches shared by every case."""
+    import live_dcs  # noqa: F401
+
+    from adapters.pack_gates import load_compiled_pack_gates
+    from adapters.step_inference import load_pack_steps
+    from core.knowledge import load_index_data
+
+    load_pack_steps(suite.pack_path)
+    for scenario_profile in sorted({case.scenario_profile for case in suite.cases}):
+        load_compiled_pack_gates(suite.pack_path, scenario_profile=scenario_profile)
+    load_index_data(suite.knowledge_index_path)
+
+
+# Per-process state installed by the pool initializer; cases are then submitted by index only.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_replay_eval_worker(
+    suite: ReplayEvalSuite,
+    output_dir: Path,
+    model_factory: Callable[[ReplayEvalCase], Any] | None,
+    fast_forward: bool,
+) -> None:
+    _WORKER_STATE["suite"] = suite
+    _WORKER_STATE["fast_forward"] = fast_forward
+    _WORKER_STATE["output_dir"] = output_dir
+    _WORKER_STATE["factory"] = model_factory or (lambda case: _default_model_factory(case, lang=suite.lang))
+    try:
+        _preload_replay_eval_resources(suite)
+    except Exception:
+        # Broken inputs are reported per case by the run itself, not by killing the pool.
+        pass
+
+
+def _run_replay_eval_worker_case(case_index: int) -> dict[str, Any]:
+    suite: ReplayEvalSuite = _WORKER_STATE["suite"]
+    return _run_replay_eval_case(
+        suite,
+        suite.cases[case_index],
+        output_dir=_WORKER_STATE["output_dir"],
+        factory=_WORKER_STATE["factory"],
+        fast_forward=_WORKER_STATE["fast_forward"],
+    )
+
+
+def _run_cases_in_pool(
+    suite: ReplayEvalSuite,
+    *,
+    output_dir: Path,
+    model_factory: Callable[[ReplayEvalCase], Any] | None,
+    jobs: int,
+    fast_forward: bool,
+) -> list[dict[str, Any]]:
+    case_results: list[dict[str, Any]] = []
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_replay_eval_worker,
+        initargs=(suite, output_dir, model_factory, fast_forward),
+    ) as pool:
+        futures = {pool.submit(_run_replay_eval_worker_case, index): case for index, case in enumerate(suite.cases)}
+        for future in as_completed(futures):
+            case = futures[future]
+            try:
+                case_results.append(future.result())
+            except Exception as exc:
+                # Only reachable when the worker itself died (e.g. BrokenProcessPool).
+                case_results.append(
+                    _error_case_result(
+                        case=case,
+                        primary_stage="worker",
+                        primary_exc=exc,
+                        event_log_path=output_dir / case.case_id / "events.jsonl",
+                    )
                 )
+    return case_results
+
+
+def run_replay_eval_suite(
+    suite: ReplayEvalSuite,
+    *,
+    output_dir: str | Path,
+    report_path: str | Path | None = None,
+    model_factory: Callable[[ReplayEvalCase], Any] | None = None,
+    provider_name: str = "replay_eval_oracle",
+    jobs: int = 1,
+    fast_forward: bool = False,
+) -> dict[str, Any]:
+    """
+    Run every suite case and write a report sorted by case_id.
+
+    With `jobs > 1` cases are fanned out to a process pool whose workers preload
+    the pack and knowledge index once; `model_factory` must then be picklable
+    when the platform start method is not fork. `fast_forward` skips per-frame
+    observation events; the extracted case outcomes are unchanged.
+    """
+    resolved_output_dir = Path(output_dir).expanduser().resolve()
+    resolved_output_dir.mkdir(parents=True, exist_ok=True)
+
+    worker_count = max(1, min(int(jobs), len(suite.cases)))
+    if worker_count > 1:
+        case_results = _run_cases_in_pool(
+            suite,
+            output_dir=resolved_output_dir,
+            model_factory=model_factory,
+            jobs=worker_count,
+            fast_forward=fast_forward,
+        )
+    else:
+        factory = model_factory or (lambda case: _default_model_factory(case, lang=suite.lang))
+        case_results = [
+            _run_replay_eval_case(
+                suite,
+                case,
+                output_dir=resolved_output_dir,
+                factory=factory,
+                fast_forward=fast_forward,
             )
+            for case in suite.cases
+        ]
 
     case_results.sort(key=lambda item: str(item.get("case_id")))
     report = {
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from importlib import resources
 from typing import Any, Mapping
 
@@ -39,6 +40,7 @@ def load_schema(name: str) -> Mapping[str, Any]:
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
 def get_validator(name: str) -> Draft202012Validator:
     return Draft202012Validator(load_schema(name), format_checker=FormatChecker())
 
@@ -34,6 +34,38 @@ class FakeResponse:
         return self._payload
 
 
+class FakeStreamResponse(FakeResponse):
+    """Streamed response: `lines` are served by `iter_lines()` and consumption is counted."""
+
+    def __init__(
+        self,
+        lines: list[str],
+        status_code: int = 200,
+        *,
+        content_type: str = "text/event-stream",
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(payload, status_code)
+        self._lines = list(lines)
+        self.headers = {"content-type": content_type}
+        self.lines_read = 0
+        self.closed = False
+
+    def __enter__(self) -> "FakeStreamResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.closed = True
+
+    def read(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def iter_lines(self):
+        for line in self._lines:
+            self.lines_read += 1
+            yield line
+
+
 class FakeClient:
     def __init__(self, responses: list[FakeResponse] | None = None, to_raise: Exception | None = None) -> None:
         self._responses = list(responses or [])
@@ -61,6 +93,29 @@ class FakeClient:
             raise RuntimeError("no fake response left")
         return self._responses.pop(0)
 
+    def stream(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any],  # noqa: A002
+        timeout: float,
+        headers: dict[str, str] | None = None,
+    ) -> FakeResponse:
+        self.calls.append(
+            {
+                "method": method,
+                "url": url,
+                "json": json,
+                "timeout": timeout,
+                "headers": dict(headers or {}),
+            }
+        )
+        if self._to_raise is not None:
+            raise self._to_raise
+        if not self._responses:
+            raise RuntimeError("no fake response left")
+        return self._responses.pop(0)
+
 
 def _extract_prompt_constraints_json(prompt: str) -> dict[str, Any]:
     marker = "Context and constraints JSON:\n"
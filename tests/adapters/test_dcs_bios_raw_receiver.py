@@ -65,3 +65,56 @@ def test_raw_receiver_decodes_frame(tmp_path: Path) -> None:
         delta = rx._apply_frame(frames[0])
         assert delta["_ACFT_NAME"] == "A"
         assert delta["SWITCH_1"] == 0x1234
+
+
+def _write(address: int, payload: bytes) -> bytes:
+    return address.to_bytes(2, "little") + len(payload).to_bytes(2, "little") + payload
+
+
+def test_raw_receiver_decodes_shared_word_and_partial_string_writes(tmp_path: Path) -> None:
+    ref_path = tmp_path / "controls.json"
+    data = {
+        "TEST": {
+            "LOW": {"identifier": "LOW", "outputs": [{"address": 8, "mask": 0x00FF, "shift_by": 0, "type": "integer"}]},
+            "HIGH": {"identifier": "HIGH", "outputs": [{"address": 8, "mask": 0xFF00, "shift_by": 8, "type": "integer"}]},
+            "TEXT": {"identifier": "TEXT", "outputs": [{"address": 10, "max_length": 6, "type": "string"}]},
+        }
+    }
+    ref_path.write_text(json.dumps(data), encoding="utf-8")
+
+    with DcsBiosRawReceiver(
+        host="127.0.0.1",
+        port=0,
+        control_reference_paths=[str(ref_path)],
+        include_metadata=False,
+    ) as rx:
+        delta = rx._apply_frame(_write(8, b"\x02\x07") + _write(10, b"AB\x00\x00\x00\x00"))
+        assert delta == {"LOW": 2, "HIGH": 7, "TEXT": "AB"}
+
+        # A write touching only the tail of the string still re-decodes it.
+        delta = rx._apply_frame(_write(12, b"CD"))
+        assert delta == {"TEXT": "ABCD"}
+
+        # Unchanged values are not reported.
+        assert rx._apply_frame(_write(8, b"\x02\x07")) == {}
+
+
+def test_raw_receiver_full_state_snapshots_are_copy_on_write(tmp_path: Path) -> None:
+    ref_path = tmp_path / "controls.json"
+    _build_sample_reference(ref_path)
+
+    with DcsBiosRawReceiver(
+        host="127.0.0.1",
+        port=0,
+        control_reference_paths=[str(ref_path)],
+        include_metadata=False,
+    ) as rx:
+        rx._enqueue_observation(rx._apply_frame(_write(4, b"\x01\x00")), ("127.0.0.1", 0))
+        first = rx.get_observation()
+        rx._enqueue_observation(rx._apply_frame(_write(4, b"\x02\x00")), ("127.0.0.1", 0))
+        second = rx.get_observation()
+
+    assert first is not None and second is not None
+    assert first.payload["bios"] == {"SWITCH_1": 1}
+    assert second.payload["bios"] == {"SWITCH_1": 2}
+    assert second.payload["delta"] == {"SWITCH_1": 2}
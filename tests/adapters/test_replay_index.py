@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from uuid import uuid4
+
+from adapters.event_store.replay_index import (
+    build_replay_index,
+    default_replay_index_path,
+    load_or_build_replay_index,
+    load_replay_index,
+    write_replay_index,
+)
+
+
+def _tmp_dir() -> Path:
+    base = Path("tests/.tmp_telemetry")
+    base.mkdir(parents=True, exist_ok=True)
+    path = base / uuid4().hex
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _delta_frame(seq: int) -> dict:
+    # Delta-only frames: each carries just the key that changed.
+    return {"schema_version": "v2", "seq": seq, "t_wall": 100.0 + seq, "bios": {f"K{seq % 3}": seq}}
+
+
+def _write_log(path: Path, count: int) -> None:
+    lines = [json.dumps(_delta_frame(seq)) for seq in range(count)]
+    lines.insert(3, "not json")
+    lines.insert(5, json.dumps({"kind": "tutor_request", "payload": {}}))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_build_replay_index_records_keyframes_with_merged_state() -> None:
+    path = _tmp_dir() / "bios.jsonl"
+    _write_log(path, 10)
+
+    index = build_replay_index(path, every_n_frames=4)
+
+    assert index.frame_count == 10
+    assert index.t0 == 100.0
+    assert [keyframe.frame for keyframe in index.keyframes] == [0, 4, 8]
+    assert index.keyframes[0].bios == {}
+    # State before frame 8 is the latest value of each key in frames 0..7.
+    assert index.keyframes[2].bios == {"K0": 6, "K1": 7, "K2": 5}
+    with path.open("rb") as fh:
+        fh.seek(index.keyframes[1].offset)
+        assert json.loads(fh.readline())["seq"] == 4
+    assert index.keyframe_for_seq(7).frame == 4
+    assert index.keyframe_for_t_wall(100.0 + 8.5).frame == 8
+    assert index.keyframe_for_t_wall(50.0).frame == 0
+
+
+def test_replay_index_round_trips_and_rebuilds_when_log_changes() -> None:
+    path = _tmp_dir() / "bios.jsonl"
+    _write_log(path, 6)
+    index_path = default_replay_index_path(path)
+    assert index_path.name == "bios.jsonl.idx.gz"
+
+    index = load_or_build_replay_index(path, every_n_frames=2)
+    assert index_path.exists()
+    assert load_replay_index(index_path) == index
+
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(_delta_frame(6)) + "\n")
+    os.utime(path, ns=(index.source_mtime_ns + 1_000_000, index.source_mtime_ns + 1_000_000))
+    assert not index.is_current_for(path)
+    rebuilt = load_or_build_replay_index(path, every_n_frames=2)
+    assert rebuilt.frame_count == 7
+    assert load_replay_index(index_path) == rebuilt
+
+
+def test_load_replay_index_rejects_foreign_schema() -> None:
+    tmp_path = _tmp_dir()
+    path = tmp_path / "bios.jsonl"
+    _write_log(path, 3)
+    index = build_replay_index(path)
+    index_path = write_replay_index(index, tmp_path / "custom.idx.gz")
+    assert load_replay_index(index_path) == index
+
+    (tmp_path / "bad.idx.gz").write_bytes(b"not gzip")
+    assert load_replay_index(tmp_path / "bad.idx.gz") is None
@@ -3,6 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 from uuid import uuid4
 
+from adapters.event_store.columnar_telemetry import (
+    ColumnarTelemetryReader,
+    ColumnarTelemetryWriter,
+    convert_jsonl_to_columnar,
+)
 from adapters.event_store.telemetry_writer import TelemetryWriter
 from core.types_v2 import TelemetryFrame
 
@@ -41,3 +46,55 @@ def test_writer_round_trip_gzip() -> None:
     frames = TelemetryWriter.load(path)
     assert len(frames) == 1
     assert frames[0]["vars"]["k"] == 1
+
+
+def _bios_frame(seq: int, **bios: int) -> dict:
+    return {"schema_version": "v2", "seq": seq, "t_wall": 100.0 + seq * 0.5, "bios": bios, "delta": dict(bios)}
+
+
+def test_columnar_round_trip_and_seek_across_chunks() -> None:
+    tmp_path = _tmp_dir()
+    path = tmp_path / "telemetry.tcol"
+    frames = [_bios_frame(seq, APU=seq // 4, BATT=1, FLAP=seq % 3) for seq in range(1, 30)]
+    frames[5]["bios"].pop("BATT")
+    frames[6]["aircraft"] = "FA-18C"
+    frames[7]["bios"]["APU"] = 1.0
+    frames.append(TelemetryFrame(seq=30, t_wall=115.0, vars={"k": 30}).to_dict())
+    with ColumnarTelemetryWriter(path, chunk_frames=4) as writer:
+        writer.extend(frames)
+
+    reader = ColumnarTelemetryReader(path)
+    assert len(reader) == len(frames)
+    assert len(reader.chunks) == 8
+    assert reader.time_range == (100.5, 115.0)
+    assert TelemetryWriter.load(path) == frames
+    assert isinstance(TelemetryWriter.load(path)[7]["bios"]["APU"], float)
+    assert list(reader.iter_frames(start_t_wall=106.0)) == frames[11:]
+
+
+def test_columnar_reader_ignores_truncated_tail_chunk() -> None:
+    tmp_path = _tmp_dir()
+    path = tmp_path / "telemetry.tcol"
+    frames = [_bios_frame(seq, APU=seq) for seq in range(1, 10)]
+    with ColumnarTelemetryWriter(path, chunk_frames=4, compression="zlib") as writer:
+        writer.extend(frames)
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+
+    assert TelemetryWriter.load(path) == frames[:8]
+
+
+def test_convert_jsonl_event_log_to_columnar() -> None:
+    tmp_path = _tmp_dir()
+    source = tmp_path / "events.jsonl"
+    frames = [_bios_frame(seq, APU=seq % 2) for seq in range(1, 6)]
+    with TelemetryWriter(source) as writer:
+        for frame in frames:
+            writer.append({"kind": "observation", "payload": {"source": "dcs_bios", "payload": frame}})
+        writer.append({"kind": "tutor_request", "payload": {}})
+
+    summary = convert_jsonl_to_columnar(source, tmp_path / "events.tcol")
+
+    assert summary["frames"] == 5
+    assert summary["skipped"] == 1
+    assert TelemetryWriter.load(tmp_path / "events.tcol") == frames
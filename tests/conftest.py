@@ -3,8 +3,27 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure repo root is on sys.path for direct imports like "adapters.*".
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from adapters.image_payload_cache import reset_shared_image_payload_cache  # noqa: E402
+from adapters.openai_compat_capabilities import reset_shared_endpoint_capability_caches  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolate_endpoint_capability_cache():
+    # Capability rejections are process-wide; keep one test's fake 400s from shaping the next.
+    reset_shared_endpoint_capability_caches()
+    yield
+    reset_shared_endpoint_capability_caches()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_image_payload_cache():
+    reset_shared_image_payload_cache()
+    yield
+    reset_shared_image_payload_cache()
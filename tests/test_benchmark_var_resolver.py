@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from core.vars import IncrementalVarResolver, VarResolver
+from tools.benchmark_var_resolver import (
+    DEFAULT_LOG,
+    DEFAULT_TELEMETRY_MAP,
+    benchmark_resolver,
+    load_frames,
+)
+
+
+def test_benchmark_resolver_reports_frames_per_second() -> None:
+    resolver = VarResolver.from_yaml(DEFAULT_TELEMETRY_MAP)
+    frames = list(load_frames(DEFAULT_LOG))[:5]
+
+    summary = benchmark_resolver(resolver, frames, repeat=2)
+
+    assert summary["frames"] == 10
+    assert summary["rules"] == len(resolver.rules)
+    assert summary["frames_per_s"] > 0
+
+
+def test_benchmark_resolver_supports_incremental_resolver() -> None:
+    resolver = IncrementalVarResolver(VarResolver.from_yaml(DEFAULT_TELEMETRY_MAP))
+    frames = list(load_frames(DEFAULT_LOG))[:5]
+
+    summary = benchmark_resolver(resolver, frames, repeat=2)
+
+    assert summary["frames"] == 10
+    assert resolver.full_resolves == 2
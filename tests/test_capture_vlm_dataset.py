@@ -258,6 +258,81 @@ def test_dataset_capture_index_and_output_dirs_match_expected_layout(tmp_path: P
     assert Path(frame["artifact_image_path"]).parent == writer.artifact_dir
 
 
+def test_dataset_capture_renders_artifacts_in_pool_and_appends_manifest_in_capture_order(tmp_path: Path) -> None:
+    ticks = iter(1772872445.010 + index * 0.5 for index in range(10))
+    writer = DatasetFrameWriter(
+        output_root=tmp_path / "captures",
+        session_id="sess-live",
+        channel="composite_panel",
+        layout_id="fa18c_composite_panel_v2",
+        capture_callable=_capture_image,
+        clock=lambda: next(ticks),
+        render_workers=1,
+        render_queue_max=2,
+        artifact_compress_level=1,
+    )
+    try:
+        frames = [writer.capture_frame(reason="interval") for _ in range(4)]
+        assert writer.pending_renders <= 2
+    finally:
+        writer.close()
+
+    assert writer.pending_renders == 0
+    manifest = [json.loads(line) for line in writer.manifest_path.read_text(encoding="utf-8").splitlines()]
+    index = [json.loads(line) for line in writer.capture_index_path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["frame_seq"] for entry in manifest] == [0, 1, 2, 3]
+    assert [entry["frame_id"] for entry in index] == [frame["frame_id"] for frame in frames]
+    assert all(Path(entry["artifact_image_path"]).exists() for entry in index)
+
+
+def test_dataset_capture_renders_inline_when_a_pool_render_fails(tmp_path: Path) -> None:
+    from concurrent.futures import Future
+
+    class _FailingExecutor:
+        def submit(self, *_args, **_kwargs) -> Future:
+            future: Future = Future()
+            future.set_exception(RuntimeError("worker died"))
+            return future
+
+        def shutdown(self, wait: bool = True) -> None:
+            return None
+
+    ticks = iter(1772872445.010 + index * 0.5 for index in range(10))
+    writer = DatasetFrameWriter(
+        output_root=tmp_path / "captures",
+        session_id="sess-live",
+        channel="composite_panel",
+        layout_id="fa18c_composite_panel_v2",
+        capture_callable=_capture_image,
+        clock=lambda: next(ticks),
+        render_workers=1,
+        render_queue_max=4,
+    )
+    writer._render_executor = _FailingExecutor()  # type: ignore[assignment]
+    try:
+        frames = [writer.capture_frame(reason="interval") for _ in range(2)]
+    finally:
+        writer.close()
+
+    index = [json.loads(line) for line in writer.capture_index_path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["frame_id"] for entry in index] == [frame["frame_id"] for frame in frames]
+    assert all(Path(entry["artifact_image_path"]).exists() for entry in index)
+    assert all("artifact_render_error" not in entry for entry in index)
+
+
+def test_dataset_capture_render_workers_ignore_sigint() -> None:
+    import signal
+
+    from tools.capture_vlm_dataset import _ignore_sigint
+
+    previous = signal.getsignal(signal.SIGINT)
+    try:
+        _ignore_sigint()
+        assert signal.getsignal(signal.SIGINT) is signal.SIG_IGN
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
 def test_dataset_capture_cli_defaults_and_runtime_config(tmp_path: Path) -> None:
     config_path = _write_lua_config(tmp_path)
     parser = build_arg_parser()
@@ -279,6 +354,8 @@ def test_dataset_capture_cli_defaults_and_runtime_config(tmp_path: Path) -> None
     assert config.screen_width == 1600
     assert config.screen_height == 900
     assert config.render_vlm_artifacts is True
+    assert config.render_workers == 0
+    assert config.artifact_compress_level is None
     assert resolved_config_path == config_path
 
 
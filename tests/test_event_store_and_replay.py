@@ -1,8 +1,10 @@
+import threading
 from pathlib import Path
 from time import sleep
 from uuid import uuid4
 
-from core.event_store import JsonlEventStore
+from core.event_store import BufferedJsonlEventStore, JsonlEventStore
+from core.types import Event
 from simtutor.runner import replay_log, run_simulation
 
 
@@ -96,3 +98,112 @@ def test_replay_log_malformed_file():
         assert "failed to load log" in msg
     finally:
         cleanup_path(log_path)
+
+
+def test_buffered_event_store_round_trips_with_load():
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    path = TEMP_DIR / f"buffered_{uuid4().hex}.jsonl"
+    events = [Event(kind="observation", payload={"idx": idx}) for idx in range(50)]
+    try:
+        with BufferedJsonlEventStore(path, mode="w", flush_max_events=8, fsync_on_close=True) as store:
+            for ev in events:
+                store.append(ev)
+            store.append({"kind": "custom", "payload": {"raw": True}})
+            assert store.flush(timeout=5.0)
+            assert len(JsonlEventStore.load(path)) == 51
+        loaded = JsonlEventStore.load(path)
+        assert [row["payload"] for row in loaded[:-1]] == [{"idx": idx} for idx in range(50)]
+        assert loaded[-1] == {"kind": "custom", "payload": {"raw": True}}
+        assert store.stats.appended == 51
+        assert store.stats.written == 51
+        assert store.stats.dropped == 0
+        assert store.stats.flushes >= 1
+    finally:
+        cleanup_path(path)
+
+
+def test_buffered_event_store_builds_deferred_events_on_writer_thread():
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    path = TEMP_DIR / f"buffered_deferred_{uuid4().hex}.jsonl"
+    built_on: list[str] = []
+
+    def build() -> Event:
+        built_on.append(threading.current_thread().name)
+        return Event(kind="observation", payload={"deferred": True})
+
+    try:
+        with BufferedJsonlEventStore(path, mode="w") as store:
+            store.append(Event(kind="custom", payload={"idx": 0}))
+            store.append_deferred(build)
+            store.append(Event(kind="custom", payload={"idx": 1}))
+        loaded = JsonlEventStore.load(path)
+        assert [row["payload"] for row in loaded] == [{"idx": 0}, {"deferred": True}, {"idx": 1}]
+        assert built_on == ["jsonl-event-writer"]
+        assert store.stats.written == 3
+    finally:
+        cleanup_path(path)
+
+
+def test_buffered_event_store_survives_failing_deferred_builder():
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    path = TEMP_DIR / f"buffered_builder_error_{uuid4().hex}.jsonl"
+
+    def broken() -> Event:
+        raise RuntimeError("builder failed")
+
+    try:
+        with BufferedJsonlEventStore(path, mode="w", queue_max=2) as store:
+            store.append_deferred(broken)
+            for idx in range(20):
+                store.append(Event(kind="custom", payload={"idx": idx}))
+            assert store.flush(timeout=5.0)
+        loaded = JsonlEventStore.load(path)
+        assert [row["payload"]["idx"] for row in loaded] == list(range(20))
+        assert store.stats.write_errors == 1
+    finally:
+        cleanup_path(path)
+
+
+def test_buffered_event_store_writes_synchronously_once_writer_stops():
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    path = TEMP_DIR / f"buffered_dead_writer_{uuid4().hex}.jsonl"
+
+    class DeadWriterStore(BufferedJsonlEventStore):
+        def _run_writer(self) -> None:
+            return
+
+    try:
+        store = DeadWriterStore(path, mode="w", queue_max=2)
+        store._writer.join(timeout=5.0)
+        for idx in range(5):
+            store.append(Event(kind="custom", payload={"idx": idx}))
+        assert store.flush(timeout=5.0)
+        assert [row["payload"]["idx"] for row in JsonlEventStore.load(path)] == list(range(5))
+        store.close()
+        assert store.stats.written == 5
+    finally:
+        cleanup_path(path)
+
+
+def test_buffered_event_store_drop_policy_counts_overflow():
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    path = TEMP_DIR / f"buffered_drop_{uuid4().hex}.jsonl"
+    gate = threading.Event()
+
+    class SlowEvent(Event):
+        def to_dict(self):
+            gate.wait(5.0)
+            return super().to_dict()
+
+    try:
+        store = BufferedJsonlEventStore(path, mode="w", queue_max=2, overflow="drop")
+        store.append(SlowEvent(kind="observation"))
+        for _ in range(20):
+            store.append({"kind": "observation"})
+        gate.set()
+        store.close()
+        assert store.stats.dropped > 0
+        assert store.stats.written + store.stats.dropped == store.stats.appended == 21
+        assert len(JsonlEventStore.load(path)) == store.stats.written
+    finally:
+        cleanup_path(path)
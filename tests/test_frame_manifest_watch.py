@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import threading
+import time
+
+from adapters.frame_manifest_watch import DirectoryChangeWaiter, ManifestTailer
+
+
+def _read_all(tailer: ManifestTailer) -> list[bytes]:
+    lines = []
+    for line_start, line in tailer.iter_lines():
+        tailer.offset = line_start + len(line)
+        lines.append(line)
+    return lines
+
+
+def test_manifest_tailer_reads_only_appended_bytes(tmp_path: Path) -> None:
+    manifest = tmp_path / "frames.jsonl"
+    tailer = ManifestTailer(manifest)
+    assert tailer.changed() is False
+
+    manifest.write_bytes(b'{"a": 1}\n')
+    assert tailer.changed() is True
+    assert _read_all(tailer) == [b'{"a": 1}\n']
+    assert tailer.changed() is False
+
+    with manifest.open("ab") as handle:
+        handle.write(b'{"a": 2}\n')
+    assert tailer.changed() is True
+    assert _read_all(tailer) == [b'{"a": 2}\n']
+    tailer.close()
+
+
+def test_manifest_tailer_restarts_after_replace_or_truncate(tmp_path: Path) -> None:
+    manifest = tmp_path / "frames.jsonl"
+    manifest.write_bytes(b'{"a": 1}\n{"a": 2}\n')
+    tailer = ManifestTailer(manifest)
+    assert tailer.changed() is True
+    assert len(_read_all(tailer)) == 2
+
+    replacement = tmp_path / "frames.jsonl.new"
+    replacement.write_bytes(b'{"b": 1}\n{"b": 2}\n{"b": 3}\n')
+    os.replace(replacement, manifest)
+    assert tailer.changed() is True
+    assert _read_all(tailer) == [b'{"b": 1}\n', b'{"b": 2}\n', b'{"b": 3}\n']
+
+    manifest.write_bytes(b'{"c": 1}\n')
+    assert tailer.changed() is True
+    assert _read_all(tailer) == [b'{"c": 1}\n']
+    tailer.close()
+
+
+def test_directory_change_waiter_wakes_on_write(tmp_path: Path) -> None:
+    waiter = DirectoryChangeWaiter(tmp_path)
+    writer = threading.Timer(0.05, (tmp_path / "frames.jsonl").write_bytes, args=(b"{}\n",))
+    try:
+        writer.start()
+        started = time.monotonic()
+        changed = False
+        while not changed and time.monotonic() - started < 5.0:
+            changed = waiter.wait(5.0)
+    finally:
+        writer.join()
+        waiter.close()
+
+    assert changed is True
+    assert time.monotonic() - started < 5.0
+
+
+def test_polling_waiter_returns_early_when_closed(tmp_path: Path) -> None:
+    waiter = DirectoryChangeWaiter(tmp_path, poll_interval_s=10.0, use_inotify=False)
+    assert waiter.mode == "polling"
+    closer = threading.Timer(0.05, waiter.close)
+    started = time.monotonic()
+    closer.start()
+    assert waiter.wait(10.0) is False
+    closer.join()
+    assert time.monotonic() - started < 5.0
+
+
+def test_directory_change_waiter_sees_write_made_before_first_wait(tmp_path: Path) -> None:
+    waiter = DirectoryChangeWaiter(tmp_path)
+    try:
+        (tmp_path / "frames.jsonl").write_bytes(b"{}\n")
+        started = time.monotonic()
+        assert waiter.wait(5.0) is True
+        assert time.monotonic() - started < 1.0
+    finally:
+        waiter.close()
+
+
+def test_inotify_waiter_returns_early_when_closed(tmp_path: Path) -> None:
+    waiter = DirectoryChangeWaiter(tmp_path)
+    results: list[bool] = []
+    thread = threading.Thread(target=lambda: results.append(waiter.wait(10.0)))
+    started = time.monotonic()
+    thread.start()
+    time.sleep(0.05)
+    waiter.close()
+    thread.join(timeout=5.0)
+
+    assert not thread.is_alive()
+    assert results == [False]
+    assert time.monotonic() - started < 5.0
+    assert waiter.mode == "polling"
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta, timezone
 
-from core.gating import GatingEngine
+from core.gating import GatingEngine, ObservationHistory, compile_rules
 
 
 def iso(dt):
@@ -344,3 +344,78 @@ def test_flag_true_distinguishes_false_vs_source_missing_unknown() -> None:
     assert res_unknown.allowed is False
     assert "unknown(source_missing)" in (res_unknown.reason or "")
 
+
+
+def test_compiled_rules_match_interpreter_reasons():
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    history = [
+        make_obs(t0, payload={}, tags=["apu_ready"]),
+        make_obs(
+            t0 + timedelta(seconds=3),
+            payload={
+                "rpm": 0.15,
+                "temp": 650,
+                "mode": "unknown",
+                "flag": "maybe",
+                "vars": {"battery_on": 0, "throttle": "x", "vars_source_missing": ["gear_down"]},
+            },
+        ),
+    ]
+    rule_sets = [
+        [{"op": "var_gte", "var": "payload.rpm", "value": 0.2}],
+        [{"op": "var_gte", "var": "payload.rpm", "value": "high"}],
+        [{"op": "var_gte", "var": "throttle", "value": 0.7}],
+        [{"op": "var_gte", "var": "payload.missing", "value": 1}],
+        [{"op": "var_gte", "var": "payload.mode", "value": 1}],
+        [{"op": "var_gte", "var": "vars.gear_down", "value": 1}],
+        [{"op": "var_gte", "var": "payload.rpm"}],
+        [{"op": "arg_in_range", "var": "payload.temp", "min": 190, "max": 590}],
+        [{"op": "flag_true", "var": "battery_on"}],
+        [{"op": "flag_true", "var": "payload.flag"}],
+        [{"op": "time_since", "tag": "apu_ready", "at_least": 5}],
+        [{"op": "time_since", "tag": "apu_ready", "at_least": "soon"}],
+        [{"op": "time_since", "tag": "never", "at_least": 1}],
+        [{"op": "mystery_op"}],
+        [{"op": "var_gte", "var": "payload.rpm", "value": 0.1}, {"op": "flag_true", "var": "battery_on"}],
+    ]
+    for rules in rule_sets:
+        expected = GatingEngine(rules).evaluate_with_failure_index_from_history(history)
+        compiled = compile_rules(rules).evaluate_with_failure_index_from_history(history)
+        assert compiled == expected, rules
+
+
+def test_observation_history_indexes_tags_for_time_since():
+    t0 = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    observations = [
+        make_obs(t0, tags=["apu_ready"]),
+        make_obs(t0 + timedelta(seconds=2), tags=[]),
+        make_obs(t0 + timedelta(seconds=4), tags=["apu_ready"]),
+        make_obs(t0 + timedelta(seconds=10), tags=["apu_ready"]),
+    ]
+    history = ObservationHistory(observations)
+    rules = [{"op": "time_since", "tag": "apu_ready", "at_least": 5}]
+
+    for engine in (GatingEngine(rules), compile_rules(rules)):
+        # Latest tag is ignored; the t0+4s tag is the newest earlier sighting.
+        assert engine.evaluate_with_failure_index_from_history(history) == (
+            engine.evaluate_with_failure_index_from_history(observations)
+        )
+        result, _ = engine.evaluate_with_failure_index_from_history(history)
+        assert result.allowed
+    assert history.last_seen("apu_ready") == t0 + timedelta(seconds=4)
+    assert history.last_seen("never") is None
+
+
+def test_observation_history_forgets_tags_evicted_from_window():
+    t0 = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    history = ObservationHistory(max_items=2)
+    history.append(make_obs(t0, tags=["apu_ready"]))
+    history.append(make_obs(t0 + timedelta(seconds=6)))
+    engine = GatingEngine([{"op": "time_since", "tag": "apu_ready", "at_least": 5}])
+    assert engine.evaluate(history).allowed
+
+    history.append(make_obs(t0 + timedelta(seconds=7)))
+    assert len(history) == 2
+    result = engine.evaluate(history)
+    assert not result.allowed
+    assert result.reason == "tag apu_ready never seen"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from adapters.help_response_cache import HELP_CACHE_SCHEMA_VERSION, HelpResponseCache
+from core.types import TutorResponse
+
+
+def _response(message: str) -> TutorResponse:
+    return TutorResponse(message=message, metadata={"provider": "mock"})
+
+
+def test_help_response_cache_evicts_least_recently_used_entry() -> None:
+    cache = HelpResponseCache(max_entries=2, ttl_s=60.0)
+    cache.put("a", _response("A"), now_wall=0.0)
+    cache.put("b", _response("B"), now_wall=1.0)
+    assert cache.get("a", now_wall=2.0) is not None
+    cache.put("c", _response("C"), now_wall=3.0)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 1
+
+
+def test_help_response_cache_expires_entries_after_ttl() -> None:
+    cache = HelpResponseCache(max_entries=4, ttl_s=5.0)
+    cache.put("a", _response("A"), now_wall=10.0)
+
+    assert cache.get("a", now_wall=15.0) is not None
+    assert cache.get("a", now_wall=15.5) is None
+    assert "a" not in cache
+    assert cache.stats.expirations == 1
+    assert cache.stats.misses == 1
+
+
+def test_help_response_cache_zero_entries_disables_storage() -> None:
+    cache = HelpResponseCache(max_entries=0, ttl_s=60.0)
+    cache.put("a", _response("A"), now_wall=0.0)
+
+    assert len(cache) == 0
+    assert cache.get("a", now_wall=0.0) is None
+
+
+def test_help_response_cache_round_trips_through_disk(tmp_path: Path) -> None:
+    cache_path = tmp_path / "nested" / "help_cache.json"
+    cache = HelpResponseCache(max_entries=4, ttl_s=60.0, path=cache_path)
+    cache.put("a", _response("A"), now_wall=100.0)
+    cache.put("b", _response("B"), now_wall=101.0)
+    cache.discard("a")
+    assert not cache_path.exists()
+    cache.flush()
+
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert payload["schema_version"] == HELP_CACHE_SCHEMA_VERSION
+    assert [row["key"] for row in payload["entries"]] == ["b"]
+    assert not list(cache_path.parent.glob(".help_response_cache_*.tmp"))
+
+    reloaded = HelpResponseCache(max_entries=4, ttl_s=60.0, path=cache_path)
+    entry = reloaded.get("b", now_wall=120.0)
+    assert entry is not None
+    assert entry.response.message == "B"
+    assert entry.response.metadata == {"provider": "mock"}
+
+
+def test_help_response_cache_ignores_unreadable_or_foreign_files(tmp_path: Path) -> None:
+    cache_path = tmp_path / "help_cache.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+    assert len(HelpResponseCache(ttl_s=60.0, path=cache_path)) == 0
+
+    cache_path.write_text(json.dumps({"schema_version": "other", "entries": []}), encoding="utf-8")
+    assert len(HelpResponseCache(ttl_s=60.0, path=cache_path)) == 0
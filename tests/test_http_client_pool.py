@@ -0,0 +1,87 @@
+import http.server
+import importlib.util
+import threading
+
+import pytest
+
+from adapters.http_client_pool import (
+    HttpClientConfig,
+    build_request_timeout,
+    close_shared_http_clients,
+    endpoint_origin,
+    http_client_pool_stats,
+    shared_http_client,
+)
+from adapters.openai_compat_model import OpenAICompatModel
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def keepalive_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    close_shared_http_clients()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        close_shared_http_clients()
+        server.shutdown()
+        server.server_close()
+
+
+def test_shared_client_is_reused_per_origin_and_config() -> None:
+    first = shared_http_client("http://Example.test:8000/v1/")
+    try:
+        assert shared_http_client("http://example.test:8000") is first
+        assert shared_http_client("http://example.test:8000", config=HttpClientConfig(max_connections=2)) is not first
+        assert endpoint_origin("HTTP://Example.test:8000/v1") == "http://example.test:8000"
+    finally:
+        close_shared_http_clients()
+
+
+def test_fresh_models_reuse_pooled_connections(keepalive_server: str) -> None:
+    for _ in range(3):
+        model = OpenAICompatModel(base_url=keepalive_server, timeout_s=5.0)
+        response = model._client.post(
+            f"{model.base_url}/v1/chat/completions",
+            json={"model": "m"},
+            timeout=model._request_timeout,
+        )
+        assert response.status_code == 200
+        model.close()
+
+    stats = http_client_pool_stats()
+    assert stats.clients == 1
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.connections_reused == 2
+
+
+def test_request_timeout_splits_connect_phase() -> None:
+    timeout = build_request_timeout(20.0, HttpClientConfig(connect_timeout_s=2.5))
+    assert timeout.connect == 2.5
+    assert timeout.read == 20.0
+    assert build_request_timeout(1.0, HttpClientConfig(connect_timeout_s=2.5)).connect == 1.0
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 installed")
+def test_http2_without_h2_raises_clear_error() -> None:
+    with pytest.raises(RuntimeError, match="h2"):
+        shared_http_client("http://127.0.0.1:9", config=HttpClientConfig(http2=True))
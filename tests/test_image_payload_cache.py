@@ -0,0 +1,119 @@
+import base64
+import io
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from adapters.image_payload_cache import ImageEncodeOptions, ImagePayloadCache
+from adapters.openai_compat_multimodal import build_multimodal_image_contents, summarize_image_payloads
+
+
+def _write_png(path: Path, *, size: tuple[int, int] = (64, 48), color: tuple[int, int, int] = (40, 120, 200)) -> Path:
+    image = Image.new("RGB", size, color)
+    # Noise keeps the PNG large enough for byte-budget tests to bite.
+    for x in range(0, size[0], 3):
+        for y in range(0, size[1], 2):
+            image.putpixel((x, y), ((x * 7) % 256, (y * 13) % 256, (x * y) % 256))
+    image.save(path, format="PNG")
+    return path
+
+
+def _decode_data_url(data_url: str) -> tuple[str, bytes]:
+    header, encoded = data_url.split(",", 1)
+    return header[len("data:") : -len(";base64")], base64.b64decode(encoded)
+
+
+def test_cache_reuses_encoding_and_rekeys_on_file_change(tmp_path: Path) -> None:
+    path = tmp_path / "frame.png"
+    path.write_bytes(b"first")
+    cache = ImagePayloadCache()
+
+    first, first_hit = cache.get_or_encode(path, mime_type="image/png")
+    second, second_hit = cache.get_or_encode(path, mime_type="image/png")
+
+    assert (first_hit, second_hit) == (False, True)
+    assert second is first
+    assert _decode_data_url(first.data_url) == ("image/png", b"first")
+
+    path.write_bytes(b"second!")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third, third_hit = cache.get_or_encode(path, mime_type="image/png")
+
+    assert third_hit is False
+    assert _decode_data_url(third.data_url) == ("image/png", b"second!")
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = ImagePayloadCache(max_entries=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.png"
+        path.write_bytes(name.encode("ascii"))
+        paths.append(path)
+
+    cache.get_or_encode(paths[0], mime_type="image/png")
+    cache.get_or_encode(paths[1], mime_type="image/png")
+    cache.get_or_encode(paths[0], mime_type="image/png")
+    cache.get_or_encode(paths[2], mime_type="image/png")
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.get_or_encode(paths[0], mime_type="image/png")[1] is True
+    assert cache.get_or_encode(paths[1], mime_type="image/png")[1] is False
+
+
+def test_transcode_downscales_to_pixel_budget_and_fits_byte_budget(tmp_path: Path) -> None:
+    path = _write_png(tmp_path / "frame.png", size=(320, 240))
+    options = ImageEncodeOptions(format="jpeg", max_pixels=160 * 120, max_bytes=4000, quality=95)
+
+    encoded, _ = ImagePayloadCache().get_or_encode(path, mime_type="image/png", options=options)
+
+    mime_type, data = _decode_data_url(encoded.data_url)
+    assert mime_type == "image/jpeg"
+    assert encoded.transcoded is True
+    assert encoded.output_bytes == len(data) <= 4000
+    assert encoded.source_bytes == path.stat().st_size
+    with Image.open(io.BytesIO(data)) as image:
+        assert image.format == "JPEG"
+        assert image.width * image.height <= 160 * 120
+
+
+def test_encode_options_reject_invalid_values() -> None:
+    with pytest.raises(ValueError, match="unsupported image format"):
+        ImageEncodeOptions(format="gif")
+    with pytest.raises(ValueError, match="quality"):
+        ImageEncodeOptions(format="jpeg", quality=0)
+    assert ImageEncodeOptions().transcodes is False
+
+
+def test_build_multimodal_image_contents_records_cache_hits_and_output_sizes(tmp_path: Path) -> None:
+    path = _write_png(tmp_path / "trigger.png")
+    frames = [{"frame_id": "f1", "image_uri": str(path), "mime_type": "image/png"}]
+    cache = ImagePayloadCache()
+    options = ImageEncodeOptions(format="webp", quality=70)
+
+    first = build_multimodal_image_contents(
+        frames,
+        allowed_local_image_roots=[tmp_path.resolve()],
+        max_local_image_bytes=1024 * 1024,
+        encode_options=options,
+        image_cache=cache,
+    )
+    second = build_multimodal_image_contents(
+        frames,
+        allowed_local_image_roots=[tmp_path.resolve()],
+        max_local_image_bytes=1024 * 1024,
+        encode_options=options,
+        image_cache=cache,
+    )
+
+    assert first["image_contents"] == second["image_contents"]
+    assert first["image_contents"][0]["image_url"]["url"].startswith("data:image/webp;base64,")
+    summary = summarize_image_payloads(second["image_payloads"])
+    assert summary["multimodal_image_cache_hits"] == 1
+    assert summary["multimodal_image_output_bytes"] == second["image_payloads"][0]["output_bytes"] > 0
+    assert summarize_image_payloads(first["image_payloads"])["multimodal_image_cache_hits"] == 0
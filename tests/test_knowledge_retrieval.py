@@ -360,6 +360,31 @@ def test_retriever_pool_is_bounded(tmp_path: Path) -> None:
     assert len(LocalKnowledgeAdapter._retriever_pool) <= RETRIEVER_POOL_MAX_SIZE
 
 
+
+def test_retriever_pool_closes_evicted_retrievers(tmp_path: Path) -> None:
+    adapters = []
+    for idx in range(RETRIEVER_POOL_MAX_SIZE + 1):
+        doc = tmp_path / f"doc_evict_{idx}.md"
+        index_path = tmp_path / f"index_evict_{idx}.json"
+        doc.write_text(f"# H{idx}\nBattery on {idx}\n", encoding="utf-8")
+        build_index([str(doc)], str(index_path))
+        adapters.append(LocalKnowledgeAdapter(index_path))
+        if idx == 0:
+            first = adapters[0].retriever
+            assert first is not None
+            closed: list[bool] = []
+            first.close = lambda: closed.append(True)  # type: ignore[method-assign]
+
+    assert closed == [True]
+    assert first not in LocalKnowledgeAdapter._retriever_pool.values()
+
+    # The adapter that still held the evicted retriever re-acquires a pooled one.
+    snippets, meta = adapters[0].retrieve_with_meta("battery", top_k=1)
+    assert [item["doc_id"] for item in snippets] == ["doc_evict_0"]
+    assert meta["grounding_missing"] is False
+    assert adapters[0].retriever is not first
+    assert adapters[0].retriever is LocalKnowledgeAdapter._retriever_pool[str((tmp_path / "index_evict_0.json").resolve())]
+
 def test_step_cache_is_bounded(tmp_path: Path) -> None:
     doc = tmp_path / "doc_step_cache.md"
     index_path = tmp_path / "index_step_cache.json"
@@ -391,3 +416,112 @@ def test_build_grounding_query_ignores_blank_inferred_step() -> None:
         recent_ui_targets=["apu_switch"],
     )
     assert query == "F/A-18C Cold Start | vars.apu_ready==true | apu_switch"
+
+
+def test_bm25_inverted_index_matches_brute_force_scores_and_order(tmp_path: Path) -> None:
+    import math
+    from collections import Counter
+
+    from core.knowledge import BM25Retriever, _tokenize
+
+    doc = tmp_path / "doc_bm25.md"
+    doc.write_text(
+        "# Battery\nBattery switch ON.\n"
+        "# APU\nAPU switch ON after battery.\n"
+        "# Crank\nEngine crank right. Battery battery.\n"
+        "# Duplicate\nBattery switch ON.\n"
+        "# Other\nCanopy close.\n",
+        encoding="utf-8",
+    )
+    index_path = tmp_path / "index_bm25.json"
+    build_index([str(doc)], str(index_path))
+    retriever = BM25Retriever(index_path)
+
+    query = "battery battery switch apu"
+    terms = [Counter(_tokenize(chunk["content"])) for chunk in retriever.chunks]
+    n_docs = len(terms)
+    avgdl = sum(sum(t.values()) for t in terms) / n_docs
+    expected = []
+    for chunk, doc_terms in zip(retriever.chunks, terms):
+        dl = sum(doc_terms.values()) or 1
+        score = 0.0
+        for q in _tokenize(query):
+            if q not in doc_terms:
+                continue
+            df = sum(1 for t in terms if q in t)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            tf = doc_terms[q]
+            score += idf * ((tf * 2.5) / (tf + 1.5 * (1 - 0.75 + 0.75 * dl / avgdl)))
+        if score > 0:
+            expected.append((chunk, score))
+    expected.sort(key=lambda item: (-item[1], item[0]["doc_id"], item[0]["section"] or "", str(item[0]["page_or_heading"] or ""), item[0]["snippet_id"]))
+
+    results = retriever.query(query, k=3)
+
+    assert [item["snippet_id"] for item in results] == [chunk["snippet_id"] for chunk, _ in expected[:3]]
+    assert [item["score"] for item in results] == [score for _, score in expected[:3]]
+    assert all(item["snippet_id"] != "doc_bm25_4" for item in retriever.query(query, k=10))
+
+
+def test_binary_index_sidecar_matches_json_results_without_parsing_json(monkeypatch, tmp_path: Path) -> None:
+    from core import knowledge as knowledge_core
+    from core.knowledge import BM25Retriever, binary_index_path
+
+    doc = tmp_path / "doc_binary.md"
+    doc.write_text(
+        "# Battery\nBattery switch ON.\n# APU\nAPU switch ON after battery.\n# Crank\nEngine crank right.\n",
+        encoding="utf-8",
+    )
+    index_path = tmp_path / "index_binary.json"
+    build_index([str(doc)], str(index_path), binary=True)
+    assert binary_index_path(index_path).is_file()
+
+    json_retriever = BM25Retriever(index_path, prefer_binary=False)
+    expected = [json_retriever.query(q, k=k) for q in ("battery apu", "crank", "missing") for k in (1, 5)]
+
+    knowledge_core._load_index_data_cached.cache_clear()
+
+    def _fail_json_loads(*_args, **_kwargs):
+        raise AssertionError("binary index must not parse index.json")
+
+    monkeypatch.setattr(knowledge_core, "load_index_data", _fail_json_loads)
+    retriever = BM25Retriever(index_path)
+    assert retriever.binary_index is not None
+    assert [retriever.query(q, k=k) for q in ("battery apu", "crank", "missing") for k in (1, 5)] == expected
+    retriever.close()
+
+
+def test_binary_index_retriever_loads_chunks_lazily_and_releases_file(tmp_path: Path) -> None:
+    from core.knowledge import BM25Retriever, binary_index_path
+
+    doc = tmp_path / "doc_binary_chunks.md"
+    doc.write_text("# Battery\nBattery switch ON.\n# APU\nAPU switch ON after battery.\n", encoding="utf-8")
+    index_path = tmp_path / "index_binary_chunks.json"
+    build_index([str(doc)], str(index_path), binary=True)
+    expected_chunks = BM25Retriever(index_path, prefer_binary=False).chunks
+
+    with BM25Retriever(index_path) as retriever:
+        assert retriever.binary_index is not None
+        assert retriever._chunks is None
+        assert retriever.chunks == expected_chunks
+
+    binary_index_path(index_path).unlink()
+    assert not binary_index_path(index_path).exists()
+
+
+def test_stale_binary_index_sidecar_falls_back_to_json(tmp_path: Path) -> None:
+    import os
+
+    from core.knowledge import BM25Retriever
+
+    doc = tmp_path / "doc_stale.md"
+    doc.write_text("# Battery\nBattery switch ON.\n", encoding="utf-8")
+    index_path = tmp_path / "index_stale.json"
+    build_index([str(doc)], str(index_path), binary=True)
+    stat = index_path.stat()
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    retriever = BM25Retriever(index_path)
+
+    assert retriever.binary_index is None
+    assert retriever.query("battery", k=1)[0]["snippet_id"] == "doc_stale_0"
@@ -4,6 +4,7 @@ import builtins
 import json
 import math
 import socket
+import threading
 from datetime import datetime, timezone
 from pathlib import Path, PureWindowsPath
 from typing import Any
@@ -16,14 +17,17 @@ import yaml
 from core.types_v2 import VisionFact, VisionFactObservation, VisionObservation
 from adapters.action_executor import OverlayActionExecutor
 from adapters.dcs.overlay.sender import DcsOverlaySender
+from adapters.event_store.columnar_telemetry import ColumnarTelemetryWriter
 from adapters.openai_compat_model import OpenAICompatModel
 from adapters.step_inference import StepInferenceResult
 from adapters.vision_fact_extractor import VisionFactExtractionResult
 from adapters.source_chunk_refs import build_source_chunk_ref
-from core.help_failure import ALLOWLIST_FAIL, EVIDENCE_FAIL
+from core.event_store import BufferedJsonlEventStore, JsonlEventStore
+from core.help_failure import ALLOWLIST_FAIL, EVIDENCE_FAIL, VISION_UNAVAILABLE
 from core.types import Observation, TutorRequest, TutorResponse
 from live_dcs import (
     CompositeHelpTrigger,
+    HelpLatencyHistogram,
     LiveDcsTutorLoop,
     ReplayBiosReceiver,
     StdinHelpTrigger,
@@ -638,6 +642,7 @@ def test_live_loop_offline_single_sample_runs_help_response_and_actions(tmp_path
     assert stats["frames"] == 1
     assert stats["help_cycles"] == 1
     assert stats["model_calls"] == 1
+    assert {"http_requests", "http_connections_opened", "http_connections_reused"} <= set(stats)
     assert len(model.calls) == 1
     request = model.calls[0]["request"]
     assert request is not None
@@ -668,6 +673,33 @@ def test_live_loop_offline_single_sample_runs_help_response_and_actions(tmp_path
     assert executor.calls[0][0]["target"] == "apu_switch"
 
 
+
+def test_live_loop_http_stats_report_traffic_since_loop_start(monkeypatch, tmp_path: Path) -> None:
+    import live_dcs as live_dcs_module
+    from adapters.http_client_pool import HttpClientPoolStats
+
+    pool_stats = [HttpClientPoolStats(clients=2, requests=7, connections_opened=3)]
+    monkeypatch.setattr(live_dcs_module, "http_client_pool_stats", lambda: pool_stats[-1])
+    replay_path = tmp_path / "bios_http_stats.jsonl"
+    _write_replay(replay_path, [_bios_frame(1, 10.0, apu_switch=0)])
+    loop = LiveDcsTutorLoop(
+        source=ReplayBiosReceiver(replay_path),
+        model=RecordingModel(),
+        action_executor=RecordingExecutor(),
+        event_sink=[].append,
+    )
+    try:
+        assert loop.stats.http_requests == 0
+        pool_stats.append(HttpClientPoolStats(clients=2, requests=10, connections_opened=4))
+        stats = loop.stats
+        assert (stats.http_requests, stats.http_connections_opened, stats.http_connections_reused) == (3, 1, 2)
+        pool_stats.append(HttpClientPoolStats(clients=1, requests=2, connections_opened=1))
+        stats = loop.stats
+        assert (stats.http_requests, stats.http_connections_opened, stats.http_connections_reused) == (2, 1, 1)
+    finally:
+        loop.close()
+
+
 def test_live_auto_help_uses_help_action_wall_time_for_live_vision(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     replay_path = tmp_path / "bios_one.jsonl"
     _write_replay(replay_path, [_bios_frame(1, 10.0, apu_switch=0)])
@@ -2034,6 +2066,23 @@ def test_replay_receiver_skips_non_mapping_json_values(tmp_path: Path) -> None:
         source.close()
 
 
+def test_replay_receiver_reads_columnar_recording(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_columnar.tcol"
+    frames = [_bios_frame(seq, 10.0 + seq * 0.1, apu_switch=seq % 2) for seq in range(1, 6)]
+    with ColumnarTelemetryWriter(replay_path, chunk_frames=2) as writer:
+        writer.extend(frames)
+
+    source = ReplayBiosReceiver(replay_path, speed=0)
+    try:
+        payloads = []
+        while (obs := source.get_observation()) is not None:
+            payloads.append(obs.payload)
+        assert payloads == frames
+        assert source.is_exhausted is True
+    finally:
+        source.close()
+
+
 def test_replay_receiver_speed_realtime_paces_by_t_wall(monkeypatch, tmp_path: Path) -> None:
     replay_path = tmp_path / "bios_speed_realtime.jsonl"
     _write_replay(
@@ -3753,6 +3802,15 @@ def test_live_dcs_cli_model_max_tokens_rejects_negative_value() -> None:
         parser.parse_args(["--model-max-tokens", "-1"])
 
 
+@pytest.mark.parametrize("value", ["0", "-3"])
+def test_live_dcs_cli_observation_sample_every_n_rejects_non_positive_value(value: str) -> None:
+    parser = build_arg_parser()
+    assert parser.parse_args([]).observation_sample_every_n is None
+    assert parser.parse_args(["--observation-sample-every-n", "5"]).observation_sample_every_n == 5
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--observation-sample-every-n", value])
+
+
 def test_live_dcs_cli_scenario_profile_defaults_airfield_and_accepts_carrier() -> None:
     parser = build_arg_parser()
     args = parser.parse_args([])
@@ -6384,3 +6442,568 @@ def test_build_vision_selection_falls_back_when_trigger_time_is_non_finite(
     assert selection.observation_t_wall_s == 42.5
     assert selection.observation_t_wall_ms == 42500
     assert selection.trigger_wall_ms == 42500
+
+
+def test_live_loop_help_cache_reuses_responses_across_alternating_states(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_alternating_states.jsonl"
+    _write_replay(
+        replay_path,
+        [
+            _bios_frame(1, 17.0, apu_switch=0),
+            _bios_frame(2, 17.1, apu_switch=1),
+            _bios_frame(3, 27.0, apu_switch=0),
+            _bios_frame(4, 27.1, apu_switch=1),
+        ],
+    )
+
+    source = ReplayBiosReceiver(replay_path)
+    model = RecordingModel()
+    executor = RecordingExecutor()
+    loop = LiveDcsTutorLoop(
+        source=source,
+        model=model,
+        action_executor=executor,
+        cooldown_s=30.0,
+        lang="en",
+    )
+    try:
+        stats = loop.run(max_frames=4, auto_help_every_n_frames=1)
+    finally:
+        loop.close()
+
+    assert stats["help_cycles"] == 4
+    assert stats["model_calls"] == 2
+    assert stats["cache_hits"] == 2
+    assert stats["cache_misses"] == 2
+    assert stats["cache_evictions"] == 0
+
+
+def test_live_loop_help_cache_persists_responses_across_runs(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_persisted_cache.jsonl"
+    _write_replay(replay_path, [_bios_frame(1, 19.0, apu_switch=0)])
+    cache_path = tmp_path / "help_cache.json"
+
+    def _run_once() -> tuple[dict[str, int], RecordingModel]:
+        model = RecordingModel()
+        loop = LiveDcsTutorLoop(
+            source=ReplayBiosReceiver(replay_path),
+            model=model,
+            action_executor=RecordingExecutor(),
+            cooldown_s=0.0,
+            lang="en",
+            help_cache_ttl_s=3600.0,
+            help_cache_path=cache_path,
+        )
+        try:
+            return loop.run(max_frames=1, auto_help_every_n_frames=1), model
+        finally:
+            loop.close()
+
+    first_stats, first_model = _run_once()
+    assert first_stats["cache_misses"] == 1
+    assert len(first_model.calls) == 1
+    assert cache_path.is_file()
+
+    second_stats, second_model = _run_once()
+    assert second_stats["cache_hits"] == 1
+    assert second_stats["model_calls"] == 0
+    assert second_model.calls == []
+
+
+def test_live_loop_persisted_help_cache_outlives_cooldown_and_keys_on_prompt(monkeypatch, tmp_path: Path) -> None:
+    import live_dcs as live_dcs_module
+
+    replay_path = tmp_path / "bios_persisted_cache_ttl.jsonl"
+    _write_replay(replay_path, [_bios_frame(1, 19.0, apu_switch=0)])
+    cache_path = tmp_path / "help_cache.json"
+
+    def _run_once() -> dict[str, int]:
+        loop = LiveDcsTutorLoop(
+            source=ReplayBiosReceiver(replay_path),
+            model=RecordingModel(),
+            action_executor=RecordingExecutor(),
+            cooldown_s=0.0,
+            lang="en",
+            help_cache_path=cache_path,
+        )
+        try:
+            return loop.run(max_frames=1, auto_help_every_n_frames=1)
+        finally:
+            loop.close()
+
+    assert _run_once()["model_calls"] == 1
+    assert _run_once()["cache_hits"] == 1
+
+    monkeypatch.setattr(live_dcs_module, "help_prompt_fingerprint", lambda: "edited-prompt")
+    stats = _run_once()
+    assert stats["cache_hits"] == 0
+    assert stats["model_calls"] == 1
+
+
+class _BlockingModel(RecordingModel):
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.released_in_time: list[bool] = []
+
+    def explain_error(self, observation: Observation, request=None) -> TutorResponse:
+        self.started.set()
+        self.released_in_time.append(self.release.wait(timeout=5.0))
+        return super().explain_error(observation, request)
+
+
+def test_live_loop_async_help_keeps_ingesting_frames_during_model_call(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_async_help.jsonl"
+    _write_replay(replay_path, [_bios_frame(idx, 30.0 + idx * 0.1, apu_switch=0) for idx in range(1, 5)])
+    model = _BlockingModel()
+
+    class _ReleasingSource(ReplayBiosReceiver):
+        def get_observation(self) -> Observation | None:
+            obs = super().get_observation()
+            if obs is None:
+                model.release.set()
+            return obs
+
+    loop = LiveDcsTutorLoop(
+        source=_ReleasingSource(replay_path),
+        model=model,
+        action_executor=RecordingExecutor(),
+        lang="en",
+        async_help=True,
+    )
+    try:
+        stats = loop.run(auto_help_on_first_frame=True)
+        latency = loop.help_latency.to_dict()
+    finally:
+        loop.close()
+
+    assert model.released_in_time == [True]
+    assert stats["frames"] == 4
+    assert stats["help_cycles"] == 1
+    assert latency["count"] == 1
+    assert sum(bucket["count"] for bucket in latency["buckets"]) == 1
+
+
+def test_live_loop_async_help_newer_press_supersedes_pending_cycles() -> None:
+    class _NoopSource:
+        def close(self) -> None:
+            return
+
+    model = _BlockingModel()
+    executor = RecordingExecutor()
+    events: list[Any] = []
+    loop = LiveDcsTutorLoop(
+        source=_NoopSource(),
+        model=model,
+        action_executor=executor,
+        lang="en",
+        cooldown_s=30.0,
+        event_sink=events.append,
+        async_help=True,
+    )
+    try:
+        loop._ingest_observation(
+            Observation(
+                source="mock",
+                payload={"seq": 1, "t_wall": 10.0, "vars": {"battery_on": True}},
+            )
+        )
+        first = loop.submit_help_cycle(trigger_t_wall=10.0)
+        assert model.started.wait(timeout=5.0)
+        second = loop.submit_help_cycle(trigger_t_wall=10.1)
+        third = loop.submit_help_cycle(trigger_t_wall=10.2)
+        model.release.set()
+        loop.wait_for_help_cycles(timeout_s=5.0)
+    finally:
+        loop.close()
+
+    assert first is not None and second is not None and third is not None
+    assert second.cancelled()
+    first_response, first_report = first.result()
+    assert first_report is not None and first_report.get("superseded") is True
+    assert first_response is not None and first_response.metadata["help_cycle_superseded"] is True
+    assert len(model.calls) == 1
+    assert len(executor.calls) == 1
+    assert loop.stats.help_cycles_superseded == 2
+    kinds = [event.kind for event in events if event.kind in {"tutor_request", "tutor_response"}]
+    assert kinds == ["tutor_request", "tutor_response", "tutor_request", "tutor_response"]
+
+
+def test_live_loop_async_help_records_worker_failure_without_raising_on_next_submit() -> None:
+    class _NoopSource:
+        def close(self) -> None:
+            return
+
+    events: list[Any] = []
+    loop = LiveDcsTutorLoop(
+        source=_NoopSource(),
+        model=RecordingModel(),
+        action_executor=RecordingExecutor(),
+        lang="en",
+        cooldown_s=0.0,
+        event_sink=events.append,
+        async_help=True,
+    )
+    calls: list[int] = []
+    original = loop._run_help_cycle_from_snapshot
+
+    def _failing_once(snapshot):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("model exploded")
+        return original(snapshot)
+
+    loop._run_help_cycle_from_snapshot = _failing_once  # type: ignore[method-assign]
+    try:
+        loop._ingest_observation(
+            Observation(
+                source="mock",
+                payload={"seq": 1, "t_wall": 10.0, "vars": {"battery_on": True}},
+            )
+        )
+        first = loop.submit_help_cycle(trigger_t_wall=10.0)
+        assert first is not None
+        first.exception(timeout=5.0)
+        second = loop.submit_help_cycle(trigger_t_wall=10.1)
+        assert loop.wait_for_help_cycles(timeout_s=5.0) is True
+        # Ending the run must not re-raise a failure that was already recorded.
+        loop._help_future = first
+        assert loop.wait_for_help_cycles(timeout_s=5.0) is True
+    finally:
+        loop.close()
+
+    assert second is not None and second.exception() is None
+    assert loop.stats.help_cycle_errors == 1
+    error_events = [event for event in events if event.kind == "system"]
+    assert [event.payload for event in error_events] == [
+        {"type": "help_cycle_error", "error_type": "RuntimeError", "error": "model exploded"}
+    ]
+    validate_instance(error_events[0].to_dict(), "event")
+
+
+def test_live_loop_vision_events_hold_the_emit_lock() -> None:
+    lock_held: list[tuple[str, bool]] = []
+    loop: LiveDcsTutorLoop | None = None
+
+    def _sink(event: Any) -> None:
+        if loop is None:
+            return
+        lock_held.append((str(event.metadata.get("observation_kind", event.kind)), loop._emit_lock.locked()))
+
+    extractor = _GatedVisionFactExtractor()
+    loop = _pipelined_loop(extractor, RecordingModel(), event_sink=_sink)
+    try:
+        loop.run_help_cycle(trigger_t_wall=1772872445.0)
+    finally:
+        loop.close()
+
+    kinds = {kind for kind, _held in lock_held}
+    assert {"vision", "vision_fact"} <= kinds
+    assert all(held for _kind, held in lock_held)
+
+
+def test_help_latency_histogram_buckets_by_upper_bound() -> None:
+    histogram = HelpLatencyHistogram(bounds_ms=(100.0, 1000.0))
+    for latency_ms in (50.0, 100.0, 400.0, 5000.0):
+        histogram.observe(latency_ms)
+
+    summary = histogram.to_dict()
+    assert [bucket["count"] for bucket in summary["buckets"]] == [2, 1, 1]
+    assert summary["buckets"][-1]["le_ms"] is None
+    assert summary["count"] == 4
+    assert summary["max_ms"] == 5000.0
+
+
+class _PipelinedVisionPort:
+    def start(self, session_id: str) -> None:
+        return
+
+    def poll(self) -> list[VisionObservation]:
+        return [
+            VisionObservation(
+                frame_id=f"1772872444950_00012{idx}",
+                source="vision_test",
+                capture_wall_ms=1772872444950 + idx * 30,
+                frame_seq=120 + idx,
+                layout_id="fa18c_composite_panel_v2",
+                channel="composite_panel",
+                image_uri=f"/tmp/1772872444950_00012{idx}.png",
+            )
+            for idx in range(2)
+        ]
+
+    def stop(self) -> None:
+        return
+
+
+class _GatedVisionFactExtractor:
+    def __init__(self, *, gate: threading.Event | None = None) -> None:
+        self.gate = gate
+        self.calls: list[list[str]] = []
+
+    def extract(self, vision, *, session_id: str | None, trigger_wall_ms: int) -> VisionFactExtractionResult:
+        self.calls.append(list(vision["frame_ids"]))
+        if self.gate is not None:
+            self.gate.wait(timeout=5.0)
+        return VisionFactExtractionResult(
+            status="available",
+            observation=VisionFactObservation(
+                session_id=session_id,
+                trigger_wall_ms=trigger_wall_ms,
+                frame_ids=list(vision["frame_ids"]),
+                facts=[
+                    VisionFact(
+                        fact_id="supt_page_visible",
+                        state="seen",
+                        source_frame_id=vision["frame_ids"][-1],
+                        expires_after_ms=5000,
+                        evidence_note="SUPT page visible on the left DDI.",
+                    )
+                ],
+            ),
+        )
+
+    def close(self) -> None:
+        return
+
+
+def _pipelined_loop(extractor: _GatedVisionFactExtractor, model: RecordingModel, **kwargs: Any) -> LiveDcsTutorLoop:
+    loop = LiveDcsTutorLoop(
+        source=ReplayBiosReceiver(Path(__file__)),
+        model=model,
+        action_executor=RecordingExecutor(),
+        session_id="sess-pipelined",
+        vision_port=_PipelinedVisionPort(),
+        vision_session_id="sess-pipelined",
+        vision_mode="live",
+        vision_trigger_wait_ms=0,
+        vision_fact_extractor=extractor,
+        pipelined_vision=True,
+        **kwargs,
+    )
+    loop._ingest_observation(
+        Observation(
+            source="mock",
+            payload={"seq": 1, "t_wall": 1772872444.9, "vars": {"battery_on": True}},
+        )
+    )
+    return loop
+
+
+def test_live_loop_pipelined_vision_reuses_speculative_fact_extraction() -> None:
+    extractor = _GatedVisionFactExtractor()
+    model = RecordingModel()
+    events: list[Any] = []
+    loop = _pipelined_loop(extractor, model, speculative_vision=True, event_sink=events.append)
+    try:
+        loop._poll_vision_sidecar()
+        response, _report = loop.run_help_cycle(trigger_t_wall=1772872445.0)
+    finally:
+        loop.close()
+
+    assert response is not None
+    assert len(extractor.calls) == 1
+    assert response.metadata["vision_fact_status"] == "available"
+    timing = response.metadata["help_cycle_timing"]
+    assert timing["mode"] == "pipelined"
+    assert timing["prefetch"] in {"hit", "inflight"}
+    assert timing["timed_out"] is False
+    assert isinstance(timing["overlap_ms"], float)
+    request = model.calls[0]["request"]
+    assert request.metadata["help_cycle_timing"]["mode"] == "pipelined"
+    # The speculative result is attributed to the press that consumed it.
+    fact_events = [
+        event for event in events if event.kind == "observation" and event.metadata.get("observation_kind") == "vision_fact"
+    ]
+    assert len(fact_events) == 1
+    fact_payload = fact_events[0].payload["payload"]
+    assert fact_payload["trigger_wall_ms"] == 1772872445000
+    assert fact_payload["metadata"]["prefetched_trigger_wall_ms"] == 1772872444981
+
+
+def test_live_loop_pipelined_vision_selects_speculative_frames_off_the_ingest_thread(monkeypatch) -> None:
+    extractor = _GatedVisionFactExtractor()
+    model = RecordingModel()
+    loop = _pipelined_loop(extractor, model, speculative_vision=True)
+    assert loop._vision_session is not None
+
+    def _no_blocking_selection(**_kwargs):
+        raise AssertionError("speculation must not run select_for_help on the ingest thread")
+
+    monkeypatch.setattr(loop._vision_session, "select_for_help", _no_blocking_selection)
+    try:
+        loop._poll_vision_sidecar()
+        deadline = time.monotonic() + 5.0
+        while not extractor.calls and time.monotonic() < deadline:
+            time.sleep(0.001)
+    finally:
+        loop.close()
+
+    assert extractor.calls == [["1772872444950_000121"]]
+    assert loop._vision_prefetcher is not None
+    assert ("1772872444950_000121",) in loop._vision_prefetcher._results
+
+
+def test_live_loop_pipelined_vision_speculates_only_when_opted_in_and_frames_change() -> None:
+    extractor = _GatedVisionFactExtractor()
+    loop = _pipelined_loop(extractor, RecordingModel())
+    try:
+        loop._poll_vision_sidecar()
+        time.sleep(0.05)
+    finally:
+        loop.close()
+    assert extractor.calls == []
+
+    def _frame(frame_id: str, capture_wall_ms: int, right_hash: str) -> VisionObservation:
+        return VisionObservation(
+            frame_id=frame_id,
+            source="vision_test",
+            capture_wall_ms=capture_wall_ms,
+            layout_id="fa18c_composite_panel_v2",
+            channel="composite_panel",
+            image_uri=f"/tmp/{frame_id}.png",
+            metadata={"region_hashes": {"left_ddi": "0" * 64, "right_ddi": right_hash}},
+        )
+
+    loop = _pipelined_loop(extractor, RecordingModel(), speculative_vision=True)
+    try:
+        assert loop._speculation_due(_frame("a", 1772872444950, "0" * 64)) is True
+        assert loop._speculation_due(_frame("b", 1772872444980, "0" * 64)) is False
+        assert loop._speculation_due(_frame("c", 1772872445010, "f" * 64)) is True
+    finally:
+        loop.close()
+
+
+def test_live_loop_pipelined_vision_times_out_to_text_only_request() -> None:
+    gate = threading.Event()
+    extractor = _GatedVisionFactExtractor(gate=gate)
+    model = RecordingModel()
+    loop = _pipelined_loop(extractor, model, vision_fact_timeout_s=0.05)
+    try:
+        response, _report = loop.run_help_cycle(trigger_t_wall=1772872445.0)
+    finally:
+        gate.set()
+        loop.close()
+
+    assert response is not None
+    assert len(model.calls) == 1
+    assert response.metadata["vision_fact_status"] == "vision_unavailable"
+    assert response.metadata["vision_fallback_reason"] == VISION_UNAVAILABLE
+    timing = response.metadata["help_cycle_timing"]
+    assert timing["prefetch"] == "miss"
+    assert timing["timed_out"] is True
+
+
+def test_live_loop_fast_forward_logs_only_help_and_sampled_observations(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_fast_forward.jsonl"
+    _write_replay(replay_path, [_bios_frame(idx, 40.0 + idx * 0.1, apu_switch=0) for idx in range(1, 11)])
+    events: list[Any] = []
+    loop = LiveDcsTutorLoop(
+        source=ReplayBiosReceiver(replay_path, speed=0.0),
+        model=RecordingModel(),
+        action_executor=RecordingExecutor(),
+        lang="en",
+        cooldown_s=0.0,
+        event_sink=events.append,
+        fast_forward=True,
+        observation_sample_every_n=4,
+    )
+    try:
+        stats = loop.run(auto_help_every_n_frames=6)
+        throughput = loop.replay_throughput.to_dict()
+    finally:
+        loop.close()
+
+    observation_seqs = [event.payload["payload"]["seq"] for event in events if event.kind == "observation"]
+    assert stats["frames"] == 10
+    assert stats["help_cycles"] == 1
+    # Frames 1, 5 and 9 are sampled; frame 6 is logged for its help cycle, right before the request.
+    assert observation_seqs == [1, 5, 6, 9]
+    request_index = next(idx for idx, event in enumerate(events) if event.kind == "tutor_request")
+    previous_observation = next(event for event in reversed(events[:request_index]) if event.kind == "observation")
+    assert previous_observation.payload["payload"]["seq"] == 6
+    assert throughput["frames"] == 10
+    assert throughput["observation_events"] == 4
+    assert throughput["observation_events_skipped"] == 6
+    assert throughput["frames_per_s"] is not None and throughput["frames_per_s"] > 0
+
+
+def test_live_loop_serializes_observation_events_on_buffered_writer_thread(tmp_path: Path, monkeypatch) -> None:
+    replay_path = tmp_path / "bios_buffered.jsonl"
+    _write_replay(replay_path, [_bios_frame(idx, 40.0 + idx * 0.1, apu_switch=0) for idx in range(1, 4)])
+    serialized_on: list[str] = []
+    original_to_dict = Observation.to_dict
+
+    def _recording_to_dict(self: Observation) -> dict[str, Any]:
+        serialized_on.append(threading.current_thread().name)
+        return original_to_dict(self)
+
+    monkeypatch.setattr(Observation, "to_dict", _recording_to_dict)
+    store = BufferedJsonlEventStore(tmp_path / "events.jsonl", mode="w")
+    loop = LiveDcsTutorLoop(
+        source=ReplayBiosReceiver(replay_path, speed=0.0),
+        model=RecordingModel(),
+        action_executor=RecordingExecutor(),
+        lang="en",
+        event_sink=store.append,
+    )
+    try:
+        stats = loop.run()
+    finally:
+        loop.close()
+        store.close()
+
+    observations = [row for row in JsonlEventStore.load(tmp_path / "events.jsonl") if row["kind"] == "observation"]
+    assert stats["frames"] == 3
+    assert [row["payload"]["payload"]["seq"] for row in observations] == [1, 2, 3]
+    assert all(row["session_id"] == loop.session_id for row in observations)
+    assert serialized_on == ["jsonl-event-writer"] * 3
+
+
+def test_replay_receiver_seeks_by_seq_and_rebuilds_merged_state(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_seek.jsonl"
+    frames = [
+        {"schema_version": "v2", "seq": seq, "t_wall": 50.0 + seq * 0.5, "bios": {f"K{seq % 4}": seq}}
+        for seq in range(1, 21)
+    ]
+    _write_replay(replay_path, frames)
+
+    source = ReplayBiosReceiver(replay_path, speed=0, start_seq=11, index_every_n_frames=4)
+    try:
+        first = source.get_observation()
+        assert first is not None
+        assert first.payload["seq"] == 11
+        assert first.payload["bios"] == {"K0": 8, "K1": 9, "K2": 10, "K3": 11}
+        rest = []
+        while (obs := source.get_observation()) is not None:
+            rest.append(obs.payload["seq"])
+        assert rest == list(range(12, 21))
+    finally:
+        source.close()
+    assert source.index is not None
+    assert (tmp_path / "bios_seek.jsonl.idx.gz").exists()
+
+
+def test_replay_receiver_replays_time_window(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_window.jsonl"
+    _write_replay(replay_path, [_bios_frame(seq, 10.0 + seq, apu_switch=seq % 2) for seq in range(0, 30)])
+
+    source = ReplayBiosReceiver(replay_path, speed=0, start_t=12.0, end_t=15.0, index_every_n_frames=8)
+    try:
+        seqs = []
+        while (obs := source.get_observation()) is not None:
+            seqs.append(obs.payload["seq"])
+    finally:
+        source.close()
+
+    assert seqs == [12, 13, 14, 15]
+    assert source.is_exhausted is True
+
+
+def test_replay_receiver_rejects_conflicting_start_points(tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_conflict.jsonl"
+    _write_replay(replay_path, [_bios_frame(1, 10.0, apu_switch=0)])
+
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        ReplayBiosReceiver(replay_path, start_t=1.0, start_seq=1)
@@ -1,10 +1,13 @@
-﻿from adapters.ollama_model import OllamaModel
+﻿import json
+
+from adapters.ollama_model import OllamaModel
 from core.help_failure import SCHEMA_FAIL
 from core.llm_schema import validate_help_response
 from core.types import Observation
 from tests._fakes import (
     FakeClient,
     FakeResponse,
+    FakeStreamResponse,
     _help_obj_ok,
     _ollama_message_payload_from_help_obj,
     _ollama_response_payload_from_help_obj,
@@ -255,3 +258,23 @@ def test_explain_error_metadata_reads_delta_dropped_count_from_direct_context()
 
     assert res.status == "ok"
     assert res.metadata["delta_dropped_count"] == 5
+
+
+def test_ollama_stream_closes_after_valid_help_json() -> None:
+    help_text = json.dumps(_help_obj_ok(), ensure_ascii=False)
+    lines = [
+        json.dumps({"message": {"role": "assistant", "content": piece}, "done": False}, ensure_ascii=False)
+        for piece in (help_text[:40], help_text[40:], " trailing words")
+    ]
+    lines.append(json.dumps({"message": {"role": "assistant", "content": ""}, "done": True}))
+    stream = FakeStreamResponse(lines, content_type="application/x-ndjson")
+    fake = FakeClient(responses=[stream])
+    model = OllamaModel(model_name="qwen3:8b", client=fake, stream=True)
+
+    res = model.explain_error(Observation(source="mock", procedure_hint="S03"), _request_help())
+
+    assert res.status == "ok"
+    assert fake.calls[0]["json"]["stream"] is True
+    assert stream.lines_read == 2
+    assert res.metadata["stream_closed_early"] is True
+    assert isinstance(res.metadata["stream_time_to_valid_json_ms"], float)
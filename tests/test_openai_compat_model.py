@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 from adapters.openai_compat_model import OpenAICompatModel
@@ -7,6 +8,7 @@ from core.types import Observation, TutorRequest
 from tests._fakes import (
     FakeClient,
     FakeResponse,
+    FakeStreamResponse,
     _extract_prompt_constraints_json,
     _help_obj_ok,
     _openai_chat_payload_from_help_obj,
@@ -1521,3 +1523,147 @@ def test_explain_error_metadata_ignores_bool_nested_dropped_total() -> None:
 
     assert res.status == "ok"
     assert res.metadata["delta_dropped_count"] == 0
+
+
+def test_openai_compat_capability_cache_skips_rejected_features_across_instances() -> None:
+    valid_payload = _openai_chat_payload_from_help_obj(_help_obj_ok())
+    first_client = FakeClient(
+        responses=[
+            FakeResponse({"error": {"message": "Unknown field: chat_template_kwargs"}}, status_code=400),
+            FakeResponse(valid_payload, status_code=200),
+        ]
+    )
+    first = OpenAICompatModel(client=first_client, model_name="Qwen/Qwen3.5-9B")
+    first_res = first.explain_error(Observation(source="mock", procedure_hint="S03"), _request_help())
+
+    second_client = FakeClient(responses=[FakeResponse(valid_payload, status_code=200)])
+    second = OpenAICompatModel(client=second_client, model_name="Qwen/Qwen3.5-9B")
+    second_res = second.explain_error(Observation(source="mock", procedure_hint="S03"), _request_help())
+
+    assert first_res.metadata["endpoint_capabilities_rejected"] == ["request_overrides"]
+    assert len(second_client.calls) == 1
+    assert "chat_template_kwargs" not in second_client.calls[0]["json"]
+    assert "response_format" in second_client.calls[0]["json"]
+    assert second_res.status == "ok"
+    assert second_res.metadata["endpoint_capabilities_skipped"] == ["request_overrides"]
+    assert second_res.metadata["endpoint_capabilities_rejected"] == []
+
+
+def test_openai_compat_capability_cache_persists_and_expires(tmp_path: Path) -> None:
+    from adapters.openai_compat_capabilities import CAPABILITY_JSON_SCHEMA, EndpointCapabilityCache
+
+    path = tmp_path / "capabilities.json"
+    cache = EndpointCapabilityCache(ttl_s=60.0, path=path)
+    cache.record_rejected("http://host:8000/", "m", CAPABILITY_JSON_SCHEMA, reason="no grammar", now=1000.0)
+
+    reloaded = EndpointCapabilityCache(ttl_s=60.0, path=path)
+    rejection = reloaded.rejection("http://host:8000", "m", CAPABILITY_JSON_SCHEMA, now=1030.0)
+    assert rejection is not None and rejection.reason == "no grammar"
+    assert not reloaded.is_rejected("http://host:8000", "other", CAPABILITY_JSON_SCHEMA, now=1030.0)
+    assert not reloaded.is_rejected("http://host:8000", "m", CAPABILITY_JSON_SCHEMA, now=1061.0)
+    assert reloaded.stats.expirations == 1
+    assert len(EndpointCapabilityCache(path=path)) == 0
+
+
+def _openai_sse_lines(content_chunks: list[str]) -> list[str]:
+    lines = [
+        "data: " + json.dumps({"choices": [{"index": 0, "delta": {"content": chunk}}]}, ensure_ascii=False)
+        for chunk in content_chunks
+    ]
+    return [*lines, "data: [DONE]"]
+
+
+def test_openai_compat_stream_closes_after_valid_help_json() -> None:
+    help_text = json.dumps(_help_obj_ok(), ensure_ascii=False)
+    mid = len(help_text) // 2
+    stream = FakeStreamResponse(
+        _openai_sse_lines([help_text[:mid], help_text[mid:], "\n\nExtra commentary", " that never gets read."])
+    )
+    fake = FakeClient(responses=[stream])
+    model = OpenAICompatModel(client=fake, stream=True)
+
+    res = model.explain_error(Observation(source="mock", procedure_hint="S03"), _request_help())
+
+    assert res.status == "ok"
+    assert fake.calls[0]["method"] == "POST"
+    assert fake.calls[0]["json"]["stream"] is True
+    assert stream.lines_read == 2
+    assert stream.closed is True
+    assert res.metadata["stream_enabled"] is True
+    assert res.metadata["stream_closed_early"] is True
+    assert res.metadata["stream_chunk_count"] == 2
+    assert isinstance(res.metadata["stream_time_to_first_token_ms"], float)
+    assert isinstance(res.metadata["stream_time_to_valid_json_ms"], float)
+    assert res.metadata["json_repaired"] is False
+
+
+def test_openai_compat_stream_early_close_keeps_fenced_reply_metadata() -> None:
+    fenced_text = "```json\n" + json.dumps(_help_obj_ok(), ensure_ascii=False) + "\n```"
+    full = OpenAICompatModel(
+        client=FakeClient(
+            responses=[FakeResponse({"choices": [{"message": {"content": fenced_text}}]}, status_code=200)]
+        )
+    )
+    stream = FakeStreamResponse(_openai_sse_lines([fenced_text[:40], fenced_text[40:-4], fenced_text[-4:]]))
+    streamed = OpenAICompatModel(client=FakeClient(responses=[stream]), stream=True)
+
+    full_res = full.explain_error(Observation(source="mock", procedure_hint="S03"), _request_help())
+    stream_res = streamed.explain_error(Observation(source="mock", procedure_hint="S03"), _request_help())
+
+    assert stream_res.metadata["stream_closed_early"] is True
+    assert stream.lines_read == 2
+    for key in ("json_repaired", "json_repair_reasons", "generation_mode"):
+        assert stream_res.metadata[key] == full_res.metadata[key]
+    assert stream_res.metadata["json_repair_reasons"] == ["removed_code_fence"]
+
+
+def test_openai_compat_stream_retries_json_schema_400_and_reads_invalid_json_to_end() -> None:
+    invalid_text = json.dumps({"diagnosis": {"step_id": "S02"}})
+    stream = FakeStreamResponse(_openai_sse_lines([invalid_text, " tail"]))
+    fake = FakeClient(
+        responses=[
+            FakeStreamResponse(
+                [],
+                status_code=400,
+                payload={"error": {"message": "response_format json_schema is not supported"}},
+            ),
+            stream,
+        ]
+    )
+    model = OpenAICompatModel(client=fake, stream=True)
+
+    raw = model._chat([{"role": "user", "content": "help"}])
+
+    assert len(fake.calls) == 2
+    assert "response_format" in fake.calls[0]["json"]
+    assert fake.calls[1]["json"].get("response_format") != fake.calls[0]["json"]["response_format"]
+    assert raw == invalid_text + " tail"
+    assert stream.lines_read == 3
+    assert model._runtime_metadata["stream_closed_early"] is False
+    assert model._runtime_metadata["stream_time_to_valid_json_ms"] is None
+    assert model._runtime_metadata["endpoint_capabilities_rejected"] == ["json_schema"]
+
+
+def test_openai_compat_reuses_encoded_frames_across_help_requests(tmp_path: Path) -> None:
+    primary_image = tmp_path / "trigger_frame.png"
+    primary_image.write_bytes(b"primary-frame")
+    valid_payload = _openai_chat_payload_from_help_obj(_help_obj_ok())
+    fake = FakeClient(responses=[FakeResponse(valid_payload), FakeResponse(valid_payload)])
+    model = OpenAICompatModel(
+        client=fake,
+        model_name="Qwen/Qwen3.5-27B",
+        enable_multimodal=True,
+        allowed_local_image_roots=[tmp_path],
+    )
+
+    results = []
+    for _ in range(2):
+        request = _request_help()
+        _attach_vision_context(request, primary_image=primary_image)
+        results.append(model.explain_error(Observation(source="mock", procedure_hint="S03"), request))
+
+    assert [res.metadata["multimodal_image_cache_hits"] for res in results] == [0, 1]
+    assert results[1].metadata["multimodal_image_output_bytes"] == len(b"primary-frame")
+    assert results[1].metadata["multimodal_image_payloads"][0]["frame_id"] == "1772872445010_000123"
+    first_url = fake.calls[0]["json"]["messages"][1]["content"][0]["image_url"]["url"]
+    assert fake.calls[1]["json"]["messages"][1]["content"][0]["image_url"]["url"] == first_url
@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from adapters.pack_gates import evaluate_pack_gates, load_pack_gate_config
+from adapters.pack_gates import evaluate_pack_gates, load_compiled_pack_gates, load_pack_gate_config
 from adapters.prompting import build_help_prompt_result
 
 
@@ -393,3 +393,22 @@ def test_scenario_profile_changes_prompt_gate_hints() -> None:
     assert '"scenario_profile":"carrier"' in carrier_prompt
     assert "GND for airfield startup" in airfield_prompt
     assert "CV for carrier startup" in carrier_prompt
+
+
+def test_compiled_pack_gates_match_evaluate_pack_gates_and_are_cached() -> None:
+    compiled = load_compiled_pack_gates(PACK_PATH, scenario_profile="carrier")
+    assert load_compiled_pack_gates(PACK_PATH, scenario_profile="carrier") is compiled
+    assert load_compiled_pack_gates(PACK_PATH, scenario_profile="airfield") is not compiled
+
+    cfg = load_pack_gate_config(PACK_PATH, scenario_profile="carrier")
+    for vars_map in (
+        {},
+        {"battery_on": True, "apu_ready": False, "vars_source_missing": ["apu_ready"]},
+        {"battery_on": True, "apu_ready": True, "eng_left_rpm": 65, "radar_mode": "OPR", "ins_mode": "CV"},
+    ):
+        observations = [_obs_with_vars(**vars_map)]
+        assert compiled.evaluate(observations) == evaluate_pack_gates(
+            observations=observations,
+            precondition_gates=cfg["precondition_gates"],
+            completion_gates=cfg["completion_gates"],
+        )
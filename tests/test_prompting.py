@@ -2,11 +2,14 @@ import json
 from pathlib import Path
 
 from adapters.evidence_refs import infer_evidence_type_from_ref
+import adapters.prompting as prompting_module
 from adapters.prompting import (
+    HELP_PROMPT_VERSION,
     MAX_DELTA_SUMMARY_ITEMS,
     MAX_RECENT_ACTIONS_SIGNAL_ITEMS,
     build_help_prompt,
     build_help_prompt_result,
+    help_prompt_fingerprint,
 )
 from adapters.recent_actions import build_recent_button_signal
 from tests._fakes import _extract_prompt_constraints_json
@@ -1375,3 +1378,12 @@ def test_prompt_deterministic_step_hint_keeps_step_signal_metadata() -> None:
     assert hint["step_evidence_requirements"] == ["visual", "gate"]
     assert hint["requires_visual_confirmation"] is True
     assert payload["allowed_overlay_evidence_types"] == ["var", "gate", "rag", "delta", "visual"]
+
+
+def test_help_prompt_fingerprint_tracks_explicit_version(monkeypatch) -> None:
+    fingerprint = help_prompt_fingerprint()
+    assert fingerprint.startswith(f"v{HELP_PROMPT_VERSION}-")
+    assert help_prompt_fingerprint() == fingerprint
+
+    monkeypatch.setattr(prompting_module, "HELP_PROMPT_VERSION", f"{HELP_PROMPT_VERSION}-next")
+    assert help_prompt_fingerprint() != fingerprint
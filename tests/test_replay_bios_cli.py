@@ -221,6 +221,120 @@ def test_cli_replay_bios_udp_help_generates_help_cycle_and_dry_run_overlay(monke
     assert "overlay_dry_run" in kinds
 
 
+def test_cli_replay_bios_buffered_events_writes_loadable_log(monkeypatch, tmp_path: Path, capsys) -> None:
+    replay_path = tmp_path / "bios_cli_buffered.jsonl"
+    _write_replay(
+        replay_path,
+        [
+            _bios_frame(1, 10.0, apu_switch=0),
+            _bios_frame(2, 10.4, apu_switch=1),
+            _bios_frame(3, 10.8, apu_switch=1),
+        ],
+    )
+    output_path = tmp_path / "replay_buffered.jsonl"
+    monkeypatch.setattr("simtutor.__main__._build_replay_model_from_args", lambda _args: ModelStub(mode="A"))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "simtutor",
+            "replay-bios",
+            "--input",
+            str(replay_path),
+            "--output",
+            str(output_path),
+            "--speed",
+            "0",
+            "--buffered-events",
+            "--event-flush-interval-s",
+            "0.01",
+            "--event-fsync-on-close",
+        ],
+    )
+
+    code = main()
+
+    assert code == 0
+    events = JsonlEventStore.load(output_path)
+    assert [event["kind"] for event in events].count("observation") == 3
+    stats_line = next(line for line in capsys.readouterr().out.splitlines() if "event_store=" in line)
+    event_stats = json.loads(stats_line.split("event_store=", 1)[1])
+    assert event_stats["written"] == len(events)
+    assert event_stats["dropped"] == 0
+
+
+def test_cli_replay_bios_fast_forward_reports_throughput(monkeypatch, tmp_path: Path, capsys) -> None:
+    replay_path = tmp_path / "bios_cli_fast_forward.jsonl"
+    _write_replay(
+        replay_path,
+        [
+            _bios_frame(1, 10.0, apu_switch=0),
+            _bios_frame(2, 10.4, apu_switch=1),
+            _bios_frame(3, 10.8, apu_switch=1),
+        ],
+    )
+    output_path = tmp_path / "replay_fast_forward.jsonl"
+    monkeypatch.setattr("simtutor.__main__._build_replay_model_from_args", lambda _args: ModelStub(mode="A"))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "simtutor",
+            "replay-bios",
+            "--input",
+            str(replay_path),
+            "--output",
+            str(output_path),
+            "--fast-forward",
+            "--auto-help-once",
+        ],
+    )
+
+    code = main()
+
+    assert code == 0
+    events = JsonlEventStore.load(output_path)
+    assert [event["kind"] for event in events].count("observation") == 1
+    assert any(event["kind"] == "tutor_response" for event in events)
+    stats_line = next(line for line in capsys.readouterr().out.splitlines() if "replay_throughput=" in line)
+    throughput = json.loads(stats_line.split("replay_throughput=", 1)[1])
+    assert throughput["frames"] == 3
+    assert throughput["observation_events_skipped"] == 2
+
+
+def test_cli_replay_bios_start_seq_replays_window(monkeypatch, tmp_path: Path) -> None:
+    replay_path = tmp_path / "bios_cli_window.jsonl"
+    _write_replay(replay_path, [_bios_frame(seq, 10.0 + seq * 0.4, apu_switch=seq % 2) for seq in range(1, 9)])
+    output_path = tmp_path / "replay_window.jsonl"
+    monkeypatch.setattr("simtutor.__main__._build_replay_model_from_args", lambda _args: ModelStub(mode="A"))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "simtutor",
+            "replay-bios",
+            "--input",
+            str(replay_path),
+            "--output",
+            str(output_path),
+            "--speed",
+            "0",
+            "--start-seq",
+            "4",
+            "--end-t",
+            "2.0",
+        ],
+    )
+
+    code = main()
+
+    assert code == 0
+    events = JsonlEventStore.load(output_path)
+    seqs = [event["payload"]["payload"]["seq"] for event in events if event["kind"] == "observation"]
+    assert seqs == [4, 5, 6]
+    assert (tmp_path / "bios_cli_window.jsonl.idx.gz").exists()
+
+
 def test_cli_replay_bios_closes_source_when_store_enter_fails(monkeypatch, tmp_path: Path) -> None:
     replay_path = tmp_path / "bios_cli_store_fail.jsonl"
     _write_replay(replay_path, [_bios_frame(1, 10.0, apu_switch=0)])
@@ -6,6 +6,7 @@ from pathlib import Path
 
 import pytest
 
+from core.event_store import JsonlEventStore
 from core.llm_schema import validate_help_response
 from core.types import Observation, TutorRequest
 from simtutor.__main__ import main
@@ -121,6 +122,45 @@ def test_cli_replay_eval_writes_report(monkeypatch, tmp_path: Path) -> None:
     assert 0 <= report["summary"]["passed_case_count"] <= 5
 
 
+def test_cli_replay_eval_jobs_writes_sorted_report(monkeypatch, tmp_path: Path) -> None:
+    report_path = tmp_path / "replay_eval_report.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "simtutor",
+            "replay-eval",
+            "--suite",
+            str(SUITE_PATH),
+            "--output-dir",
+            str(tmp_path / "logs"),
+            "--report",
+            str(report_path),
+            "--jobs",
+            "2",
+        ],
+    )
+
+    code = main()
+
+    assert code == 0
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    case_ids = [case["case_id"] for case in report["cases"]]
+    assert case_ids == sorted(case_ids)
+    assert report["summary"]["case_count"] == 5
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2"])
+def test_cli_replay_eval_rejects_non_positive_jobs(monkeypatch, capsys, jobs: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["simtutor", "replay-eval", "--jobs", jobs])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert "--jobs" in capsys.readouterr().err
+
+
 def test_load_replay_eval_suite_rejects_unsupported_schema_version(tmp_path: Path) -> None:
     suite_path = tmp_path / "suite.yaml"
     suite_path.write_text(
@@ -502,3 +542,31 @@ def test_run_replay_eval_suite_continues_after_case_error(tmp_path: Path) -> Non
     passed_case_ids = [case["case_id"] for case in report["cases"] if case["status"] == "passed"]
     assert "noop_2min" in passed_case_ids
     assert len(passed_case_ids) >= 1
+
+
+def test_run_replay_eval_suite_parallel_jobs_match_sequential_report(tmp_path: Path) -> None:
+    suite = load_replay_eval_suite(SUITE_PATH)
+
+    sequential = run_replay_eval_suite(suite, output_dir=tmp_path / "sequential")
+    parallel = run_replay_eval_suite(suite, output_dir=tmp_path / "parallel", jobs=3)
+
+    assert parallel == sequential
+    assert [case["case_id"] for case in parallel["cases"]] == sorted(case.case_id for case in suite.cases)
+    assert json.loads((tmp_path / "parallel" / "report.json").read_text(encoding="utf-8")) == parallel
+    for case in suite.cases:
+        assert (tmp_path / "parallel" / case.case_id / "events.jsonl").exists()
+
+
+def test_run_replay_eval_suite_fast_forward_keeps_outcomes_and_skips_observations(tmp_path: Path) -> None:
+    suite = load_replay_eval_suite(SUITE_PATH)
+
+    full = run_replay_eval_suite(suite, output_dir=tmp_path / "full")
+    fast = run_replay_eval_suite(suite, output_dir=tmp_path / "fast", fast_forward=True)
+
+    assert fast == full
+    case_id = suite.cases[0].case_id
+    full_events = JsonlEventStore.load(tmp_path / "full" / case_id / "events.jsonl")
+    fast_events = JsonlEventStore.load(tmp_path / "fast" / case_id / "events.jsonl")
+    full_observations = [event for event in full_events if event.get("kind") == "observation"]
+    fast_observations = [event for event in fast_events if event.get("kind") == "observation"]
+    assert len(fast_observations) < len(full_observations)
@@ -0,0 +1,110 @@
+import json
+import time
+
+import pytest
+
+from adapters.json_extract import extract_first_json
+from adapters.streaming_json import (
+    IncrementalJsonScanner,
+    iter_ollama_stream_content,
+    iter_openai_stream_content,
+    read_text_stream,
+)
+
+
+def _feed_all(scanner: IncrementalJsonScanner, chunks: list[str]) -> list[str | None]:
+    return [scanner.feed(chunk) for chunk in chunks]
+
+
+def test_scanner_reports_segment_when_object_closes_across_chunks() -> None:
+    scanner = IncrementalJsonScanner()
+
+    results = _feed_all(scanner, ['prefix {"a": "x}', '\\"y", "b": [1, {"c"', ": 2}]}", " trailing"])
+
+    assert results[:2] == [None, None]
+    assert results[2] == 'prefix {"a": "x}\\"y", "b": [1, {"c": 2}]}'
+    assert results[3] is None
+    assert scanner.segment_end == len(results[2])
+    assert json.loads(results[2][len("prefix ") :]) == {"a": 'x}"y', "b": [1, {"c": 2}]}
+
+
+def test_scanner_skips_leading_think_blocks_split_across_chunks() -> None:
+    scanner = IncrementalJsonScanner()
+
+    results = _feed_all(scanner, ["  <thi", 'nk>draft {"a": 1}</th', "ink>\n", '{"a": 2}'])
+
+    assert results[:3] == [None, None, None]
+    assert results[3] is not None and results[3].endswith('{"a": 2}')
+
+
+@pytest.mark.parametrize(
+    "full_text",
+    [
+        '```json\n{"a": [1, 2]}\n```',
+        '```json {"a": [1, 2]} ```',
+        '<think>plan {"x": 0}</think>\n```\n{"a": [1, 2]}\n```',
+        'Answer: {"a": [1, 2]}',
+    ],
+)
+def test_scanner_candidate_reports_same_repairs_as_full_reply(full_text: str) -> None:
+    scanner = IncrementalJsonScanner()
+
+    results = _feed_all(scanner, [full_text[i : i + 3] for i in range(0, len(full_text), 3)])
+
+    candidates = [result for result in results if result is not None]
+    assert len(candidates) == 1
+    assert extract_first_json(candidates[0]) == extract_first_json(full_text)
+    assert scanner.text == full_text
+
+
+def test_read_text_stream_stops_at_accepted_segment_and_records_timings() -> None:
+    consumed: list[str] = []
+
+    def chunks():
+        for chunk in ['{"k":', " 1}", " and then", " more text"]:
+            consumed.append(chunk)
+            yield chunk
+
+    streamed = read_text_stream(chunks(), started=time.perf_counter(), accept=lambda text: True)
+
+    assert streamed.text == '{"k": 1}'
+    assert streamed.closed_early is True
+    assert consumed == ['{"k":', " 1}"]
+    assert streamed.time_to_first_token_ms is not None
+    assert streamed.time_to_valid_json_ms is not None
+    assert streamed.time_to_valid_json_ms >= streamed.time_to_first_token_ms
+
+
+def test_read_text_stream_reads_to_end_when_segment_is_rejected() -> None:
+    streamed = read_text_stream(['{"k": 1}', " tail"], started=time.perf_counter(), accept=lambda text: False)
+
+    assert streamed.text == '{"k": 1} tail'
+    assert streamed.closed_early is False
+    assert streamed.time_to_valid_json_ms is None
+    assert streamed.chunk_count == 2
+
+
+def test_iter_openai_stream_content_reads_deltas_until_done() -> None:
+    lines = [
+        ": keep-alive",
+        'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+        'data: {"choices": [{"delta": {"content": "ab"}}]}',
+        "",
+        'data: {"choices": [{"delta": {"content": "c"}}]}',
+        "data: [DONE]",
+        'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+    ]
+
+    assert list(iter_openai_stream_content(lines)) == ["ab", "c"]
+
+
+def test_iter_ollama_stream_content_stops_on_done_and_surfaces_errors() -> None:
+    lines = [
+        json.dumps({"message": {"role": "assistant", "content": "a"}, "done": False}),
+        json.dumps({"message": {"role": "assistant", "content": "b"}, "done": True}),
+        json.dumps({"message": {"role": "assistant", "content": "late"}, "done": False}),
+    ]
+    assert list(iter_ollama_stream_content(lines)) == ["a", "b"]
+
+    with pytest.raises(ValueError, match="model not found"):
+        list(iter_ollama_stream_content([json.dumps({"error": "model not found"})]))
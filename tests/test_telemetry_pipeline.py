@@ -1,5 +1,6 @@
 import json
 from collections import OrderedDict
+import threading
 from pathlib import Path
 
 import pytest
@@ -11,7 +12,7 @@ import adapters.telemetry_pipeline as telemetry_pipeline
 from adapters.telemetry_pipeline import TelemetryDebugCache, enrich_bios_observation
 from core.types import Event
 from core.types import Observation
-from core.vars import VarResolver
+from core.vars import IncrementalVarResolver, VarResolver
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -1043,3 +1044,75 @@ def test_resolve_policy_and_sanitizer_returns_lock_for_caller_sanitizer() -> Non
     assert resolved is sanitizer
     assert lock1 is not None
     assert lock2 is lock1
+
+
+def test_enrich_bios_observation_accepts_incremental_resolver() -> None:
+    incremental = IncrementalVarResolver(_resolver())
+    bios = {"BATTERY_SW": 2, "IFEI_RPM_R": " 20"}
+    first = Observation(
+        source="dcs_bios",
+        payload={"seq": 1, "t_wall": 1.0, "bios": dict(bios), "delta": dict(bios)},
+    )
+    bios["IFEI_RPM_R"] = " 64"
+    second = Observation(
+        source="dcs_bios",
+        payload={"seq": 2, "t_wall": 2.0, "bios": dict(bios), "delta": {"IFEI_RPM_R": " 64"}},
+    )
+
+    enrich_bios_observation(first, incremental, delta_stream_id="incremental-test")
+    enriched = enrich_bios_observation(second, incremental, delta_stream_id="incremental-test")
+
+    assert enriched.payload["vars"]["rpm_r"] == 64
+    assert enriched.payload["vars"]["rpm_r_gte_25"] is True
+    assert incremental.incremental_resolves == 1
+
+
+def test_completion_latch_write_behind_coalesces_changes_and_flushes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    latch_path = tmp_path / "completion_latches.json"
+    monkeypatch.setattr(telemetry_pipeline, "_COMPLETION_LATCHES_PATH", latch_path)
+    monkeypatch.setattr(telemetry_pipeline, "_COMPLETION_LATCHES", OrderedDict())
+    monkeypatch.setattr(telemetry_pipeline, "_COMPLETION_LATCHES_LOADED", True)
+    monkeypatch.setattr(telemetry_pipeline, "_COMPLETION_LATCH_PERSIST_STATS", telemetry_pipeline.CompletionLatchPersistStats())
+
+    save_threads: list[str] = []
+    real_save = telemetry_pipeline._save_completion_latches_to_disk
+
+    def _recording_save(payload=None) -> None:
+        save_threads.append(threading.current_thread().name)
+        real_save(payload)
+
+    monkeypatch.setattr(telemetry_pipeline, "_save_completion_latches_to_disk", _recording_save)
+    telemetry_pipeline.configure_completion_latch_write_behind(60.0)
+    try:
+        for seq, (fcs, trim) in enumerate(((1, 0), (0, 1), (1, 1)), start=540):
+            enrich_bios_observation(
+                Observation(
+                    source="dcs_bios",
+                    payload={
+                        "seq": seq,
+                        "t_wall": float(seq),
+                        "bios": {"FCS_RESET_BTN": fcs, "TO_TRIM_BTN": trim, "BATTERY_SW": 2},
+                        "delta": {"FCS_RESET_BTN": fcs, "TO_TRIM_BTN": trim},
+                    },
+                    metadata={"session_id": "sess-write-behind"},
+                ),
+                _resolver(),
+                mapper=_mapper(),
+            )
+        assert save_threads == []
+        assert not latch_path.exists()
+
+        assert telemetry_pipeline.flush_completion_latches(timeout=5.0) is True
+    finally:
+        telemetry_pipeline.configure_completion_latch_write_behind(None)
+
+    assert save_threads == ["completion-latch-writer"]
+    persisted = json.loads(latch_path.read_text(encoding="utf-8"))
+    assert persisted["sess-write-behind"] == {"fcs_reset_complete": True, "takeoff_trim_set": True}
+    stats = telemetry_pipeline.completion_latch_persist_stats()
+    assert stats["writes"] == 1
+    assert stats["changes"] == stats["coalesced"] + 1
+    assert stats["max_write_ms"] >= 0
@@ -6,7 +6,7 @@ import pytest
 import yaml
 
 from core.types_v2 import TelemetryFrame
-from core.vars import VarResolver, VarResolverError
+from core.vars import IncrementalVarResolver, VarResolver, VarResolverError, compile_expression
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 PACK_TELEMETRY_MAP_PATH = REPO_ROOT / "packs" / "fa18c_startup" / "telemetry_map.yaml"
@@ -987,3 +987,95 @@ def test_var_resolver_pack_composite_vars_propagate_source_missing() -> None:
     assert "core_avionics_online" in vars_out["vars_source_missing"]
     assert "obogs_switch_on" in vars_out["vars_source_missing"]
     assert "obogs_flow_on" in vars_out["vars_source_missing"]
+
+
+def test_var_resolver_compiles_expressions_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    import core.vars as vars_module
+
+    resolver = VarResolver.from_yaml(PACK_TELEMETRY_MAP_PATH)
+
+    def _fail_parse(*_args, **_kwargs):
+        raise AssertionError("ast.parse must not run per frame")
+
+    monkeypatch.setattr(vars_module.ast, "parse", _fail_parse)
+    vars_out = resolver.resolve(TelemetryFrame(seq=1, t_wall=1.0, source="dcs_bios", bios={}))
+
+    assert "vars_source_missing" in vars_out
+
+
+def test_compiled_expression_keeps_deferred_errors_and_source_refs() -> None:
+    compiled = compile_expression("vars.flag and bios.VALUE is None")
+
+    assert compiled.source_refs == ("bios.VALUE", "vars.flag")
+    assert compiled.evaluate({"vars": {"flag": False}, "bios": {}}) is False
+    with pytest.raises(VarResolverError, match="Unsupported comparison operator.*Is"):
+        compiled.evaluate({"vars": {"flag": True}, "bios": {"VALUE": 1}})
+
+    broken = compile_expression("bios.VALUE ==")
+    with pytest.raises(VarResolverError, match="Invalid expression"):
+        broken.evaluate({})
+    with pytest.raises(VarResolverError, match="Division by zero"):
+        compile_expression("bios.A / bios.B").evaluate({"bios": {"A": 1, "B": 0}})
+
+
+def test_incremental_var_resolver_matches_full_resolve_on_recorded_log() -> None:
+    resolver = VarResolver.from_yaml(PACK_TELEMETRY_MAP_PATH)
+    incremental = IncrementalVarResolver(resolver)
+    frames = [json.loads(line) for line in SAMPLE_RAW_JSONL_PATH.read_text(encoding="utf-8").splitlines() if line]
+
+    for frame in frames:
+        assert incremental.resolve(frame) == resolver.resolve(frame)
+
+    assert incremental.supported is True
+    assert incremental.full_resolves == 1
+    assert incremental.incremental_resolves == len(frames) - 1
+
+
+def test_incremental_var_resolver_recomputes_only_affected_vars() -> None:
+    mapping = {
+        "vars": {
+            "battery_on": "bios.BATTERY_SW == 2",
+            "apu_on": "bios.APU_CONTROL_SW == 1",
+            "power_available": "derived(vars.battery_on and vars.apu_on)",
+        }
+    }
+    path = _tmp_dir() / "telemetry_map.yaml"
+    path.write_text(yaml.safe_dump(mapping), encoding="utf-8")
+    incremental = IncrementalVarResolver(VarResolver.from_yaml(path))
+
+    first = incremental.resolve({"seq": 1, "bios": {"BATTERY_SW": 2}, "delta": {"BATTERY_SW": 2}})
+    assert first["vars_source_missing"] == ["apu_on"]
+
+    second = incremental.resolve(
+        {"seq": 2, "bios": {"BATTERY_SW": 2, "APU_CONTROL_SW": 1}, "delta": {"APU_CONTROL_SW": 1}}
+    )
+    assert second["power_available"] is True
+    assert second["vars_source_missing"] == []
+    assert incremental.last_recomputed == 2
+
+    unchanged = incremental.resolve(
+        {"seq": 3, "bios": {"BATTERY_SW": 2, "APU_CONTROL_SW": 1}, "delta": {"UNRELATED": 1}}
+    )
+    assert unchanged == second
+    assert incremental.last_recomputed == 0
+
+    # A seq gap forces a full resolve that reseeds the cache.
+    incremental.resolve({"seq": 9, "bios": {"BATTERY_SW": 0, "APU_CONTROL_SW": 1}, "delta": {}})
+    assert incremental.full_resolves == 2
+
+
+def test_incremental_var_resolver_falls_back_for_forward_refs() -> None:
+    mapping = {"vars": {"early": "derived(vars.late)", "late": "bios.VALUE == 1"}}
+    path = _tmp_dir() / "telemetry_map.yaml"
+    path.write_text(yaml.safe_dump(mapping), encoding="utf-8")
+    resolver = VarResolver.from_yaml(path)
+    incremental = IncrementalVarResolver(resolver)
+
+    frames = [
+        {"seq": 1, "bios": {"VALUE": 1}, "delta": {"VALUE": 1}},
+        {"seq": 2, "bios": {"VALUE": 1}, "delta": {}},
+    ]
+    for frame in frames:
+        assert incremental.resolve(frame) == resolver.resolve(frame)
+    assert incremental.supported is False
+    assert incremental.incremental_resolves == 0
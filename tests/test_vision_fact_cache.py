@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from PIL import Image, ImageDraw
+
+from adapters.perceptual_hash import dhash_image, hamming_distance, region_hash_distance, text_dhash
+from adapters.vision_fact_cache import VisionFactResultCache, restamp_cached_observation
+from core.types_v2 import VisionFact, VisionFactObservation
+
+
+def _panel(text_offset: int = 0, *, noise: bool = False) -> Image.Image:
+    image = Image.new("RGB", (320, 240), (12, 18, 20))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((40 + text_offset, 60, 200 + text_offset, 120), fill=(90, 220, 120))
+    draw.ellipse((220, 140, 300, 220), fill=(200, 200, 60))
+    if noise:
+        image.putpixel((5, 5), (13, 18, 20))
+    return image
+
+
+def _observation(trigger_wall_ms: int) -> VisionFactObservation:
+    return VisionFactObservation(
+        session_id="sess-a",
+        trigger_wall_ms=trigger_wall_ms,
+        frame_ids=["1772872445010_000123"],
+        facts=[
+            VisionFact(
+                fact_id="tac_page_visible",
+                state="seen",
+                source_frame_id="1772872445010_000123",
+                expires_after_ms=2000,
+                evidence_note="TAC page",
+                observed_at_wall_ms=trigger_wall_ms,
+                sticky=False,
+            )
+        ],
+    )
+
+
+def test_dhash_is_stable_for_near_identical_frames_and_moves_for_changed_content() -> None:
+    base = dhash_image(_panel())
+
+    assert len(base) == 64
+    assert hamming_distance(base, dhash_image(_panel(noise=True))) <= 2
+    assert hamming_distance(base, dhash_image(_panel(text_offset=60))) > 8
+    assert region_hash_distance({"ampcd": base}, {"left_ddi": base}) is None
+
+
+def test_vision_fact_result_cache_serves_near_duplicates_within_distance() -> None:
+    cache = VisionFactResultCache(max_distance=2)
+    hashes = [{"left_ddi": dhash_image(_panel()), "ampcd": dhash_image(_panel(text_offset=10))}]
+    cache.store(hashes, _observation(1_000), trigger_wall_ms=1_000)
+
+    near = [{"left_ddi": dhash_image(_panel(noise=True)), "ampcd": hashes[0]["ampcd"]}]
+    changed = [{"left_ddi": hashes[0]["left_ddi"], "ampcd": dhash_image(_panel(text_offset=70))}]
+
+    hit = cache.lookup(near, trigger_wall_ms=5_000)
+    assert hit is not None
+    assert hit.source_trigger_wall_ms == 1_000
+    assert cache.lookup(changed, trigger_wall_ms=5_000) is None
+    assert cache.stats.to_dict()["hits"] == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_vision_fact_result_cache_expires_entries_by_max_age() -> None:
+    cache = VisionFactResultCache(max_age_ms=10_000)
+    hashes = [{"frame": dhash_image(_panel())}]
+    cache.store(hashes, _observation(1_000), trigger_wall_ms=1_000)
+
+    assert cache.lookup(hashes, trigger_wall_ms=11_000) is not None
+    assert cache.lookup(hashes, trigger_wall_ms=11_001) is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_restamped_observation_keeps_original_fact_observation_time() -> None:
+    restamped = restamp_cached_observation(
+        _observation(1_000),
+        session_id="sess-b",
+        trigger_wall_ms=9_000,
+        frame_ids=["1772872449000_000200"],
+    )
+
+    fact = restamped.facts[0]
+    assert restamped.trigger_wall_ms == 9_000
+    assert restamped.session_id == "sess-b"
+    assert fact.observed_at_wall_ms == 1_000
+    assert fact.source_frame_id == "1772872449000_000200"
+    assert fact.expires_after_ms == 2000
+
+
+def _ins_panel(status: str) -> Image.Image:
+    image = Image.new("RGB", (448, 448), (10, 14, 16))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((20, 20, 428, 428), outline=(0, 200, 0))
+    draw.text((200, 300), "INS", fill=(0, 220, 0))
+    draw.text((240, 300), status, fill=(0, 220, 0))
+    return image
+
+
+def test_default_cache_misses_small_text_change_that_dhash_alone_cannot_see() -> None:
+    assert hamming_distance(dhash_image(_ins_panel("GRND")), dhash_image(_ins_panel("OK"))) <= 4
+
+    cache = VisionFactResultCache()
+    stored = [{"ampcd": text_dhash(_ins_panel("GRND"))}]
+    cache.store(stored, _observation(1_000), trigger_wall_ms=1_000)
+
+    assert cache.lookup([{"ampcd": text_dhash(_ins_panel("OK"))}], trigger_wall_ms=2_000) is None
+    assert cache.lookup([{"ampcd": text_dhash(_ins_panel("GRND"))}], trigger_wall_ms=2_000) is not None
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 from PIL import Image
 
+from adapters.vision_fact_cache import VisionFactResultCache
 from adapters.vision_fact_extractor import VisionFactExtractor
 from core.vision_facts import VISION_FACT_IDS
 from tests._fakes import FakeClient, FakeResponse
@@ -715,6 +716,37 @@ def test_vision_fact_extractor_downgrades_when_multimodal_rejected(tmp_path: Pat
     assert "Unknown field image_url" in str(result.error)
 
 
+def test_vision_fact_extractor_skips_request_after_model_saw_multimodal_rejection(tmp_path: Path) -> None:
+    from adapters.openai_compat_capabilities import CAPABILITY_MULTIMODAL, EndpointCapabilityCache
+
+    primary = tmp_path / "1772872445010_000123.png"
+    _write_png(primary)
+    cache = EndpointCapabilityCache()
+    cache.record_rejected(
+        "http://127.0.0.1:8000",
+        "Qwen3.5-27B-Instruct",
+        CAPABILITY_MULTIMODAL,
+        reason="Unknown field image_url",
+    )
+    fake = FakeClient(responses=[])
+    extractor = VisionFactExtractor(
+        client=fake,
+        allowed_local_image_roots=[str(tmp_path)],
+        capability_cache=cache,
+    )
+
+    result = extractor.extract(
+        _vision_context(primary),
+        session_id="sess-live",
+        trigger_wall_ms=1772872445000,
+    )
+
+    assert fake.calls == []
+    assert result.status == "extractor_failed"
+    assert "Unknown field image_url" in str(result.error)
+    assert result.metadata["endpoint_capabilities_skipped"] == ["multimodal"]
+
+
 def test_vision_fact_extractor_prompt_excludes_frame_ids(tmp_path: Path) -> None:
     primary = tmp_path / "1772872445010_000123.png"
     missing = tmp_path / "1772872444950_000122.png"
@@ -917,3 +949,103 @@ def test_vision_fact_extractor_prompt_stays_image_grounded_without_runtime_bias(
     assert "vision_status" not in prompt
     assert "PB18" not in prompt
     assert "PB15" not in prompt
+
+
+def test_vision_fact_extractor_reuses_result_for_unchanged_frames(tmp_path: Path) -> None:
+    primary = tmp_path / "1772872445010_000123.png"
+    changed = tmp_path / "1772872449010_000160.png"
+    image = Image.new("RGB", (64, 48), (16, 32, 48))
+    image.paste((200, 220, 90), (8, 8, 40, 24))
+    image.save(primary, format="PNG")
+    image.transpose(Image.Transpose.FLIP_LEFT_RIGHT).save(changed, format="PNG")
+    seen_tac = _chat_payload(
+        [
+            {"fact_id": fact_id, "state": "seen" if fact_id == "tac_page_visible" else "not_seen", "evidence_note": "ok"}
+            for fact_id in VISION_FACT_IDS
+        ]
+    )
+    fake = FakeClient(responses=[FakeResponse(seen_tac), FakeResponse(seen_tac)])
+    extractor = VisionFactExtractor(client=fake, allowed_local_image_roots=[str(tmp_path)], lang="en")
+
+    first = extractor.extract(_vision_context(primary), session_id="sess-live", trigger_wall_ms=1772872445000)
+    second = extractor.extract(_vision_context(primary), session_id="sess-live", trigger_wall_ms=1772872447000)
+    third = extractor.extract(_vision_context(changed), session_id="sess-live", trigger_wall_ms=1772872449000)
+
+    assert len(fake.calls) == 2
+    assert first.status == second.status == "available"
+    assert first.metadata["vision_fact_cache"]["hit"] is False
+    assert second.metadata["vision_fact_cache"]["hit"] is True
+    assert second.metadata["vision_fact_summary"]["cache"]["hit_rate"] == 0.5
+    assert third.metadata["vision_fact_cache"]["hit"] is False
+    assert second.observation is not None
+    facts_by_id = {fact.fact_id: fact for fact in second.observation.facts}
+    assert facts_by_id["tac_page_visible"].state == "seen"
+    assert facts_by_id["tac_page_visible"].observed_at_wall_ms == 1772872445000
+    assert second.observation.metadata["vision_fact_cache"]["source_trigger_wall_ms"] == 1772872445000
+
+
+def test_vision_fact_extractor_region_incremental_only_requeries_changed_regions(tmp_path: Path) -> None:
+    source = tmp_path / "1772872445010_000123.png"
+    Image.new("RGB", (1920, 1080), (16, 32, 48)).save(source, format="PNG")
+    left_facts = ("tac_page_visible", "supt_page_visible", "fcs_page_visible", "fcs_page_x_marks_visible")
+
+    def context(right_hash: str) -> dict[str, object]:
+        payload = _vision_context(source)
+        frame = dict(payload["trigger_frame"])  # type: ignore[arg-type]
+        frame["source_image_path"] = str(source)
+        frame["region_hashes"] = {"left_ddi": "0" * 64, "ampcd": "0" * 64, "right_ddi": right_hash}
+        payload["trigger_frame"] = frame
+        payload["selected_frames"] = [frame]
+        return payload
+
+    full = _chat_payload(
+        [
+            {"fact_id": fact_id, "state": "seen" if fact_id == "tac_page_visible" else "not_seen", "evidence_note": "ok"}
+            for fact_id in VISION_FACT_IDS
+        ]
+    )
+    right_only = _chat_payload(
+        [
+            {"fact_id": fact_id, "state": "seen" if fact_id == "bit_root_page_visible" else "not_seen", "evidence_note": "ok"}
+            for fact_id in VISION_FACT_IDS
+            if fact_id.startswith(("bit_root", "fcsmc"))
+        ]
+    )
+    fake = FakeClient(responses=[FakeResponse(full), FakeResponse(right_only)])
+    extractor = VisionFactExtractor(
+        client=fake,
+        allowed_local_image_roots=[str(tmp_path)],
+        lang="en",
+        result_cache=VisionFactResultCache(max_entries=0),
+        region_incremental=True,
+    )
+
+    first = extractor.extract(context("0" * 64), session_id="sess-live", trigger_wall_ms=1772872445000)
+    unchanged = extractor.extract(context("1" + "0" * 63), session_id="sess-live", trigger_wall_ms=1772872446000)
+    second = extractor.extract(context("f" * 64), session_id="sess-live", trigger_wall_ms=1772872447000)
+
+    assert len(fake.calls) == 2
+    assert first.metadata["vision_fact_regions"]["mode"] == "full"
+    assert unchanged.status == "available"
+    assert unchanged.metadata["vision_fact_regions"]["queried_regions"] == []
+    assert second.status == "available"
+    assert second.metadata["vision_fact_regions"]["queried_regions"] == ["right_ddi"]
+    request = fake.calls[1]["json"]
+    images = [part for part in request["messages"][1]["content"] if part.get("type") == "image_url"]
+    assert len(images) == 1
+    assert (tmp_path / "artifacts" / "1772872445010_000123_right_ddi.png").exists()
+    schema_ids = json.dumps(request.get("response_format", {}))
+    assert "tac_page_visible" not in schema_ids
+    assert second.observation is not None
+    facts_by_id = {fact.fact_id: fact for fact in second.observation.facts}
+    assert [fact.fact_id for fact in second.observation.facts] == list(VISION_FACT_IDS)
+    assert facts_by_id["bit_root_page_visible"].state == "seen"
+    assert facts_by_id["tac_page_visible"].state == "seen"
+    # Carried-forward facts keep the time they were actually read and are not reported as fresh.
+    assert facts_by_id["tac_page_visible"].observed_at_wall_ms == 1772872445000
+    assert set(left_facts) <= set(second.observation.metadata["carried_forward_fact_ids"])
+    assert "tac_page_visible" not in second.metadata["vision_fact_summary"]["fresh_fact_ids"]
+    assert "bit_root_page_visible" in second.metadata["vision_fact_summary"]["fresh_fact_ids"]
+    assert unchanged.observation is not None
+    assert {fact.observed_at_wall_ms for fact in unchanged.observation.facts} == {1772872445000}
+    assert unchanged.metadata["vision_fact_summary"]["fresh_fact_ids"] == []
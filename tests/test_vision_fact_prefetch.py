@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from adapters.vision_fact_extractor import VisionFactExtractionResult
+from adapters.vision_fact_prefetch import VISION_FACT_TIMEOUT_REASON, VisionFactPrefetcher, vision_frame_key
+from core.types_v2 import VisionFactObservation
+
+
+def _vision(*frame_ids: str) -> dict[str, Any]:
+    frames = [{"frame_id": frame_id, "image_uri": f"/tmp/{frame_id}.png"} for frame_id in frame_ids]
+    payload: dict[str, Any] = {"frame_ids": list(frame_ids), "selected_frames": frames}
+    if len(frames) >= 2:
+        payload["pre_trigger_frame"] = frames[-2]
+    if frames:
+        payload["trigger_frame"] = frames[-1]
+    return payload
+
+
+class _CountingExtractor:
+    def __init__(self, *, status: str = "available", gate: threading.Event | None = None) -> None:
+        self.calls: list[tuple[str, ...]] = []
+        self.status = status
+        self.gate = gate
+
+    def extract(self, vision, *, session_id: str | None, trigger_wall_ms: int) -> VisionFactExtractionResult:
+        self.calls.append(vision_frame_key(vision))
+        if self.gate is not None:
+            self.gate.wait(timeout=5.0)
+        return VisionFactExtractionResult(status=self.status, metadata={"trigger_wall_ms": trigger_wall_ms})
+
+
+def test_vision_frame_key_prefers_trigger_pair_over_selected_frames() -> None:
+    assert vision_frame_key(_vision("a", "b", "c")) == ("b", "c")
+    assert vision_frame_key({"selected_frames": [{"frame_id": "x"}, {"frame_id": "x"}, {"frame_id": "y"}]}) == (
+        "x",
+        "y",
+    )
+    assert vision_frame_key({}) == ()
+
+
+def test_prefetcher_reuses_speculative_result_for_same_frames() -> None:
+    extractor = _CountingExtractor()
+    prefetcher = VisionFactPrefetcher(extractor, session_id="sess")
+    try:
+        assert prefetcher.prefetch(_vision("a", "b"), trigger_wall_ms=1000) is True
+        assert prefetcher.prefetch(_vision("a", "b"), trigger_wall_ms=1001) is False
+        result, timing = prefetcher.extract(_vision("a", "b"), trigger_wall_ms=1200, timeout_s=5.0)
+    finally:
+        prefetcher.close()
+
+    assert result.status == "available"
+    assert result.metadata["trigger_wall_ms"] == 1000
+    assert timing["prefetch"] in {"hit", "inflight"}
+    assert timing["timed_out"] is False
+    assert extractor.calls == [("a", "b")]
+    assert prefetcher.stats.speculative_started == 1
+
+
+def test_prefetcher_defers_only_newest_selection_while_speculation_runs() -> None:
+    gate = threading.Event()
+    extractor = _CountingExtractor(gate=gate)
+    prefetcher = VisionFactPrefetcher(extractor, session_id="sess")
+    try:
+        prefetcher.prefetch(_vision("a", "b"), trigger_wall_ms=1000)
+        prefetcher.prefetch(_vision("b", "c"), trigger_wall_ms=1100)
+        prefetcher.prefetch(_vision("c", "d"), trigger_wall_ms=1200)
+        gate.set()
+        deadline = time.monotonic() + 5.0
+        while prefetcher.stats.speculative_started < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        result, timing = prefetcher.extract(_vision("c", "d"), trigger_wall_ms=1300, timeout_s=5.0)
+    finally:
+        prefetcher.close()
+
+    assert result.status == "available"
+    assert timing["prefetch"] in {"hit", "inflight"}
+    assert extractor.calls == [("a", "b"), ("c", "d")]
+
+
+def test_prefetcher_times_out_to_vision_unavailable_and_keeps_request_running() -> None:
+    gate = threading.Event()
+    extractor = _CountingExtractor(gate=gate)
+    prefetcher = VisionFactPrefetcher(extractor, session_id="sess")
+    try:
+        result, timing = prefetcher.extract(_vision("a", "b"), trigger_wall_ms=1000, timeout_s=0.01)
+        gate.set()
+        retried, retried_timing = prefetcher.extract(_vision("a", "b"), trigger_wall_ms=1100, timeout_s=5.0)
+    finally:
+        prefetcher.close()
+
+    assert result.status == "vision_unavailable"
+    assert result.error == VISION_FACT_TIMEOUT_REASON
+    assert timing == {"prefetch": "miss", "wait_ms": timing["wait_ms"], "timed_out": True}
+    assert retried.status == "available"
+    assert retried_timing["prefetch"] in {"hit", "inflight"}
+    assert extractor.calls == [("a", "b")]
+
+
+def test_prefetcher_retries_failed_speculative_extraction() -> None:
+    extractor = _CountingExtractor(status="extractor_failed")
+    prefetcher = VisionFactPrefetcher(extractor, session_id="sess")
+    try:
+        prefetcher.prefetch(_vision("a", "b"), trigger_wall_ms=1000)
+        prefetcher.extract(_vision("a", "b"), trigger_wall_ms=1100, timeout_s=5.0)
+        extractor.status = "available"
+        result, timing = prefetcher.extract(_vision("a", "b"), trigger_wall_ms=1200, timeout_s=5.0)
+    finally:
+        prefetcher.close()
+
+    assert result.status == "available"
+    assert timing["prefetch"] == "miss"
+    assert len(extractor.calls) >= 2
+
+
+def test_prefetcher_start_runs_extraction_before_wait() -> None:
+    gate = threading.Event()
+    extractor = _CountingExtractor(gate=gate)
+    prefetcher = VisionFactPrefetcher(extractor, session_id="sess")
+    try:
+        request = prefetcher.start(_vision("a", "b"), trigger_wall_ms=1000)
+        deadline = time.monotonic() + 5.0
+        while not extractor.calls and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert extractor.calls == [("a", "b")]
+        gate.set()
+        result, timing = prefetcher.wait(request, timeout_s=5.0)
+    finally:
+        prefetcher.close()
+
+    assert result.status == "available"
+    assert timing["prefetch"] == "miss"
+    assert timing["timed_out"] is False
+
+
+def test_prefetcher_builds_speculative_selection_on_worker() -> None:
+    extractor = _CountingExtractor()
+    prefetcher = VisionFactPrefetcher(extractor, session_id="sess")
+    built_on: list[str] = []
+
+    def build() -> tuple[dict[str, Any], int]:
+        built_on.append(threading.current_thread().name)
+        return _vision("a", "b"), 1000
+
+    try:
+        assert prefetcher.prefetch_frames(("x",), lambda: None) is True
+        assert prefetcher.prefetch_frames(("a", "b"), build) in {True, False}
+        deadline = time.monotonic() + 5.0
+        while not extractor.calls and time.monotonic() < deadline:
+            time.sleep(0.001)
+        result, timing = prefetcher.extract(_vision("a", "b"), trigger_wall_ms=1200, timeout_s=5.0)
+    finally:
+        prefetcher.close()
+
+    assert result.status == "available"
+    assert timing["prefetch"] in {"hit", "inflight"}
+    assert extractor.calls == [("a", "b")]
+    assert built_on and built_on[0].startswith("vision-fact-prefetch")
+
+
+def test_prefetcher_restamps_reused_result_to_consuming_press() -> None:
+    class _ObservingExtractor(_CountingExtractor):
+        def extract(self, vision, *, session_id, trigger_wall_ms):
+            self.calls.append(vision_frame_key(vision))
+            return VisionFactExtractionResult(
+                status="available",
+                observation=VisionFactObservation(
+                    session_id=session_id,
+                    trigger_wall_ms=trigger_wall_ms,
+                    frame_ids=list(vision_frame_key(vision)),
+                    facts=[],
+                ),
+            )
+
+    extractor = _ObservingExtractor()
+    prefetcher = VisionFactPrefetcher(extractor, session_id="sess")
+    try:
+        prefetcher.prefetch(_vision("a", "b"), trigger_wall_ms=1000)
+        press = {**_vision("a", "b"), "request_id": "req-1", "help_cycle_id": "req-1"}
+        result, timing = prefetcher.extract(press, trigger_wall_ms=1500, timeout_s=5.0)
+        again, _ = prefetcher.extract(press, trigger_wall_ms=1600, timeout_s=5.0)
+    finally:
+        prefetcher.close()
+
+    assert timing["prefetch"] in {"hit", "inflight"}
+    assert result.observation is not None and again.observation is not None
+    assert result.observation.trigger_wall_ms == 1500
+    assert result.observation.metadata["request_id"] == "req-1"
+    assert result.observation.metadata["prefetched_trigger_wall_ms"] == 1000
+    assert result.metadata["prefetched_trigger_wall_ms"] == 1000
+    assert again.observation.trigger_wall_ms == 1600
+    assert again.observation.observation_id != result.observation.observation_id
+    assert extractor.calls == [("a", "b")]
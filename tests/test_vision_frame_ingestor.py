@@ -3,6 +3,8 @@ from __future__ import annotations
 import copy
 import json
 from pathlib import Path
+import threading
+import time
 
 import pytest
 from PIL import Image, ImageDraw
@@ -120,6 +122,9 @@ def test_render_vlm_ready_frame_crops_main_view_and_draws_region_guides(
     assert metadata["artifact_size"]["width"] == processed_size[0]
     assert metadata["crop_rect"]["width"] < width
     assert metadata["artifact_size"]["width"] > metadata["crop_rect"]["width"] + 40
+    assert sorted(metadata["region_hashes"]) == ["ampcd", "left_ddi", "right_ddi"]
+    # Every layout region is OCR-priority text: 256-bit dHash plus a 128-bit pixel digest.
+    assert all(len(value) == 64 + 32 for value in metadata["region_hashes"].values())
 
 
 def test_render_vlm_ready_frame_rejects_unknown_region_id(tmp_path: Path) -> None:
@@ -467,3 +472,80 @@ def test_frame_directory_port_retries_after_invalid_json_line(tmp_path: Path) ->
     port.stop()
 
     assert [obs.frame_id for obs in observations] == ["1772872444902_000123"]
+
+
+def test_frame_directory_port_rereads_held_line_once_its_image_lands(tmp_path: Path) -> None:
+    saved_games_dir = tmp_path / "Saved Games" / "DCS"
+    channel_dir = build_frame_channel_dir(
+        saved_games_dir=saved_games_dir,
+        session_id="sess-late-image",
+        channel=DEFAULT_FRAME_CHANNEL,
+    )
+    _append_manifest_entry(
+        channel_dir,
+        _manifest_entry(
+            channel_dir=channel_dir,
+            capture_wall_ms=1772872444902,
+            frame_seq=123,
+            width=1920,
+            height=1080,
+        ),
+    )
+    port = FrameDirectoryVisionPort(saved_games_dir=saved_games_dir, channel=DEFAULT_FRAME_CHANNEL)
+    port.start("sess-late-image")
+    try:
+        assert port.poll() == []
+        assert port.poll() == []
+        _make_source_frame(
+            channel_dir / build_frame_filename(capture_wall_ms=1772872444902, frame_seq=123),
+            width=1920,
+            height=1080,
+        )
+        observations = port.poll()
+        assert port.poll() == []
+    finally:
+        port.stop()
+
+    assert [obs.frame_id for obs in observations] == ["1772872444902_000123"]
+
+
+def test_frame_directory_port_wait_for_frames_wakes_on_manifest_append(tmp_path: Path) -> None:
+    saved_games_dir = tmp_path / "Saved Games" / "DCS"
+    channel_dir = build_frame_channel_dir(
+        saved_games_dir=saved_games_dir,
+        session_id="sess-wait",
+        channel=DEFAULT_FRAME_CHANNEL,
+    )
+    channel_dir.mkdir(parents=True)
+    frame_path = channel_dir / build_frame_filename(capture_wall_ms=1772872444902, frame_seq=123)
+    _make_source_frame(frame_path, width=1920, height=1080)
+    port = FrameDirectoryVisionPort(saved_games_dir=saved_games_dir, channel=DEFAULT_FRAME_CHANNEL)
+    port.start("sess-wait")
+    assert port.poll() == []
+    writer = threading.Timer(
+        0.05,
+        _append_manifest_entry,
+        args=(
+            channel_dir,
+            _manifest_entry(
+                channel_dir=channel_dir,
+                capture_wall_ms=1772872444902,
+                frame_seq=123,
+                width=1920,
+                height=1080,
+            ),
+        ),
+    )
+    try:
+        writer.start()
+        started = time.monotonic()
+        observations: list[object] = []
+        while not observations and time.monotonic() - started < 5.0:
+            port.wait_for_frames(5.0)
+            observations = port.poll()
+    finally:
+        writer.join()
+        port.stop()
+
+    assert [obs.frame_id for obs in observations] == ["1772872444902_000123"]
+    assert time.monotonic() - started < 5.0
@@ -4,7 +4,7 @@ import math
 
 from core.types_v2 import VisionObservation
 
-from adapters.vision_sync import BufferedVisionSession, select_help_cycle_frames
+from adapters.vision_sync import BufferedVisionSession, VisionFrameHistory, select_help_cycle_frames
 
 
 def _vision_obs(frame_id: str, capture_wall_ms: int) -> VisionObservation:
@@ -305,6 +305,50 @@ def test_buffered_vision_session_waits_for_future_fallback_in_live_mode(monkeypa
     assert sleeps
 
 
+def test_buffered_vision_session_live_mode_waits_on_port_instead_of_sleeping(monkeypatch) -> None:
+    class WaitableVisionPort:
+        def __init__(self) -> None:
+            self.poll_calls = 0
+            self.waits: list[float] = []
+
+        def start(self, session_id: str) -> None:
+            assert session_id == "sess-live"
+
+        def poll(self) -> list[VisionObservation]:
+            self.poll_calls += 1
+            if self.poll_calls == 2:
+                return [_vision_obs("1772872445010_000123", 1772872445010)]
+            return []
+
+        def wait_for_frames(self, timeout_s: float) -> bool:
+            self.waits.append(timeout_s)
+            return True
+
+        def stop(self) -> None:
+            return
+
+    sleeps: list[float] = []
+    monkeypatch.setattr("adapters.vision_sync.time.sleep", lambda value: sleeps.append(float(value)))
+    port = WaitableVisionPort()
+
+    session = BufferedVisionSession(
+        vision_port=port,
+        session_id="sess-live",
+        sync_window_ms=250,
+        trigger_wait_ms=500,
+        live_mode=True,
+    )
+    try:
+        selection = session.select_for_help(trigger_wall_s=1772872445.0)
+    finally:
+        session.close()
+
+    assert selection.frame_id == "1772872445010_000123"
+    assert sleeps == []
+    assert len(port.waits) == 1
+    assert 0 < port.waits[0] <= 0.5
+
+
 def test_buffered_vision_session_live_mode_accepts_past_only_frame_as_partial(monkeypatch) -> None:
     class SequencedVisionPort:
         def start(self, session_id: str) -> None:
@@ -376,3 +420,68 @@ def test_buffered_vision_session_prunes_history_outside_retention_window() -> No
 
 def test_history_key_preserves_zero_capture_wall_ms() -> None:
     assert BufferedVisionSession._history_key(_vision_obs("0_000000", 0)) == (0, "0_000000")
+
+
+def test_vision_frame_history_orders_dedupes_and_queries_windows() -> None:
+    history = VisionFrameHistory(
+        [
+            _vision_obs("1772872445010_000123", 1772872445010),
+            _vision_obs("1772872444950_000122", 1772872444950),
+            _vision_obs("1772872445300_000125", 1772872445300),
+            _vision_obs("1772872445200_000124", 1772872445200),
+        ]
+    )
+
+    assert history.insert(_vision_obs("1772872445010_000123", 1772872445010)) is False
+    assert len(history) == 4
+    assert [item.frame_id for item in history] == [
+        "1772872444950_000122",
+        "1772872445010_000123",
+        "1772872445200_000124",
+        "1772872445300_000125",
+    ]
+    assert [frame_id for _ms, frame_id, _obs in history.window(1772872444950, 1772872445200)] == [
+        "1772872444950_000122",
+        "1772872445010_000123",
+        "1772872445200_000124",
+    ]
+
+    removed = history.prune_before(1772872445010)
+    assert [item.frame_id for item in removed] == ["1772872444950_000122"]
+    assert "1772872444950_000122" not in history
+    assert history.latest_capture_wall_ms() == 1772872445300
+
+
+def test_vision_frame_history_compacts_after_long_retention_run() -> None:
+    history = VisionFrameHistory()
+    for index in range(2000):
+        history.insert(_vision_obs(f"{1772872440000 + index * 10}_{index:06d}", 1772872440000 + index * 10))
+        history.prune_before(1772872440000 + index * 10 - 500)
+
+    assert len(history) == 51
+    assert len(history._keys) < 600
+    assert history.window(1772872440000, 1772872440000 + 19990 - 501) == []
+
+
+def test_select_help_cycle_frames_matches_list_selection_for_history() -> None:
+    observations = [
+        _vision_obs(f"{1772872444000 + offset}_{index:06d}", 1772872444000 + offset)
+        for index, offset in enumerate((0, 700, 940, 990, 1000, 1010, 1240, 1600))
+    ]
+    history = VisionFrameHistory(reversed(observations))
+
+    for policy in ("window", "trigger_only"):
+        for trigger_wall_ms in (1772872443900, 1772872444995, 1772872445000, 1772872445500):
+            expected = select_help_cycle_frames(
+                observations,
+                trigger_wall_ms=trigger_wall_ms,
+                sync_window_ms=250,
+                selection_policy=policy,
+            )
+            actual = select_help_cycle_frames(
+                history,
+                trigger_wall_ms=trigger_wall_ms,
+                sync_window_ms=250,
+                selection_policy=policy,
+            )
+            assert actual == expected
@@ -0,0 +1,85 @@
+"""
+Microbenchmark VarResolver throughput (frames/sec) over a recorded BIOS JSONL log.
+
+Usage:
+  python -m tools.benchmark_var_resolver
+  python -m tools.benchmark_var_resolver --log logs/dcs_bios_raw_15s.jsonl --repeat 20
+  python -m tools.benchmark_var_resolver --incremental
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Sequence
+
+from core.vars import IncrementalVarResolver, VarResolver
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TELEMETRY_MAP = _REPO_ROOT / "packs" / "fa18c_startup" / "telemetry_map.yaml"
+DEFAULT_LOG = _REPO_ROOT / "logs" / "dcs_bios_raw_15s.jsonl"
+
+
+def load_frames(path: str | Path) -> Iterator[dict[str, Any]]:
+    source = Path(path)
+    with source.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict):
+                yield record
+
+
+def benchmark_resolver(
+    resolver: VarResolver | IncrementalVarResolver,
+    frames: Sequence[Mapping[str, Any]],
+    *,
+    repeat: int = 10,
+) -> dict[str, Any]:
+    if not frames:
+        raise ValueError("benchmark requires at least one frame")
+    repeat = max(1, int(repeat))
+    total_frames = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        if isinstance(resolver, IncrementalVarResolver):
+            resolver.reset()
+        for frame in frames:
+            resolver.resolve(frame)
+            total_frames += 1
+    elapsed_s = time.perf_counter() - started
+    return {
+        "rules": len(resolver.resolver.rules if isinstance(resolver, IncrementalVarResolver) else resolver.rules),
+        "frames": total_frames,
+        "elapsed_s": round(elapsed_s, 6),
+        "frames_per_s": round(total_frames / elapsed_s, 1) if elapsed_s > 0 else None,
+        "us_per_frame": round(elapsed_s * 1e6 / total_frames, 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure VarResolver frames/sec over a BIOS JSONL log.")
+    parser.add_argument("--telemetry-map", default=str(DEFAULT_TELEMETRY_MAP), help="telemetry_map.yaml path")
+    parser.add_argument("--log", default=str(DEFAULT_LOG), help="BIOS JSONL log with one frame per line")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the log")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Benchmark delta-driven IncrementalVarResolver instead of full per-frame resolve",
+    )
+    args = parser.parse_args(argv)
+
+    resolver: VarResolver | IncrementalVarResolver = VarResolver.from_yaml(args.telemetry_map)
+    if args.incremental:
+        resolver = IncrementalVarResolver(resolver)
+    frames = list(load_frames(args.log))
+    summary = benchmark_resolver(resolver, frames, repeat=args.repeat)
+    print(json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
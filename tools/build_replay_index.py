@@ -0,0 +1,54 @@
+"""
+Build the keyframe seek index for a JSONL BIOS replay log.
+
+`replay-bios --start-t/--start-seq` builds the index on first use; run this
+ahead of time to index long recordings once.
+
+Usage:
+  python -m tools.build_replay_index logs/dcs_bios_raw_15s.jsonl
+  python -m tools.build_replay_index session.jsonl --every-n-frames 128 --output /tmp/session.jsonl.idx.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from adapters.event_store.replay_index import (
+    DEFAULT_INDEX_EVERY_N_FRAMES,
+    build_replay_index,
+    default_replay_index_path,
+    write_replay_index,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the seek index for a JSONL BIOS replay log.")
+    parser.add_argument("source", help="JSONL replay log (raw frames or observation events)")
+    parser.add_argument("--output", default="", help="Index path (default: <source>.idx.gz)")
+    parser.add_argument(
+        "--every-n-frames",
+        type=int,
+        default=DEFAULT_INDEX_EVERY_N_FRAMES,
+        help="Frames between keyframes",
+    )
+    args = parser.parse_args(argv)
+
+    output = Path(args.output) if args.output else default_replay_index_path(args.source)
+    index = build_replay_index(args.source, every_n_frames=args.every_n_frames)
+    write_replay_index(index, output)
+    summary = {
+        "source": str(args.source),
+        "index": str(output),
+        "frames": index.frame_count,
+        "keyframes": len(index.keyframes),
+        "every_n_frames": index.every_n_frames,
+        "index_bytes": output.stat().st_size,
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
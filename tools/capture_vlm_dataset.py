@@ -5,11 +5,14 @@ Help-triggered dataset capture tool for VLM fine-tuning.
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 import csv
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
 from pathlib import Path
+import signal
 import sys
 import time
 from typing import Any, Callable, Mapping
@@ -38,6 +41,8 @@ from tools.capture_vision_sidecar import (
 )
 
 DEFAULT_CAPTURE_FPS = 2.0
+DEFAULT_RENDER_WORKERS = 0
+DEFAULT_RENDER_QUEUE_MAX = 8
 DEFAULT_OUTPUT_ROOT = Path(__file__).resolve().parent / ".captures"
 
 
@@ -50,6 +55,8 @@ class DatasetCaptureConfig:
     screen_width: int
     screen_height: int
     render_vlm_artifacts: bool
+    render_workers: int = DEFAULT_RENDER_WORKERS
+    artifact_compress_level: int | None = None
 
 
 @dataclass(frozen=True)
@@ -70,6 +77,17 @@ class DatasetCaptureStats:
         }
 
 
+@dataclass
+class _PendingFrame:
+    manifest_entry: dict[str, Any]
+    index_entry: dict[str, Any]
+    render: Future[dict[str, Any]]
+
+
+def _ignore_sigint() -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
 @dataclass(frozen=True)
 class CapturePlanItem:
     seq: int
@@ -1138,6 +1156,9 @@ class DatasetFrameWriter:
         capture_callable: Callable[[], Image.Image],
         render_vlm_artifacts: bool = True,
         clock: Callable[[], float] = time.time,
+        render_workers: int = 0,
+        render_queue_max: int = DEFAULT_RENDER_QUEUE_MAX,
+        artifact_compress_level: int | None = None,
     ) -> None:
         self.output_root = Path(output_root).expanduser().resolve()
         self.session_id = str(session_id).strip()
@@ -1152,6 +1173,12 @@ class DatasetFrameWriter:
         self.capture_callable = capture_callable
         self.render_vlm_artifacts = bool(render_vlm_artifacts)
         self.clock = clock
+        # render_workers > 0 renders artifacts in worker processes; manifest lines follow in capture order.
+        self.render_workers = max(0, int(render_workers))
+        self.render_queue_max = max(1, int(render_queue_max))
+        self.artifact_compress_level = artifact_compress_level
+        self._render_executor: Executor | None = None
+        self._pending: deque[_PendingFrame] = deque()
         self._frame_seq = self._resolve_next_frame_seq()
 
     @property
@@ -1213,10 +1240,8 @@ class DatasetFrameWriter:
         temp_path.replace(raw_path)
 
         artifact_path: Path | None = None
-        artifact_metadata: dict[str, Any] | None = None
         if self.render_vlm_artifacts:
             artifact_path = self.artifact_dir / f"{raw_path.stem}{DEFAULT_ARTIFACT_SUFFIX}"
-            artifact_metadata = render_vlm_ready_frame(raw_path, artifact_path)
 
         manifest_entry = {
             "schema_version": "v2",
@@ -1231,10 +1256,6 @@ class DatasetFrameWriter:
             "source_session_id": self.session_id,
         }
         validate_instance(manifest_entry, "vision_frame_manifest_entry")
-        with self.manifest_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(manifest_entry, ensure_ascii=False) + "\n")
-            handle.flush()
-
         index_entry = {
             "frame_id": frame_id,
             "capture_wall_ms": capture_wall_ms,
@@ -1245,9 +1266,31 @@ class DatasetFrameWriter:
             "channel": self.channel,
             "layout_id": self.layout_id,
         }
-        with self.capture_index_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(index_entry, ensure_ascii=False) + "\n")
-            handle.flush()
+
+        artifact_metadata: dict[str, Any] | None = None
+        if artifact_path is not None and self.render_workers > 0:
+            self._pending.append(
+                _PendingFrame(
+                    manifest_entry=manifest_entry,
+                    index_entry=index_entry,
+                    render=self._executor().submit(
+                        render_vlm_ready_frame,
+                        raw_path,
+                        artifact_path,
+                        compress_level=self.artifact_compress_level,
+                    ),
+                )
+            )
+            # Bounded queue: block on the oldest render instead of dropping frames.
+            self._write_completed(block_until=len(self._pending) - self.render_queue_max)
+        else:
+            if artifact_path is not None:
+                artifact_metadata = render_vlm_ready_frame(
+                    raw_path,
+                    artifact_path,
+                    compress_level=self.artifact_compress_level,
+                )
+            self._write_frame_entries(manifest_entry, index_entry)
 
         return {
             **manifest_entry,
@@ -1257,6 +1300,66 @@ class DatasetFrameWriter:
             "timestamp": datetime.fromtimestamp(capture_wall_ms / 1000.0, tz=timezone.utc).isoformat(),
         }
 
+    @property
+    def pending_renders(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """Wait for every queued artifact render and append its manifest and index lines."""
+        self._write_completed(block_until=len(self._pending))
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            if self._render_executor is not None:
+                self._render_executor.shutdown(wait=True)
+                self._render_executor = None
+
+    def _executor(self) -> Executor:
+        if self._render_executor is None:
+            # Workers ignore Ctrl+C so stopping a capture lets in-flight renders finish and flush.
+            self._render_executor = ProcessPoolExecutor(
+                max_workers=self.render_workers,
+                initializer=_ignore_sigint,
+            )
+        return self._render_executor
+
+    def _write_completed(self, *, block_until: int) -> None:
+        """Append entries for finished renders in capture order, waiting for the first `block_until`."""
+        written = 0
+        while self._pending and (written < block_until or self._pending[0].render.done()):
+            pending = self._pending[0]
+            try:
+                pending.render.result()
+            except Exception:
+                self._render_inline_fallback(pending)
+            # Popped only once the entry is settled, so an interrupted wait keeps it queued for close().
+            self._pending.popleft()
+            self._write_frame_entries(pending.manifest_entry, pending.index_entry)
+            written += 1
+
+    def _render_inline_fallback(self, pending: _PendingFrame) -> None:
+        """Re-render a frame whose worker render failed; record the error if that fails too."""
+        index_entry = pending.index_entry
+        try:
+            render_vlm_ready_frame(
+                Path(index_entry["raw_image_path"]),
+                Path(index_entry["artifact_image_path"]),
+                compress_level=self.artifact_compress_level,
+            )
+        except Exception as exc:
+            index_entry["artifact_image_path"] = None
+            index_entry["artifact_render_error"] = f"{type(exc).__name__}: {exc}"
+
+    def _write_frame_entries(self, manifest_entry: Mapping[str, Any], index_entry: Mapping[str, Any]) -> None:
+        with self.manifest_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(manifest_entry, ensure_ascii=False) + "\n")
+            handle.flush()
+        with self.capture_index_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(index_entry, ensure_ascii=False) + "\n")
+            handle.flush()
+
 
 class CaptureEventSource:
     def poll(self) -> dict[str, Any] | None:
@@ -1464,6 +1567,23 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable VLM-ready artifact rendering and only keep raw frames.",
     )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        default=DEFAULT_RENDER_WORKERS,
+        help=(
+            "Worker processes rendering VLM artifacts off the capture path (frames are then returned without "
+            "artifact_metadata). Default 0 renders inline before each manifest write."
+        ),
+    )
+    parser.add_argument(
+        "--artifact-compress-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="0-9",
+        help="Optional PNG zlib level for VLM artifacts (lower encodes faster; default keeps Pillow's level).",
+    )
     return parser
 
 
@@ -1482,6 +1602,8 @@ def _resolve_runtime_config(args: argparse.Namespace) -> tuple[DatasetCaptureCon
         raise ValueError("screen_width must be > 0")
     if screen_height <= 0:
         raise ValueError("screen_height must be > 0")
+    if int(args.render_workers) < 0:
+        raise ValueError("render_workers must be >= 0")
     return (
         DatasetCaptureConfig(
             session_id=str(args.session_id).strip(),
@@ -1491,6 +1613,8 @@ def _resolve_runtime_config(args: argparse.Namespace) -> tuple[DatasetCaptureCon
             screen_width=screen_width,
             screen_height=screen_height,
             render_vlm_artifacts=not bool(args.no_render_vlm_artifacts),
+            render_workers=int(args.render_workers),
+            artifact_compress_level=args.artifact_compress_level,
         ),
         config_path,
     )
@@ -1526,6 +1650,8 @@ def main() -> int:
             channel=config.channel,
             layout_id=config.layout_id,
             render_vlm_artifacts=config.render_vlm_artifacts,
+            render_workers=config.render_workers,
+            artifact_compress_level=config.artifact_compress_level,
             capture_callable=lambda: capture_screen_region(
                 width=config.screen_width,
                 height=config.screen_height,
@@ -1587,6 +1713,7 @@ def main() -> int:
                         "trigger_host": args.help_trigger_host,
                         "trigger_port": listener.bound_port if listener is not None else 0,
                         "render_vlm_artifacts": config.render_vlm_artifacts,
+                        "render_workers": config.render_workers,
                         "start_on_launch": bool(args.start_on_launch),
                     },
                     ensure_ascii=False,
@@ -1604,6 +1731,8 @@ def main() -> int:
                 listener.close()
             if global_hotkey_source is not None:
                 global_hotkey_source.close()
+            # Drain queued artifact renders so every captured frame reaches the manifest.
+            writer.close()
     except KeyboardInterrupt:
         return 130
     except Exception as exc:
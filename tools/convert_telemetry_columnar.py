@@ -0,0 +1,57 @@
+"""
+Convert a JSONL telemetry/BIOS log to the chunked columnar `.tcol` format.
+
+Usage:
+  python -m tools.convert_telemetry_columnar logs/dcs_bios_raw_15s.jsonl
+  python -m tools.convert_telemetry_columnar session.jsonl.gz --output session.tcol --chunk-frames 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from adapters.event_store.columnar_telemetry import (
+    COLUMNAR_COMPRESSIONS,
+    COLUMNAR_TELEMETRY_SUFFIX,
+    DEFAULT_CHUNK_FRAMES,
+    convert_jsonl_to_columnar,
+)
+
+
+def default_output_path(source: str | Path) -> Path:
+    path = Path(source)
+    name = path.name
+    for suffix in (".gz", ".zst", ".zstd", ".jsonl", ".json"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return path.with_name(name + COLUMNAR_TELEMETRY_SUFFIX)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Convert a JSONL telemetry log to columnar .tcol.")
+    parser.add_argument("source", help="JSONL log (raw frames or observation events; .gz/.zst accepted)")
+    parser.add_argument("--output", default="", help="Destination .tcol path (default: next to source)")
+    parser.add_argument("--chunk-frames", type=int, default=DEFAULT_CHUNK_FRAMES, help="Frames per chunk")
+    parser.add_argument(
+        "--compression",
+        choices=list(COLUMNAR_COMPRESSIONS),
+        default="auto",
+        help="Chunk codec (auto uses zstd when zstandard is installed, else zlib)",
+    )
+    args = parser.parse_args(argv)
+
+    output = Path(args.output) if args.output else default_output_path(args.source)
+    summary = convert_jsonl_to_columnar(
+        args.source,
+        output,
+        chunk_frames=args.chunk_frames,
+        compression=args.compression,
+    )
+    print(json.dumps(summary, ensure_ascii=False, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
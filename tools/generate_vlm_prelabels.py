@@ -12,6 +12,7 @@ import os
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+from adapters.http_client_pool import HttpClientConfig, build_request_timeout, shared_http_client
 from adapters.json_extract import parse_first_json
 from adapters.openai_compat_multimodal import (
     copy_messages_for_payload,
@@ -733,6 +734,7 @@ class DashScopeVlmPrelabeler:
         max_local_image_bytes: int = DEFAULT_MAX_LOCAL_IMAGE_BYTES,
         lang: str = "zh",
         client: object | None = None,
+        http_client_config: HttpClientConfig | None = None,
         print_model_io: bool = False,
         save_raw_response: bool = False,
         include_capture_plan_hint: bool = False,
@@ -748,14 +750,14 @@ class DashScopeVlmPrelabeler:
         self.save_raw_response = bool(save_raw_response)
         self.include_capture_plan_hint = bool(include_capture_plan_hint)
         self.prompt = _build_prompt(lang=self.lang)
+        self.http_client_config = http_client_config
         if client is None:
-            import httpx
-
-            self._client = httpx.Client(timeout=self.timeout_s)
-            self._owns_client = True
+            self._client = shared_http_client(self.base_url, config=http_client_config)
+            self._request_timeout: Any = build_request_timeout(self.timeout_s, http_client_config)
         else:
             self._client = client
-            self._owns_client = False
+            self._request_timeout = self.timeout_s
+        self._owns_client = False
 
     def close(self) -> None:
         if self._owns_client and hasattr(self._client, "close"):
@@ -907,7 +909,7 @@ class DashScopeVlmPrelabeler:
             _chat_completions_url(self.base_url),
             json=payload,
             headers=headers,
-            timeout=self.timeout_s,
+            timeout=self._request_timeout,
         )
         status_code = getattr(response, "status_code", None)
         if isinstance(status_code, int) and status_code >= 400:
@@ -7,6 +7,8 @@ referenced by the runtime code paths today.
 Usage:
   python -m tools.index_docs --output index.json
   # defaults to indexing all docs under Doc/Evaluation
+  python -m tools.index_docs --output index.json --binary
+  # also writes index.bm25, a memory-mappable sidecar loaded without re-tokenizing
 """
 
 from __future__ import annotations
@@ -19,6 +21,8 @@ from typing import List, Dict
 
 import PyPDF2
 
+from core.knowledge import binary_index_path, write_binary_index
+
 
 def tokenize(text: str) -> List[str]:
     return [t for t in re.split(r"[^a-z0-9]+", text.lower()) if t]
@@ -52,7 +56,7 @@ def chunk_pdf(path: Path) -> List[Dict]:
     return chunks
 
 
-def build_index(input_paths: List[str], output: str):
+def build_index(input_paths: List[str], output: str, binary: bool = False):
     documents = []
     for p in input_paths:
         path = Path(p)
@@ -96,6 +100,8 @@ def build_index(input_paths: List[str], output: str):
     }
     Path(output).parent.mkdir(parents=True, exist_ok=True)
     Path(output).write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding="utf-8")
+    if binary:
+        write_binary_index(out, binary_index_path(output), source_path=output)
     return out
 
 
@@ -107,11 +113,18 @@ def main():
         help="Files or directories to index (default: Doc/Evaluation)",
     )
     parser.add_argument("--output", required=True, help="Output index JSON path")
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Also write a memory-mappable .bm25 sidecar next to the JSON index",
+    )
     args = parser.parse_args()
 
     inputs = args.input or ["Doc/Evaluation"]
-    build_index(inputs, args.output)
+    build_index(inputs, args.output, binary=args.binary)
     print(f"Wrote index to {args.output} from {inputs}")
+    if args.binary:
+        print(f"Wrote binary index to {binary_index_path(args.output)}")
 
 
 if __name__ == "__main__":